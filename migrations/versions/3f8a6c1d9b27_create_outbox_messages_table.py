@@ -0,0 +1,41 @@
+"""create outbox messages table
+
+Revision ID: 3f8a6c1d9b27
+Revises: 27d2b4491590
+Create Date: 2026-10-16 09:12:44.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '3f8a6c1d9b27'
+down_revision = '27d2b4491590'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('outbox_messages',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('context', sa.String(), nullable=False),
+    sa.Column('event_type', sa.String(), nullable=False),
+    sa.Column('handler', sa.String(), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('available_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('last_error', sa.String(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('processed_at', postgresql.TIMESTAMP(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_outbox_messages')),
+    schema='shared_kernel'
+    )
+    op.create_index('ix_outbox_messages_context_available_at_unfinished', 'outbox_messages', ['context', 'available_at'], unique=False, schema='shared_kernel', postgresql_where=sa.text("status IN ('pending', 'processing')"))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_messages_context_available_at_unfinished', table_name='outbox_messages', schema='shared_kernel', postgresql_where=sa.text("status IN ('pending', 'processing')"))
+    op.drop_table('outbox_messages', schema='shared_kernel')
@@ -1,11 +1,14 @@
+from __future__ import annotations
+
 from enum import Enum, unique
+from typing import TYPE_CHECKING
 
-from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.ollama import OllamaProvider
-from pydantic_ai.providers.grok import GrokProvider
-from pydantic_ai.providers.deepseek import DeepSeekProvider
-from pydantic_ai.models.mistral import MistralModel
-from pydantic_ai.models.anthropic import AnthropicModel
+# Providers pull in their vendor SDKs; each is imported by the getter that
+# needs it so importing this module stays cheap.
+if TYPE_CHECKING:
+    from pydantic_ai.models.anthropic import AnthropicModel
+    from pydantic_ai.models.mistral import MistralModel
+    from pydantic_ai.models.openai import OpenAIChatModel
 
 @unique
 class LLMModel(str, Enum):
@@ -17,34 +20,49 @@ class LLMModel(str, Enum):
     DEEPSEEK = "deepseek-chat"
 
 def get_ollama_model() -> OpenAIChatModel:
+    from pydantic_ai.models.openai import OpenAIChatModel
+    from pydantic_ai.providers.ollama import OllamaProvider
+
     return OpenAIChatModel(
         LLMModel.OLLAMA.value,
         provider=OllamaProvider(base_url='http://localhost:11434/v1'),
     )
 
 def get_openai_model() -> OpenAIChatModel:
+    from pydantic_ai.models.openai import OpenAIChatModel
+
     return OpenAIChatModel(
         LLMModel.OPENAI.value
     )
 
 def get_grok_model() -> OpenAIChatModel:
+    from pydantic_ai.models.openai import OpenAIChatModel
+    from pydantic_ai.providers.grok import GrokProvider
+
     return OpenAIChatModel(
         LLMModel.XAI.value,
         provider=GrokProvider(),
     )
 
 def get_deepseek_model() -> OpenAIChatModel:
+    from pydantic_ai.models.openai import OpenAIChatModel
+    from pydantic_ai.providers.deepseek import DeepSeekProvider
+
     return OpenAIChatModel(
         LLMModel.DEEPSEEK.value,
         provider=DeepSeekProvider(),
     )
 
 def get_mistral_model() -> MistralModel:
+    from pydantic_ai.models.mistral import MistralModel
+
     return MistralModel(
         LLMModel.MISTRAL.value,
     )
 
 def get_anthropic_model() -> AnthropicModel:
+    from pydantic_ai.models.anthropic import AnthropicModel
+
     return AnthropicModel(
         LLMModel.MISTRAL.value,
     )
\ No newline at end of file
@@ -38,6 +38,29 @@ class APPSettings(BaseSettings):
         access_token_expire_minutes: Minutes until access token expiry.
         algorithm: JWS/JWT signing algorithm.
         cleanup_timeout: Time in seconds for graceful cleanup operations.
+        query_cache_enabled: Enable the process-wide repository query cache.
+        query_cache_max_entries: Maximum cached result sets per process.
+        query_cache_ttl: Seconds a cached result set stays valid.
+        cross_context_in_process: Call other bounded contexts' internal
+            endpoints in-process and exchange read models instead of JSON.
+        iam_user_cache_max_entries: Maximum cached IAM user lookups per process.
+        iam_user_cache_ttl: Seconds a cached IAM user lookup stays valid.
+        messagebus_outbox_enabled: Write domain events to the transactional
+            outbox instead of running their handlers in-process; requires an
+            outbox dispatcher (the FastAPI app runs one per context).
+        messagebus_outbox_batch_size: Outbox rows claimed per dispatch.
+        messagebus_outbox_max_attempts: Failed handler runs before an outbox
+            row is dead-lettered.
+        messagebus_coalesce_window: Seconds coalesced event handlers keep
+            merging events for the same aggregate across commands; 0 merges
+            only within one command. Keep it below the event timeout.
+        lambda_pool_size: Pooled connections kept by a Lambda container.
+        lambda_max_overflow: Extra connections a Lambda invocation may open.
+        lambda_pool_recycle: Seconds before a Lambda pooled connection is
+            replaced.
+        lambda_idle_revalidate_seconds: Idle seconds (e.g. a frozen
+            container) after which a warm invocation first checks that
+            pooled connections are still alive.
     """
 
     project_name: str = "vlep"
@@ -55,6 +78,13 @@ class APPSettings(BaseSettings):
     fastapi_max_overflow: int = 20
     fastapi_pool_pre_ping: bool = True
     fastapi_pool_recycle: int = 3600
+    # AWS Lambda database settings (one invocation at a time per container)
+    lambda_pool_size: int = int(os.getenv("LAMBDA_POOL_SIZE") or 2)
+    lambda_max_overflow: int = int(os.getenv("LAMBDA_MAX_OVERFLOW") or 2)
+    lambda_pool_recycle: int = int(os.getenv("LAMBDA_POOL_RECYCLE") or 600)
+    lambda_idle_revalidate_seconds: float = float(
+        os.getenv("LAMBDA_IDLE_REVALIDATE_SECONDS") or 60.0
+    )
     
     # Optimized HTTP client settings (for both FastAPI and Lambda)
     http_timeout_connect: float = 5.0
@@ -67,6 +97,36 @@ class APPSettings(BaseSettings):
     # Message bus timeout settings
     messagebus_cmd_timeout: int = int(os.getenv("MESSAGEBUS_CMD_TIMEOUT") or 10)
     messagebus_event_timeout: int = int(os.getenv("MESSAGEBUS_EVENT_TIMEOUT") or 10)
+    messagebus_outbox_enabled: bool = (
+        os.getenv("MESSAGEBUS_OUTBOX_ENABLED", "false").lower() == "true"
+    )
+    messagebus_outbox_batch_size: int = int(
+        os.getenv("MESSAGEBUS_OUTBOX_BATCH_SIZE") or 50
+    )
+    messagebus_outbox_max_attempts: int = int(
+        os.getenv("MESSAGEBUS_OUTBOX_MAX_ATTEMPTS") or 5
+    )
+    messagebus_coalesce_window: float = float(
+        os.getenv("MESSAGEBUS_COALESCE_WINDOW") or 0.0
+    )
+
+    # Repository query-result cache settings
+    query_cache_enabled: bool = (
+        os.getenv("QUERY_CACHE_ENABLED", "false").lower() == "true"
+    )
+    query_cache_max_entries: int = int(os.getenv("QUERY_CACHE_MAX_ENTRIES") or 1024)
+    query_cache_ttl: int = int(os.getenv("QUERY_CACHE_TTL") or 60)
+
+    # Cross-context provider transport
+    cross_context_in_process: bool = (
+        os.getenv("CROSS_CONTEXT_IN_PROCESS", "false").lower() == "true"
+    )
+
+    # Process-wide IAM user cache settings
+    iam_user_cache_max_entries: int = int(
+        os.getenv("IAM_USER_CACHE_MAX_ENTRIES") or 2048
+    )
+    iam_user_cache_ttl: int = int(os.getenv("IAM_USER_CACHE_TTL") or 300)
     
     # FastAPI development configuration
     fastapi_host: str = os.getenv("FASTAPI_HOST") or "0.0.0.0"
@@ -17,7 +17,6 @@
 
 if TYPE_CHECKING:
     from src.contexts.shared_kernel.services.messagebus import MessageBus
-import anyio
 from src.contexts.client_onboarding.core.bootstrap.container import Container
 from src.contexts.shared_kernel.middleware.auth.authentication import (
     client_onboarding_aws_auth_middleware,
@@ -25,6 +24,7 @@
 from src.contexts.shared_kernel.middleware.error_handling.exception_handler import (
     aws_lambda_exception_handler_middleware,
 )
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -116,4 +116,4 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         Dict containing statusCode, headers, and body for Lambda response
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
+    return run_lambda_handler(async_handler, event, context)
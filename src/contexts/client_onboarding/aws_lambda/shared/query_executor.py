@@ -69,12 +69,12 @@ def _parse_client_identifiers(client_identifiers_data) -> ClientIdentifierSet |
     return None
 
 
-def _create_form_summary(form, responses: list) -> FormSummary:
-    """Create a form summary from form and responses data.
+def _create_form_summary(form, response_count: int) -> FormSummary:
+    """Create a form summary from form data and its response count.
 
     Args:
         form: Form entity object
-        responses: List of response objects for the form
+        response_count: Number of responses stored for the form
 
     Returns:
         FormSummary with form metadata and response count
@@ -86,7 +86,7 @@ def _create_form_summary(form, responses: list) -> FormSummary:
         status=form.status.value,
         created_at=form.created_at,
         updated_at=form.updated_at,
-        response_count=len(responses),
+        response_count=response_count,
     )
 
 
@@ -115,20 +115,20 @@ def _create_response_summary(
     )
 
 
-def _apply_pagination(items: list, offset: int | None, limit: int | None) -> list:
-    """Apply pagination to a list of items.
+def _page_bounds(offset: int | None, limit: int | None) -> tuple[int, int]:
+    """Resolve request pagination into concrete SQL offset and limit.
 
     Args:
-        items: List of items to paginate
         offset: Starting index for pagination
         limit: Maximum number of items to return
 
     Returns:
-        Paginated subset of items
+        Tuple of (offset, limit) with defaults applied
     """
-    start_idx = offset if offset is not None else 0
-    end_idx = start_idx + (limit if limit is not None else DEFAULT_PAGINATION_LIMIT)
-    return items[start_idx:end_idx]
+    return (
+        offset if offset is not None else 0,
+        limit if limit is not None else DEFAULT_PAGINATION_LIMIT,
+    )
 
 
 async def _execute_forms_by_user_query(
@@ -143,17 +143,18 @@ async def _execute_forms_by_user_query(
     Returns:
         ResponseQueryResponse with form summaries for the user
     """
-    async with uow:
-        forms = await uow.onboarding_forms.get_by_user_id(query.user_id)
-
-    form_summaries = []
-    for form in forms:
-        responses = await uow.form_responses.get_by_form_id(form.id)
-        form_summary = _create_form_summary(form, responses)
-        form_summaries.append(form_summary)
+    offset, limit = _page_bounds(query.offset, query.limit)
+    total_count = await uow.onboarding_forms.count_by_user_id(query.user_id)
+    forms_with_counts = (
+        await uow.onboarding_forms.get_page_with_response_counts_by_user_id(
+            query.user_id, offset=offset, limit=limit
+        )
+    )
 
-    total_count = len(form_summaries)
-    paginated_forms = _apply_pagination(form_summaries, query.offset, query.limit)
+    paginated_forms = [
+        _create_form_summary(form, response_count)
+        for form, response_count in forms_with_counts
+    ]
 
     return ResponseQueryResponse(
         success=True,
@@ -225,23 +226,22 @@ async def _execute_responses_by_form_query(
             pagination=None,
         )
 
-    # Get responses for the form
-    responses = await uow.form_responses.get_by_form_id(query.form_id)
-
-    response_summaries = []
+    # Get the requested page of responses for the form
     include_full_data = query.limit is not None and query.limit <= SMALL_QUERY_LIMIT
-
-    for response in responses:
-        response_summary = _create_response_summary(
-            response, include_full_data=include_full_data
-        )
-        response_summaries.append(response_summary)
-
-    total_count = len(response_summaries)
-    paginated_responses = _apply_pagination(
-        response_summaries, query.offset, query.limit
+    offset, limit = _page_bounds(query.offset, query.limit)
+    total_count = await uow.form_responses.count_by_form_id(query.form_id)
+    responses = await uow.form_responses.get_page_by_form_id(
+        query.form_id,
+        offset=offset,
+        limit=limit,
+        include_response_data=include_full_data,
     )
 
+    paginated_responses = [
+        _create_response_summary(response, include_full_data=include_full_data)
+        for response in responses
+    ]
+
     return ResponseQueryResponse(
         success=True,
         query_type=query.query_type,
@@ -348,29 +348,20 @@ async def _execute_responses_by_user_query(
         uow: Unit of work for database operations
 
     Returns:
-        ResponseQueryResponse with all response summaries for the user
+        ResponseQueryResponse with one page of response summaries for the user
     """
-    async with uow:
-        user_forms = await uow.onboarding_forms.get_by_user_id(query.user_id)
-
-        all_responses = []
-        for form in user_forms:
-            form_responses = await uow.form_responses.get_by_form_id(form.id)
-            all_responses.extend(form_responses)
-
-    response_summaries = []
-    for response in all_responses:
-        response_summary = _create_response_summary(response, include_full_data=False)
-        response_summaries.append(response_summary)
-
-    # Sort by submission date (newest first)
-    response_summaries.sort(key=lambda r: r.submitted_at, reverse=True)
-
-    total_count = len(response_summaries)
-    paginated_responses = _apply_pagination(
-        response_summaries, query.offset, query.limit
+    # Responses are sorted by submission date (newest first) in SQL
+    offset, limit = _page_bounds(query.offset, query.limit)
+    total_count = await uow.form_responses.count_by_user_id(query.user_id)
+    responses = await uow.form_responses.get_page_by_user_id(
+        query.user_id, offset=offset, limit=limit, include_response_data=False
     )
 
+    paginated_responses = [
+        _create_response_summary(response, include_full_data=False)
+        for response in responses
+    ]
+
     return ResponseQueryResponse(
         success=True,
         query_type=query.query_type,
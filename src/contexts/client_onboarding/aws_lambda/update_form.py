@@ -23,7 +23,6 @@
     from src.contexts.client_onboarding.core.services.uow import UnitOfWork
     from src.contexts.shared_kernel.services.messagebus import MessageBus
 
-import anyio
 from src.contexts.client_onboarding.core.bootstrap.container import Container
 from src.contexts.shared_kernel.middleware.auth.authentication import (
     client_onboarding_aws_auth_middleware,
@@ -31,6 +30,7 @@
 from src.contexts.shared_kernel.middleware.error_handling.exception_handler import (
     aws_lambda_exception_handler_middleware,
 )
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -168,4 +168,4 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         Dict containing statusCode, headers, and body for Lambda response
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
+    return run_lambda_handler(async_handler, event, context)
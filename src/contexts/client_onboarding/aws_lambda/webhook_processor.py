@@ -9,7 +9,6 @@
 from datetime import UTC, datetime
 from typing import Any
 
-import anyio
 from src.config.app_config import get_app_settings
 from src.contexts.client_onboarding.core.adapters.api_schemas.commands.api_process_webhook import (
     ApiProcessWebhook,
@@ -21,6 +20,7 @@
 from src.contexts.shared_kernel.middleware.error_handling.exception_handler import (
     aws_lambda_exception_handler_middleware,
 )
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -111,4 +111,4 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         Dict containing statusCode, headers, and body for Lambda response
     """
     generate_correlation_id()
-    return anyio.run(async_lambda_handler, event, context)
+    return run_lambda_handler(async_lambda_handler, event, context)
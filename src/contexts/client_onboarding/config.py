@@ -46,6 +46,15 @@ class ClientOnboardingConfig(BaseSettings):
         2  # Changed from 4 to 2 for TypeForm API compliance
     )
     typeform_timeout_seconds: int = 30
+    # Shared per API key; burst of back-to-back requests before pacing
+    typeform_rate_limit_burst: int = 2
+    # Requests one client keeps in flight (bulk status checks fan out)
+    typeform_max_concurrent_requests: int = 4
+    # Retries of a 429 response, honouring Retry-After
+    typeform_rate_limit_max_retries: int = 3
+    # Form/webhook metadata cache, revalidated with ETags once expired; 0 disables
+    typeform_metadata_cache_ttl_seconds: int = 300
+    typeform_metadata_cache_max_entries: int = 1024
 
     # Webhook Configuration
     typeform_webhook_secret: str = os.getenv("TYPEFORM_WEBHOOK_SECRET", "")
@@ -55,6 +64,8 @@ class ClientOnboardingConfig(BaseSettings):
     # Security Settings
     webhook_signature_header: str = "Typeform-Signature"
     max_webhook_payload_size: int = 1024 * 1024  # 1MB
+    # Fingerprints kept per process for replay protection
+    webhook_replay_cache_max_entries: int = 5000
 
     # Webhook Retry Configuration
     webhook_retry_initial_interval_minutes: int = 2
@@ -5,9 +5,14 @@
 Provides async CRUD operations for TypeForm response data storage.
 """
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from src.contexts.client_onboarding.core.domain.models.form_response import FormResponse
+from src.contexts.client_onboarding.core.domain.models.onboarding_form import (
+    OnboardingForm,
+    OnboardingFormStatus,
+)
 
 
 class FormResponseRepo:
@@ -91,6 +96,110 @@ async def get_by_form_id(self, form_id: int) -> list[FormResponse]:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_page_by_form_id(
+        self,
+        form_id: int,
+        *,
+        offset: int,
+        limit: int,
+        include_response_data: bool = True,
+    ) -> list[FormResponse]:
+        """Get one page of responses for an onboarding form.
+
+        Args:
+            form_id: Internal onboarding form ID
+            offset: Number of responses to skip
+            limit: Maximum number of responses to return
+            include_response_data: Whether to load the response_data payload
+
+        Returns:
+            List of FormResponse objects ordered by ID
+        """
+        stmt = (
+            select(FormResponse)
+            .where(FormResponse.form_id == form_id)
+            .order_by(FormResponse.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        if not include_response_data:
+            stmt = stmt.options(defer(FormResponse.response_data))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count_by_form_id(self, form_id: int) -> int:
+        """Count responses for an onboarding form.
+
+        Args:
+            form_id: Internal onboarding form ID
+
+        Returns:
+            Number of responses stored for the form
+        """
+        stmt = (
+            select(func.count())
+            .select_from(FormResponse)
+            .where(FormResponse.form_id == form_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def get_page_by_user_id(
+        self,
+        user_id: str,
+        *,
+        offset: int,
+        limit: int,
+        include_response_data: bool = True,
+    ) -> list[FormResponse]:
+        """Get one page of responses across all active forms of a user.
+
+        Args:
+            user_id: Owner of the onboarding forms
+            offset: Number of responses to skip
+            limit: Maximum number of responses to return
+            include_response_data: Whether to load the response_data payload
+
+        Returns:
+            List of FormResponse objects, newest submission first
+        """
+        stmt = (
+            select(FormResponse)
+            .join(OnboardingForm, FormResponse.form_id == OnboardingForm.id)
+            .where(
+                OnboardingForm.user_id == user_id,
+                OnboardingForm.status != OnboardingFormStatus.DELETED,
+            )
+            .order_by(FormResponse.submitted_at.desc(), FormResponse.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        if not include_response_data:
+            stmt = stmt.options(defer(FormResponse.response_data))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count_by_user_id(self, user_id: str) -> int:
+        """Count responses across all active forms of a user.
+
+        Args:
+            user_id: Owner of the onboarding forms
+
+        Returns:
+            Number of responses stored for the user's forms
+        """
+        stmt = (
+            select(func.count())
+            .select_from(FormResponse)
+            .join(OnboardingForm, FormResponse.form_id == OnboardingForm.id)
+            .where(
+                OnboardingForm.user_id == user_id,
+                OnboardingForm.status != OnboardingFormStatus.DELETED,
+            )
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
     async def update(self, form_response: FormResponse) -> FormResponse:
         """Update an existing form response.
 
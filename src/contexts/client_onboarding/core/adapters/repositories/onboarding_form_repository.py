@@ -5,8 +5,9 @@
 Provides async CRUD operations for TypeForm integration and form management.
 """
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.contexts.client_onboarding.core.domain.models.form_response import FormResponse
 from src.contexts.client_onboarding.core.domain.models.onboarding_form import (
     OnboardingForm,
     OnboardingFormStatus,
@@ -105,6 +106,58 @@ async def get_by_user_id(self, user_id: str) -> list[OnboardingForm]:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_page_with_response_counts_by_user_id(
+        self, user_id: str, *, offset: int, limit: int
+    ) -> list[tuple[OnboardingForm, int]]:
+        """Get one page of a user's forms with the number of responses of each.
+
+        Response counts are aggregated in SQL; responses are not loaded.
+        Excludes soft-deleted forms from results.
+
+        Args:
+            user_id: User ID to filter forms by
+            offset: Number of forms to skip
+            limit: Maximum number of forms to return
+
+        Returns:
+            List of (OnboardingForm, response_count) tuples ordered by form ID
+        """
+        response_count = func.count(FormResponse.id).label("response_count")
+        stmt = (
+            select(OnboardingForm, response_count)
+            .outerjoin(FormResponse, FormResponse.form_id == OnboardingForm.id)
+            .where(
+                OnboardingForm.user_id == user_id,
+                OnboardingForm.status != OnboardingFormStatus.DELETED,
+            )
+            .group_by(OnboardingForm.id)
+            .order_by(OnboardingForm.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [(form, count) for form, count in result.all()]
+
+    async def count_by_user_id(self, user_id: str) -> int:
+        """Count a user's onboarding forms, excluding soft-deleted ones.
+
+        Args:
+            user_id: User ID to filter forms by
+
+        Returns:
+            Number of active forms owned by the user
+        """
+        stmt = (
+            select(func.count())
+            .select_from(OnboardingForm)
+            .where(
+                OnboardingForm.user_id == user_id,
+                OnboardingForm.status != OnboardingFormStatus.DELETED,
+            )
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
     async def update(self, onboarding_form: OnboardingForm) -> OnboardingForm:
         """Update an existing onboarding form.
 
@@ -4,7 +4,7 @@
 from src.contexts.client_onboarding.core.services.webhooks.manager import (
     create_webhook_manager,
 )
-from src.db.fastapi_database import fastapi_db
+from src.db.fastapi_database import get_fastapi_database
 
 
 class Container(containers.DeclarativeContainer):
@@ -21,7 +21,7 @@ class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(modules=[__name__])
 
     # Database connection provider
-    database = providers.Object(fastapi_db)
+    database = providers.Callable(get_fastapi_database)
 
     # Unit of Work provider for transaction management
     uow_factory = providers.Factory(
@@ -25,6 +25,15 @@
     TypeFormWebhookCreationError,
     TypeFormWebhookNotFoundError,
 )
+from src.contexts.client_onboarding.core.services.integrations.typeform.metadata_cache import (
+    cache_scope,
+    form_id_of,
+    get_typeform_metadata_cache,
+)
+from src.contexts.client_onboarding.core.services.integrations.typeform.scheduler import (
+    RequestScheduler,
+    get_token_bucket,
+)
 
 # Relocated content from services/typeform_client.py
 from src.logging.logger import get_logger
@@ -35,6 +44,7 @@
 HTTP_STATUS_OK = 200
 HTTP_STATUS_CREATED = 201
 HTTP_STATUS_NO_CONTENT = 204
+HTTP_STATUS_NOT_MODIFIED = 304
 HTTP_STATUS_BAD_REQUEST = 400
 HTTP_STATUS_UNAUTHORIZED = 401
 HTTP_STATUS_FORBIDDEN = 403
@@ -134,18 +144,11 @@ def validate_rate_limit_config(self) -> dict[str, Any]:
             )
         return validation_result
 
-    async def enforce_rate_limit(self) -> None:
-        """Enforce rate limiting by sleeping if necessary."""
-        async with self.lock:
-            current_time = time.time()
-            time_since_last_request = current_time - self.last_request_time
-            if time_since_last_request < self.min_interval:
-                sleep_time = self.min_interval - time_since_last_request
-                logger.debug("Rate limit enforced", sleep_time=f"{sleep_time:.3f}", action="rate_limit_sleep")
-                await anyio.sleep(sleep_time)
-                current_time = time.time()
-            self.last_request_time = current_time
-            self.request_timestamps.append(current_time)
+    def record_request(self) -> None:
+        """Record a request paced elsewhere (e.g. by a shared token bucket)."""
+        current_time = time.time()
+        self.last_request_time = current_time
+        self.request_timestamps.append(current_time)
 
     async def get_rate_limit_status(self) -> dict[str, Any]:
         """Get current rate limit status and compliance information.
@@ -247,7 +250,12 @@ class TypeFormClient:
     webhook management and form operations.
     """
 
-    def __init__(self, api_key: str | None = None, base_url: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
         self.api_key = api_key or config.typeform_api_key
         self.base_url = base_url or config.typeform_api_base_url
         if not self.api_key:
@@ -267,6 +275,20 @@ def __init__(self, api_key: str | None = None, base_url: str | None = None):
             min_interval_ms=round(self.rate_limit_validator.min_interval * 1000, 3),
             action="rate_limit_config"
         )
+        # Requests are paced by a token bucket shared by every client of the
+        # API key, since TypeForm limits per account
+        self.scheduler = RequestScheduler(
+            get_token_bucket(
+                self.api_key,
+                config.typeform_rate_limit_requests_per_second,
+                config.typeform_rate_limit_burst,
+            ),
+            max_concurrency=config.typeform_max_concurrent_requests,
+            max_retries=config.typeform_rate_limit_max_retries,
+        )
+        # Form and webhook metadata shared by every client of the API key
+        self.metadata_cache = get_typeform_metadata_cache()
+        self._cache_scope = cache_scope(self.api_key)
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -285,6 +307,7 @@ def __init__(self, api_key: str | None = None, base_url: str | None = None):
             ),
             # Use TypeForm-specific connection limits (more conservative than defaults)
             limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            transport=transport,
         )
         logfire.instrument_httpx(self.client.client)
 
@@ -300,8 +323,14 @@ async def close(self):
         """Close the HTTP client connection."""
         await self.client.close()
 
-    async def _enforce_rate_limit(self) -> None:
-        await self.rate_limit_validator.enforce_rate_limit()
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the scheduler, retrying 429 responses."""
+
+        async def send() -> httpx.Response:
+            self.rate_limit_validator.record_request()
+            return await self.client.request(method, url, **kwargs)
+
+        return await self.scheduler.run(send)
 
     async def get_rate_limit_status(self) -> dict[str, Any]:
         """Get current rate limit status and compliance information.
@@ -440,9 +469,60 @@ def _handle_response(self, response: Any) -> dict[str, Any]:
     async def _make_request(
         self, method: str, endpoint: str, **kwargs
     ) -> dict[str, Any]:
-        await self._enforce_rate_limit()
-
         url = self._build_url(endpoint)
+        if method == "GET" and not kwargs:
+            # Identical GETs in flight (e.g. a bulk check listing the same
+            # form twice) share one request and its result
+            return await self.scheduler.coalesce(
+                url, lambda: self._cached_get(url, endpoint)
+            )
+        try:
+            response = await self._request(method, url, endpoint, **kwargs)
+        finally:
+            self._invalidate_endpoint(endpoint)
+        return self._handle_response(response)
+
+    async def _cached_get(self, url: str, endpoint: str) -> dict[str, Any]:
+        """GET an endpoint through the metadata cache.
+
+        Fresh entries are served without a request; expired entries with an
+        ETag are revalidated with ``If-None-Match``.
+        """
+        cache = self.metadata_cache
+        form_id = form_id_of(endpoint)
+        if not cache.enabled or form_id is None:
+            return self._handle_response(await self._request("GET", url, endpoint))
+
+        entry = cache.lookup(self._cache_scope, endpoint)
+        if entry is not None:
+            return entry.data
+        entry = cache.stale(self._cache_scope, endpoint)
+        kwargs: dict[str, Any] = {}
+        if entry is not None and entry.etag:
+            kwargs["headers"] = {"If-None-Match": entry.etag}
+        generation = cache.generation()
+        response = await self._request("GET", url, endpoint, **kwargs)
+        if response.status_code == HTTP_STATUS_NOT_MODIFIED and entry is not None:
+            cache.renew(self._cache_scope, endpoint)
+            return entry.data
+        data = self._handle_response(response)
+        cache.store(
+            self._cache_scope, endpoint, data, response.headers.get("ETag"), generation
+        )
+        return data
+
+    def _invalidate_endpoint(self, endpoint: str) -> None:
+        form_id = form_id_of(endpoint)
+        if form_id is not None:
+            self.invalidate_form_cache(form_id)
+
+    def invalidate_form_cache(self, form_id: str) -> None:
+        """Drop cached metadata of a form so the next read hits the API."""
+        self.metadata_cache.invalidate_form(self._cache_scope, form_id)
+
+    async def _request(
+        self, method: str, url: str, endpoint: str, **kwargs
+    ) -> httpx.Response:
         logger.debug(
             "Making HTTP request",
             method=method,
@@ -453,7 +533,7 @@ async def _make_request(
             endpoint=endpoint,
         )
         try:
-            response = await self.client.request(method, url, **kwargs)
+            response = await self._send(method, url, **kwargs)
         except httpx.ConnectError:
             logger.error(
                 "Connect error during HTTP request",
@@ -479,7 +559,7 @@ async def _make_request(
             endpoint=endpoint,
             response_success=200 <= response.status_code < 300,
         )
-        return self._handle_response(response)
+        return response
 
     async def validate_form_access(self, form_id: str) -> FormInfo:
         """Validate access to a TypeForm form and return form information.
@@ -1093,12 +1173,14 @@ async def delete_webhook(self, form_id: str, tag: str) -> bool:
             form_id=form_id,
             action="webhook_delete_start",
         )
-        await self._enforce_rate_limit()
         path = f"forms/{form_id}/webhooks/{tag}"
 
         url = self._build_url(path)
         logger.debug("Making DELETE request", url=url, action="http_delete")
-        response = await self.client.delete(url)
+        try:
+            response = await self._send("DELETE", url)
+        finally:
+            self.invalidate_form_cache(form_id)
         if response.status_code == HTTP_STATUS_NO_CONTENT:
             logger.info(
                 "Webhook deleted successfully",
@@ -1171,13 +1253,19 @@ async def _test_webhook_endpoint(self, url: str) -> httpx.Response:
             return response
 
 
-def create_typeform_client(api_key: str | None = None) -> TypeFormClient:
+def create_typeform_client(
+    api_key: str | None = None,
+    base_url: str | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> TypeFormClient:
     """Create a new TypeForm client instance.
 
     Args:
         api_key: Optional API key override. Uses config default if not provided.
+        base_url: Optional API base URL override (e.g. a local fake server).
+        transport: Optional httpx transport, for tests against a fake server.
 
     Returns:
         Configured TypeFormClient instance.
     """
-    return TypeFormClient(api_key=api_key)
+    return TypeFormClient(api_key=api_key, base_url=base_url, transport=transport)
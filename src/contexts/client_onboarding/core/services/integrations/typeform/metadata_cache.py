@@ -0,0 +1,173 @@
+"""Process-wide cache of TypeForm form and webhook metadata.
+
+Form info and webhook listings are read for ownership validation, status
+checks and synchronization but rarely change. :class:`TypeFormMetadataCache`
+keeps successful GET responses per API key and endpoint for a bounded time.
+Expired entries that carried an ``ETag`` are kept so the next request can
+revalidate them with ``If-None-Match``; a 304 answer renews the entry without
+transferring the body again.
+
+Every write to a form (webhook create, update or delete) invalidates the
+entries of that form. A load that races with an invalidation is not stored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+from src.contexts.client_onboarding.config import config
+from src.contexts.seedwork.adapters.caching import LruTtlCache
+
+type CacheKey = tuple[str, str]
+
+
+class CachedResponse:
+    """Cached response body of one endpoint.
+
+    Attributes:
+        data: Decoded JSON body; shared, must not be mutated.
+        etag: ``ETag`` header of the response, if any.
+    """
+
+    __slots__ = ("data", "etag")
+
+    def __init__(self, data: dict[str, Any], etag: str | None):
+        self.data = data
+        self.etag = etag
+
+
+def cache_scope(api_key: str) -> str:
+    """Return the cache scope of an API key (accounts see different data)."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def form_id_of(endpoint: str) -> str | None:
+    """Return the form id of a ``forms/{form_id}[/...]`` endpoint."""
+    parts = endpoint.strip("/").split("/")
+    if len(parts) >= 2 and parts[0] == "forms":
+        return parts[1]
+    return None
+
+
+class TypeFormMetadataCache:
+    """Bounded LRU cache of TypeForm GET responses with per-entry TTL.
+
+    Entries are keyed by (scope, endpoint) and indexed by form so writes can
+    evict every endpoint of a form at once. Expired entries stay until
+    evicted so they can be revalidated.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300.0):
+        self.ttl = ttl
+        self._entries: LruTtlCache[CacheKey, CachedResponse] = LruTtlCache(
+            max_entries, keep_expired=True, on_drop=self._unindex
+        )
+        self._form_keys: dict[CacheKey, set[CacheKey]] = {}
+        # Invalidation counter; each form records the value of its last
+        # invalidation. Records beyond max_entries are forgotten and raise
+        # the floor instead, so a load older than the floor is not stored.
+        self._generation = 0
+        self._invalidated: OrderedDict[CacheKey, int] = OrderedDict()
+        self._floor = 0
+        self.revalidated = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        return self._entries.max_entries
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def lookup(self, scope: str, endpoint: str) -> CachedResponse | None:
+        """Return the fresh entry of an endpoint, counting a hit or a miss."""
+        return self._entries.get((scope, endpoint))
+
+    def stale(self, scope: str, endpoint: str) -> CachedResponse | None:
+        """Return the expired entry of an endpoint, to revalidate with its ETag."""
+        return self._entries.peek((scope, endpoint))
+
+    def generation(self) -> int:
+        """Return the invalidation counter, to pass to `store` after a load."""
+        return self._generation
+
+    def store(
+        self,
+        scope: str,
+        endpoint: str,
+        data: dict[str, Any],
+        etag: str | None,
+        generation: int,
+    ) -> None:
+        """Cache a successful response unless its form was invalidated since
+        `generation` was read.
+        """
+        form_id = form_id_of(endpoint)
+        if form_id is None or generation < self._floor:
+            return
+        if generation < self._invalidated.get((scope, form_id), 0):
+            return
+        key = (scope, endpoint)
+        self._entries.set(key, CachedResponse(data, etag), self.ttl)
+        self._form_keys.setdefault((scope, form_id), set()).add(key)
+
+    def renew(self, scope: str, endpoint: str) -> None:
+        """Extend an entry confirmed unchanged by a 304 response."""
+        if self._entries.touch((scope, endpoint), self.ttl):
+            self.revalidated += 1
+
+    def invalidate_form(self, scope: str, form_id: str) -> None:
+        """Evict every endpoint of a form."""
+        form_key = (scope, form_id)
+        self._generation += 1
+        self._invalidated.pop(form_key, None)
+        self._invalidated[form_key] = self._generation
+        while len(self._invalidated) > max(self.max_entries, 1):
+            _, self._floor = self._invalidated.popitem(last=False)
+        for key in self._form_keys.pop(form_key, ()):
+            if self._entries.pop(key) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Evict every entry."""
+        self._generation += 1
+        self._floor = self._generation
+        self._invalidated.clear()
+        self._entries.clear()
+        self._form_keys.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss counters and current occupancy."""
+        return {
+            **self._entries.stats(),
+            "revalidated": self.revalidated,
+            "invalidations": self.invalidations,
+        }
+
+    def _unindex(self, key: CacheKey, _: CachedResponse) -> None:
+        form_id = form_id_of(key[1])
+        keys = self._form_keys.get((key[0], form_id)) if form_id else None
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._form_keys[(key[0], form_id)]
+
+
+@lru_cache
+def get_typeform_metadata_cache() -> TypeFormMetadataCache:
+    """Return the process-wide TypeForm metadata cache.
+
+    Sized by ``typeform_metadata_cache_max_entries`` and
+    ``typeform_metadata_cache_ttl_seconds`` (see ``ClientOnboardingConfig``).
+    """
+    return TypeFormMetadataCache(
+        max_entries=config.typeform_metadata_cache_max_entries,
+        ttl=config.typeform_metadata_cache_ttl_seconds,
+    )
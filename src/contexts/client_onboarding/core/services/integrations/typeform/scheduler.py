@@ -0,0 +1,198 @@
+"""Request scheduling for the TypeForm API.
+
+TypeForm rate limits per account (API key), not per client instance, so the
+token bucket is shared process-wide per API key. Each `TypeFormClient` owns a
+`RequestScheduler` that caps its concurrent requests, waits for a token
+before each request, pauses the shared bucket when TypeForm answers 429 with
+``Retry-After`` and coalesces identical in-flight GETs. Fanned-out requests
+therefore complete in about max(latency, N / rate) instead of the sum of
+their latencies.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+import anyio
+import httpx
+from src.contexts.seedwork.adapters.caching import SingleFlight
+from src.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+HTTP_STATUS_TOO_MANY_REQUESTS = 429
+
+
+class TokenBucket:
+    """Token bucket rate limiter (GCRA), fair in call order.
+
+    Each acquisition reserves the next free slot up front, so concurrent
+    callers never wake up together and race for the same token.
+
+    Attributes:
+        rate: Tokens added per second.
+        capacity: Maximum burst of back-to-back acquisitions.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._interval = 1.0 / rate
+        # Theoretical arrival time of the next request
+        self._tat = 0.0
+        self._paused_until = 0.0
+        self.acquired = 0
+        self.waited_seconds = 0.0
+
+    def reserve(self) -> float:
+        """Reserve a token and return how long to wait before using it."""
+        now = time.monotonic()
+        tat = max(self._tat, now, self._paused_until)
+        allowed_at = max(tat - (self.capacity - 1) * self._interval, self._paused_until)
+        self._tat = tat + self._interval
+        self.acquired += 1
+        return max(0.0, allowed_at - now)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            self.waited_seconds += delay
+            await anyio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next `seconds` (e.g. ``Retry-After``)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tat = max(self._tat, self._paused_until)
+
+
+_buckets: dict[bytes, TokenBucket] = {}
+
+
+def get_token_bucket(api_key: str, rate: float, capacity: float = 1.0) -> TokenBucket:
+    """Return the process-wide token bucket of an API key.
+
+    Args:
+        api_key: TypeForm API key; only its SHA-256 digest is kept.
+        rate: Requests per second allowed for the key.
+        capacity: Burst size.
+    """
+    digest = hashlib.sha256(api_key.encode()).digest()
+    bucket = _buckets.get(digest)
+    if bucket is None or bucket.rate != rate or bucket.capacity != max(capacity, 1.0):
+        bucket = _buckets[digest] = TokenBucket(rate, capacity)
+    return bucket
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    """Return the ``Retry-After`` delay of a response in seconds, if any."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class RequestScheduler:
+    """Bounded-concurrency, rate-limited request runner of one client.
+
+    Attributes:
+        bucket: Token bucket shared by every client of the API key.
+        max_concurrency: Maximum requests in flight for this client.
+        max_retries: Retries of a request answered with 429.
+        base_backoff: Retry delay in seconds when 429 has no ``Retry-After``;
+            doubled on each retry.
+
+    Notes:
+        Designed for a single event loop; the limiter is created lazily so
+        the scheduler can be built outside one.
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        *,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        base_backoff: float = 1.0,
+    ):
+        self.bucket = bucket
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self._limiter: anyio.CapacityLimiter | None = None
+        self._flights: SingleFlight[Hashable, Any] = SingleFlight()
+        self.requests = 0
+        self.retries = 0
+
+    @property
+    def coalesced(self) -> int:
+        """GETs answered by an identical request already in flight."""
+        return self._flights.coalesced
+
+    def _get_limiter(self) -> anyio.CapacityLimiter:
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.max_concurrency)
+        return self._limiter
+
+    async def run(
+        self, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Send a request once a token is available, retrying 429 responses.
+
+        Args:
+            send: Sends the request; called once per attempt.
+
+        Returns:
+            The first non-429 response, or the last 429 once retries are
+            exhausted.
+        """
+        attempt = 0
+        while True:
+            async with self._get_limiter():
+                await self.bucket.acquire()
+                self.requests += 1
+                response = await send()
+            if (
+                response.status_code != HTTP_STATUS_TOO_MANY_REQUESTS
+                or attempt >= self.max_retries
+            ):
+                return response
+            delay = parse_retry_after(response)
+            if delay is None:
+                delay = self.base_backoff * 2**attempt
+            # Every client of this API key backs off, not only this one
+            self.bucket.pause(delay)
+            attempt += 1
+            self.retries += 1
+            logger.warning(
+                "TypeForm rate limited, backing off",
+                retry_after_seconds=delay,
+                attempt=attempt,
+                action="rate_limit_backoff",
+            )
+
+    async def coalesce(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `fetch` once for concurrent callers sharing `key`.
+
+        Callers arriving while a fetch for `key` is in flight wait for it and
+        get its result (or its exception) instead of sending a duplicate.
+        """
+        return await self._flights.run(key, fetch)
+
+    def stats(self) -> dict[str, Any]:
+        """Return request, retry and coalescing counters."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "coalesced": self.coalesced,
+            "max_concurrency": self.max_concurrency,
+            "rate_limit_wait_seconds": round(self.bucket.waited_seconds, 3),
+        }
@@ -4,6 +4,8 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable
 
+import anyio
+
 # Re-export of the existing implementation to the new location.
 # The content is moved verbatim from services/webhook_manager.py to maintain behavior.
 from src.logging.logger import get_logger
@@ -653,56 +655,69 @@ async def get_comprehensive_webhook_status(
                 raise WebhookConfigurationError(
                     f"Onboarding form {onboarding_form_id} not found"
                 )
-            issues: list[str] = []
-            webhook_info: WebhookInfo | None = None
-            webhook_exists = False
-            try:
-                webhook_info = await self.typeform_client.get_webhook(
-                    form_id=onboarding_form.typeform_id,
-                    tag=self.webhook_tag,
-                )
-                webhook_exists = True
-                logger.info("Webhook found", webhook_id=webhook_info.id, action="webhook_found", business_context="webhook_management")
-            except TypeFormFormNotFoundError:
-                logger.info(
-                    "No webhook found for form",
-                    typeform_id=onboarding_form.typeform_id,
-                    action="webhook_not_found",
-                    business_context="webhook_management"
-                )
-                webhook_exists = False
-            except Exception as e:
-                issues.append(f"Error checking webhook status: {e}")
-                logger.warning(
-                    "Error checking webhook status",
-                    action="webhook_status_check_error",
-                    error_type=type(e).__name__,
-                    error_message=str(e),
-                    resolution_hint="Verify TypeForm API connectivity and webhook configuration"
-                )
+            return await self._check_webhook_status(onboarding_form)
 
-            status_synchronized = self._check_status_synchronization(
-                onboarding_form, webhook_info, webhook_exists
-            )
-            if not status_synchronized:
-                issues.append("Database and TypeForm webhook status not synchronized")
+    async def _check_webhook_status(
+        self, onboarding_form: OnboardingForm
+    ) -> WebhookStatusInfo:
+        """Compare a loaded onboarding form with its TypeForm webhook.
 
-            if webhook_exists and webhook_info and onboarding_form.webhook_url and webhook_info.url != onboarding_form.webhook_url:
-                    issues.append(
-                        f"Webhook URL mismatch: DB={onboarding_form.webhook_url}, TypeForm={webhook_info.url}"
-                    )
+        Args:
+            onboarding_form: Database onboarding form record.
 
-            return WebhookStatusInfo(
-                onboarding_form_id=onboarding_form_id,
+        Returns:
+            WebhookStatusInfo with status and issue analysis.
+        """
+        issues: list[str] = []
+        webhook_info: WebhookInfo | None = None
+        webhook_exists = False
+        try:
+            webhook_info = await self.typeform_client.get_webhook(
+                form_id=onboarding_form.typeform_id,
+                tag=self.webhook_tag,
+            )
+            webhook_exists = True
+            logger.info("Webhook found", webhook_id=webhook_info.id, action="webhook_found", business_context="webhook_management")
+        except TypeFormFormNotFoundError:
+            logger.info(
+                "No webhook found for form",
                 typeform_id=onboarding_form.typeform_id,
-                webhook_exists=webhook_exists,
-                webhook_info=webhook_info,
-                database_status=onboarding_form.status.value,
-                database_webhook_url=onboarding_form.webhook_url,
-                status_synchronized=status_synchronized,
-                last_checked=datetime.now(),
-                issues=issues,
+                action="webhook_not_found",
+                business_context="webhook_management"
             )
+            webhook_exists = False
+        except Exception as e:
+            issues.append(f"Error checking webhook status: {e}")
+            logger.warning(
+                "Error checking webhook status",
+                action="webhook_status_check_error",
+                error_type=type(e).__name__,
+                error_message=str(e),
+                resolution_hint="Verify TypeForm API connectivity and webhook configuration"
+            )
+
+        status_synchronized = self._check_status_synchronization(
+            onboarding_form, webhook_info, webhook_exists
+        )
+        if not status_synchronized:
+            issues.append("Database and TypeForm webhook status not synchronized")
+
+        if webhook_exists and webhook_info and onboarding_form.webhook_url and webhook_info.url != onboarding_form.webhook_url:
+                issues.append(
+                    f"Webhook URL mismatch: DB={onboarding_form.webhook_url}, TypeForm={webhook_info.url}"
+                )
+
+        return WebhookStatusInfo(
+            onboarding_form_id=onboarding_form.id,
+            typeform_id=onboarding_form.typeform_id,
+            webhook_exists=webhook_exists,
+            webhook_info=webhook_info,
+            database_status=onboarding_form.status.value,
+            database_webhook_url=onboarding_form.webhook_url,
+            status_synchronized=status_synchronized,
+            last_checked=datetime.now(),
+            issues=issues,
+        )
 
     async def bulk_webhook_status_check(
         self, uow_factory: Callable[[],UnitOfWork], user_id: str, include_deleted: bool = False
@@ -725,37 +740,40 @@ async def bulk_webhook_status_check(
         )
         async with uow_factory() as uow:
             forms = await uow.onboarding_forms.get_by_user_id(user_id)
-            if not include_deleted:
-                forms = [f for f in forms if f.status != OnboardingFormStatus.DELETED]
-            logger.info(
-                "Checking onboarding forms",
-                form_count=len(forms),
-                user_id_suffix=user_id[-4:] if len(user_id) >= 4 else user_id,  # Last 4 chars for debugging
-                action="forms_check_start",
-                business_context="webhook_management"
-            )
-            status_results: list[WebhookStatusInfo] = []
-            for form in forms:
-                try:
-                    status_info = await self.get_comprehensive_webhook_status(
-                        uow_factory, form.id
-                    )
-                    status_results.append(status_info)
-                except Exception as e:
-                    logger.error("Error checking form status", form_id=form.id, error=str(e), action="form_status_check_error")
-                    error_status = WebhookStatusInfo(
-                        onboarding_form_id=form.id,
-                        typeform_id=form.typeform_id,
-                        webhook_exists=False,
-                        webhook_info=None,
-                        database_status=form.status.value,
-                        database_webhook_url=form.webhook_url,
-                        status_synchronized=False,
-                        last_checked=datetime.now(),
-                        issues=[f"Error during status check: {e}"],
-                    )
-                    status_results.append(error_status)
-            return status_results
+        if not include_deleted:
+            forms = [f for f in forms if f.status != OnboardingFormStatus.DELETED]
+        logger.info(
+            "Checking onboarding forms",
+            form_count=len(forms),
+            user_id_suffix=user_id[-4:] if len(user_id) >= 4 else user_id,  # Last 4 chars for debugging
+            action="forms_check_start",
+            business_context="webhook_management"
+        )
+        # TypeForm lookups run concurrently; the client's scheduler bounds
+        # them and paces them to the API key's rate limit
+        status_results: list[WebhookStatusInfo | None] = [None] * len(forms)
+
+        async def check(index: int, form: OnboardingForm) -> None:
+            try:
+                status_results[index] = await self._check_webhook_status(form)
+            except Exception as e:
+                logger.error("Error checking form status", form_id=form.id, error=str(e), action="form_status_check_error")
+                status_results[index] = WebhookStatusInfo(
+                    onboarding_form_id=form.id,
+                    typeform_id=form.typeform_id,
+                    webhook_exists=False,
+                    webhook_info=None,
+                    database_status=form.status.value,
+                    database_webhook_url=form.webhook_url,
+                    status_synchronized=False,
+                    last_checked=datetime.now(),
+                    issues=[f"Error during status check: {e}"],
+                )
+
+        async with anyio.create_task_group() as tg:
+            for index, form in enumerate(forms):
+                tg.start_soon(check, index, form)
+        return [status for status in status_results if status is not None]
 
     async def track_webhook_operation(
         self,
@@ -838,6 +856,11 @@ async def synchronize_webhook_status(
                 action="webhook_sync_already_done"
             )
             return True
+        # Never update the database from cached TypeForm metadata
+        self.typeform_client.invalidate_form_cache(status_info.typeform_id)
+        status_info = await self.get_comprehensive_webhook_status(
+            uow_factory, onboarding_form_id
+        )
         async with uow_factory() as uow:
             onboarding_form = await uow.onboarding_forms.get_by_id(onboarding_form_id)
             if not onboarding_form:
@@ -0,0 +1,169 @@
+"""Replay-protection stores for webhook request fingerprints.
+
+A fingerprint (payload hash + signature) is remembered for the replay window;
+seeing it again within that window marks the request as a replay.
+
+Two stores are available:
+
+- :class:`InMemoryReplayStore`: per-process store on the shared LRU/TTL
+  cache; expired fingerprints are purged from its oldest end, so expiring
+  and bounding the store cost amortized O(1) per request instead of a scan
+  of every fingerprint.
+- :class:`SharedReplayStore`: store on top of any
+  :class:`SharedFingerprintStore` (e.g. Redis), so several webhook workers
+  see the same fingerprints. :class:`InMemoryFingerprintStore` is a local
+  stand-in.
+"""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+from src.contexts.client_onboarding.config import config
+from src.contexts.seedwork.adapters.caching import LruTtlCache
+
+
+class ReplayStore(Protocol):
+    """Contract for webhook replay-protection stores."""
+
+    async def seen_or_add(self, fingerprint: str, ttl: float) -> bool:
+        """Return True if fingerprint is known; otherwise remember it for
+        ttl seconds and return False, atomically.
+        """
+        ...
+
+    async def add(self, fingerprint: str, ttl: float) -> None:
+        """Remember fingerprint for ttl seconds."""
+        ...
+
+    async def clear(self) -> None:
+        """Forget every fingerprint."""
+        ...
+
+
+class SharedFingerprintStore(Protocol):
+    """Minimal key contract required by :class:`SharedReplayStore`.
+
+    Maps directly onto Redis ``SET NX PX``/``SET PX``.
+    """
+
+    async def set_if_absent(self, key: str, ttl: float) -> bool:
+        """Store key for ttl seconds unless present; return True if stored."""
+        ...
+
+    async def set(self, key: str, ttl: float) -> None:
+        """Store key for ttl seconds."""
+        ...
+
+    async def flush(self) -> None:
+        """Remove every key owned by the store."""
+        ...
+
+
+class InMemoryReplayStore:
+    """Bounded in-process fingerprint store.
+
+    Fingerprints live in an LRU/TTL cache for their ttl. Each request first
+    purges expired fingerprints from the least recently used end; when
+    ``max_entries`` is exceeded the least recently seen fingerprint is
+    evicted. Operations never await, so check-and-add needs no lock.
+    """
+
+    def __init__(self, max_entries: int = 5000):
+        self._entries: LruTtlCache[str, bool] = LruTtlCache(max_entries)
+        self.replays = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        return self._entries.max_entries
+
+    async def seen_or_add(self, fingerprint: str, ttl: float) -> bool:
+        self._entries.purge_expired()
+        if self._entries.get(fingerprint):
+            self.replays += 1
+            return True
+        self._entries.set(fingerprint, True, ttl)
+        return False
+
+    async def add(self, fingerprint: str, ttl: float) -> None:
+        self._entries.purge_expired()
+        self._entries.set(fingerprint, True, ttl)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return replay/expiry counters and current occupancy."""
+        return {**self._entries.stats(), "replays": self.replays}
+
+
+class SharedReplayStore:
+    """Replay store backed by an external key store shared by workers.
+
+    Expiry is delegated to the backend's key TTL, and check-and-add is a
+    single atomic ``set_if_absent``.
+    """
+
+    def __init__(
+        self, store: SharedFingerprintStore, *, prefix: str = "webhook-replay"
+    ):
+        self._store = store
+        self._prefix = prefix
+
+    def _key(self, fingerprint: str) -> str:
+        return f"{self._prefix}:{fingerprint}"
+
+    async def seen_or_add(self, fingerprint: str, ttl: float) -> bool:
+        return not await self._store.set_if_absent(self._key(fingerprint), ttl)
+
+    async def add(self, fingerprint: str, ttl: float) -> None:
+        await self._store.set(self._key(fingerprint), ttl)
+
+    async def clear(self) -> None:
+        await self._store.flush()
+
+
+class InMemoryFingerprintStore:
+    """Local stand-in for a shared fingerprint store (tests, single process)."""
+
+    def __init__(self, max_entries: int = 5000):
+        self._store = InMemoryReplayStore(max_entries)
+
+    async def set_if_absent(self, key: str, ttl: float) -> bool:
+        return not await self._store.seen_or_add(key, ttl)
+
+    async def set(self, key: str, ttl: float) -> None:
+        await self._store.add(key, ttl)
+
+    async def flush(self) -> None:
+        await self._store.clear()
+
+
+_replay_store: ReplayStore | None = None
+
+
+def get_replay_store() -> ReplayStore:
+    """Return the process-wide replay store.
+
+    Defaults to an :class:`InMemoryReplayStore` sized by
+    ``webhook_replay_cache_max_entries`` (see ``ClientOnboardingConfig``).
+    """
+    global _replay_store
+    if _replay_store is None:
+        _replay_store = InMemoryReplayStore(
+            max_entries=config.webhook_replay_cache_max_entries
+        )
+    return _replay_store
+
+
+def set_replay_store(store: ReplayStore | None) -> None:
+    """Install the process-wide replay store.
+
+    Install a :class:`SharedReplayStore` so every webhook worker sees the
+    same fingerprints; None restores the in-memory default.
+    """
+    global _replay_store
+    _replay_store = store
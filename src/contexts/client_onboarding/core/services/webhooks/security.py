@@ -11,16 +11,17 @@
 
 # Directly moved from services/webhook_security.py to webhooks/security.py
 import hmac
-import time
 from datetime import UTC, datetime
-from typing import ClassVar
 
-import anyio
 from src.contexts.client_onboarding.config import config
 from src.contexts.client_onboarding.core.services.exceptions import (
     WebhookPayloadError,
     WebhookSecurityError,
 )
+from src.contexts.client_onboarding.core.services.webhooks.replay_store import (
+    ReplayStore,
+    get_replay_store,
+)
 from src.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -34,16 +35,21 @@ class WebhookSecurityVerifier:
     """
 
     _replay_window_minutes: int = 10
-    _global_replay_cache: ClassVar[dict[str, float]] = {}
-    _global_cache_lock: anyio.Lock = anyio.Lock()
 
-    def __init__(self, webhook_secret: str | None = None):
+    def __init__(
+        self,
+        webhook_secret: str | None = None,
+        replay_store: ReplayStore | None = None,
+    ):
         """Initialize the webhook security verifier.
 
         Args:
             webhook_secret: Optional webhook secret for signature verification.
+            replay_store: Store of seen request fingerprints; defaults to the
+                process-wide store.
         """
         self.webhook_secret = webhook_secret or config.typeform_webhook_secret
+        self.replay_store = replay_store or get_replay_store()
         self.signature_header = config.webhook_signature_header
         self.max_payload_size = config.max_webhook_payload_size
         self._processed_requests: set[str] = set()
@@ -280,27 +286,9 @@ async def _check_replay_protection(
         payload_hash = self._get_payload_hash(payload)
         signature = self._extract_signature(headers)
         request_fingerprint = f"{payload_hash}:{signature}"
-        now = time.time()
-        ttl_seconds = self._replay_window_minutes * 60
-        async with self._global_cache_lock:
-            if self._global_replay_cache:
-                expired_keys = [
-                    k for k, exp in self._global_replay_cache.items() if exp <= now
-                ]
-                for k in expired_keys:
-                    self._global_replay_cache.pop(k, None)
-            if request_fingerprint in self._global_replay_cache:
-                return True
-            self._global_replay_cache[request_fingerprint] = now + ttl_seconds
-            if len(self._global_replay_cache) > 5000:
-                sorted_items = sorted(
-                    self._global_replay_cache.items(), key=lambda item: item[1]
-                )
-                halfway_index = len(sorted_items) // 2
-                for k, _ in sorted_items[:halfway_index]:
-                    self._global_replay_cache.pop(k, None)
-                logger.debug("Cleaned up replay protection cache (size-based)")
-        return False
+        return await self.replay_store.seen_or_add(
+            request_fingerprint, self._replay_window_minutes * 60
+        )
 
     @classmethod
     async def mark_request_processed(
@@ -308,6 +296,8 @@ async def mark_request_processed(
     ) -> None:
         """Mark a webhook request as processed for replay protection.
 
+        Records the fingerprint in the process-wide replay store.
+
         Args:
             payload: Raw webhook payload string.
             headers: HTTP headers from the webhook request.
@@ -321,18 +311,9 @@ async def mark_request_processed(
         if signature_value.startswith("sha256="):
             signature_value = signature_value[7:]
         request_fingerprint = f"{payload_hash}:{signature_value}"
-        now = time.time()
-        ttl_seconds = cls._replay_window_minutes * 60
-        async with cls._global_cache_lock:
-            if cls._global_replay_cache:
-                expired_keys = [
-                    k for k, exp in cls._global_replay_cache.items() if exp <= now
-                ]
-                for k in expired_keys:
-                    cls._global_replay_cache.pop(k, None)
-            cls._global_replay_cache[request_fingerprint] = now + ttl_seconds
-
-
+        await get_replay_store().add(
+            request_fingerprint, cls._replay_window_minutes * 60
+        )
 
     def _get_payload_hash(self, payload: str) -> str:
         """Generate SHA256 hash of the payload for fingerprinting.
@@ -18,7 +18,6 @@
 if TYPE_CHECKING:
     from src.contexts.shared_kernel.services.messagebus import MessageBus
 
-import anyio
 from src.contexts.iam.core.bootstrap.container import Container
 from src.contexts.iam.core.domain.commands import AssignRoleToUser
 from src.contexts.iam.core.domain.enums import Permission
@@ -31,6 +30,7 @@
 from src.contexts.shared_kernel.middleware.error_handling.exception_handler import (
     aws_lambda_exception_handler_middleware,
 )
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -133,4 +133,4 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         Generates correlation ID for request tracing.
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
+    return run_lambda_handler(async_handler, event, context)
@@ -7,7 +7,6 @@
 import json
 from typing import TYPE_CHECKING, Any
 
-import anyio
 from src.config.app_config import get_app_settings
 from src.contexts.iam.core.adapters.api_schemas.commands.api_create_user import (
     ApiCreateUser,
@@ -23,6 +22,7 @@
 from src.contexts.shared_kernel.middleware.error_handling.exception_handler import (
     aws_lambda_exception_handler_middleware,
 )
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -113,4 +113,4 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         Generates correlation ID for request tracing.
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
+    return run_lambda_handler(async_handler, event, context)
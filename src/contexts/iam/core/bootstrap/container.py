@@ -6,7 +6,7 @@
 
 from dependency_injector import containers, providers
 from src.contexts.iam.core.services.uow import UnitOfWork
-from src.db.fastapi_database import fastapi_db
+from src.db.fastapi_database import get_fastapi_database
 
 from .bootstrap import bootstrap
 
@@ -29,7 +29,7 @@ class Container(containers.DeclarativeContainer):
     """
     wiring_config = containers.WiringConfiguration(modules=[__name__])
 
-    database = providers.Object(fastapi_db)
+    database = providers.Callable(get_fastapi_database)
     uow_factory = providers.Factory(
         UnitOfWork, session_factory=database.provided.async_session_factory
     )
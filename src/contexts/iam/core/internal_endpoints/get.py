@@ -8,7 +8,7 @@
 
 import json
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from src.contexts.iam.core.adapters.api_schemas.root_aggregate.api_user import ApiUser
 from src.contexts.iam.core.bootstrap.container import Container
@@ -42,6 +42,29 @@ async def get(id: str, caller_context: str) -> dict[str, int | str]:
             - statusCode: HTTP status code (200, 404, or 500)
             - body: JSON string with user data or error message
 
+    Notes:
+        Serializing wrapper around :func:`get_user_data` for callers outside
+        this process.
+    """
+    response = await get_user_data(id, caller_context)
+    return {"statusCode": response["statusCode"], "body": json.dumps(response["body"])}
+
+
+async def get_user_data(id: str, caller_context: str) -> dict[str, Any]:
+    """Retrieve user data filtered by caller context without serializing.
+
+    Same contract as :func:`get`, but ``body`` is the plain dict instead of a
+    JSON string, so in-process callers can validate it directly.
+
+    Args:
+        id: UUID v4 identifier of the user to retrieve.
+        caller_context: Context string to filter user roles by.
+
+    Returns:
+        HTTP response dict containing:
+            - statusCode: HTTP status code (200, 404, or 500)
+            - body: ``{"id", "roles"}`` on success, ``{"message"}`` on error
+
     Raises:
         EntityNotFoundError: When user with id does not exist.
         MultipleEntitiesFoundError: When multiple users found for id.
@@ -94,7 +117,7 @@ async def get(id: str, caller_context: str) -> dict[str, int | str]:
             )
             return {
                 "statusCode": 404,
-                "body": json.dumps({"message": "User not in database."}),
+                "body": {"message": "User not in database."},
             }
         except MultipleEntitiesFoundError:
             elapsed_time = time.time() - start_time
@@ -108,7 +131,7 @@ async def get(id: str, caller_context: str) -> dict[str, int | str]:
             )
             return {
                 "statusCode": 500,
-                "body": json.dumps({"message": "Multiple users found in database."}),
+                "body": {"message": "Multiple users found in database."},
             }
         except Exception as e:
             elapsed_time = time.time() - start_time
@@ -125,7 +148,7 @@ async def get(id: str, caller_context: str) -> dict[str, int | str]:
             )
             return {
                 "statusCode": 500,
-                "body": json.dumps({"message": "Internal server error."}),
+                "body": {"message": "Internal server error."},
             }
 
         # logger.debug(
@@ -151,7 +174,7 @@ async def get(id: str, caller_context: str) -> dict[str, int | str]:
 
 def _get_user_data_with_right_context_roles(
     user: User, caller_context: str
-) -> dict[str, int | str]:
+) -> dict[str, Any]:
     """Filter user roles by caller context and prepare API response.
 
     Converts domain User entity to API schema, filters roles by caller context,
@@ -165,7 +188,7 @@ def _get_user_data_with_right_context_roles(
     Returns:
         HTTP response dict with:
             - statusCode: 200 (always successful)
-            - body: JSON string containing user ID and filtered roles
+            - body: dict containing user ID and filtered roles
 
     Notes:
         Side effect: logs role filtering details for debugging.
@@ -226,14 +249,12 @@ def _get_user_data_with_right_context_roles(
         filtered_role = {"name": role.name, "permissions": list(role.permissions)}
         filtered_roles.append(filtered_role)
 
-    response_data = {"id": api_user.id, "roles": filtered_roles}
-    response_body = json.dumps(response_data)
+    response_body = {"id": api_user.id, "roles": filtered_roles}
 
     logger.debug(
         "API response generated successfully",
         operation="api_response_generation",
         user_id=user.id,
         response_roles_count=len(caller_context_roles),
-        response_size_bytes=len(response_body),
     )
-    return {"statusCode": 200} | {"body": response_body}
+    return {"statusCode": 200, "body": response_body}
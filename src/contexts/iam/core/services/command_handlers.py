@@ -16,6 +16,7 @@
     EntityNotFoundError,
     MultipleEntitiesFoundError,
 )
+from src.contexts.shared_kernel.middleware.auth.user_cache import get_iam_user_cache
 from src.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -56,6 +57,8 @@ async def create_user(cmd: CreateUser, uow: UnitOfWork) -> None:
             )
             await uow.users.add(user)
             await uow.commit()
+            # Drop a cached "user not found" lookup
+            get_iam_user_cache().invalidate_user(cmd.user_id)
         else:
             logger.info(
                 "User already exists",
@@ -88,12 +91,14 @@ async def assign_role_to_user(cmd: AssignRoleToUser, uow: UnitOfWork) -> None:
 
     Side Effects:
         Updates User aggregate with new role, persists to database.
+        Evicts the user from the process-wide IAM user cache.
     """
     async with uow:
         user = await uow.users.get(cmd.user_id)
         user.assign_role(cmd.role)
         await uow.users.persist(user)
         await uow.commit()
+    get_iam_user_cache().invalidate_user(cmd.user_id)
 
 
 async def remove_role_from_user(cmd: RemoveRoleFromUser, uow: UnitOfWork) -> None:
@@ -117,9 +122,11 @@ async def remove_role_from_user(cmd: RemoveRoleFromUser, uow: UnitOfWork) -> Non
 
     Side Effects:
         Updates User aggregate by removing role, persists to database.
+        Evicts the user from the process-wide IAM user cache.
     """
     async with uow:
         user = await uow.users.get(cmd.user_id)
         user.remove_role(cmd.role)
         await uow.users.persist(user)
         await uow.commit()
+    get_iam_user_cache().invalidate_user(cmd.user_id)
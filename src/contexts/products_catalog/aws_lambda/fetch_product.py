@@ -18,8 +18,7 @@
     from src.contexts.products_catalog.core.services.uow import UnitOfWork
     from src.contexts.shared_kernel.services.messagebus import MessageBus
 
-import anyio
-from pydantic import TypeAdapter
+from pydantic import ConfigDict, TypeAdapter
 from src.contexts.products_catalog.core.bootstrap.container import Container
 from src.contexts.shared_kernel.middleware.auth.authentication import (
     products_aws_auth_middleware,
@@ -31,6 +30,7 @@
     aws_lambda_exception_handler_middleware,
 )
 from src.contexts.shared_kernel.middleware.lambda_helpers import LambdaHelpers
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -40,7 +40,10 @@
 
 container = Container()
 
-ProductListTypeAdapter = TypeAdapter(list[ApiProduct])
+# Schemas are built on first dump, not during Lambda module init
+ProductListTypeAdapter = TypeAdapter(
+    list[ApiProduct], config=ConfigDict(defer_build=True)
+)
 
 # Structured logger for this handler
 logger = get_logger("products_catalog.fetch_product")
@@ -84,6 +87,8 @@ async def async_handler(event: dict[str, Any], _: Any) -> dict[str, Any]:
     Notes:
         Maps to UnitOfWork.products.query() and translates errors to HTTP codes.
         Supports pagination, sorting, and filtering. Default limit: 50, sort: -updated_at.
+        Full pages carry an X-Next-Cursor header; pass it back as `cursor`
+        for keyset pagination. skip/limit keeps working as a fallback.
         Logs conversion errors but continues processing remaining products.
     """
 
@@ -107,6 +112,7 @@ async def async_handler(event: dict[str, Any], _: Any) -> dict[str, Any]:
     uow: UnitOfWork
     async with bus.uow_factory() as uow:
         result: list[Product] = await uow.products.query(filters=filters)
+        next_cursor = uow.products.next_cursor(result, filters)
 
     logger.info(
         "Product query completed successfully",
@@ -165,7 +171,7 @@ async def async_handler(event: dict[str, Any], _: Any) -> dict[str, Any]:
 
     return {
         "statusCode": 200,
-        "headers": API_headers,
+        "headers": {**API_headers, **LambdaHelpers.pagination_headers(next_cursor)},
         "body": response_body,
     }
 
@@ -181,4 +187,4 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         dict[str, Any]: HTTP response with status code, headers, and body.
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
+    return run_lambda_handler(async_handler, event, context)
@@ -10,8 +10,7 @@
     from src.contexts.products_catalog.core.services.uow import UnitOfWork
     from src.contexts.shared_kernel.services.messagebus import MessageBus
 
-import anyio
-from pydantic import TypeAdapter
+from pydantic import ConfigDict, TypeAdapter
 from src.config.app_config import get_app_settings
 from src.contexts.products_catalog.core.adapters.api_schemas.entities.classifications.api_classification_filter import (
     ApiClassificationFilter,
@@ -30,6 +29,7 @@
     aws_lambda_exception_handler_middleware,
 )
 from src.contexts.shared_kernel.middleware.lambda_helpers import LambdaHelpers
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -42,7 +42,10 @@
 # Structured logger for this handler
 logger = get_logger("products_catalog.fetch_product_source_name")
 
-SourceListTypeAdapter = TypeAdapter(list[ApiSource])
+# Schemas are built on first dump, not during Lambda module init
+SourceListTypeAdapter = TypeAdapter(
+    list[ApiSource], config=ConfigDict(defer_build=True)
+)
 
 
 @async_endpoint_handler(
@@ -173,4 +176,4 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     Returns:
         dict[str, Any]: HTTP response with status code, headers, and body.
     """
-    return anyio.run(async_handler, event, context)
+    return run_lambda_handler(async_handler, event, context)
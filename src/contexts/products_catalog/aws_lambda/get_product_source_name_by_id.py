@@ -10,7 +10,6 @@
     from src.contexts.products_catalog.core.services.uow import UnitOfWork
     from src.contexts.shared_kernel.services.messagebus import MessageBus
 
-import anyio
 from src.config.app_config import get_app_settings
 from src.contexts.products_catalog.core.adapters.api_schemas.entities.classifications.api_source import (
     ApiSource,
@@ -26,6 +25,7 @@
     aws_lambda_exception_handler_middleware,
 )
 from src.contexts.shared_kernel.middleware.lambda_helpers import LambdaHelpers
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -108,4 +108,4 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         dict[str, Any]: HTTP response with status code, headers, and body.
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
+    return run_lambda_handler(async_handler, event, context)
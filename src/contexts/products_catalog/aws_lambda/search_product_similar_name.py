@@ -16,8 +16,7 @@
     from src.contexts.products_catalog.core.services.uow import UnitOfWork
     from src.contexts.shared_kernel.services.messagebus import MessageBus
 
-import anyio
-from pydantic import TypeAdapter
+from pydantic import ConfigDict, TypeAdapter
 from src.contexts.products_catalog.core.bootstrap.container import Container
 from src.contexts.shared_kernel.middleware.auth.authentication import (
     products_aws_auth_middleware,
@@ -29,6 +28,7 @@
     aws_lambda_exception_handler_middleware,
 )
 from src.contexts.shared_kernel.middleware.lambda_helpers import LambdaHelpers
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -38,7 +38,10 @@
 
 container = Container()
 
-ProductListTypeAdapter = TypeAdapter(list[ApiProduct])
+# Schemas are built on first dump, not during Lambda module init
+ProductListTypeAdapter = TypeAdapter(
+    list[ApiProduct], config=ConfigDict(defer_build=True)
+)
 
 
 @async_endpoint_handler(
@@ -111,4 +114,4 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         dict[str, Any]: HTTP response with status code, headers, and body.
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
\ No newline at end of file
+    return run_lambda_handler(async_handler, event, context)
\ No newline at end of file
@@ -26,6 +26,7 @@ class ApiProductFilter(BaseModel):
         skip: Number of records to skip for pagination.
         limit: Maximum number of records to return.
         sort: Sort order for results.
+        cursor: Keyset cursor from a previous page; replaces skip.
         created_at_gte: Filter products created after this date.
         created_at_lte: Filter products created before this date.
     """
@@ -43,6 +44,7 @@ class ApiProductFilter(BaseModel):
     skip: int | None = None
     limit: int | None = get_pagination_settings().PRODUCTS
     sort: str | None = "-date"
+    cursor: str | None = None
     created_at_gte: str | None = None
     created_at_lte: str | None = None
     # TODO add full text search
@@ -79,6 +81,7 @@ def filter_must_be_allowed_by_repo(cls, values):
                 "skip",
                 "limit",
                 "sort",
+                "cursor",
                 "created_at",
             ]
         )
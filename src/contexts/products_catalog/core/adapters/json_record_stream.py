@@ -0,0 +1,90 @@
+"""Incremental reader for JSON array and NDJSON record files.
+
+Product dumps are either a single top-level JSON array or one JSON object
+per line (NDJSON). Both are read in fixed-size blocks and decoded one record
+at a time, so memory use is bounded by the largest record rather than the
+file size.
+"""
+import json
+from collections.abc import Iterator
+from typing import Any
+
+DEFAULT_READ_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+def iter_json_records(
+    path: str, *, read_size: int = DEFAULT_READ_SIZE
+) -> Iterator[Any]:
+    """Yield the records of a JSON array or NDJSON file.
+
+    The format is detected from the first non-whitespace character: ``[``
+    starts a JSON array, anything else is read as NDJSON.
+
+    Args:
+        path: File to read.
+        read_size: Number of characters read per block.
+
+    Yields:
+        Decoded records in file order.
+
+    Raises:
+        json.JSONDecodeError: If the file contains malformed JSON.
+    """
+    with open(path, encoding="utf-8") as f:
+        buffer = ""
+        while not (buffer := buffer.lstrip(_WHITESPACE)):
+            buffer = f.read(read_size)
+            if not buffer:
+                return
+        if buffer[0] == "[":
+            yield from _iter_array(f, buffer[1:], read_size)
+        else:
+            yield from _iter_lines(f, buffer)
+
+
+def _iter_lines(f, buffer: str) -> Iterator[Any]:
+    *complete, partial = buffer.split("\n")
+    for line in (*complete, partial + f.readline()):
+        if line.strip():
+            yield json.loads(line)
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _iter_array(f, buffer: str, read_size: int) -> Iterator[Any]:
+    position = 0
+    eof = False
+    while True:
+        position = _skip(buffer, position, _WHITESPACE + ",")
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        try:
+            record, end = _decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = f.read(read_size)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        if end == len(buffer) and not eof:
+            # A number may continue in the next block; read on to be sure.
+            chunk = f.read(read_size)
+            eof = not chunk
+            if chunk:
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+        yield record
+        position = end
+
+
+def _skip(buffer: str, position: int, characters: str) -> int:
+    while position < len(buffer) and buffer[position] in characters:
+        position += 1
+    return position
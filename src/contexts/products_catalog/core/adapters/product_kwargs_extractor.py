@@ -5,17 +5,26 @@
 """
 import json
 from collections import abc
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from itertools import batched
 from typing import Any
 
+from src.contexts.products_catalog.core.adapters.json_record_stream import (
+    iter_json_records,
+)
+
 
 def traverse(
-    *, keys: list, type: Callable, data: Any, nutri_fact_value_normalizer: float = 1
+    *,
+    keys: abc.Sequence,
+    type: Callable,
+    data: Any,
+    nutri_fact_value_normalizer: float = 1,
 ) -> Any:
     """Traverse nested data structure and extract value with type conversion.
     
     Args:
-        keys: List of keys to traverse in order.
+        keys: Keys to traverse in order. Not modified.
         type: Type to convert the final value to.
         data: Source data structure to traverse.
         nutri_fact_value_normalizer: Divisor for nutritional fact values.
@@ -26,28 +35,22 @@ def traverse(
     Raises:
         Exception: When traversal fails and type is not numeric.
     """
-    if not keys:
-        if type is str and isinstance(data, abc.MutableSequence):
-            return data.pop(0)
+    for position, key in enumerate(keys):
         try:
-            return type(data) / nutri_fact_value_normalizer
-        except Exception:
+            data = data[key]
+        except Exception as e:
             if type is float or type is int:
                 return 0
-            return data
-    i = keys.pop(0)
+            error_msg = f"Error while traversing {list(keys[position + 1:])} in {data}"
+            raise Exception(error_msg) from e
+    if type is str and isinstance(data, abc.MutableSequence):
+        return data.pop(0)
     try:
-        return traverse(
-            keys=keys,
-            type=type,
-            data=data[i],
-            nutri_fact_value_normalizer=nutri_fact_value_normalizer,
-        )
-    except Exception as e:
+        return type(data) / nutri_fact_value_normalizer
+    except Exception:
         if type is float or type is int:
             return 0
-        error_msg = f"Error while traversing {keys} in {data}"
-        raise Exception(error_msg) from e
+        return data
 
 
 def taco_extractor(data: dict) -> dict[str, Any]:
@@ -687,22 +690,26 @@ def private_extractor(data: dict) -> dict[str, Any]:
 class ProductKwargsExtractor:
     """Extract and normalize product kwargs for bulk creation.
     
+    Records are consumed lazily, so ``data`` may be a generator (e.g. from
+    :func:`iter_json_records`); in that case the extractor can be iterated
+    only once.
+
     Attributes:
-        data: List of raw product data records.
+        data: Raw product data records.
         extractor: Function to extract kwargs from individual records.
         nutri_factor_divider: Optional tuple for nutritional factor division.
     """
     
     def __init__(
         self,
-        data: list[dict],
+        data: Iterable[dict],
         extractor: Callable[..., dict[str, Any]],
         nutri_factor_divider: tuple | None = None,
     ) -> None:
         """Initialize extractor with data and extraction function.
         
         Args:
-            data: List of raw product data records.
+            data: Raw product data records.
             extractor: Function to extract kwargs from individual records.
             nutri_factor_divider: Optional tuple for nutritional factor division.
         """
@@ -717,19 +724,36 @@ def kwargs(self) -> list[dict[str, Any]]:
         Returns:
             List of normalized product kwargs with original JSON data included.
         """
-        product_list_kwargs: list[dict[str, Any]] = []
+        return list(self.iter_kwargs())
+
+    def iter_kwargs(self) -> Iterator[dict[str, Any]]:
+        """Yield normalized kwargs one record at a time.
+
+        Yields:
+            Normalized product kwargs with original JSON data included.
+        """
         for product in self.data:
             kwargs = self.extractor(product)
             kwargs["json_data"] = json.dumps(product, ensure_ascii=False)
             if all(i == 0 for i in kwargs["score"].values()):
                 kwargs["score"] = None
-            product_list_kwargs.append(kwargs)
-        return product_list_kwargs
+            yield kwargs
+
+    def iter_chunks(self, size: int) -> Iterator[tuple[dict[str, Any], ...]]:
+        """Yield normalized kwargs in chunks of at most ``size`` records.
+
+        Args:
+            size: Maximum number of records per chunk.
+        """
+        yield from batched(self.iter_kwargs(), size, strict=False)
 
     @classmethod
     def from_path(cls, path):
         """Load file and return appropriate extractor from filename convention.
         
+        The whole file is parsed up front; use :meth:`stream_path` for large
+        dumps.
+
         Args:
             path: File path containing product data.
             
@@ -741,27 +765,42 @@ def from_path(cls, path):
         """
         try:
             with open(path) as f:
-                txt = f.read()
-            data = json.loads(txt)
-            if "private" in path:
-                return cls.from_private(data)
-            elif "taco" in path:
-                return cls.from_taco(data)
-            else:
-                raise NotImplementedError
+                data = json.load(f)
+            return ProductKwargsExtractorFactory().get_extractor(
+                source_from_path(path)
+            )(data)
         except Exception:
             return path
 
+    @classmethod
+    def stream_path(cls, path: str, source: str | None = None):
+        """Return an extractor reading records from ``path`` incrementally.
+
+        Args:
+            path: JSON array or NDJSON file containing product data.
+            source: 'private' or 'taco'; inferred from the file name if omitted.
+
+        Returns:
+            ProductKwargsExtractor over a lazy record stream.
+
+        Raises:
+            NotImplementedError: If the source cannot be determined.
+        """
+        factory = ProductKwargsExtractorFactory()
+        return factory.get_extractor(source or source_from_path(path))(
+            iter_json_records(path)
+        )
+
     @classmethod
     def from_private(
         cls,
-        data: list[dict],
+        data: Iterable[dict],
         extractor: Callable[..., dict[str, Any]] = private_extractor,
     ):
         """Create extractor for private dataset format.
         
         Args:
-            data: List of private dataset records.
+            data: Private dataset records.
             extractor: Extraction function, defaults to private_extractor.
             
         Returns:
@@ -771,12 +810,14 @@ def from_private(
 
     @classmethod
     def from_taco(
-        cls, data: list[dict], extractor: Callable[..., dict[str, Any]] = taco_extractor
+        cls,
+        data: Iterable[dict],
+        extractor: Callable[..., dict[str, Any]] = taco_extractor,
     ):
         """Create extractor for TACO dataset format.
         
         Args:
-            data: List of TACO dataset records.
+            data: TACO dataset records.
             extractor: Extraction function, defaults to taco_extractor.
             
         Returns:
@@ -812,3 +853,37 @@ def get_extractor(self, source: str) -> Callable[..., ProductKwargsExtractor]:
             KeyError: If source is not supported.
         """
         return self._extractor[source]
+
+
+def source_from_path(path: str) -> str:
+    """Infer the dataset source from the file name convention.
+
+    Args:
+        path: File path containing 'private' or 'taco'.
+
+    Returns:
+        Source identifier.
+
+    Raises:
+        NotImplementedError: If the file name matches no known source.
+    """
+    if "private" in path:
+        return "private"
+    if "taco" in path:
+        return "taco"
+    raise NotImplementedError(f"Unknown product source for {path}")
+
+
+def normalize_records(source: str, records: Iterable[dict]) -> list[dict[str, Any]]:
+    """Normalize a chunk of raw records for ``source``.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        source: Source identifier ('private' or 'taco').
+        records: Raw dataset records.
+
+    Returns:
+        Normalized product kwargs.
+    """
+    return ProductKwargsExtractorFactory().get_extractor(source)(records).kwargs
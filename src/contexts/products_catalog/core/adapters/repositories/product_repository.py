@@ -32,8 +32,12 @@
 )
 from src.contexts.products_catalog.core.domain.enums import FrontendFilterTypes
 from src.contexts.products_catalog.core.domain.root_aggregate.product import Product
+from src.contexts.seedwork.adapters.repositories.bulk_upsert import BulkUpsertResult
 from src.contexts.seedwork.adapters.repositories.filter_mapper import FilterColumnMapper
 from src.contexts.seedwork.adapters.repositories.protocols import CompositeRepository
+from src.contexts.seedwork.adapters.repositories.query_cache import (
+    QueryCacheBackend,
+)
 from src.contexts.seedwork.adapters.repositories.repository_logger import (
     RepositoryLogger,
 )
@@ -102,6 +106,7 @@ def __init__(
         self,
         db_session: AsyncSession,
         repository_logger: RepositoryLogger | None = None,
+        cache_backend: QueryCacheBackend | None = None,
     ):
         self._session = db_session
 
@@ -118,6 +123,7 @@ def __init__(
             sa_model_type=ProductSaModel,
             filter_to_column_mappers=ProductRepo.filter_to_column_mappers,
             repository_logger=self._repository_logger,
+            cache_backend=cache_backend,
         )
         self.data_mapper = self._generic_repo.data_mapper
         self.domain_model_type = self._generic_repo.domain_model_type
@@ -127,6 +133,9 @@ def __init__(
     async def add(self, entity: Product):
         await self._generic_repo.add(entity)
 
+    async def add_all(self, entities: list[Product]):
+        await self._generic_repo.add_all(entities)
+
     async def get(self, id: str) -> Product:
         return await self._generic_repo.get(id)
 
@@ -629,8 +638,25 @@ async def query(
 
             return model_objs
 
+    def next_cursor(
+        self, items: list[Product], filters: dict[str, Any] | None
+    ) -> str | None:
+        """Return the keyset cursor for the page after items.
+
+        Args:
+            items: Products returned by query() for filters.
+            filters: Filters the page was queried with.
+
+        Returns:
+            Opaque cursor, or None on the last page or for sorts that only
+            support skip/limit pagination.
+        """
+        return self._generic_repo.next_cursor(items, filters)
+
     async def persist(self, domain_obj: Product) -> None:
         await self._generic_repo.persist(domain_obj)
 
-    async def persist_all(self, domain_entities: list[Product] | None = None) -> None:
-        await self._generic_repo.persist_all(domain_entities)
+    async def persist_all(
+        self, domain_entities: list[Product] | None = None, *, bulk: bool = False
+    ) -> BulkUpsertResult | None:
+        return await self._generic_repo.persist_all(domain_entities, bulk=bulk)
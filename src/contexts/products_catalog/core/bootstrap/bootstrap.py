@@ -26,6 +26,7 @@
 )
 from src.contexts.seedwork.domain.event import Event as SeedworkEvent
 from src.contexts.shared_kernel.services.messagebus import MessageBus
+from src.contexts.shared_kernel.services.outbox import get_outbox
 
 
 def bootstrap(
@@ -103,4 +104,5 @@ def bootstrap(
         uow_factory=uow_factory,
         event_handlers=injected_event_handlers,
         command_handlers=injected_command_handlers,
+        outbox=get_outbox("products_catalog", injected_event_handlers),
     )
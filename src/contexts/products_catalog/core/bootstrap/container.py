@@ -2,7 +2,8 @@
 
 from dependency_injector import containers, providers
 from src.contexts.products_catalog.core.services.uow import UnitOfWork
-from src.db.fastapi_database import fastapi_db
+from src.contexts.seedwork.adapters.repositories.query_cache import get_query_cache
+from src.db.fastapi_database import get_fastapi_database
 
 from .bootstrap import bootstrap
 
@@ -11,10 +12,12 @@ class Container(containers.DeclarativeContainer):
     """DI container exposing DB, UnitOfWork, and bootstrapped MessageBus."""
     wiring_config = containers.WiringConfiguration(modules=[__name__])
 
-    database = providers.Object(fastapi_db)
+    database = providers.Callable(get_fastapi_database)
+    query_cache = providers.Callable(get_query_cache)
     uow_factory = providers.Factory(
         UnitOfWork,
         session_factory=database.provided.async_session_factory,
+        query_cache=query_cache,
     )
     bootstrap = providers.Factory(
         bootstrap,
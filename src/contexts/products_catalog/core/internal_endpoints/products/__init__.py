@@ -2,12 +2,16 @@
     add_house_input_to_is_food_registry,
 )
 from src.contexts.products_catalog.core.internal_endpoints.products.fetch import (
+    get_api_products,
     get_products,
 )
 from src.contexts.products_catalog.core.internal_endpoints.products.filter_options import (
     get_filter_options,
 )
-from src.contexts.products_catalog.core.internal_endpoints.products.get_by_id import get
+from src.contexts.products_catalog.core.internal_endpoints.products.get_by_id import (
+    get,
+    get_api_product,
+)
 from src.contexts.products_catalog.core.internal_endpoints.products.search_similar_names import (
     search_similar_name,
 )
@@ -15,6 +19,8 @@
 __all__ = [
     "add_house_input_to_is_food_registry",
     "add_house_input_to_is_food_registry",
+    "get_api_product",
+    "get_api_products",
     "get_products",
     "get",
     "get_filter_options",
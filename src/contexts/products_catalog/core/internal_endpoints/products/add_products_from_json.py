@@ -1,4 +1,6 @@
 import inspect
+from collections.abc import Iterable
+from typing import Any
 
 from src.contexts.products_catalog.core.adapters.product_kwargs_extractor import (
     ProductKwargsExtractorFactory,
@@ -38,15 +40,25 @@ async def add_products_from_json(raw_data: list[dict], source: str) -> None:
     bus: MessageBus = Container().bootstrap()
     kwargs_extractor = ProductKwargsExtractorFactory().get_extractor(source=source)
     extractor = kwargs_extractor(raw_data)
-    products_kwargs = extractor.kwargs
-    add_product_cmd = []
-    for i in products_kwargs:
-        kwargs = {}
-        for param in list(inspect.signature(AddFoodProduct).parameters.keys()):
-            if param in i and param != "product_id":
-                kwargs[param] = i[param]
-        add_product_cmd.append(AddFoodProduct(**kwargs))
     cmd = AddFoodProductBulk(
-        add_product_cmds=add_product_cmd,
+        add_product_cmds=build_add_product_cmds(extractor.iter_kwargs()),
     )
     await bus.handle(cmd)
+
+
+_ADD_FOOD_PRODUCT_PARAMS = frozenset(
+    inspect.signature(AddFoodProduct).parameters
+) - {"product_id"}
+
+
+def build_add_product_cmds(
+    products_kwargs: Iterable[dict[str, Any]],
+) -> list[AddFoodProduct]:
+    """Build AddFoodProduct commands from normalized product kwargs.
+
+    Keys that are not parameters of AddFoodProduct are ignored.
+    """
+    return [
+        AddFoodProduct(**{k: v for k, v in i.items() if k in _ADD_FOOD_PRODUCT_PARAMS})
+        for i in products_kwargs
+    ]
@@ -12,14 +12,17 @@
 from src.contexts.shared_kernel.services.messagebus import MessageBus
 
 
-async def get_products(filters: dict[str, Any] | None = None) -> Any:
-    """Execute the get products query use case.
+async def get_api_products(filters: dict[str, Any] | None = None) -> list[ApiProduct]:
+    """Execute the get products query use case without serializing.
+
+    Used by in-process callers that share this runtime; remote callers go
+    through :func:`get_products`.
 
     Args:
         filters: Optional product filter criteria.
 
     Returns:
-        JSON string: Serialized list of products matching filters.
+        list[ApiProduct]: Validated read models of the matching products.
 
     Transactions:
         One UnitOfWork per call. Read-only transaction.
@@ -35,6 +38,24 @@ async def get_products(filters: dict[str, Any] | None = None) -> Any:
         products = await uow.products.query(
             filters=filters if filters else {},
         )
+    return [ApiProduct.from_domain(product) for product in products]  # type: ignore
+
+
+async def get_products(filters: dict[str, Any] | None = None) -> Any:
+    """Execute the get products query use case.
+
+    Args:
+        filters: Optional product filter criteria.
+
+    Returns:
+        JSON string: Serialized list of products matching filters.
+
+    Transactions:
+        One UnitOfWork per call. Read-only transaction.
+
+    Side Effects:
+        None. Pure query operation.
+    """
     return json.dumps(
-        [ApiProduct.from_domain(product).model_dump() for product in products] # type: ignore
+        [product.model_dump() for product in await get_api_products(filters)]
     )
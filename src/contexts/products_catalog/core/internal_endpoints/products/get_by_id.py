@@ -9,14 +9,17 @@
 from src.contexts.shared_kernel.services.messagebus import MessageBus
 
 
-async def get(id: str) -> Any:
-    """Execute the get product by ID query use case.
+async def get_api_product(id: str) -> ApiProduct:
+    """Execute the get product by ID query use case without serializing.
+
+    Used by in-process callers that share this runtime; remote callers go
+    through :func:`get`.
 
     Args:
         id: UUID v4 of the product to retrieve.
 
     Returns:
-        JSON string: Serialized product data.
+        ApiProduct: Validated product read model.
 
     Transactions:
         One UnitOfWork per call. Read-only transaction.
@@ -28,4 +31,22 @@ async def get(id: str) -> Any:
     uow: UnitOfWork
     async with bus.uow_factory() as uow:
         product = await uow.products.get(id)
-        return json.dumps(ApiProduct.from_domain(product).model_dump())
+        return ApiProduct.from_domain(product)
+
+
+async def get(id: str) -> Any:
+    """Execute the get product by ID query use case.
+
+    Args:
+        id: UUID v4 of the product to retrieve.
+
+    Returns:
+        JSON string: Serialized product data.
+
+    Transactions:
+        One UnitOfWork per call. Read-only transaction.
+
+    Side Effects:
+        None. Pure query operation.
+    """
+    return json.dumps((await get_api_product(id)).model_dump())
@@ -0,0 +1,153 @@
+"""Streaming bulk import of TACO/private product dumps.
+
+Records are read incrementally from a JSON array or NDJSON file, normalized
+in chunks (optionally in worker processes) and persisted one
+AddFoodProductBulk command per chunk, so memory use is bounded by
+``batch_size * workers`` records instead of the size of the dump.
+"""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from itertools import batched
+
+import anyio
+import anyio.to_process
+
+from src.contexts.products_catalog.core.adapters.json_record_stream import (
+    iter_json_records,
+)
+from src.contexts.products_catalog.core.adapters.product_kwargs_extractor import (
+    normalize_records,
+    source_from_path,
+)
+from src.contexts.products_catalog.core.bootstrap.container import Container
+from src.contexts.products_catalog.core.domain.commands.products.add_food_product_bulk import (
+    AddFoodProductBulk,
+)
+from src.contexts.products_catalog.core.internal_endpoints.products.add_products_from_json import (
+    build_add_product_cmds,
+)
+from src.contexts.shared_kernel.services.messagebus import MessageBus
+from src.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass(slots=True)
+class ImportProgress:
+    """Counters of a running or finished import.
+
+    Attributes:
+        source: Dataset source identifier.
+        records_read: Raw records read from the file.
+        products_added: Products persisted.
+        batches: Batches persisted.
+        started_at: ``time.perf_counter()`` value at the start of the import.
+    """
+
+    source: str
+    records_read: int = 0
+    products_added: int = 0
+    batches: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def products_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.products_added / elapsed if elapsed > 0 else 0.0
+
+
+async def import_products_from_file(
+    path: str,
+    source: str | None = None,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = 1,
+    on_progress: Callable[[ImportProgress], None] | None = None,
+) -> ImportProgress:
+    """Execute the streaming bulk import use case.
+
+    Args:
+        path: JSON array or NDJSON file with raw product records.
+        source: 'private' or 'taco'; inferred from the file name if omitted.
+        batch_size: Records normalized and persisted per batch.
+        workers: Batches normalized concurrently. Above 1, normalization runs
+            in worker processes; persistence stays sequential.
+        on_progress: Called with the counters after each persisted batch.
+
+    Returns:
+        ImportProgress: Final counters.
+
+    Events:
+        FoodProductCreated: Emitted for each product added.
+
+    Idempotency:
+        No. Products whose barcode and source already exist fail their batch.
+
+    Transactions:
+        One UnitOfWork per batch. Batches committed before a failure stay
+        committed.
+
+    Side Effects:
+        Persists products to the repository and publishes domain events.
+    """
+    source = source or source_from_path(path)
+    bus: MessageBus = Container().bootstrap()
+    progress = ImportProgress(source=source)
+    limiter = anyio.CapacityLimiter(max(workers, 1))
+
+    async def normalize(records: tuple[dict, ...]) -> list[dict]:
+        if workers <= 1:
+            return normalize_records(source, records)
+        return await anyio.to_process.run_sync(
+            normalize_records, source, records, limiter=limiter
+        )
+
+    async def normalize_into(
+        results: list[list[dict]], index: int, records: tuple[dict, ...]
+    ) -> None:
+        results[index] = await normalize(records)
+
+    chunks = batched(iter_json_records(path), batch_size, strict=False)
+    for window in batched(chunks, max(workers, 1), strict=False):
+        normalized: list[list[dict]] = [[] for _ in window]
+
+        async with anyio.create_task_group() as tg:
+            for index, records in enumerate(window):
+                tg.start_soon(normalize_into, normalized, index, records)
+
+        for records, products_kwargs in zip(window, normalized, strict=True):
+            cmds = build_add_product_cmds(products_kwargs)
+            await bus.handle(AddFoodProductBulk(add_product_cmds=cmds))
+            progress.records_read += len(records)
+            progress.products_added += len(cmds)
+            progress.batches += 1
+            logger.info(
+                "Product import batch persisted",
+                source=source,
+                batch=progress.batches,
+                batch_size=len(cmds),
+                records_read=progress.records_read,
+                products_added=progress.products_added,
+                products_per_second=round(progress.products_per_second, 1),
+            )
+            if on_progress is not None:
+                on_progress(progress)
+
+    logger.info(
+        "Product import finished",
+        source=source,
+        records_read=progress.records_read,
+        products_added=progress.products_added,
+        batches=progress.batches,
+        elapsed_seconds=round(progress.elapsed_seconds, 3),
+        products_per_second=round(progress.products_per_second, 1),
+    )
+    return progress
@@ -1,3 +1,5 @@
+from itertools import batched
+
 from src.contexts.products_catalog.core.domain.commands.products.add_food_product_bulk import (
     AddFoodProductBulk,
 )
@@ -5,6 +7,9 @@
 from src.contexts.products_catalog.core.services.uow import UnitOfWork
 from src.contexts.shared_kernel.domain.exceptions import BusinessRuleValidationError
 
+# Barcodes per lookup query; a barcode may exist once per source.
+BARCODE_LOOKUP_CHUNK = 250
+
 
 async def add_new_food_product(cmd: AddFoodProductBulk, uow: UnitOfWork) -> list[str]:
     """Execute the add food product bulk use case.
@@ -17,7 +22,8 @@ async def add_new_food_product(cmd: AddFoodProductBulk, uow: UnitOfWork) -> list
         list[str]: List of created product IDs.
     
     Raises:
-        BusinessRuleValidationError: If product with same barcode and source exists.
+        BusinessRuleValidationError: If product with same barcode and source exists,
+            or appears more than once in the command.
     
     Events:
         FoodProductCreated: Emitted for each successfully created product.
@@ -32,39 +38,52 @@ async def add_new_food_product(cmd: AddFoodProductBulk, uow: UnitOfWork) -> list
         Creates new Product aggregates, publishes FoodProductCreated events.
     """
     async with uow:
-        products_ids = []
+        existing = await _existing_barcodes(
+            uow, [c.barcode for c in cmd.add_product_cmds if c.barcode]
+        )
+        products = []
         for c in cmd.add_product_cmds:
-            if c.barcode:
-                products = await uow.products.query(filters={"barcode": c.barcode})
-                try:
-                    next(
-                        p
-                        for p in products
-                        if p.source_id == c.source_id and p.barcode == c.barcode
-                    )
-                    raise BusinessRuleValidationError(
-                        f'Product with barcode "{c.barcode}" and source "{c.source_id}" already exists.'
-                    )
-                except StopIteration:
-                    pass
-            c = Product.add_food_product(
-                source_id=c.source_id,
-                name=c.name,
-                category_id=c.category_id,
-                parent_category_id=c.parent_category_id,
-                nutri_facts=c.nutri_facts,
-                ingredients=c.ingredients,
-                package_size=c.package_size,
-                package_size_unit=c.package_size_unit,
-                json_data=c.json_data,
-                food_group_id=c.food_group_id,
-                process_type_id=c.process_type_id,
-                score=c.score,
-                brand_id=c.brand_id,
-                barcode=c.barcode,
-                image_url=c.image_url,
+            if c.barcode and (c.barcode, c.source_id) in existing:
+                raise BusinessRuleValidationError(
+                    f'Product with barcode "{c.barcode}" and source "{c.source_id}" already exists.'
+                )
+            products.append(
+                Product.add_food_product(
+                    source_id=c.source_id,
+                    name=c.name,
+                    category_id=c.category_id,
+                    parent_category_id=c.parent_category_id,
+                    nutri_facts=c.nutri_facts,
+                    ingredients=c.ingredients,
+                    package_size=c.package_size,
+                    package_size_unit=c.package_size_unit,
+                    json_data=c.json_data,
+                    food_group_id=c.food_group_id,
+                    process_type_id=c.process_type_id,
+                    score=c.score,
+                    brand_id=c.brand_id,
+                    barcode=c.barcode,
+                    image_url=c.image_url,
+                )
             )
-            await uow.products.add(c)
-            products_ids.append(c.id)
+            if c.barcode:
+                # Catches repeats within the batch, which the lookup cannot see
+                existing.add((c.barcode, c.source_id))
+        await uow.products.add_all(products)
         await uow.commit()
-    return products_ids
+    return [p.id for p in products]
+
+
+async def _existing_barcodes(
+    uow: UnitOfWork, barcodes: list[str]
+) -> set[tuple[str, str]]:
+    """Return the (barcode, source_id) pairs already stored for ``barcodes``.
+
+    Barcodes are looked up in chunks, one query each, so the result stays
+    under the repository's maximum page size.
+    """
+    existing: set[tuple[str, str]] = set()
+    for chunk in batched(dict.fromkeys(barcodes), BARCODE_LOOKUP_CHUNK, strict=False):
+        products = await uow.products.query(filters={"barcode": list(chunk)})
+        existing.update((p.barcode, p.source_id) for p in products)
+    return existing
@@ -40,7 +40,7 @@ class UnitOfWork(SeedUnitOfWork):
     """
     async def __aenter__(self):
         await super().__aenter__()
-        self.products = ProductRepo(self.session)
+        self.products = ProductRepo(self.session, cache_backend=self.query_cache)
         self.sources = SourceRepo(self.session)
         self.brands = BrandRepo(self.session)
         self.categories = CategoryRepo(self.session)
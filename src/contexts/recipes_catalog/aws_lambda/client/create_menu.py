@@ -3,7 +3,6 @@
 import json
 from typing import TYPE_CHECKING, Any
 
-import anyio
 from src.config.app_config import get_app_settings
 from src.contexts.recipes_catalog.core.adapters.client.api_schemas.commands.api_create_menu import (
     ApiCreateMenu,
@@ -20,6 +19,7 @@
     aws_lambda_exception_handler_middleware,
 )
 from src.contexts.shared_kernel.middleware.lambda_helpers import LambdaHelpers
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -111,7 +111,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     Notes:
         Generates correlation ID and delegates to async handler.
-        Wraps async execution in anyio runtime.
+        Runs the async handler on the container's persistent event loop.
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
+    return run_lambda_handler(async_handler, event, context)
@@ -3,7 +3,6 @@
 import json
 from typing import TYPE_CHECKING, Any
 
-import anyio
 from src.config.app_config import get_app_settings
 from src.contexts.recipes_catalog.core.adapters.client.api_schemas.commands.api_delete_menu import (
     ApiDeleteMenu,
@@ -19,6 +18,7 @@
 from src.contexts.shared_kernel.middleware.error_handling.exception_handler import (
     aws_lambda_exception_handler_middleware,
 )
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -117,7 +117,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     Notes:
         Generates correlation ID and delegates to async handler.
-        Wraps async execution in anyio runtime.
+        Runs the async handler on the container's persistent event loop.
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
+    return run_lambda_handler(async_handler, event, context)
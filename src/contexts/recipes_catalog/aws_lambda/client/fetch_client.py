@@ -2,8 +2,7 @@
 
 from typing import TYPE_CHECKING, Any
 
-import anyio
-from pydantic import TypeAdapter
+from pydantic import ConfigDict, TypeAdapter
 from src.config.app_config import get_app_settings
 from src.contexts.recipes_catalog.core.adapters.client.api_schemas.root_aggregate.api_client import (
     ApiClient,
@@ -22,6 +21,7 @@
     aws_lambda_exception_handler_middleware,
 )
 from src.contexts.shared_kernel.middleware.lambda_helpers import LambdaHelpers
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -35,7 +35,10 @@
 
 container = Container()
 
-ClientListTypeAdapter = TypeAdapter(list[ApiClient])
+# Schemas are built on first dump, not during Lambda module init
+ClientListTypeAdapter = TypeAdapter(
+    list[ApiClient], config=ConfigDict(defer_build=True)
+)
 
 
 @async_endpoint_handler(
@@ -125,7 +128,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     Notes:
         Generates correlation ID and delegates to async handler.
-        Wraps async execution in anyio runtime.
+        Runs the async handler on the container's persistent event loop.
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
+    return run_lambda_handler(async_handler, event, context)
@@ -2,8 +2,7 @@
 
 from typing import TYPE_CHECKING, Any
 
-import anyio
-from pydantic import TypeAdapter
+from pydantic import ConfigDict, TypeAdapter
 from src.config.app_config import get_app_settings
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.root_aggregate.api_meal import (
     ApiMeal,
@@ -11,6 +10,9 @@
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.root_aggregate.api_meal_filter import (
     ApiMealFilter,
 )
+from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.root_aggregate.api_meal_summary import (
+    ApiMealSummary,
+)
 from src.contexts.recipes_catalog.core.bootstrap.container import Container
 from src.contexts.shared_kernel.middleware.auth.authentication import (
     recipes_aws_auth_middleware,
@@ -22,6 +24,7 @@
     aws_lambda_exception_handler_middleware,
 )
 from src.contexts.shared_kernel.middleware.lambda_helpers import LambdaHelpers
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -35,7 +38,11 @@
 
 container = Container()
 
-MealListAdapter = TypeAdapter(list[ApiMeal])
+# Schemas are built on first dump, not during Lambda module init
+MealListAdapter = TypeAdapter(list[ApiMeal], config=ConfigDict(defer_build=True))
+MealSummaryListAdapter = TypeAdapter(
+    list[ApiMealSummary], config=ConfigDict(defer_build=True)
+)
 
 
 @async_endpoint_handler(
@@ -74,6 +81,10 @@ async def async_handler(event: dict[str, Any], _: Any) -> dict[str, Any]:
     Notes:
         Maps to Meal repository query() method and translates errors to HTTP codes.
         Default limit: 50, default sort: -updated_at (newest first).
+        Full pages carry an X-Next-Cursor header; pass it back as `cursor`
+        for keyset pagination. skip/limit keeps working as a fallback.
+        projection=summary returns ApiMealSummary items built from a column
+        projection instead of full aggregates.
         User-specific tag filtering applied automatically.
         Continues processing on individual meal conversion errors.
     """
@@ -104,9 +115,25 @@ async def async_handler(event: dict[str, Any], _: Any) -> dict[str, Any]:
 
     bus: MessageBus = container.bootstrap()
     uow: UnitOfWork
+    if LambdaHelpers.wants_summary_projection(event):
+        async with bus.uow_factory() as uow:
+            summaries = await uow.meals.query_summaries(filters=filters)
+            next_cursor = uow.meals.next_cursor(summaries, filters)
+        return {
+            "statusCode": 200,
+            "headers": {
+                **API_headers,
+                **LambdaHelpers.pagination_headers(next_cursor),
+            },
+            "body": MealSummaryListAdapter.dump_json(
+                [ApiMealSummary.from_read_model(s) for s in summaries]
+            ),
+        }
+
     async with bus.uow_factory() as uow:
         # Business context: Query execution with final filters
         result = await uow.meals.query(filters=filters)
+        next_cursor = uow.meals.next_cursor(result, filters)
 
     # Convert domain meals to API meals
     api_meals = []
@@ -114,7 +141,7 @@ async def async_handler(event: dict[str, Any], _: Any) -> dict[str, Any]:
 
     for _, meal in enumerate(result):
         try:
-            api_meal = ApiMeal.from_domain(meal)
+            api_meal = ApiMeal.from_domain_trusted(meal)
             api_meals.append(api_meal)
         except Exception:
             conversion_errors += 1
@@ -129,7 +156,7 @@ async def async_handler(event: dict[str, Any], _: Any) -> dict[str, Any]:
 
     return {
         "statusCode": 200,
-        "headers": API_headers,
+        "headers": {**API_headers, **LambdaHelpers.pagination_headers(next_cursor)},
         "body": response_body,
     }
 
@@ -146,7 +173,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     Notes:
         Generates correlation ID and delegates to async handler.
-        Wraps async execution in anyio runtime.
+        Runs the async handler on the container's persistent event loop.
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
+    return run_lambda_handler(async_handler, event, context)
@@ -2,8 +2,7 @@
 
 from typing import TYPE_CHECKING, Any
 
-import anyio
-from pydantic import TypeAdapter
+from pydantic import ConfigDict, TypeAdapter
 from src.config.app_config import get_app_settings
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.entities import (
     api_recipe,
@@ -11,6 +10,9 @@
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.entities.api_recipe_filter import (
     ApiRecipeFilter,
 )
+from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.entities.api_recipe_summary import (
+    ApiRecipeSummary,
+)
 from src.contexts.recipes_catalog.core.bootstrap.container import Container
 from src.contexts.shared_kernel.middleware.auth.authentication import (
     recipes_aws_auth_middleware,
@@ -22,6 +24,7 @@
     aws_lambda_exception_handler_middleware,
 )
 from src.contexts.shared_kernel.middleware.lambda_helpers import LambdaHelpers
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -40,7 +43,11 @@
 
 # Import the API schema classes
 ApiRecipe = api_recipe.ApiRecipe
-RecipeListAdapter = TypeAdapter(list[ApiRecipe])
+# Schemas are built on first dump, not during Lambda module init
+RecipeListAdapter = TypeAdapter(list[ApiRecipe], config=ConfigDict(defer_build=True))
+RecipeSummaryListAdapter = TypeAdapter(
+    list[ApiRecipeSummary], config=ConfigDict(defer_build=True)
+)
 
 
 @async_endpoint_handler(
@@ -79,6 +86,10 @@ async def async_handler(event: dict[str, Any], _: Any) -> dict[str, Any]:
     Notes:
         Maps to Recipe repository query() method and translates errors to HTTP codes.
         Default limit: 50, default sort: -updated_at (newest first).
+        Full pages carry an X-Next-Cursor header; pass it back as `cursor`
+        for keyset pagination. skip/limit keeps working as a fallback.
+        projection=summary returns ApiRecipeSummary items built from a column
+        projection instead of full aggregates.
         User-specific tag filtering applied automatically.
     """
     # Get authenticated user from middleware (no manual auth needed)
@@ -108,14 +119,30 @@ async def async_handler(event: dict[str, Any], _: Any) -> dict[str, Any]:
 
     bus: MessageBus = container.bootstrap()
     uow: UnitOfWork
+    if LambdaHelpers.wants_summary_projection(event):
+        async with bus.uow_factory() as uow:
+            summaries = await uow.recipes.query_summaries(filters=filters)
+            next_cursor = uow.recipes.next_cursor(summaries, filters)
+        return {
+            "statusCode": 200,
+            "headers": {
+                **API_headers,
+                **LambdaHelpers.pagination_headers(next_cursor),
+            },
+            "body": RecipeSummaryListAdapter.dump_json(
+                [ApiRecipeSummary.from_read_model(s) for s in summaries]
+            ),
+        }
+
     async with bus.uow_factory() as uow:
         # Business context: Query execution with final filters
         result = await uow.recipes.query(filters=filters)
+        next_cursor = uow.recipes.next_cursor(result, filters)
 
     # Convert domain recipes to API recipes
     api_recipes = []
     for recipe in result:
-        api_recipe = ApiRecipe.from_domain(recipe)
+        api_recipe = ApiRecipe.from_domain_trusted(recipe)
         api_recipes.append(api_recipe)
 
     # Serialize API recipes
@@ -123,7 +150,7 @@ async def async_handler(event: dict[str, Any], _: Any) -> dict[str, Any]:
 
     return {
         "statusCode": 200,
-        "headers": API_headers,
+        "headers": {**API_headers, **LambdaHelpers.pagination_headers(next_cursor)},
         "body": response_body,
     }
 
@@ -140,7 +167,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     Notes:
         Generates correlation ID and delegates to async handler.
-        Wraps async execution in anyio runtime.
+        Runs the async handler on the container's persistent event loop.
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
\ No newline at end of file
+    return run_lambda_handler(async_handler, event, context)
\ No newline at end of file
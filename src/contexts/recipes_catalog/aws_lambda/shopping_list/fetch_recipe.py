@@ -3,7 +3,6 @@
 import json
 from typing import TYPE_CHECKING, Any
 
-import anyio
 from src.config.app_config import get_app_settings
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.entities.api_recipe import (
     ApiRecipe,
@@ -22,6 +21,7 @@
     aws_lambda_exception_handler_middleware,
 )
 from src.contexts.shared_kernel.middleware.lambda_helpers import LambdaHelpers
+from src.contexts.shared_kernel.middleware.lambda_runtime import run_lambda_handler
 from src.contexts.shared_kernel.middleware.logging.structured_logger import (
     aws_lambda_logging_middleware,
 )
@@ -113,7 +113,7 @@ async def async_handler(event: dict[str, Any], _: Any) -> dict[str, Any]:
 
     for _, recipe in enumerate(result):
         try:
-            api_recipe = ApiRecipe.from_domain(recipe)
+            api_recipe = ApiRecipe.from_domain_trusted(recipe)
             api_recipes.append(api_recipe)
         except Exception:
             conversion_errors += 1
@@ -145,7 +145,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     Notes:
         Generates correlation ID and delegates to async handler.
-        Wraps async execution in anyio runtime.
+        Runs the async handler on the container's persistent event loop.
     """
     generate_correlation_id()
-    return anyio.run(async_handler, event, context)
+    return run_lambda_handler(async_handler, event, context)
@@ -110,6 +110,15 @@ async def map_domain_to_sa(
                 if menu.id not in ids_of_menus_on_domain_client:
                     menu.discarded = True
 
+        # Resolve the client's tags together with every menu's tags in one
+        # query; menu mappers then hit the session's TagIdentityMap.
+        client_tags = list(domain_obj.tags)
+        resolved_tags = await TagMapper.map_domain_tags_to_sa(
+            session,
+            [*client_tags, *(tag for menu in domain_obj.menus for tag in menu.tags)],
+        )
+        tags = resolved_tags[: len(client_tags)]
+
         menus_tasks = (
             [
                 MenuMapper.map_domain_to_sa(session, i, merge=merge_children)
@@ -118,53 +127,27 @@ async def map_domain_to_sa(
             if domain_obj.menus
             else []
         )
-        tags_tasks = (
-            [TagMapper.map_domain_to_sa(session, i) for i in domain_obj.tags]
-            if domain_obj.tags
-            else []
-        )
-
-        # Combine both lists of awaitables into one list
-        combined_tasks = menus_tasks + tags_tasks
 
-        # If we have any tasks, gather them in one call.
-        if combined_tasks:
+        # Tags are shared across menus through the TagIdentityMap, so no
+        # further deduplication is needed after mapping.
+        if menus_tasks:
             log.debug(
-                "Starting concurrent mapping of menus and tags",
+                "Starting concurrent mapping of menus",
                 menu_tasks=len(menus_tasks),
-                tag_tasks=len(tags_tasks),
-                total_tasks=len(combined_tasks),
+                tags_resolved=len(resolved_tags),
             )
-            combined_results = await helpers.gather_results_with_timeout(
-                combined_tasks,
+            menus = await helpers.gather_results_with_timeout(
+                menus_tasks,
                 timeout=5,
-                timeout_message="Timeout mapping recipes and tags in ClientMapper",
+                timeout_message="Timeout mapping menus in ClientMapper",
             )
             log.info(
-                "Completed concurrent mapping of menus and tags",
-                results_count=len(combined_results),
-                menus_mapped=len(menus_tasks),
-                tags_mapped=len(tags_tasks),
+                "Completed concurrent mapping of menus",
+                menus_mapped=len(menus),
+                tags_mapped=len(tags),
             )
-            # Split the combined results back into recipes and tags.
-            menus = combined_results[: len(menus_tasks)]
-            tags = combined_results[len(menus_tasks) :]
-
-            # Global deduplication of tags across all recipes.
-            all_tags = {}
-            for menu in menus:
-                current_menu_tags = {}
-                for tag in menu.tags:
-                    key = (tag.key, tag.value, tag.author_id, tag.type)
-                    if key in all_tags:
-                        current_menu_tags[key] = all_tags[key]
-                    else:
-                        current_menu_tags[key] = tag
-                        all_tags[key] = tag
-                menu.tags = list(current_menu_tags.values())
         else:
             menus = []
-            tags = []
         sa_client_kwargs = {
             "id": domain_obj.id,
             "author_id": domain_obj.author_id,
@@ -85,21 +85,12 @@ async def map_domain_to_sa(
         else:
             menu_meals = []
 
-        tags_tasks = (
-            [TagMapper.map_domain_to_sa(session, i) for i in domain_obj.tags]
+        tags = (
+            await TagMapper.map_domain_tags_to_sa(session, domain_obj.tags)
             if domain_obj.tags
             else []
         )
 
-        if tags_tasks:
-            tags = await helpers.gather_results_with_timeout(
-                tags_tasks,
-                timeout=5,
-                timeout_message="Timeout mapping tags in TagMapper",
-            )
-        else:
-            tags = []
-
         sa_menu_kwargs = {
             "id": domain_obj.id,
             "author_id": domain_obj.author_id,
@@ -77,6 +77,15 @@ async def map_domain_to_sa(
                     recipe.discarded = True
         # being_discarded_now = [recipe for recipe in meal_on_db.recipes if recipe.id not in [recipe.id for recipe in domain_obj.recipes]]
         # recipes_to_map = (domain_obj.recipes + being_discarded_now)
+        # Resolve the meal's tags together with every recipe's tags in one
+        # query; recipe mappers then hit the session's TagIdentityMap.
+        meal_tags = list(domain_obj.tags)
+        resolved_tags = await TagMapper.map_domain_tags_to_sa(
+            session,
+            [*meal_tags, *(tag for recipe in domain_obj.recipes for tag in recipe.tags)],
+        )
+        tags = resolved_tags[: len(meal_tags)]
+
         recipes_tasks = (
             [
                 RecipeMapper.map_domain_to_sa(session, i, merge=merge_children)
@@ -85,41 +94,16 @@ async def map_domain_to_sa(
             if domain_obj.recipes
             else []
         )
-        tags_tasks = (
-            [TagMapper.map_domain_to_sa(session, i) for i in domain_obj.tags]
-            if domain_obj.tags
-            else []
-        )
-
-        # Combine both lists of awaitables into one list
-        combined_tasks = recipes_tasks + tags_tasks
-
-        # If we have any tasks, gather them in one call.
-        if combined_tasks:  # and not is_domain_obj_discarded:
-            combined_results = await helpers.gather_results_with_timeout(
-                combined_tasks,
+        # Tags are shared across recipes through the TagIdentityMap, so no
+        # further deduplication is needed after mapping.
+        if recipes_tasks:  # and not is_domain_obj_discarded:
+            recipes = await helpers.gather_results_with_timeout(
+                recipes_tasks,
                 timeout=5,
-                timeout_message="Timeout mapping recipes and tags in MealMapper",
+                timeout_message="Timeout mapping recipes in MealMapper",
             )
-            # Split the combined results back into recipes and tags.
-            recipes = combined_results[: len(recipes_tasks)]
-            tags = combined_results[len(recipes_tasks) :]
-
-            # Global deduplication of tags across all recipes.
-            all_tags = {}
-            for recipe in recipes:
-                current_recipe_tags = {}
-                for tag in recipe.tags:
-                    key = (tag.key, tag.value, tag.author_id, tag.type)
-                    if key in all_tags:
-                        current_recipe_tags[key] = all_tags[key]
-                    else:
-                        current_recipe_tags[key] = tag
-                        all_tags[key] = tag
-                recipe.tags = list(current_recipe_tags.values())
         else:
             recipes = []
-            tags = []
 
         # Log mapping progress for complex meals with multiple recipes
         if len(domain_obj.recipes) > 1:
@@ -69,8 +69,8 @@ async def map_domain_to_sa(
             # so we should not need merge the children
             merge_children = True
         # if not is_domain_obj_discarded:
-        tags_tasks = (
-            [TagMapper.map_domain_to_sa(session, i) for i in domain_obj.tags]
+        tags = (
+            await TagMapper.map_domain_tags_to_sa(session, domain_obj.tags)
             if domain_obj.tags
             else []
         )
@@ -101,14 +101,14 @@ async def map_domain_to_sa(
             else []
         )
 
-        combined_tasks = tags_tasks + ratings_tasks + ingredients_tasks
+        combined_tasks = ratings_tasks + ingredients_tasks
 
         # If we have any tasks, gather them in one call.
         if combined_tasks:
             logger.debug(
                 "Mapping recipe child entities",
                 recipe_id=domain_obj.id,
-                tags_count=len(tags_tasks),
+                tags_count=len(tags),
                 ratings_count=len(ratings_tasks),
                 ingredients_count=len(ingredients_tasks),
                 total_tasks=len(combined_tasks),
@@ -117,27 +117,23 @@ async def map_domain_to_sa(
                 combined_results = await helpers.gather_results_with_timeout(
                     combined_tasks,
                     timeout=5,
-                    timeout_message="Timeout mapping recipes and tags in RecipeMapper",
+                    timeout_message="Timeout mapping ratings and ingredients in RecipeMapper",
                 )
             except Exception as e:
                 logger.error(
                     "Failed to map recipe child entities",
                     recipe_id=domain_obj.id,
                     error=str(e),
-                    tags_count=len(tags_tasks),
+                    tags_count=len(tags),
                     ratings_count=len(ratings_tasks),
                     ingredients_count=len(ingredients_tasks),
                 )
                 raise
-            # Split the combined results back into recipes and tags.
-            tags = combined_results[: len(tags_tasks)]
-            ratings = combined_results[
-                len(tags_tasks) : len(tags_tasks) + len(ratings_tasks)
-            ]
-            ingredients = combined_results[len(tags_tasks) + len(ratings_tasks) :]
+            # Split the combined results back into ratings and ingredients.
+            ratings = combined_results[: len(ratings_tasks)]
+            ingredients = combined_results[len(ratings_tasks) :]
         else:
-            # No child entities to map - this is normal for recipes without tags, ratings, or ingredients
-            tags = []
+            # No child entities to map - this is normal for recipes without ratings or ingredients
             ratings = []
             ingredients = []
 
@@ -101,6 +101,7 @@ class BaseMealApiFilter(BaseModel):
     skip: int | None = None
     limit: int | None = get_pagination_settings().MEALS_AND_RECIPES
     sort: str | None = Field(default="-created_at")
+    cursor: str | None = None
 
     def model_dump(self, *args, **kwargs) -> dict[str, Any]:
         """
@@ -141,6 +142,7 @@ def get_allowed_filters(self) -> list[str]:
             "skip",
             "limit",
             "sort",
+            "cursor",
             "created_at",
             "tags",
             "tags_not_exists",
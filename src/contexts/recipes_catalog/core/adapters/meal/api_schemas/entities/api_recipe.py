@@ -1,6 +1,6 @@
 from dataclasses import asdict
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 import src.contexts.recipes_catalog.core.adapters.meal.api_schemas.entities.api_recipe_fields as fields
 from pydantic import HttpUrl, ValidationInfo, field_validator
@@ -66,6 +66,8 @@ class ApiRecipe(BaseApiEntity[_Recipe, RecipeSaModel]):
         ValidationError: If the instance is invalid.
     """
 
+    trusted_output_safe: ClassVar[bool] = True
+
     name: fields.RecipeNameRequired
     instructions: fields.RecipeInstructionsRequired
     author_id: UUIDIdRequired
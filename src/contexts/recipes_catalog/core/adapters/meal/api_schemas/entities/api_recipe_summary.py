@@ -0,0 +1,51 @@
+"""API schema for recipe list summaries."""
+
+from typing import Self
+
+import src.contexts.recipes_catalog.core.adapters.meal.api_schemas.entities.api_recipe_fields as fields
+from pydantic import BaseModel
+from src.contexts.recipes_catalog.core.domain.meal.read_models.recipe_summary import (
+    RecipeSummary,
+)
+from src.contexts.seedwork.adapters.api_schemas.base_api_fields import (
+    DatetimeOptional,
+    UrlOptional,
+    UUIDIdRequired,
+)
+from src.contexts.seedwork.adapters.api_schemas.base_api_model import MODEL_CONFIG
+
+
+class ApiRecipeSummary(BaseModel):
+    """Read-only API view of a RecipeSummary.
+
+    Mirrors the scalar fields of ApiRecipe plus the precomputed nutrition
+    columns; ingredients, tags, ratings and instructions are left out.
+    Returned by recipe list endpoints when the client asks for
+    projection=summary.
+    """
+
+    model_config = MODEL_CONFIG
+
+    id: UUIDIdRequired
+    name: fields.RecipeNameRequired
+    description: fields.RecipeDescriptionOptional
+    author_id: UUIDIdRequired
+    meal_id: UUIDIdRequired
+    total_time: fields.RecipeTotalTimeOptional
+    privacy: fields.RecipePrivacyOptional
+    weight_in_grams: fields.RecipeWeightInGramsOptional
+    calories: float | None = None
+    calorie_density: float | None = None
+    carbo_percentage: float | None = None
+    protein_percentage: float | None = None
+    total_fat_percentage: float | None = None
+    average_taste_rating: fields.RecipeAverageTasteRatingOptional
+    average_convenience_rating: fields.RecipeAverageConvenienceRatingOptional
+    image_url: UrlOptional
+    created_at: DatetimeOptional
+    updated_at: DatetimeOptional
+
+    @classmethod
+    def from_read_model(cls, summary: RecipeSummary) -> Self:
+        """Build the API view from a RecipeSummary read model."""
+        return cls.model_validate(summary)
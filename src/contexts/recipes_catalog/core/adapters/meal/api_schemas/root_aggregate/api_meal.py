@@ -1,6 +1,6 @@
 from dataclasses import asdict
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, ClassVar
 
 import src.contexts.recipes_catalog.core.adapters.meal.api_schemas.root_aggregate.api_meal_fields as fields
 from pydantic import HttpUrl, ValidationInfo, field_validator
@@ -124,6 +124,8 @@ async def lambda_handler(event, context):
     ```
     """
 
+    trusted_output_safe: ClassVar[bool] = True
+
     name: fields.MealNameRequired
     author_id: UUIDIdRequired
     menu_id: UUIDIdOptional
@@ -149,10 +151,15 @@ def validate_recipes_have_correct_meal_and_author_id(
         Validate meal_id equals to the meal id and author_id equals to the meal
         author_id.
         """
-        meal_id = info.data["id"]
-        author_id = info.data["author_id"]
-        if v:
-            for recipe in v:
+        cls._assign_recipes_to_meal(v, info.data["id"], info.data["author_id"])
+        return v
+
+    @staticmethod
+    def _assign_recipes_to_meal(
+        recipes: list[ApiRecipe] | None, meal_id: str, author_id: str
+    ) -> None:
+        if recipes:
+            for recipe in recipes:
                 object.__setattr__(
                     recipe,
                     "meal_id",
@@ -163,7 +170,9 @@ def validate_recipes_have_correct_meal_and_author_id(
                     "author_id",
                     author_id,
                 )
-        return v
+
+    def _after_trusted_construct(self) -> None:
+        self._assign_recipes_to_meal(self.recipes, self.id, self.author_id)
 
     @field_validator("recipes", mode="after")
     @classmethod
@@ -0,0 +1,52 @@
+"""API schema for meal list summaries."""
+
+from typing import Self
+
+import src.contexts.recipes_catalog.core.adapters.meal.api_schemas.root_aggregate.api_meal_fields as fields
+from pydantic import BaseModel
+from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.entities.api_recipe_fields import (
+    RecipeTotalTimeOptional,
+)
+from src.contexts.recipes_catalog.core.domain.meal.read_models.meal_summary import (
+    MealSummary,
+)
+from src.contexts.seedwork.adapters.api_schemas.base_api_fields import (
+    DatetimeOptional,
+    UrlOptional,
+    UUIDIdOptional,
+    UUIDIdRequired,
+)
+from src.contexts.seedwork.adapters.api_schemas.base_api_model import MODEL_CONFIG
+
+
+class ApiMealSummary(BaseModel):
+    """Read-only API view of a MealSummary.
+
+    Mirrors the scalar fields of ApiMeal; recipes, tags and the full
+    nutrition facts are left out. Returned by meal list endpoints when the
+    client asks for projection=summary.
+    """
+
+    model_config = MODEL_CONFIG
+
+    id: UUIDIdRequired
+    name: fields.MealNameRequired
+    description: fields.MealDescriptionOptional
+    author_id: UUIDIdRequired
+    menu_id: UUIDIdOptional
+    total_time: RecipeTotalTimeOptional
+    like: fields.MealLikeOptional
+    weight_in_grams: fields.MealWeightInGramsOptional
+    calories: float | None = None
+    calorie_density: fields.MealCalorieDensityOptional
+    carbo_percentage: fields.MealCarboPercentageOptional
+    protein_percentage: fields.MealProteinPercentageOptional
+    total_fat_percentage: fields.MealTotalFatPercentageOptional
+    image_url: UrlOptional
+    created_at: DatetimeOptional
+    updated_at: DatetimeOptional
+
+    @classmethod
+    def from_read_model(cls, summary: MealSummary) -> Self:
+        """Build the API view from a MealSummary read model."""
+        return cls.model_validate(summary)
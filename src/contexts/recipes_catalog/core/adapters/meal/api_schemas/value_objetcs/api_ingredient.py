@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, ClassVar
 
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.value_objetcs.api_ingredient_fields import (
     IngredientFullTextOptional,
@@ -39,6 +39,8 @@ class ApiIngredient(BaseApiValueObject[Ingredient, IngredientSaModel]):
             the ingredient, if applicable.
     """
 
+    trusted_output_safe: ClassVar[bool] = True
+
     name: IngredientNameRequired
     quantity: IngredientQuantityRequired
     unit: MeasureUnit
@@ -53,7 +55,7 @@ def from_domain(cls, domain_obj: Ingredient) -> "ApiIngredient":
             return None
         return cls(
             name=domain_obj.name,
-            quantity=domain_obj.quantity,
+            quantity=float(domain_obj.quantity),
             unit=domain_obj.unit,
             full_text=domain_obj.full_text,
             product_id=domain_obj.product_id,
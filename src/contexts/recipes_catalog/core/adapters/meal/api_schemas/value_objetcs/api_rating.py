@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, ClassVar
 
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.value_objetcs.api_rating_fields import (
     RatingCommentOptional,
@@ -35,6 +35,8 @@ class ApiRating(BaseApiValueObject[Rating, RatingSaModel]):
         comment (RatingComment): Comment about the recipe.
     """
 
+    trusted_output_safe: ClassVar[bool] = True
+
     user_id: UUIDIdRequired
     recipe_id: UUIDIdRequired
     taste: RatingTasteRequired
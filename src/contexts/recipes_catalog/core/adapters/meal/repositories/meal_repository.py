@@ -22,9 +22,16 @@
     RecipeSaModel,
 )
 from src.contexts.recipes_catalog.core.domain.meal.root_aggregate.meal import Meal
+from src.contexts.recipes_catalog.core.domain.meal.read_models.meal_summary import (
+    MealSummary,
+)
 from src.contexts.seedwork.adapters.enums import FrontendFilterTypes
+from src.contexts.seedwork.adapters.repositories.bulk_upsert import BulkUpsertResult
 from src.contexts.seedwork.adapters.repositories.filter_mapper import FilterColumnMapper
 from src.contexts.seedwork.adapters.repositories.protocols import CompositeRepository
+from src.contexts.seedwork.adapters.repositories.query_cache import (
+    QueryCacheBackend,
+)
 from src.contexts.seedwork.adapters.repositories.repository_logger import (
     RepositoryLogger,
 )
@@ -111,12 +118,14 @@ def __init__(
         self,
         db_session: AsyncSession,
         repository_logger: RepositoryLogger | None = None,
+        cache_backend: QueryCacheBackend | None = None,
     ):
         """Initialize meal repository with database session and logging.
 
         Args:
             db_session: Active SQLAlchemy async session.
             repository_logger: Optional logger for query tracking.
+            cache_backend: Optional query-result cache for filter queries.
         """
         self._session = db_session
 
@@ -139,6 +148,8 @@ def __init__(
             sa_model_type=MealSaModel,
             filter_to_column_mappers=MealRepo.filter_to_column_mappers,
             repository_logger=self._repository_logger,
+            cache_backend=cache_backend,
+            related_cache_namespaces=("recipes_catalog.recipes",),
         )
         self.data_mapper = self._generic_repo.data_mapper
         self.domain_model_type = self._generic_repo.domain_model_type
@@ -226,6 +237,82 @@ async def get_meal_by_recipe_id(self, recipe_id: str) -> Meal:
         )
         return result[0]
 
+    async def _prepare_query(
+        self,
+        filters: dict[str, Any],
+        starting_stmt: Select | None,
+        query_context: dict[str, Any],
+    ) -> Select | None:
+        """Fold product-name and tag filters into the starting statement.
+
+        Pops the filters the generic column mappers can not express. Shared
+        by query() and query_summaries().
+
+        Returns:
+            Starting statement to hand to the generic repository.
+        """
+        # Handle product name similarity search
+        if filters.get("product_name"):
+            product_name = filters.pop("product_name")
+            product_repo = ProductRepo(self._session)
+            products = await product_repo.list_top_similar_names(
+                product_name, limit=3
+            )
+            product_ids = [product.id for product in products]
+            filters["products"] = product_ids
+
+            query_context["product_similarity_search"] = {
+                "search_term": product_name,
+                "products_found": len(product_ids),
+                "product_ids": (
+                    product_ids[:5] if product_ids else []
+                ),  # Include first 5 IDs for context
+            }
+
+        # Handle tag filtering using TagFilter methods
+        if "tags" in filters or "tags_not_exists" in filters:
+            query_context["tag_filtering"] = True
+
+            if starting_stmt is None:
+                starting_stmt = select(self.sa_model_type)
+
+            if filters.get("tags"):
+                tags = filters.pop("tags")
+                self.tag_filter.validate_tag_format(tags)
+
+                tag_condition = self.tag_filter.build_tag_filter(
+                    self.sa_model_type, tags, "meal"
+                )  # Using TagFilter method
+                starting_stmt = starting_stmt.where(tag_condition)
+
+                query_context["positive_tags"] = len(tags)
+                self._repository_logger.debug_filter_operation(
+                    f"Applied positive tag filter: {len(tags)} tag conditions",
+                    tags_count=len(tags),
+                )
+
+            if filters.get("tags_not_exists"):
+                tags_not_exists = filters.pop("tags_not_exists")
+                self.tag_filter.validate_tag_format(tags_not_exists)
+
+                negative_tag_condition = self.tag_filter.build_negative_tag_filter(
+                    self.sa_model_type, tags_not_exists, "meal"
+                )
+                starting_stmt = starting_stmt.where(negative_tag_condition)
+
+                query_context["negative_tags"] = len(tags_not_exists)
+                self._repository_logger.debug_filter_operation(
+                    (
+                        f"Applied negative tag filter: {len(tags_not_exists)} "
+                        f"exclusion conditions"
+                    ),
+                    exclusion_tags_count=len(tags_not_exists),
+                )
+
+            starting_stmt = starting_stmt.distinct()
+
+        return starting_stmt
+
     async def query(
         self,
         *,
@@ -256,65 +343,9 @@ async def query(
             operation="query", entity_type="Meal", filter_count=len(filters)
         ) as query_context:
 
-            # Handle product name similarity search
-            if filters.get("product_name"):
-                product_name = filters.pop("product_name")
-                product_repo = ProductRepo(self._session)
-                products = await product_repo.list_top_similar_names(
-                    product_name, limit=3
-                )
-                product_ids = [product.id for product in products]
-                filters["products"] = product_ids
-
-                query_context["product_similarity_search"] = {
-                    "search_term": product_name,
-                    "products_found": len(product_ids),
-                    "product_ids": (
-                        product_ids[:5] if product_ids else []
-                    ),  # Include first 5 IDs for context
-                }
-
-            # Handle tag filtering using TagFilter methods
-            if "tags" in filters or "tags_not_exists" in filters:
-                query_context["tag_filtering"] = True
-
-                if starting_stmt is None:
-                    starting_stmt = select(self.sa_model_type)
-
-                if filters.get("tags"):
-                    tags = filters.pop("tags")
-                    self.tag_filter.validate_tag_format(tags)
-
-                    tag_condition = self.tag_filter.build_tag_filter(
-                        self.sa_model_type, tags, "meal"
-                    )  # Using TagFilter method
-                    starting_stmt = starting_stmt.where(tag_condition)
-
-                    query_context["positive_tags"] = len(tags)
-                    self._repository_logger.debug_filter_operation(
-                        f"Applied positive tag filter: {len(tags)} tag conditions",
-                        tags_count=len(tags),
-                    )
-
-                if filters.get("tags_not_exists"):
-                    tags_not_exists = filters.pop("tags_not_exists")
-                    self.tag_filter.validate_tag_format(tags_not_exists)
-
-                    negative_tag_condition = self.tag_filter.build_negative_tag_filter(
-                        self.sa_model_type, tags_not_exists, "meal"
-                    )
-                    starting_stmt = starting_stmt.where(negative_tag_condition)
-
-                    query_context["negative_tags"] = len(tags_not_exists)
-                    self._repository_logger.debug_filter_operation(
-                        (
-                            f"Applied negative tag filter: {len(tags_not_exists)} "
-                            f"exclusion conditions"
-                        ),
-                        exclusion_tags_count=len(tags_not_exists),
-                    )
-
-                starting_stmt = starting_stmt.distinct()
+            starting_stmt = await self._prepare_query(
+                filters, starting_stmt, query_context
+            )
 
             results = await self._generic_repo.query(
                 filters=filters,
@@ -327,6 +358,59 @@ async def query(
 
             return results
 
+    async def query_summaries(
+        self,
+        *,
+        filters: dict[str, Any] | None = None,
+        limit: int | None = None,
+    ) -> list[MealSummary]:
+        """Query meals as lightweight summaries.
+
+        Accepts the same filters as query() but selects only the columns of
+        MealSummary, so no relationships are loaded and nothing is added to
+        the session.
+
+        Args:
+            filters: Dictionary of filter criteria.
+            limit: Maximum number of results to return.
+
+        Returns:
+            List of MealSummary read models matching criteria.
+        """
+        filters = filters or {}
+
+        async with self._repository_logger.track_query(
+            operation="query_summaries",
+            entity_type="Meal",
+            filter_count=len(filters),
+        ) as query_context:
+            starting_stmt = await self._prepare_query(filters, None, query_context)
+            rows = await self._generic_repo.query_projection(
+                MealSummary.columns(),
+                filters=filters,
+                starting_stmt=starting_stmt,
+                limit=limit,
+            )
+            query_context["result_count"] = len(rows)
+            return [MealSummary.from_row(row) for row in rows]
+
+    def next_cursor(
+        self,
+        items: list[Meal] | list[MealSummary],
+        filters: dict[str, Any] | None,
+    ) -> str | None:
+        """Return the keyset cursor for the page after items.
+
+        Args:
+            items: Meals returned by query() or query_summaries().
+            filters: Filters the page was queried with.
+
+        Returns:
+            Opaque cursor, or None on the last page or for sorts that only
+            support skip/limit pagination.
+        """
+        return self._generic_repo.next_cursor(items, filters)
+
     def list_filter_options(self) -> dict[str, dict]:
         """Return available filter and sort options for frontend.
 
@@ -382,10 +466,16 @@ async def persist(self, domain_obj: Meal) -> None:
             meal_name=domain_obj.name,
         )
 
-    async def persist_all(self, domain_entities: list[Meal] | None = None) -> None:
+    async def persist_all(
+        self, domain_entities: list[Meal] | None = None, *, bulk: bool = False
+    ) -> BulkUpsertResult | None:
         """Persist multiple meal entities in batch.
 
         Args:
             domain_entities: List of Meal domain objects to persist.
+            bulk: Write with multi-row upserts instead of per-meal merges.
+
+        Returns:
+            Affected row counts when ``bulk`` is set, otherwise None.
         """
-        await self._generic_repo.persist_all(domain_entities)
+        return await self._generic_repo.persist_all(domain_entities, bulk=bulk)
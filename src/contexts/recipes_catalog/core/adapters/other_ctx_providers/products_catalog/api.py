@@ -21,8 +21,8 @@
 from src.contexts.products_catalog.core.adapters.ORM.sa_models.source import (
     SourceSaModel,
 )
-from src.contexts.recipes_catalog.core.adapters.other_ctx_providers.products_catalog.schemas import (
-    ProductsCatalogProduct,
+from src.contexts.recipes_catalog.core.adapters.other_ctx_providers.products_catalog.port import (
+    get_products_catalog_port,
 )
 
 
@@ -30,7 +30,8 @@ class ProductsCatalogProvider:
     """External provider for products catalog integration.
 
     Provides access to products catalog data through internal API endpoints.
-    Handles JSON serialization/deserialization and type conversion.
+    Product reads go through the products catalog port, which skips JSON
+    when both contexts run in the same process.
 
     Notes:
         Integrates with products_catalog internal API.
@@ -47,8 +48,8 @@ async def get(id: str) -> dict:
         Returns:
             Serialized product data as dictionary.
         """
-        product_data = await products_catalog_api.get(id)
-        return ProductsCatalogProduct(**json.loads(product_data)).model_dump()
+        product = await get_products_catalog_port().get(id)
+        return product.model_dump()
 
     @staticmethod
     async def query(filter: dict | None = None) -> list[dict]:
@@ -60,11 +61,8 @@ async def query(filter: dict | None = None) -> list[dict]:
         Returns:
             List of serialized product data dictionaries.
         """
-        products_data = await products_catalog_api.get_products(filters=filter)
-        products_data = json.loads(products_data)
-        return [
-            ProductsCatalogProduct(**product).model_dump() for product in products_data
-        ]
+        products = await get_products_catalog_port().query(filter)
+        return [product.model_dump() for product in products]
 
     @staticmethod
     async def get_filter_options(
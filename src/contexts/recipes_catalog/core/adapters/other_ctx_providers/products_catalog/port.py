@@ -0,0 +1,85 @@
+"""Typed port for reading products from the products catalog context.
+
+Two transports implement the same contract:
+
+- ``InProcessProductsCatalogPort`` calls the typed internal endpoints and
+  converts ``ApiProduct`` read models without a JSON round trip. Used when
+  both contexts run in one process.
+- ``SerializedProductsCatalogPort`` consumes the JSON endpoints, validating
+  the payload straight from bytes. Used when the contexts are deployed apart.
+"""
+
+from typing import Any, Protocol
+
+from pydantic import TypeAdapter
+
+import src.contexts.products_catalog.core.internal_endpoints.products as products_catalog_api
+from src.contexts.products_catalog.core.adapters.api_schemas.root_aggregate.api_product import (
+    ApiProduct,
+)
+from src.contexts.recipes_catalog.core.adapters.other_ctx_providers.products_catalog.schemas import (
+    ProductsCatalogProduct,
+)
+from src.contexts.shared_kernel.services.cross_context import (
+    in_process_calls_enabled,
+)
+
+_PRODUCT_LIST = TypeAdapter(list[ProductsCatalogProduct])
+
+
+class ProductsCatalogPort(Protocol):
+    """Read access to products catalog products as recipes read models."""
+
+    async def get(self, id: str) -> ProductsCatalogProduct: ...
+
+    async def query(
+        self, filter: dict[str, Any] | None = None
+    ) -> list[ProductsCatalogProduct]: ...
+
+
+def product_from_api_product(api_product: ApiProduct) -> ProductsCatalogProduct:
+    """Convert a products catalog read model to the recipes read model.
+
+    ``mode="json"`` produces the same plain values the JSON endpoint would
+    emit (nested schemas as dicts, URLs as strings) without building and
+    parsing a string.
+    """
+    return ProductsCatalogProduct.model_validate(api_product.model_dump(mode="json"))
+
+
+class InProcessProductsCatalogPort:
+    """Products catalog port for contexts sharing one process."""
+
+    async def get(self, id: str) -> ProductsCatalogProduct:
+        return product_from_api_product(await products_catalog_api.get_api_product(id))
+
+    async def query(
+        self, filter: dict[str, Any] | None = None
+    ) -> list[ProductsCatalogProduct]:
+        api_products = await products_catalog_api.get_api_products(filters=filter)
+        return [product_from_api_product(product) for product in api_products]
+
+
+class SerializedProductsCatalogPort:
+    """Products catalog port over the JSON internal endpoints."""
+
+    async def get(self, id: str) -> ProductsCatalogProduct:
+        return ProductsCatalogProduct.model_validate_json(
+            await products_catalog_api.get(id)
+        )
+
+    async def query(
+        self, filter: dict[str, Any] | None = None
+    ) -> list[ProductsCatalogProduct]:
+        return _PRODUCT_LIST.validate_json(
+            await products_catalog_api.get_products(filters=filter)
+        )
+
+
+_IN_PROCESS = InProcessProductsCatalogPort()
+_SERIALIZED = SerializedProductsCatalogPort()
+
+
+def get_products_catalog_port() -> ProductsCatalogPort:
+    """Return the port matching the configured cross-context transport."""
+    return _IN_PROCESS if in_process_calls_enabled() else _SERIALIZED
@@ -1,6 +1,7 @@
 """Message bus bootstrap: wire commands/events to their handlers for recipes_catalog."""
 from collections.abc import Coroutine
 from functools import partial
+from operator import attrgetter
 from typing import Callable
 
 import src.contexts.recipes_catalog.core.domain.client.commands as client_commands
@@ -11,12 +12,15 @@
 import src.contexts.recipes_catalog.core.services.client.event_handlers as client_evt_handlers
 import src.contexts.recipes_catalog.core.services.meal.command_handlers as meal_cmd_handlers
 import src.contexts.recipes_catalog.core.services.meal.event_handlers as meal_evt_handlers
+from src.config.app_config import get_app_settings
 from src.contexts.recipes_catalog.core.services.uow import UnitOfWork
 from src.contexts.seedwork.domain.commands.command import (
     Command as SeedworkCommand,
 )
 from src.contexts.seedwork.domain.event import Event as SeedworkEvent
+from src.contexts.shared_kernel.services.event_coalescing import EventCoalescer
 from src.contexts.shared_kernel.services.messagebus import MessageBus
+from src.contexts.shared_kernel.services.outbox import get_outbox
 
 
 def bootstrap(
@@ -33,32 +37,36 @@ def bootstrap(
     Notes:
         Maps domain commands and events to their respective handlers.
         All handlers receive the unit of work for database operations.
+        Menu projection handlers are EventCoalescers keyed by menu_id.
     """
+    # Menu projections are coalesced per menu: one load/persist of a menu
+    # for all the meal changes a command (or burst of commands) made to it.
+    coalesce_window = get_app_settings().messagebus_coalesce_window
+    sync_menu_meals = EventCoalescer(
+        "recipes_catalog.sync_menu_meals",
+        partial(meal_evt_handlers.sync_menu_meals, uow_factory=uow_factory),
+        key=attrgetter("menu_id"),
+        window=coalesce_window,
+    )
+    update_menu_id_on_meals = EventCoalescer(
+        "recipes_catalog.update_menu_id_on_meals",
+        partial(
+            client_evt_handlers.update_menu_id_on_meals_batch,
+            uow_factory=uow_factory,
+        ),
+        key=attrgetter("menu_id"),
+        window=coalesce_window,
+    )
     injected_event_handlers: dict[type[SeedworkEvent], list[partial[Coroutine]]] = {
-        meal_events.MealDeleted: [
-            partial(
-                meal_evt_handlers.remove_meals_from_menu,
-                uow_factory=uow_factory,
-            ),
-        ],
-        meal_events.UpdatedAttrOnMealThatReflectOnMenu: [
-            partial(
-                meal_evt_handlers.update_menu_meals,
-                uow_factory=uow_factory,
-            ),
-        ],
+        meal_events.MealDeleted: [sync_menu_meals],
+        meal_events.UpdatedAttrOnMealThatReflectOnMenu: [sync_menu_meals],
         client_events.MenuDeleted: [
             partial(
                 client_evt_handlers.delete_related_meals,
                 uow_factory=uow_factory,
             ),
         ],
-        client_events.MenuMealAddedOrRemoved: [
-            partial(
-                client_evt_handlers.update_menu_id_on_meals,
-                uow_factory=uow_factory,
-            ),
-        ],
+        client_events.MenuMealAddedOrRemoved: [update_menu_id_on_meals],
     }
 
     injected_command_handlers: dict[type[SeedworkCommand], partial[Coroutine]] = {
@@ -81,4 +89,5 @@ def bootstrap(
         uow_factory=uow_factory,
         event_handlers=injected_event_handlers,
         command_handlers=injected_command_handlers,
+        outbox=get_outbox("recipes_catalog", injected_event_handlers),
     )
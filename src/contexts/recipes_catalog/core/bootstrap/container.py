@@ -1,7 +1,8 @@
 """Dependency Injection container for recipes_catalog core services."""
 from dependency_injector import containers, providers
 from src.contexts.recipes_catalog.core.services.uow import UnitOfWork
-from src.db.fastapi_database import fastapi_db
+from src.contexts.seedwork.adapters.repositories.query_cache import get_query_cache
+from src.db.fastapi_database import get_fastapi_database
 
 from .bootstrap import bootstrap
 
@@ -11,6 +12,7 @@ class Container(containers.DeclarativeContainer):
 
     Attributes:
         database: Database connection provider.
+        query_cache: Process-wide repository query cache (None when disabled).
         uow: Unit of work factory with database session.
         bootstrap: Message bus bootstrap factory.
 
@@ -21,10 +23,12 @@ class Container(containers.DeclarativeContainer):
 
     wiring_config = containers.WiringConfiguration(modules=[__name__])
 
-    database = providers.Object(fastapi_db)
+    database = providers.Callable(get_fastapi_database)
+    query_cache = providers.Callable(get_query_cache)
     uow_factory = providers.Factory(
         UnitOfWork,
         session_factory=database.provided.async_session_factory,
+        query_cache=query_cache,
     )
     bootstrap = providers.Factory(
         bootstrap,
@@ -0,0 +1,46 @@
+"""Lightweight read model for meal list views."""
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Self
+
+from attrs import fields, frozen
+
+
+@frozen(kw_only=True)
+class MealSummary:
+    """Scalar and precomputed nutrition columns of a meal.
+
+    Built straight from a projection row, without loading recipes, tags or
+    nutrition composites.
+
+    Notes:
+        Immutable. Not an aggregate: never persisted or mutated.
+    """
+
+    id: str
+    name: str
+    description: str | None
+    author_id: str
+    menu_id: str | None
+    total_time: int | None
+    like: bool | None
+    weight_in_grams: int | None
+    calories: float | None
+    calorie_density: float | None
+    carbo_percentage: float | None
+    protein_percentage: float | None
+    total_fat_percentage: float | None
+    image_url: str | None
+    created_at: datetime | None
+    updated_at: datetime | None
+
+    @classmethod
+    def columns(cls) -> tuple[str, ...]:
+        """Return the column names this read model is built from."""
+        return tuple(field.name for field in fields(cls))
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> Self:
+        """Build a summary from a projection row keyed by column name."""
+        return cls(**{name: row[name] for name in cls.columns()})
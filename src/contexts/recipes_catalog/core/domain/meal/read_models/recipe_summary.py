@@ -0,0 +1,51 @@
+"""Lightweight read model for recipe list views."""
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Self
+
+from attrs import fields, frozen
+from src.contexts.shared_kernel.domain.enums import Privacy
+
+
+@frozen(kw_only=True)
+class RecipeSummary:
+    """Scalar, rating and precomputed nutrition columns of a recipe.
+
+    Built straight from a projection row, without loading ingredients, tags,
+    ratings or nutrition composites.
+
+    Notes:
+        Immutable. Not an entity: never persisted or mutated.
+    """
+
+    id: str
+    name: str
+    description: str | None
+    author_id: str
+    meal_id: str
+    total_time: int | None
+    privacy: Privacy
+    weight_in_grams: int | None
+    calories: float | None
+    calorie_density: float | None
+    carbo_percentage: float | None
+    protein_percentage: float | None
+    total_fat_percentage: float | None
+    average_taste_rating: float | None
+    average_convenience_rating: float | None
+    image_url: str | None
+    created_at: datetime | None
+    updated_at: datetime | None
+
+    @classmethod
+    def columns(cls) -> tuple[str, ...]:
+        """Return the column names this read model is built from."""
+        return tuple(field.name for field in fields(cls))
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> Self:
+        """Build a summary from a projection row keyed by column name."""
+        values = {name: row[name] for name in cls.columns()}
+        values["privacy"] = Privacy(values["privacy"] or Privacy.PRIVATE)
+        return cls(**values)
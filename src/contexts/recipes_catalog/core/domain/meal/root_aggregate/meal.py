@@ -386,13 +386,14 @@ def nutri_facts(self) -> NutriFacts | None:
             - Returns None if no recipes have nutritional data
         """
         self._check_not_discarded()
-        nutri_facts = NutriFacts()
-        has_any_nutri_facts = False
-        for recipe in self.recipes:
-            if recipe.nutri_facts is not None:
-                nutri_facts += recipe.nutri_facts
-                has_any_nutri_facts = True
-        return nutri_facts if has_any_nutri_facts else None
+        recipe_nutri_facts = [
+            recipe.nutri_facts
+            for recipe in self.recipes
+            if recipe.nutri_facts is not None
+        ]
+        if not recipe_nutri_facts:
+            return None
+        return NutriFacts.sum(recipe_nutri_facts)
 
     @property
     def calorie_density(self) -> float | None:
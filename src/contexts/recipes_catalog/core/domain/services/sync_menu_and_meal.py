@@ -48,17 +48,18 @@ async def update_menu_meals_and_manage_related_meals(menu: Menu, new_meals_value
     
 
     new_set_of_menu_meals_for_menu = set()
+    meals_to_persist: dict[str, Meal] = {}
     for meal in all_meals_in_transaction:
         if meal.id in ids_of_meals_to_removed_from_menu:
             logger.error(f"meal.id: {meal.id} in ids_of_meals_to_removed_from_menu")
             meal._menu_id = None
-            await uow.meals.persist(meal)
+            meals_to_persist[meal.id] = meal
         else:
             ids_of_meals_already_in_menu = []
             for menu_meal in [i for i in new_meals_value if i.meal_id == meal.id]:
                 if menu_meal.meal_id not in ids_of_meals_already_in_menu:
                     meal._menu_id = menu.id # just make sure menu_id is correct
-                    await uow.meals.persist(meal)
+                    meals_to_persist[meal.id] = meal
                     new_set_of_menu_meals_for_menu.add(menu_meal)
                     ids_of_meals_already_in_menu.append(menu_meal.meal_id)
                 else:
@@ -70,5 +71,6 @@ async def update_menu_meals_and_manage_related_meals(menu: Menu, new_meals_value
                     await uow.meals.add(new_meal)
                     new_set_of_menu_meals_for_menu.add(menu_meal.replace(meal_id=new_meal.id))
 
+    await uow.meals.persist_all(list(meals_to_persist.values()), bulk=True)
     menu.meals = new_set_of_menu_meals_for_menu
     return menu
\ No newline at end of file
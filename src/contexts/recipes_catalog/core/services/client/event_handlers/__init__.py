@@ -3,9 +3,11 @@
 )
 from src.contexts.recipes_catalog.core.services.client.event_handlers.menu_meals_changed_handler import (
     update_menu_id_on_meals,
+    update_menu_id_on_meals_batch,
 )
 
 __all__ = [
     "delete_related_meals",
     "update_menu_id_on_meals",
+    "update_menu_id_on_meals_batch",
 ]
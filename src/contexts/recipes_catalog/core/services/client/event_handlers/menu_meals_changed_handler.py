@@ -17,5 +17,27 @@ async def update_menu_id_on_meals(evt: MenuMealAddedOrRemoved, uow_factory: Call
                 meal._menu_id = evt.menu_id
             if meal.id in evt.ids_of_meals_removed:
                 meal._menu_id = None
+        await uow.meals.persist_all(meals, bulk=True)
+        await uow.commit()
+
+
+async def update_menu_id_on_meals_batch(
+    evts: list[MenuMealAddedOrRemoved], uow_factory: Callable[[], UnitOfWork]
+):
+    """Apply several `MenuMealAddedOrRemoved` events with one query and persist.
+
+    Events are folded in the order they were raised, so the last change of
+    a meal wins (within one event, removal wins over addition).
+    """
+    menu_ids: dict[str, str | None] = {}
+    for evt in evts:
+        for meal_id in evt.ids_of_meals_added:
+            menu_ids[meal_id] = evt.menu_id
+        for meal_id in evt.ids_of_meals_removed:
+            menu_ids[meal_id] = None
+    async with uow_factory() as uow:
+        meals = await uow.meals.query(filters={"id": list(menu_ids)})
+        for meal in meals:
+            meal._menu_id = menu_ids[meal.id]
         await uow.meals.persist_all(meals)
         await uow.commit()
@@ -0,0 +1,65 @@
+"""Batched event handler that syncs a menu's `MenuMeal`s with changed meals."""
+
+from collections.abc import Callable
+
+from src.contexts.recipes_catalog.core.domain.meal.events.meal_deleted import (
+    MealDeleted,
+)
+from src.contexts.recipes_catalog.core.domain.meal.events.updated_attr_that_reflect_on_menu import (
+    UpdatedAttrOnMealThatReflectOnMenu,
+)
+from src.contexts.recipes_catalog.core.services.uow import UnitOfWork
+from src.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+async def sync_menu_meals(
+    evts: list[MealDeleted | UpdatedAttrOnMealThatReflectOnMenu],
+    uow_factory: Callable[[], UnitOfWork],
+):
+    """Apply every meal change queued for one menu in a single unit of work.
+
+    Replaces one `update_menu_meals`/`remove_meals_from_menu` run per event:
+    the menu is loaded and persisted once and all updated meals are loaded
+    with one query.
+
+    Args:
+        evts: Events of one menu, in the order they were raised.
+        uow_factory: Factory for the unit of work.
+    """
+    menu_id = evts[0].menu_id
+    deleted_ids = {evt.meal_id for evt in evts if isinstance(evt, MealDeleted)}
+    updated_ids = {
+        evt.meal_id
+        for evt in evts
+        if isinstance(evt, UpdatedAttrOnMealThatReflectOnMenu)
+    } - deleted_ids
+
+    async with uow_factory() as uow:
+        menu = await uow.menus.get(menu_id)
+        if deleted_ids:
+            menu.remove_meals(deleted_ids)
+        if updated_ids:
+            meals = await uow.meals.query(filters={"id": list(updated_ids)})
+            menu_meals = {m.meal_id: m for m in menu.get_meals_by_ids(updated_ids)}
+            for meal in meals:
+                menu_meal = menu_meals.get(meal.id)
+                if menu_meal is None:
+                    continue
+                menu.update_meal(
+                    menu_meal.replace(
+                        meal_name=meal.name,
+                        nutri_facts=meal.nutri_facts,
+                    )
+                )
+        logger.debug(
+            "Menu meals synced",
+            menu_id=menu_id,
+            events=len(evts),
+            meals_updated=len(updated_ids),
+            meals_removed=len(deleted_ids),
+            operation="sync_menu_meals",
+        )
+        await uow.menus.persist(menu)
+        await uow.commit()
@@ -21,9 +21,9 @@ class UnitOfWork(SeedUnitOfWork):
     """Bind repositories for recipes catalog within a transactional context."""
     async def __aenter__(self):
         await super().__aenter__()
-        self.recipes = RecipeRepo(self.session)
+        self.recipes = RecipeRepo(self.session, cache_backend=self.query_cache)
         self.tags = TagRepo(self.session)
-        self.meals = MealRepo(self.session)
+        self.meals = MealRepo(self.session, cache_backend=self.query_cache)
         self.menus = MenuRepo(self.session)
         self.clients = ClientRepo(self.session)
         return self
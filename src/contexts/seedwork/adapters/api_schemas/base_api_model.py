@@ -1,8 +1,12 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Annotated, Any, ClassVar, Self
 
-from pydantic import BaseModel, ConfigDict, Field, model_serializer
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_serializer
 from src.contexts.seedwork.adapters.api_schemas.base_api_fields import (
     DatetimeOptional,
     UUIDIdRequired,
@@ -37,6 +41,36 @@
 
 CONVERT = TypeConversionUtility()
 
+_trusted_output: ContextVar[bool] = ContextVar("trusted_output", default=False)
+
+# Field annotations whose values are still validated in trusted construction
+_TEXT_ANNOTATIONS = (str, str | None)
+
+# Per-schema validators for text fields, built on first trusted construction.
+# Results are memoized: stored text repeats (tag values, ingredient names) and
+# the sanitizers are regex heavy.
+_trusted_text_validators: dict[type, dict[str, Callable[[str], Any]]] = {}
+_TEXT_MEMO_SIZE = 4096
+
+# Per-schema number of times validation rebuilds each set field
+_trusted_set_rebuilds: dict[type, dict[str, int]] = {}
+
+
+@contextmanager
+def trusted_output() -> Iterator[None]:
+    """Build API models from trusted domain data without validating it.
+
+    Inside the block, schemas that set ``trusted_output_safe`` skip Pydantic
+    validation when constructed (see `BaseApiModel.from_domain_trusted`).
+    Only use it for output: the data must come from our own domain objects,
+    which were validated by the same schemas on the way in.
+    """
+    token = _trusted_output.set(True)
+    try:
+        yield
+    finally:
+        _trusted_output.reset(token)
+
 
 def _serialize_field_value(field_value: Any) -> Any:
     """Serialize field values for consistent JSON output.
@@ -218,6 +252,16 @@ def to_domain(self) -> User:
         - Enum objects → values (when use_enum_values=True)
 
         Therefore, no custom field serializers are needed for standard JSON output.
+
+    Trusted Output:
+        Responses built from domain objects re-run every field validator only
+        to dump the result. Schemas whose from_domain() already passes final
+        field values (no before-validator conversion needed) set
+        `trusted_output_safe = True`; `from_domain_trusted()` then constructs
+        them, and the nested schemas they build, without validation. Text
+        fields are the exception: they still go through their field validation
+        (sanitizers, whitespace stripping, length limits), since stored text
+        may predate a sanitizer. The JSON is the same as from `from_domain()`.
     """
 
     # Strict validation configuration - IMMUTABLE AND ENFORCED
@@ -226,6 +270,96 @@ def to_domain(self) -> User:
     # Type conversion utility - available to all schemas
     convert: ClassVar[TypeConversionUtility] = CONVERT
 
+    # Whether from_domain() may skip validation inside `trusted_output()`
+    trusted_output_safe: ClassVar[bool] = False
+
+    def __init__(self, /, **data: Any) -> None:
+        if self.trusted_output_safe and _trusted_output.get():
+            text_validators = self._text_validators()
+            set_rebuilds = self._set_rebuilds()
+            values = {}
+            for name, value in data.items():
+                if type(value) is frozenset:
+                    # Validation rebuilds frozensets by iterating them; do the
+                    # same number of times so set iteration order, and with it
+                    # the JSON arrays, match
+                    for _ in range(set_rebuilds.get(name, 1)):
+                        value = frozenset(iter(value))
+                elif type(value) is str and name in text_validators:
+                    value = text_validators[name](value)
+                values[name] = value
+            constructed = self.model_construct(**values)
+            for attr in (
+                "__dict__",
+                "__pydantic_fields_set__",
+                "__pydantic_extra__",
+                "__pydantic_private__",
+            ):
+                object.__setattr__(self, attr, getattr(constructed, attr))
+            self._after_trusted_construct()
+            return
+        super().__init__(**data)
+
+    @classmethod
+    def _text_validators(cls) -> dict[str, Callable[[str], Any]]:
+        """Validators for the text fields, keyed by field name."""
+        validators = _trusted_text_validators.get(cls)
+        if validators is None:
+            config = ConfigDict(
+                str_strip_whitespace=cls.model_config.get(
+                    "str_strip_whitespace", False
+                )
+            )
+            validators = {
+                name: lru_cache(maxsize=_TEXT_MEMO_SIZE)(
+                    TypeAdapter(
+                        Annotated[field.annotation, *field.metadata]
+                        if field.metadata
+                        else field.annotation,
+                        config=config,
+                    ).validate_python
+                )
+                for name, field in cls.model_fields.items()
+                if field.annotation in _TEXT_ANNOTATIONS
+            }
+            _trusted_text_validators[cls] = validators
+        return validators
+
+    @classmethod
+    def _set_rebuilds(cls) -> dict[str, int]:
+        """How often validation rebuilds each set field, keyed by field name.
+
+        Pydantic builds a new frozenset from the input, and each before
+        validator on the field (e.g. ``parse_tags``) returns one more.
+        """
+        rebuilds = _trusted_set_rebuilds.get(cls)
+        if rebuilds is None:
+            rebuilds = dict.fromkeys(cls.model_fields, 1)
+            for decorator in cls.__pydantic_decorators__.field_validators.values():
+                if decorator.info.mode != "before":
+                    continue
+                for name in decorator.info.fields:
+                    if name in rebuilds:
+                        rebuilds[name] += 1
+            _trusted_set_rebuilds[cls] = rebuilds
+        return rebuilds
+
+    def _after_trusted_construct(self) -> None:
+        """Apply the normalization validators would have done.
+
+        Override when a validator has side effects the output depends on.
+        """
+
+    @classmethod
+    def from_domain_trusted(cls: type[Self], domain_obj: D) -> Self:
+        """Convert a domain object for output, skipping input validation.
+
+        Same result as `from_domain()`, for domain objects loaded from our own
+        storage. Schemas without `trusted_output_safe` still validate.
+        """
+        with trusted_output():
+            return cls.from_domain(domain_obj)
+
     @model_serializer
     def serialize_model(self) -> dict[str, Any]:
         """Custom serialization for all API models.
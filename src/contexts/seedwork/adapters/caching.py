@@ -0,0 +1,230 @@
+"""In-process caching primitives shared by the application caches.
+
+- :class:`LruTtlCache`: bounded LRU mapping with per-entry expiry and
+  hit/miss/eviction counters.
+- :class:`SingleFlight`: runs one call per key at a time and shares its
+  outcome with concurrent callers.
+
+Both are meant to be owned by one event loop (a FastAPI worker or a warm
+Lambda container). None of their methods awaits while mutating state, so
+check-then-act sequences need no lock; they are not thread-safe.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from typing import Any
+
+import anyio
+
+
+class LruTtlCache[K: Hashable, V]:
+    """Bounded LRU mapping whose entries expire after a per-entry TTL.
+
+    Reads move an entry to the most recently used end; writes beyond
+    ``max_entries`` evict from the least recently used end. Expired entries
+    are dropped lazily when read, or kept for revalidation (see `peek` and
+    `touch`) with ``keep_expired``.
+
+    Attributes:
+        max_entries: Capacity; the least recently used entry is evicted
+            beyond it.
+        clock: Time source of the expiry deadlines; `time.monotonic` (looked
+            up on each call) when None.
+        keep_expired: Keep expired entries until evicted, overwritten or
+            popped instead of dropping them on read.
+        on_drop: Called with the key and value of every entry that leaves
+            the cache other than through `clear` (expiry, eviction, `pop`,
+            overwrite), so owners can keep secondary indexes in sync.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        *,
+        clock: Callable[[], float] | None = None,
+        keep_expired: bool = False,
+        on_drop: Callable[[K, V], None] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.clock = clock
+        self.keep_expired = keep_expired
+        self.on_drop = on_drop
+        # key -> (expires_at, value); insertion order is recency order
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether key is stored, fresh or awaiting revalidation."""
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Return the value of an unexpired entry, or None on miss/expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= self._now():
+            self.misses += 1
+            if not self.keep_expired:
+                self._drop(key)
+                self.expired += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: K) -> V | None:
+        """Return a stored value even if expired, without counting or reordering."""
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store value under key for ttl seconds (forever when None)."""
+        if key in self._entries:
+            self._drop(key)
+        expires_at = self._now() + ttl if ttl is not None else float("inf")
+        self._entries[key] = (expires_at, value)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def touch(self, key: K, ttl: float | None = None) -> bool:
+        """Mark an entry as recently used and restart its TTL when given.
+
+        Returns:
+            Whether key was stored.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        if ttl is not None:
+            self._entries[key] = (self._now() + ttl, entry[1])
+        self._entries.move_to_end(key)
+        return True
+
+    def pop(self, key: K) -> V | None:
+        """Remove an entry and return its value, or None if it was not stored."""
+        if key not in self._entries:
+            return None
+        return self._drop(key)
+
+    def purge_expired(self) -> int:
+        """Drop expired entries from the least recently used end.
+
+        Stops at the first unexpired entry, so it reclaims every expired
+        entry when entries share one TTL and reads do not reorder them;
+        the rest expire lazily on read.
+
+        Returns:
+            Number of entries dropped.
+        """
+        now = self._now()
+        purged = 0
+        while self._entries:
+            key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            self._drop(key)
+            purged += 1
+        self.expired += purged
+        return purged
+
+    def clear(self) -> None:
+        """Drop every entry without calling `on_drop`."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss counters and current occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expired": self.expired,
+        }
+
+    def _now(self) -> float:
+        return self.clock() if self.clock is not None else time.monotonic()
+
+    def _drop(self, key: K) -> V:
+        _, value = self._entries.pop(key)
+        if self.on_drop is not None:
+            self.on_drop(key, value)
+        return value
+
+
+class _Flight:
+    """A call in progress; waiters block on ``done`` and read the outcome."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight[K: Hashable, V]:
+    """Deduplicates concurrent calls that share a key.
+
+    The first caller for a key runs the call; callers arriving while it is
+    in flight wait for it and get its result, or its exception re-raised.
+
+    Attributes:
+        coalesced: Calls answered by another caller's flight.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[K, _Flight] = {}
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._flights
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over the keys of the calls in flight."""
+        return iter(self._flights)
+
+    async def run(self, key: K, call: Callable[[], Awaitable[V]]) -> V:
+        """Run call once for every concurrent caller of key.
+
+        Raises:
+            Exception: Whatever call raised, re-raised for every waiter.
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.coalesced += 1
+            await flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        flight = self._flights[key] = _Flight()
+        try:
+            flight.result = await call()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            del self._flights[key]
+            flight.done.set()
+        return flight.result
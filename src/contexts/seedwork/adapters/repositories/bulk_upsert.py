@@ -0,0 +1,470 @@
+"""
+Bulk persistence through multi-row ``INSERT ... ON CONFLICT``.
+
+``session.merge`` issues a SELECT per instance and an UPDATE per dirty row,
+so persisting N aggregates costs O(N) round trips. :class:`BulkUpsertPlan`
+walks the mapped SQLAlchemy graphs instead and collects plain rows per
+table; :func:`execute_bulk_upsert` then writes each table with batched
+statements:
+
+- one ``INSERT ... ON CONFLICT (pk) DO UPDATE`` per table and chunk, with
+  ``RETURNING (xmax = 0)`` to tell inserted rows from updated ones;
+- one ``DELETE`` per ``delete-orphan`` relationship for children that are no
+  longer part of their parent;
+- association tables (many-to-many) are diffed: stale links are deleted and
+  the desired ones inserted with ``ON CONFLICT DO NOTHING``.
+
+Only the writes are batched: reads done while mapping domain objects to SA
+instances (e.g. a mapper loading the stored row) are not affected.
+
+Only attributes that are loaded on an instance are written, and unloaded
+relationships are left untouched. Versioned tables keep their optimistic
+check: a conflicting row is only updated while its stored version still
+equals the one read, and :class:`StaleDataError` is raised otherwise, as a
+flush of the same instances would.
+
+The statements use the PostgreSQL dialect.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, inspect, literal_column, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import MANYTOMANY, MANYTOONE, ONETOMANY
+from sqlalchemy.orm.exc import StaleDataError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy import Column, Table
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import InstanceState, Mapper, RelationshipProperty
+
+# PostgreSQL accepts at most 32767 bind parameters per statement.
+MAX_BIND_PARAMS = 30_000
+
+
+@dataclass(slots=True)
+class BulkUpsertResult:
+    """Rows affected by a bulk upsert.
+
+    Attributes:
+        inserted: Rows inserted (no conflicting primary key).
+        updated: Rows updated through ``ON CONFLICT DO UPDATE``.
+        deleted: Orphaned child rows deleted.
+        links_inserted: Association rows inserted.
+        links_deleted: Association rows deleted.
+        statements: Statements executed.
+    """
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    links_inserted: int = 0
+    links_deleted: int = 0
+    statements: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "deleted": self.deleted,
+            "links_inserted": self.links_inserted,
+            "links_deleted": self.links_deleted,
+            "statements": self.statements,
+        }
+
+
+@dataclass(slots=True)
+class _OrphanScope:
+    """Children kept per parent key in ``table``; other children of those parents are orphans."""
+
+    table: Table
+    fk_columns: tuple[Column, ...]
+    pk_columns: tuple[Column, ...]
+    kept: dict[tuple, set[tuple]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _LinkScope:
+    """Desired link targets per owner key in an association table."""
+
+    table: Table
+    owner_columns: tuple[Column, ...]
+    target_columns: tuple[Column, ...]
+    target_key_columns: tuple[Column, ...]
+    links: dict[tuple, list[Any]] = field(default_factory=dict)
+
+
+def _column_value(state: InstanceState, mapper: Mapper, column: Column) -> Any:
+    prop = mapper.get_property_by_column(column)
+    return state.dict.get(prop.key)
+
+
+class BulkUpsertPlan:
+    """Rows, orphan deletes and association diffs for a set of SA instances.
+
+    Build the plan with :meth:`add` for each root instance, then run it
+    with :func:`execute_bulk_upsert`.
+    """
+
+    def __init__(self) -> None:
+        self.rows: dict[Table, dict[tuple, dict[str, Any]]] = defaultdict(dict)
+        self.instances: list[Any] = []
+        self.version_columns: dict[Table, str] = {}
+        self._orphans: dict[tuple[Table, tuple[Column, ...]], _OrphanScope] = {}
+        self._links: dict[tuple[Table, tuple[Column, ...]], _LinkScope] = {}
+        self._seen: set[int] = set()
+
+    @property
+    def orphan_scopes(self) -> list[_OrphanScope]:
+        return list(self._orphans.values())
+
+    @property
+    def link_scopes(self) -> list[_LinkScope]:
+        return list(self._links.values())
+
+    def add(self, instance: Any) -> None:
+        """Collect ``instance`` and the children it cascades saves to."""
+        self._collect(instance, inherited={})
+
+    def _collect(self, instance: Any, inherited: dict[str, Any]) -> tuple | None:
+        """Collect one instance; returns its primary key, or None for new
+        rows whose key the database generates."""
+        state = inspect(instance)
+        mapper = state.mapper
+        table = mapper.local_table
+        row = self._row(state, mapper)
+        row.update({k: v for k, v in inherited.items() if row.get(k) is None})
+        key: tuple | None = tuple(row.get(c.key) for c in mapper.primary_key)
+        if any(value is None for value in key):
+            if table.autoincrement_column is None:
+                raise ValueError(
+                    f"Cannot bulk upsert {mapper.class_.__name__} without a "
+                    f"primary key: {dict(zip([c.key for c in mapper.primary_key], key, strict=True))}"
+                )
+            row.pop(table.autoincrement_column.key, None)
+            key = None
+        if id(instance) in self._seen:
+            return key
+        self._seen.add(id(instance))
+        self.rows[table][key if key is not None else ("new", id(instance))] = row
+        self.instances.append(instance)
+        if mapper.version_id_col is not None:
+            self.version_columns[table] = mapper.version_id_col.key
+
+        for rel in mapper.relationships:
+            if rel.key not in state.dict or rel.viewonly:
+                continue
+            value = state.dict[rel.key]
+            if rel.direction is ONETOMANY and rel.cascade.save_update:
+                self._collect_children(rel, row, value)
+            elif rel.direction is MANYTOMANY and rel.secondary is not None:
+                self._collect_links(rel, row, value)
+        return key
+
+    def _row(self, state: InstanceState, mapper: Mapper) -> dict[str, Any]:
+        row: dict[str, Any] = {}
+        for column in mapper.local_table.columns:
+            prop = mapper.get_property_by_column(column)
+            if prop.key not in state.dict:
+                continue
+            value = state.dict[prop.key]
+            if value is None and not column.primary_key and (
+                column.default is not None or column.server_default is not None
+            ):
+                continue
+            row[column.key] = value
+        version_col = mapper.version_id_col
+        if version_col is not None and row.get(version_col.key) is None:
+            row[version_col.key] = 1
+        for rel in mapper.relationships:
+            if rel.direction is not MANYTOONE or rel.key not in state.dict:
+                continue
+            target = state.dict[rel.key]
+            if target is None:
+                continue
+            target_state = inspect(target)
+            for local, remote in rel.local_remote_pairs:
+                if row.get(local.key) is None:
+                    row[local.key] = _column_value(
+                        target_state, target_state.mapper, remote
+                    )
+        return row
+
+    def _collect_children(
+        self, rel: RelationshipProperty, parent_row: dict[str, Any], children: Any
+    ) -> None:
+        inherited = {
+            child_col.key: parent_row.get(parent_col.key)
+            for parent_col, child_col in rel.synchronize_pairs
+        }
+        child_keys = [
+            key
+            for child in _iterate(rel, children)
+            if (key := self._collect(child, inherited)) is not None
+        ]
+        if not rel.cascade.delete_orphan:
+            return
+        target_mapper = rel.mapper
+        fk_columns = tuple(child_col for _, child_col in rel.synchronize_pairs)
+        scope = self._orphans.setdefault(
+            (target_mapper.local_table, fk_columns),
+            _OrphanScope(
+                table=target_mapper.local_table,
+                fk_columns=fk_columns,
+                pk_columns=tuple(target_mapper.primary_key),
+            ),
+        )
+        parent_key = tuple(inherited[c.key] for c in fk_columns)
+        scope.kept.setdefault(parent_key, set()).update(child_keys)
+
+    def _collect_links(
+        self, rel: RelationshipProperty, owner_row: dict[str, Any], targets: Any
+    ) -> None:
+        owner_columns = tuple(sec for _, sec in rel.synchronize_pairs)
+        scope = self._links.setdefault(
+            (rel.secondary, owner_columns),
+            _LinkScope(
+                table=rel.secondary,
+                owner_columns=owner_columns,
+                target_columns=tuple(sec for _, sec in rel.secondary_synchronize_pairs),
+                target_key_columns=tuple(
+                    col for col, _ in rel.secondary_synchronize_pairs
+                ),
+            ),
+        )
+        owner_key = tuple(owner_row.get(col.key) for col, _ in rel.synchronize_pairs)
+        scope.links.setdefault(owner_key, []).extend(_iterate(rel, targets))
+
+
+def _iterate(rel: RelationshipProperty, value: Any) -> Iterable[Any]:
+    if value is None:
+        return ()
+    if not rel.uselist:
+        return (value,)
+    if isinstance(value, dict):
+        return value.values()
+    return value
+
+
+def _target_key(target: Any, key_columns: tuple[Column, ...]) -> tuple:
+    state = inspect(target)
+    return tuple(_column_value(state, state.mapper, col) for col in key_columns)
+
+
+def build_upsert_statements(
+    table: Table,
+    rows: list[dict[str, Any]],
+    *,
+    version_column: str | None = None,
+) -> list[tuple[Any, int]]:
+    """Multi-row ``INSERT ... ON CONFLICT`` statements for ``rows``.
+
+    Rows are grouped by their key set (columns omitted from a row keep their
+    database default on insert and their current value on update, except for
+    SQL ``onupdate`` defaults such as ``updated_at``) and split in chunks that
+    stay under the bind parameter limit. With ``version_column`` a conflict
+    only updates rows whose stored version matches the row's.
+
+    Returns:
+        Pairs of statement and the number of rows it writes.
+    """
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = defaultdict(list)
+    for row in rows:
+        groups[tuple(sorted(row))].append(row)
+
+    pk_names = [col.key for col in table.primary_key.columns]
+    statements = []
+    for keys, group in groups.items():
+        chunk_size = max(1, MAX_BIND_PARAMS // len(keys))
+        for start in range(0, len(group), chunk_size):
+            chunk = group[start : start + chunk_size]
+            stmt = insert(table).values(chunk)
+            updates: dict[str, Any] = {
+                key: stmt.excluded[key]
+                for key in keys
+                if key not in pk_names and key != version_column
+            }
+            versioned = version_column is not None and version_column in keys
+            if versioned:
+                updates[version_column] = table.c[version_column] + 1
+            updates.update(
+                {
+                    column.key: column.onupdate.arg
+                    for column in table.columns
+                    if column.key not in keys
+                    and column.onupdate is not None
+                    and column.onupdate.is_clause_element
+                }
+            )
+            if updates:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=pk_names,
+                    set_=updates,
+                    where=(
+                        table.c[version_column] == stmt.excluded[version_column]
+                        if versioned
+                        else None
+                    ),
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=pk_names)
+            statements.append((stmt.returning(literal_column("xmax = 0")), len(chunk)))
+    return statements
+
+
+def _chunks(values: list[Any], width: int) -> Iterable[list[Any]]:
+    size = max(1, MAX_BIND_PARAMS // max(width, 1))
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def _owner_batches(
+    members: dict[tuple, set[tuple]], owner_width: int, member_width: int
+) -> Iterable[tuple[list[tuple], list[tuple]]]:
+    """Split owners (and their members) so each statement stays under the limit."""
+    owners: list[tuple] = []
+    kept: list[tuple] = []
+    params = 0
+    for owner, owned in members.items():
+        cost = owner_width + member_width * len(owned)
+        if owners and params + cost > MAX_BIND_PARAMS:
+            yield owners, kept
+            owners, kept, params = [], [], 0
+        owners.append(owner)
+        kept.extend(owned)
+        params += cost
+    if owners:
+        yield owners, kept
+
+
+def _expunge(session: AsyncSession, instances: Iterable[Any]) -> None:
+    for instance in instances:
+        state = inspect(instance)
+        if state.persistent or state.pending:
+            session.expunge(instance)
+
+
+def _expunge_orphans(session: AsyncSession, scope: _OrphanScope) -> None:
+    orphans = []
+    for instance in list(session.identity_map.values()):
+        state = inspect(instance)
+        if state.mapper.local_table is not scope.table:
+            continue
+        parent = tuple(_column_value(state, state.mapper, c) for c in scope.fk_columns)
+        if parent not in scope.kept:
+            continue
+        key = tuple(_column_value(state, state.mapper, c) for c in scope.pk_columns)
+        if key not in scope.kept[parent]:
+            orphans.append(instance)
+    _expunge(session, orphans)
+
+
+async def _assign_target_keys(session: AsyncSession, plan: BulkUpsertPlan) -> None:
+    """Flush link targets that have no primary key yet (e.g. new tags)."""
+    pending = [
+        target
+        for scope in plan.link_scopes
+        for targets in scope.links.values()
+        for target in targets
+        if any(v is None for v in _target_key(target, scope.target_key_columns))
+    ]
+    if not pending:
+        return
+    unique = list({id(t): t for t in pending}.values())
+    session.add_all(unique)
+    await session.flush(unique)
+
+
+async def execute_bulk_upsert(
+    session: AsyncSession, plan: BulkUpsertPlan
+) -> BulkUpsertResult:
+    """Write ``plan`` with batched statements and detach its instances.
+
+    Orphaned children are deleted first, so rows inserted with database
+    generated keys are never mistaken for orphans. Association links are
+    diffed last, after the rows they reference exist.
+
+    The collected instances (and orphaned children still in the identity
+    map) are expunged from ``session`` so a later flush does not write them
+    a second time; reload them if they are needed after the call.
+
+    Raises:
+        StaleDataError: When a versioned row was changed since it was read.
+    """
+    result = BulkUpsertResult()
+    await _assign_target_keys(session, plan)
+    _expunge(session, plan.instances)
+    for scope in plan.orphan_scopes:
+        _expunge_orphans(session, scope)
+
+    order = {table: index for index, table in enumerate(_sorted_tables(plan))}
+    for scope in sorted(
+        plan.orphan_scopes, key=lambda s: -order.get(s.table, len(order))
+    ):
+        for parents, kept in _owner_batches(
+            scope.kept, len(scope.fk_columns), len(scope.pk_columns)
+        ):
+            stmt = delete(scope.table).where(tuple_(*scope.fk_columns).in_(parents))
+            if kept:
+                stmt = stmt.where(tuple_(*scope.pk_columns).not_in(kept))
+            deleted = await session.execute(stmt)
+            result.statements += 1
+            result.deleted += deleted.rowcount or 0
+
+    for table in sorted(plan.rows, key=lambda t: order.get(t, len(order))):
+        version_column = plan.version_columns.get(table)
+        for stmt, row_count in build_upsert_statements(
+            table, list(plan.rows[table].values()), version_column=version_column
+        ):
+            flags = (await session.execute(stmt)).scalars().all()
+            result.statements += 1
+            if version_column is not None and len(flags) != row_count:
+                raise StaleDataError(
+                    f"UPSERT statement on table '{table.description}' expected "
+                    f"to write {row_count} row(s); {len(flags)} were matched."
+                )
+            result.inserted += sum(1 for flag in flags if flag)
+            result.updated += sum(1 for flag in flags if not flag)
+
+    for scope in plan.link_scopes:
+        links = {
+            owner: {
+                (*owner, *_target_key(target, scope.target_key_columns))
+                for target in targets
+            }
+            for owner, targets in scope.links.items()
+        }
+        columns = (*scope.owner_columns, *scope.target_columns)
+        for owners, kept in _owner_batches(
+            links, len(scope.owner_columns), len(columns)
+        ):
+            stmt = delete(scope.table).where(tuple_(*scope.owner_columns).in_(owners))
+            if kept:
+                stmt = stmt.where(tuple_(*columns).not_in(kept))
+            deleted = await session.execute(stmt)
+            result.statements += 1
+            result.links_deleted += deleted.rowcount or 0
+        rows = [
+            dict(zip([c.key for c in columns], link, strict=True))
+            for owned in links.values()
+            for link in owned
+        ]
+        for chunk in _chunks(rows, len(columns)):
+            inserted = await session.execute(
+                insert(scope.table).values(chunk).on_conflict_do_nothing()
+            )
+            result.statements += 1
+            result.links_inserted += inserted.rowcount or 0
+    return result
+
+
+def _sorted_tables(plan: BulkUpsertPlan) -> list[Table]:
+    if not plan.rows:
+        return []
+    return list(next(iter(plan.rows)).metadata.sorted_tables)
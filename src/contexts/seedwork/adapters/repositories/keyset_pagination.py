@@ -0,0 +1,145 @@
+"""
+Keyset (cursor) pagination for repository queries.
+
+Offset pagination makes the database walk and discard ``skip`` rows on every
+page, so deep pages get linearly slower. Keyset pagination instead remembers
+the sort tuple of the last row returned (the sort column plus ``id`` as a
+tie-breaker) and asks for the rows strictly after it::
+
+    ORDER BY updated_at DESC NULLS LAST, id DESC
+    WHERE (updated_at, id) < (:last_updated_at, :last_id) OR updated_at IS NULL
+
+The tuple is carried between requests as an opaque, URL-safe cursor that
+also records the sort expression it was produced for, so a cursor can not be
+replayed against a different ordering.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import and_, literal, or_, tuple_
+
+if TYPE_CHECKING:
+    from sqlalchemy.sql.elements import ColumnElement
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor can not be decoded."""
+
+
+def _encode_value(value: Any) -> list[Any]:
+    if isinstance(value, Enum):
+        value = value.value
+    if value is None or isinstance(value, bool | int | float | str):
+        return ["v", value]
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, Decimal):
+        return ["dec", str(value)]
+    error_msg = f"Unsupported cursor value type: {type(value).__name__}"
+    raise TypeError(error_msg)
+
+
+def _decode_value(encoded: Any) -> Any:
+    try:
+        kind, raw = encoded
+        if kind == "v":
+            return raw
+        if kind == "dt":
+            return datetime.fromisoformat(raw)
+        if kind == "d":
+            return date.fromisoformat(raw)
+        if kind == "dec":
+            return Decimal(raw)
+    except (TypeError, ValueError, ArithmeticError) as e:
+        error_msg = "Malformed cursor value"
+        raise InvalidCursorError(error_msg) from e
+    error_msg = f"Unknown cursor value kind: {kind}"
+    raise InvalidCursorError(error_msg)
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetCursor:
+    """Position of the last row of a page in a ``(sort column, id)`` ordering.
+
+    Attributes:
+        sort: Sort expression the page was produced with (e.g. ``-updated_at``).
+        value: Sort column value of the last row.
+        last_id: Primary key of the last row.
+    """
+
+    sort: str
+    value: Any
+    last_id: Any
+
+    @property
+    def descending(self) -> bool:
+        return self.sort.startswith("-")
+
+    def encode(self) -> str:
+        """Serialize to an opaque, URL-safe token."""
+        payload = {
+            "s": self.sort,
+            "k": [_encode_value(self.value), _encode_value(self.last_id)],
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> KeysetCursor:
+        """Parse a token produced by :meth:`encode`.
+
+        Raises:
+            InvalidCursorError: If the token is not a valid cursor.
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            sort = payload["s"]
+            value, last_id = payload["k"]
+        except (
+            binascii.Error,
+            UnicodeError,
+            ValueError,
+            TypeError,
+            KeyError,
+        ) as e:
+            error_msg = "Malformed pagination cursor"
+            raise InvalidCursorError(error_msg) from e
+        if not isinstance(sort, str) or not sort:
+            error_msg = "Pagination cursor has no sort expression"
+            raise InvalidCursorError(error_msg)
+        return cls(sort=sort, value=_decode_value(value), last_id=_decode_value(last_id))
+
+
+def keyset_predicate(
+    column: ColumnElement, id_column: ColumnElement, cursor: KeysetCursor
+) -> ColumnElement[bool]:
+    """Build the WHERE clause selecting the rows after ``cursor``.
+
+    Matches the ``ORDER BY column [DESC] NULLS LAST, id [DESC]`` ordering
+    produced by :meth:`SaGenericRepository.sort_stmt`: rows with a NULL sort
+    value come last, ordered by ``id`` alone.
+    """
+    if cursor.value is None:
+        after_id = (
+            id_column < cursor.last_id if cursor.descending else id_column > cursor.last_id
+        )
+        return and_(column.is_(None), after_id)
+
+    row = tuple_(column, id_column)
+    bound = tuple_(
+        literal(cursor.value, column.type), literal(cursor.last_id, id_column.type)
+    )
+    seek = row < bound if cursor.descending else row > bound
+    return or_(seek, column.is_(None))
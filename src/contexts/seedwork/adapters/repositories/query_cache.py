@@ -0,0 +1,273 @@
+"""
+Query-result caching for repository reads.
+
+This module provides the cache backends used by :class:`SaGenericRepository`
+to short-circuit repeated ``query()`` calls. Cached result sets are tagged by
+entity namespace (the table of the repository) and, for id-constrained
+queries, by entity id plus a namespace-wide "pinned" tag, so writes evict only
+the result sets they can affect.
+
+Two backends are available:
+
+- :class:`InMemoryQueryCache`: per-process LRU/TTL cache with a tag index.
+- :class:`SharedQueryCache`: tag-versioned cache on top of any
+  :class:`SharedKeyValueStore` (e.g. Redis), so several workers share entries
+  and invalidations. :class:`InMemoryKeyValueStore` is a local stand-in.
+
+Values are stored pickled, so every hit hands out a private copy that callers
+may mutate without corrupting the cache.
+"""
+
+from __future__ import annotations
+
+import pickle
+import time
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any, Protocol
+
+from src.config.app_config import get_app_settings
+from src.contexts.seedwork.adapters.caching import LruTtlCache
+
+
+def namespace_tag(namespace: str) -> str:
+    """Tag shared by every open-ended result set of a namespace."""
+    return namespace
+
+
+def entity_tag(namespace: str, entity_id: str) -> str:
+    """Tag for result sets constrained to a specific entity id."""
+    return f"{namespace}:{entity_id}"
+
+
+def pinned_tag(namespace: str) -> str:
+    """Tag shared by every id-constrained result set of a namespace.
+
+    Writes in a related namespace evict it, since they can change the related
+    data those result sets carry.
+    """
+    return f"{namespace}#pinned"
+
+
+class QueryCacheBackend(Protocol):
+    """Contract for repository query-result caches.
+
+    Implementations store opaque values under a key, associate each entry
+    with invalidation tags and drop every entry carrying one of the given
+    tags on :meth:`invalidate`.
+    """
+
+    async def get(self, key: str) -> Any | None:
+        """Return a copy of the cached value or None on miss/expiry."""
+        ...
+
+    async def set(
+        self, key: str, value: Any, *, tags: Iterable[str], ttl: int | None = None
+    ) -> None:
+        """Store value under key, tagged with tags.
+
+        ttl overrides the backend default expiry (seconds) when given.
+        """
+        ...
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        """Evict every entry associated with any of the given tags."""
+        ...
+
+    async def clear(self) -> None:
+        """Evict every entry."""
+        ...
+
+
+class SharedKeyValueStore(Protocol):
+    """Minimal key/value contract required by :class:`SharedQueryCache`.
+
+    Maps directly onto Redis ``MGET``/``SET EX``/``INCR``.
+    """
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        """Return the raw values for keys (None for missing keys)."""
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: int | None = None) -> None:
+        """Store value under key, expiring after ttl seconds when given."""
+        ...
+
+    async def incr(self, key: str) -> int:
+        """Atomically increment an integer counter and return the new value."""
+        ...
+
+    async def flush(self) -> None:
+        """Remove every key owned by the store."""
+        ...
+
+
+class InMemoryQueryCache:
+    """Bounded in-process LRU cache with per-entry TTL and tag invalidation.
+
+    Entries live in an :class:`LruTtlCache`; a tag index maps every tag to
+    the keys carrying it and is kept in sync through the cache's drop hook.
+    """
+
+    def __init__(self, max_entries: int = 1024, default_ttl: int = 300):
+        self.default_ttl = default_ttl
+        self._entries: LruTtlCache[str, tuple[bytes, tuple[str, ...]]] = LruTtlCache(
+            max_entries, on_drop=self._unindex
+        )
+        self._tag_index: dict[str, set[str]] = {}
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        return self._entries.max_entries
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return pickle.loads(entry[0])
+
+    async def set(
+        self, key: str, value: Any, *, tags: Iterable[str], ttl: int | None = None
+    ) -> None:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        entry_tags = tuple(tags)
+        self._entries.set(key, (payload, entry_tags), ttl or self.default_ttl)
+        for tag in entry_tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            for key in self._tag_index.pop(tag, ()):
+                if self._entries.pop(key) is not None:
+                    self.invalidations += 1
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._tag_index.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss counters and current occupancy."""
+        return {**self._entries.stats(), "invalidations": self.invalidations}
+
+    def _unindex(self, key: str, entry: tuple[bytes, tuple[str, ...]]) -> None:
+        for tag in entry[1]:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+
+class SharedQueryCache:
+    """Query cache backed by an external key/value store.
+
+    Invalidation uses tag versions: each tag owns a counter, entries record
+    the versions of their tags when written and are treated as stale once
+    any of those counters moves. Invalidating a tag is therefore a single
+    ``INCR`` regardless of how many entries carry it, and stale entries
+    simply age out through their TTL.
+    """
+
+    def __init__(
+        self,
+        store: SharedKeyValueStore,
+        *,
+        prefix: str = "qc",
+        default_ttl: int = 300,
+    ):
+        self._store = store
+        self._prefix = prefix
+        self.default_ttl = default_ttl
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self._prefix}:entry:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._prefix}:tag:{tag}"
+
+    async def _tag_versions(self, tags: tuple[str, ...]) -> tuple[int, ...]:
+        if not tags:
+            return ()
+        raw = await self._store.get_many([self._tag_key(tag) for tag in tags])
+        return tuple(int(value) if value is not None else 0 for value in raw)
+
+    async def get(self, key: str) -> Any | None:
+        [raw] = await self._store.get_many([self._entry_key(key)])
+        if raw is None:
+            return None
+        tags, versions, value = pickle.loads(raw)
+        if await self._tag_versions(tags) != versions:
+            return None
+        return value
+
+    async def set(
+        self, key: str, value: Any, *, tags: Iterable[str], ttl: int | None = None
+    ) -> None:
+        entry_tags = tuple(tags)
+        versions = await self._tag_versions(entry_tags)
+        payload = pickle.dumps(
+            (entry_tags, versions, value), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        await self._store.set(
+            self._entry_key(key), payload, ttl or self.default_ttl
+        )
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            await self._store.incr(self._tag_key(tag))
+
+    async def clear(self) -> None:
+        await self._store.flush()
+
+
+class InMemoryKeyValueStore:
+    """Local stand-in for a shared key/value store (tests, single process)."""
+
+    def __init__(self):
+        self._data: dict[str, tuple[float | None, bytes]] = {}
+
+    def _read(self, key: str) -> bytes | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        return [self._read(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl: int | None = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._data[key] = (expires_at, value)
+
+    async def incr(self, key: str) -> int:
+        current = self._read(key)
+        value = int(current) + 1 if current is not None else 1
+        self._data[key] = (None, str(value).encode())
+        return value
+
+    async def flush(self) -> None:
+        self._data.clear()
+
+
+@lru_cache
+def get_query_cache() -> QueryCacheBackend | None:
+    """Return the process-wide query cache, or None when caching is disabled.
+
+    Controlled by ``QUERY_CACHE_ENABLED``, ``QUERY_CACHE_MAX_ENTRIES`` and
+    ``QUERY_CACHE_TTL`` (see :class:`APPSettings`).
+    """
+    settings = get_app_settings()
+    if not settings.query_cache_enabled:
+        return None
+    return InMemoryQueryCache(
+        max_entries=settings.query_cache_max_entries,
+        default_ttl=settings.query_cache_ttl,
+    )
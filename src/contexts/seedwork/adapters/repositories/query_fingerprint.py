@@ -0,0 +1,234 @@
+"""
+Canonical fingerprints for repository queries.
+
+A fingerprint identifies a *logical* query: two calls that would produce the
+same SQL with the same parameters get the same digest, regardless of filter
+dict ordering, list ordering inside ``IN``-style filters or the identity of
+the statement objects involved. The digest is used as the query cache key.
+
+Logs and metrics use the separate *shape* label instead: it covers the
+filter fields and operators, the sort and the statement structure, but no
+filter or bind values, so calls that only differ in their values (one meal
+id or another) share a label and the label set stays bounded.
+
+Filters are normalized into ``(field, postfix, value)`` triples, with the
+postfix resolved through :data:`filter_operator_registry`. Statements are
+identified through SQLAlchemy's own cache key (the same key that drives its
+compiled-statement cache): the structural part is mapped once per process to
+a digest of the compiled SQL text, and the extracted bind values are
+canonicalized alongside it. Nothing is compiled with literal binds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql
+from src.contexts.seedwork.adapters.repositories.filter_operators import (
+    filter_operator_registry,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy import Select
+
+MAX_STRUCTURE_DIGESTS = 512
+LABEL_LENGTH = 12
+# Filters whose value is part of the query shape rather than its parameters
+SHAPE_VALUE_FILTERS = frozenset({"sort"})
+
+_structure_digests: OrderedDict[Any, str] = OrderedDict()
+
+
+class UnfingerprintableError(ValueError):
+    """Raised when part of a query has no stable canonical form."""
+
+
+@dataclass(frozen=True, slots=True)
+class QueryFingerprint:
+    """Stable identity of a logical repository query.
+
+    Attributes:
+        digest: Hex SHA-256 of the canonical query description; the cache key.
+        shape: Hex SHA-256 of the query without its filter and bind values.
+    """
+
+    digest: str
+    shape: str
+
+    @property
+    def label(self) -> str:
+        """Short prefix of the shape digest, suitable for logs and metric labels."""
+        return self.shape[:LABEL_LENGTH]
+
+    def __str__(self) -> str:
+        return self.digest
+
+
+def canonicalize(value: Any) -> Any:
+    """Return a hashable, order-independent representation of a filter value.
+
+    Lists, sets and frozensets are treated as unordered collections and
+    sorted; tuples are treated as ordered records (e.g. tag
+    ``(key, value, author_id)`` triples) and keep their order. Scalars are
+    tagged with their type so ``1`` and ``"1"`` never collide.
+
+    Raises:
+        UnfingerprintableError: For values without a stable representation.
+    """
+    if value is None or isinstance(value, bool | int | float | str):
+        return (type(value).__name__, value)
+    if isinstance(value, list | set | frozenset):
+        return ("set", tuple(sorted((canonicalize(v) for v in value), key=repr)))
+    if isinstance(value, tuple):
+        return ("tuple", tuple(canonicalize(v) for v in value))
+    if isinstance(value, dict):
+        return (
+            "dict",
+            tuple(sorted(((str(k), canonicalize(v)) for k, v in value.items()))),
+        )
+    if isinstance(value, datetime | date | time):
+        return (type(value).__name__, value.isoformat())
+    if isinstance(value, Decimal | UUID):
+        return (type(value).__name__, str(value))
+    if isinstance(value, Enum):
+        return (type(value).__qualname__, canonicalize(value.value))
+    if isinstance(value, bytes):
+        return ("bytes", value.hex())
+    raise UnfingerprintableError(
+        f"Cannot fingerprint value of type {type(value).__name__}"
+    )
+
+
+def normalize_filters(filters: dict[str, Any] | None) -> tuple[Any, ...]:
+    """Return filters as sorted ``(field, postfix, canonical_value)`` triples."""
+    normalized = []
+    for key, value in (filters or {}).items():
+        base = filter_operator_registry.remove_postfix(key)
+        normalized.append((base, key[len(base) :], canonicalize(value)))
+    return tuple(sorted(normalized, key=repr))
+
+
+def filter_shape(filters: dict[str, Any] | None) -> tuple[Any, ...]:
+    """Return filters as sorted ``(field, postfix)`` pairs without their values.
+
+    Values of :data:`SHAPE_VALUE_FILTERS` (the sort) are kept as they select
+    a different query plan rather than different rows.
+    """
+    shape = []
+    for key, value in (filters or {}).items():
+        base = filter_operator_registry.remove_postfix(key)
+        shape.append(
+            (base, key[len(base) :], value if key in SHAPE_VALUE_FILTERS else None)
+        )
+    return tuple(sorted(shape, key=repr))
+
+
+def _structure_digest(structure_key: Any, stmt: Select) -> str:
+    """Map a statement's structural cache key to a process-independent digest."""
+    digest = _structure_digests.get(structure_key)
+    if digest is not None:
+        _structure_digests.move_to_end(structure_key)
+        return digest
+
+    sql_text = str(stmt.compile(dialect=postgresql.dialect()))
+    option_names = sorted(type(opt).__qualname__ for opt in stmt._with_options)
+    digest = hashlib.sha256(
+        f"{sql_text}|{option_names!r}".encode()
+    ).hexdigest()
+
+    _structure_digests[structure_key] = digest
+    if len(_structure_digests) > MAX_STRUCTURE_DIGESTS:
+        _structure_digests.popitem(last=False)
+    return digest
+
+
+def statement_fingerprint(stmt: Select) -> tuple[str, Any]:
+    """Return ``(structure_digest, canonical_bind_values)`` for a statement.
+
+    Raises:
+        UnfingerprintableError: If SQLAlchemy cannot produce a cache key for
+            the statement (e.g. it embeds uncacheable constructs).
+    """
+    cache_key = stmt._generate_cache_key()
+    if cache_key is None:
+        raise UnfingerprintableError("Statement does not support caching")
+    structure = _structure_digest(cache_key.key, stmt)
+    params = tuple(
+        ("tuple", tuple(canonicalize(v) for v in value))
+        if isinstance(value := bind.effective_value, list | tuple)
+        else canonicalize(value)
+        for bind in cache_key.bindparams
+    )
+    return structure, params
+
+
+def callable_fingerprint(func: Callable) -> str:
+    """Identify a callable by its import path.
+
+    Bound methods are identified by their underlying function. Lambdas,
+    closures and partials may capture state that the name does not
+    describe, so they are rejected.
+
+    Raises:
+        UnfingerprintableError: For lambdas, nested functions and partials.
+    """
+    target = getattr(func, "__func__", func)
+    qualname = getattr(target, "__qualname__", None)
+    module = getattr(target, "__module__", None)
+    if qualname is None or module is None or "<" in qualname:
+        raise UnfingerprintableError(f"Cannot fingerprint callable {func!r}")
+    return f"{module}.{qualname}"
+
+
+def _model_name(sa_model: Any) -> str:
+    name = getattr(sa_model, "__name__", None)
+    if name is None:
+        raise UnfingerprintableError(f"Cannot fingerprint model {sa_model!r}")
+    return name
+
+
+def fingerprint_query(
+    *,
+    namespace: str,
+    filters: dict[str, Any] | None = None,
+    starting_stmt: Select | None = None,
+    sort_stmt: Callable | None = None,
+    limit: int | None = None,
+    already_joined: set[str] | None = None,
+    sa_model: Any = None,
+    return_sa_instance: bool = False,
+) -> QueryFingerprint | None:
+    """Fingerprint the arguments of ``SaGenericRepository.query``.
+
+    Returns:
+        The fingerprint, or None when some argument has no stable canonical
+        form (such queries must not be cached).
+    """
+    try:
+        statement = (
+            statement_fingerprint(starting_stmt) if starting_stmt is not None else None
+        )
+        common = (
+            namespace,
+            callable_fingerprint(sort_stmt) if sort_stmt is not None else None,
+            tuple(sorted(already_joined or ())),
+            _model_name(sa_model) if sa_model is not None else None,
+            return_sa_instance,
+        )
+        parts = (*common, normalize_filters(filters), statement, limit)
+    except UnfingerprintableError:
+        return None
+    shape = (*common, filter_shape(filters), statement[0] if statement else None)
+    return QueryFingerprint(
+        digest=hashlib.sha256(repr(parts).encode()).hexdigest(),
+        shape=hashlib.sha256(repr(shape).encode()).hexdigest(),
+    )
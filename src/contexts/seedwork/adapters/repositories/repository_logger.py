@@ -8,12 +8,13 @@
 from __future__ import annotations
 
 import os
+import random
 import time
 import uuid
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
@@ -23,8 +24,56 @@
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+from src.contexts.seedwork.adapters.repositories.statement_tracker import (
+    current_statement_count,
+)
 from src.logging.logger import get_logger
 
+if TYPE_CHECKING:
+    from sqlalchemy.sql import Executable
+
+# Process-wide memory sample shared by all repository loggers:
+# (monotonic timestamp, rss in MB)
+_memory_sample: tuple[float, float | None] | None = None
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class LazySQL:
+    """SQL text of a statement, rendered with literal binds on first use.
+
+    Rendering large ``IN (...)`` lists with literal binds is expensive, so
+    the statement is only compiled when the text is actually needed (a log
+    record is emitted or an exception is raised) and the result is memoized.
+    """
+
+    __slots__ = ("_stmt", "_text")
+
+    def __init__(self, stmt: Executable):
+        self._stmt = stmt
+        self._text: str | None = None
+
+    @property
+    def rendered(self) -> bool:
+        """Whether the SQL text has already been compiled."""
+        return self._text is not None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            try:
+                self._text = str(
+                    self._stmt.compile(compile_kwargs={"literal_binds": True})
+                )
+            except Exception:
+                # Fallback to basic string representation
+                self._text = str(self._stmt)
+        return self._text
+
 
 class RepositoryLogger:
     """Enhanced repository logger using structlog for structured logging.
@@ -51,6 +100,12 @@ class RepositoryLogger:
         DEBUG_CONTEXTS: Comma-separated list of specific debug contexts
         {CONTEXT}_DEBUG: Enable specific context debugging
         VERBOSE_PERFORMANCE: Enable detailed performance logging
+        REPOSITORY_SQL_SAMPLE_RATE: Fraction (0-1) of queries whose SQL text
+            is rendered into performance logs (default 0)
+        REPOSITORY_SLOW_QUERY_THRESHOLD: Seconds above which a query is
+            logged as slow, with its SQL text (default 1.0)
+        REPOSITORY_MEMORY_SAMPLE_INTERVAL: Minimum seconds between two
+            process memory samples (default 1.0)
     """
 
     def __init__(self, logger_name: str = "repository", correlation_id: str | None = None):
@@ -73,6 +128,11 @@ def __init__(self, logger_name: str = "repository", correlation_id: str | None =
         self.debug_enabled = self._should_debug_be_enabled()
         self.verbose_performance = os.getenv('VERBOSE_PERFORMANCE', 'false').lower() == 'true'
 
+        # SQL rendering and memory sampling controls
+        self.sql_sample_rate = _env_float('REPOSITORY_SQL_SAMPLE_RATE', 0.0)
+        self.slow_query_threshold = _env_float('REPOSITORY_SLOW_QUERY_THRESHOLD', 1.0)
+        self.memory_sample_interval = _env_float('REPOSITORY_MEMORY_SAMPLE_INTERVAL', 1.0)
+
     def _should_debug_be_enabled(self) -> bool:
         """Determine if debug logging should be enabled based on environment.
 
@@ -128,6 +188,26 @@ def _is_context_debug_enabled(self, context: str) -> bool:
 
         return context.lower() in debug_contexts or 'all' in debug_contexts
 
+    def is_debug_enabled_for(self, context: str) -> bool:
+        """Return True if debug records for context would be emitted."""
+        return self.debug_enabled or self._is_context_debug_enabled(context)
+
+    def should_render_sql(self, execution_time: float | None = None) -> bool:
+        """Decide whether the SQL text of a query should be rendered.
+
+        SQL is rendered when SQL debugging is enabled, when the query was
+        slower than ``slow_query_threshold`` or for a random
+        ``sql_sample_rate`` fraction of queries.
+
+        Args:
+            execution_time: Query execution time in seconds, if known
+        """
+        if execution_time is not None and execution_time > self.slow_query_threshold:
+            return True
+        if self.sql_sample_rate > 0 and random.random() < self.sql_sample_rate:
+            return True
+        return self.is_debug_enabled_for("sql")
+
     def debug_query_step(self, step: str, message: str, **kwargs):
         """Debug logging specifically for query execution steps"""
         self.debug_conditional(message, context="query_steps", step=step, **kwargs)
@@ -196,9 +276,13 @@ async def track_query(
             **context: Additional context to include in logging
 
         Yields:
-            Dictionary that can be updated with additional context during execution
+            Dictionary that can be updated with additional context during execution.
+            When a statement tracker is active (e.g. inside a UnitOfWork), the
+            number of SQL statements the operation executed is added as
+            ``sql_statements``.
         """
         start_time = time.perf_counter()
+        statements_before = current_statement_count()
         operation_context: dict[str, Any] = {
             "operation": operation,
             "start_time": datetime.now(UTC).isoformat(),
@@ -220,11 +304,17 @@ async def track_query(
             # Calculate execution time
             execution_time = time.perf_counter() - start_time
             operation_context["execution_time"] = execution_time
+            statements_after = current_statement_count()
+            if statements_before is not None and statements_after is not None:
+                operation_context["sql_statements"] = (
+                    statements_after - statements_before
+                )
 
             self.logger.info(
                 "Repository operation completed",
                 operation=operation,
                 execution_time=execution_time,
+                sql_statements=operation_context.get("sql_statements"),
                 **context
             )
 
@@ -321,7 +411,7 @@ def log_performance(
             performance_data["sql_query"] = sql_query
 
         # Log at appropriate level based on performance
-        if query_time > 1.0:  # Slow query warning
+        if query_time > self.slow_query_threshold:  # Slow query warning
             self.logger.warning(
                 "Slow query detected",
                 **performance_data
@@ -406,7 +496,7 @@ def _check_performance_warnings(
             context: Operation context
         """
         # Slow query warning
-        if execution_time > 1.0:
+        if execution_time > self.slow_query_threshold:
             self.warn_performance_issue(
                 "slow_query",
                 f"Query took {execution_time:.2f} seconds",
@@ -435,35 +525,43 @@ def _check_performance_warnings(
             )
 
         # Memory usage warning (if available)
-        if PSUTIL_AVAILABLE:
-            try:
-                process = psutil.Process()
-                memory_mb = process.memory_info().rss / 1024 / 1024
-                if memory_mb > 500:  # > 500MB
-                    self.warn_performance_issue(
-                        "high_memory_usage",
-                        f"High memory usage: {memory_mb:.1f}MB",
-                        operation=operation,
-                        memory_usage_mb=memory_mb
-                    )
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass  # Ignore psutil errors
+        memory_mb = self.get_memory_usage()
+        if memory_mb is not None and memory_mb > 500:  # > 500MB
+            self.warn_performance_issue(
+                "high_memory_usage",
+                f"High memory usage: {memory_mb:.1f}MB",
+                operation=operation,
+                memory_usage_mb=memory_mb
+            )
 
     def get_memory_usage(self) -> float | None:
         """
         Get current memory usage in MB.
 
+        The process is sampled at most once per ``memory_sample_interval``
+        seconds; calls in between return the last sample.
+
         Returns:
             Memory usage in MB or None if psutil is not available
         """
+        global _memory_sample
+
         if not PSUTIL_AVAILABLE:
             return None
 
+        now = time.monotonic()
+        if (
+            _memory_sample is not None
+            and now - _memory_sample[0] < self.memory_sample_interval
+        ):
+            return _memory_sample[1]
+
         try:
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024
+            memory_mb = psutil.Process().memory_info().rss / 1024 / 1024
         except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return None
+            memory_mb = None
+        _memory_sample = (now, memory_mb)
+        return memory_mb
 
     @classmethod
     def show_debug_usage_examples(cls):
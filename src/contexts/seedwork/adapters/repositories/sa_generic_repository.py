@@ -11,8 +11,14 @@
     NoResultFound,
     SQLAlchemyError,
 )
+from sqlalchemy.orm.exc import StaleDataError
 from src.config.pagination_config import get_pagination_settings
 from src.contexts.seedwork.adapters.filter_validator import FilterValidator
+from src.contexts.seedwork.adapters.repositories.bulk_upsert import (
+    BulkUpsertPlan,
+    BulkUpsertResult,
+    execute_bulk_upsert,
+)
 from src.contexts.seedwork.adapters.repositories.filter_mapper import (
     FilterColumnMapper,
 )
@@ -21,6 +27,21 @@
     filter_operator_registry,
 )
 from src.contexts.seedwork.adapters.repositories.join_manager import JoinManager
+from src.contexts.seedwork.adapters.repositories.keyset_pagination import (
+    InvalidCursorError,
+    KeysetCursor,
+    keyset_predicate,
+)
+from src.contexts.seedwork.adapters.repositories.query_cache import (
+    QueryCacheBackend,
+    entity_tag,
+    namespace_tag,
+    pinned_tag,
+)
+from src.contexts.seedwork.adapters.repositories.query_fingerprint import (
+    QueryFingerprint,
+    fingerprint_query,
+)
 from src.contexts.seedwork.adapters.repositories.repository_exceptions import (
     EntityMappingError,
     EntityNotFoundError,
@@ -30,6 +51,7 @@
     RepositoryQueryError,
 )
 from src.contexts.seedwork.adapters.repositories.repository_logger import (
+    LazySQL,
     RepositoryLogger,
 )
 from src.contexts.seedwork.domain.entity import Entity
@@ -37,8 +59,9 @@
 from src.db.base import SaBase
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
+    from sqlalchemy import RowMapping
     from sqlalchemy.ext.asyncio import AsyncSession
     from src.contexts.seedwork.adapters.ORM.mappers.mapper import ModelMapper
 
@@ -62,6 +85,12 @@ class SaGenericRepository[D: Entity | ValueObject, S: SaBase]:
     :vartype sa_model_type: S
     :ivar filter_to_column_mappers: A list of FilterColumnMapper objects.
     :vartype filter_to_column_mappers: list[FilterColumnMapper] | None
+    :ivar cache_backend: Optional query-result cache (see ``query_cache``).
+    :vartype cache_backend: QueryCacheBackend | None
+    :ivar related_cache_namespaces: Namespaces (table full names) whose cached
+                                    results embed this repository's entities
+                                    and must be evicted on writes here.
+    :vartype related_cache_namespaces: tuple[str, ...]
 
     Example::
 
@@ -98,6 +127,19 @@ class UserRepository(SaGenericRepository):
     The filter postfixes are now managed by FilterOperatorRegistry instead of
       a hardcoded ALLOWED_POSTFIX list, providing better extensibility and
       organization for comparison operators like _gte, _lte, _ne, _not_in, _is_not.
+
+    When a ``cache_backend`` is given, filter-only queries are served from and
+      stored in the cache. Result sets are tagged with the repository namespace,
+      or with ``namespace:id`` tags when the query is constrained by ``id``, so
+      ``add``/``persist``/``persist_all`` evict only the entries they affect.
+      After the first write the repository bypasses the cache for the rest of
+      the session so uncommitted state is never cached.
+
+    Pagination is offset based (``skip``/``limit``) unless a ``cursor`` filter
+      is given. Cursors come from :meth:`next_cursor` and switch the query to
+      keyset pagination on the ``(sort column, id)`` tuple; ``skip`` is then
+      ignored. Only sorts on columns of the repository's own model support
+      cursors.
     """
 
     # Constants for magic numbers
@@ -112,6 +154,7 @@ class UserRepository(SaGenericRepository):
         "skip",
         "limit",
         "sort",
+        "cursor",
         "created_at",
         "updated_at",
         "discarded",
@@ -124,8 +167,9 @@ def __init__(
         domain_model_type: type[D],
         sa_model_type: type[S],
         filter_to_column_mappers: list[FilterColumnMapper] | None = None,
-        cache_backend: Any = None,  # Optional cache backend for future use
+        cache_backend: QueryCacheBackend | None = None,
         repository_logger: RepositoryLogger | None = None,
+        related_cache_namespaces: tuple[str, ...] = (),
     ):
         self._session = db_session
         self.data_mapper = data_mapper
@@ -134,7 +178,11 @@ def __init__(
         self.filter_to_column_mappers = filter_to_column_mappers or []
         self.inspector = inspect(sa_model_type)
         self.seen: set[D] = set()
-        self.cache_backend = cache_backend  # Placeholder for future caching layer
+        self.cache_backend = cache_backend
+        self.related_cache_namespaces = related_cache_namespaces
+        self._cache_namespace: str = sa_model_type.__table__.fullname
+        self._cache_bypass = False
+        self.pending_cache_invalidations: set[str] = set()
 
         # Initialize structured logger for this repository instance
         if repository_logger is None:
@@ -200,7 +248,31 @@ async def add(
             self._session.autoflush = True
             await self._session.flush()
         self.refresh_seen(domain_obj)
-        self._invalidate_cache_for_entity(domain_obj, ttl=ttl)
+        await self._invalidate_cache_for_entity(domain_obj, ttl=ttl)
+
+    async def add_all(
+        self,
+        domain_objs: list[D],
+        *,
+        ttl: int = 300,
+    ) -> None:
+        """
+        Add several new entities and flush them together.
+
+        The session groups the INSERTs per table, so this costs a constant
+        number of round trips instead of one flush per entity.
+        """
+        if not domain_objs:
+            return
+        self._session.autoflush = False
+        try:
+            self._session.add_all(await self._map_for_persist(domain_objs))
+        finally:
+            self._session.autoflush = True
+            await self._session.flush()
+        for domain_obj in domain_objs:
+            self.refresh_seen(domain_obj)
+            await self._invalidate_cache_for_entity(domain_obj, ttl=ttl)
 
     async def _get(
         self,
@@ -1111,12 +1183,19 @@ def setup_skip_and_limit(
         limit: int | None = None,
     ) -> Select:
         skip = filters.get("skip", 0) if filters else 0
-        if limit:
-            limit = min(limit, self.MAX_LIMIT)
-        else:
-            limit = filters.get("limit", self.MAX_LIMIT) if filters else self.MAX_LIMIT
+        if filters and filters.get("cursor"):
+            # A keyset cursor replaces the offset
+            skip = None
+        limit = self._effective_limit(filters, limit)
         return stmt.offset(skip).limit(limit) if limit else stmt.offset(skip)
 
+    def _effective_limit(
+        self, filters: dict[str, Any] | None, limit: int | None = None
+    ) -> int | None:
+        if limit:
+            return min(limit, self.MAX_LIMIT)
+        return filters.get("limit", self.MAX_LIMIT) if filters else self.MAX_LIMIT
+
     def get_filter_key_to_column_name_for_sa_model_type(
         self, sa_model_type: type[S]
     ) -> dict[str, Any] | None:
@@ -1153,23 +1232,9 @@ def sort_stmt(
         if not value_of_sort_query:
             return stmt
 
-        sa_model_type_to_sort_by = (
-            self.get_sa_model_type_by_filter_key(
-                self.remove_desc_prefix(value_of_sort_query)
-            )
-            or self.sa_model_type
-        )
-        inspector = inspect(sa_model_type_to_sort_by)
-        mapping = self.get_filter_key_to_column_name_for_sa_model_type(
-            sa_model_type_to_sort_by
-        )
-        if mapping and mapping.get(self.remove_desc_prefix(value_of_sort_query), None):
-            clean_sort_name = mapping.get(
-                self.remove_desc_prefix(value_of_sort_query), None
-            )
-        else:
-            clean_sort_name = self.remove_desc_prefix(value_of_sort_query)
-        if clean_sort_name and clean_sort_name in inspector.columns and "source" not in value_of_sort_query:
+        sort_target = self._resolve_sort_column(value_of_sort_query)
+        if sort_target:
+            sa_model_type_to_sort_by, clean_sort_name = sort_target
             column_attr = getattr(sa_model or sa_model_type_to_sort_by, clean_sort_name)
 
             # Check if we're sorting by a column from a different table than the main table
@@ -1200,8 +1265,125 @@ def sort_stmt(
                     stmt = stmt.order_by(nulls_last(column_attr.desc()))
                 else:
                     stmt = stmt.order_by(nulls_last(column_attr))
+                # Tie-break on id so pages are stable and keyset cursors are exact
+                if clean_sort_name != "id":
+                    id_attr = (sa_model or self.sa_model_type).id
+                    stmt = stmt.order_by(
+                        id_attr.desc() if value_of_sort_query.startswith("-") else id_attr
+                    )
         return stmt
 
+    def _resolve_sort_column(
+        self, value_of_sort_query: str
+    ) -> tuple[type[S], str] | None:
+        """Return the model and column name a sort expression orders by.
+
+        Returns None when the sort key does not map to a real column.
+        """
+        sort_key = self.remove_desc_prefix(value_of_sort_query)
+        sa_model_type_to_sort_by = (
+            self.get_sa_model_type_by_filter_key(sort_key) or self.sa_model_type
+        )
+        inspector = inspect(sa_model_type_to_sort_by)
+        mapping = self.get_filter_key_to_column_name_for_sa_model_type(
+            sa_model_type_to_sort_by
+        )
+        if mapping and mapping.get(sort_key, None):
+            clean_sort_name = mapping.get(sort_key, None)
+        else:
+            clean_sort_name = sort_key
+        if (
+            clean_sort_name
+            and clean_sort_name in inspector.columns
+            and "source" not in value_of_sort_query
+        ):
+            return sa_model_type_to_sort_by, clean_sort_name
+        return None
+
+    def _keyset_sort_column_name(self, sort: str | None) -> str | None:
+        """Column name of the repository model that supports cursors for sort."""
+        if not sort:
+            return None
+        sort_target = self._resolve_sort_column(sort)
+        if sort_target is None or sort_target[0] is not self.sa_model_type:
+            return None
+        return sort_target[1]
+
+    def _apply_keyset_pagination(
+        self,
+        stmt: Select,
+        filters: dict[str, Any],
+        sort_stmt: Callable | None,
+        sa_model: type[S] | None = None,
+    ) -> Select:
+        """Restrict the statement to the rows after the ``cursor`` filter.
+
+        Raises:
+            FilterValidationError: If the cursor is malformed, was issued for
+                another sort, or the sort does not support cursors.
+        """
+        sort = filters.get("sort")
+        try:
+            cursor = KeysetCursor.decode(filters["cursor"])
+        except InvalidCursorError as e:
+            raise FilterValidationError(
+                message=f"Invalid pagination cursor: {e}",
+                repository=self,
+                invalid_filters=["cursor"],
+            ) from e
+        column_name = self._keyset_sort_column_name(sort)
+        if sort_stmt is not None or column_name is None or cursor.sort != sort:
+            raise FilterValidationError(
+                message=(
+                    f"Pagination cursor can not be used with sort '{sort}'; "
+                    "use skip/limit instead"
+                ),
+                repository=self,
+                invalid_filters=["cursor"],
+                suggested_filters=["skip", "limit"],
+            )
+
+        model = sa_model or self.sa_model_type
+        self._repo_logger.debug_query_step(
+            "keyset", "Applying keyset pagination", sort_value=sort
+        )
+        return stmt.where(
+            keyset_predicate(getattr(model, column_name), model.id, cursor)
+        )
+
+    def next_cursor(
+        self,
+        items: list[Any],
+        filters: dict[str, Any] | None,
+        limit: int | None = None,
+    ) -> str | None:
+        """Cursor for the page following ``items``, or None.
+
+        Returns None when ``items`` is a short (last) page or the sort does
+        not support keyset pagination; callers then fall back to ``skip``.
+
+        Args:
+            items: Page just returned by :meth:`query` for the same filters,
+                as entities or read models exposing ``id`` and the sort column.
+            filters: Filters the page was queried with.
+            limit: Explicit limit passed to :meth:`query`, if any.
+        """
+        filters = filters or {}
+        page_size = self._effective_limit(filters, limit)
+        if not items or (page_size and len(items) < page_size):
+            return None
+        sort = filters.get("sort")
+        column_name = self._keyset_sort_column_name(sort)
+        last = items[-1]
+        if column_name is None or not hasattr(last, column_name):
+            return None
+        try:
+            return KeysetCursor(
+                sort=sort, value=getattr(last, column_name), last_id=last.id
+            ).encode()
+        except TypeError:
+            return None
+
     async def execute_stmt(
         self, stmt: Select, *, _return_sa_instance: bool = False
     ) -> Any:
@@ -1227,7 +1409,7 @@ async def execute_stmt(
             sa_model=self.sa_model_type.__name__,
         )
 
-        # Try to get SQL string for logging (best effort)
+        # SQL text is rendered lazily, only when it is actually logged
         sql_query = self._compile_sql_for_logging(stmt, correlation_id)
 
         try:
@@ -1265,7 +1447,7 @@ async def execute_stmt(
                 total_time=total_time,
                 error=str(e),
                 error_type=type(e).__name__,
-                sql_query=sql_query,
+                sql_query=str(sql_query),
             )
 
             raise RepositoryQueryError(
@@ -1275,39 +1457,41 @@ async def execute_stmt(
                 correlation_id=correlation_id,
             ) from e
 
-    def _compile_sql_for_logging(self, stmt: Select, correlation_id: str) -> str | None:
+    def _compile_sql_for_logging(self, stmt: Select, correlation_id: str) -> LazySQL:
         """
-        Compile SQL statement for logging purposes.
+        Prepare the SQL statement for logging purposes.
+
+        The statement is only compiled (with literal binds) here when SQL
+        debug logging is enabled; otherwise compilation is deferred until a
+        log record or exception actually needs the text.
 
         Returns:
-            Compiled SQL string or None if compilation fails
+            Lazily rendered SQL text
         """
-        sql_query = None
-        try:
-            sql_query = str(stmt.compile(compile_kwargs={"literal_binds": True}))
-            self._repo_logger.log_sql_construction(
-                step="final_sql",
-                sql_fragment=(
-                    sql_query[: self.MAX_SQL_LOG_LENGTH] + "..."
-                    if len(sql_query) > self.MAX_SQL_LOG_LENGTH
-                    else sql_query
-                ),
-                parameters={"full_sql_length": len(sql_query)},
-            )
-        except Exception as e:
-            sql_query = str(stmt)  # Fallback to basic string representation
-            self._repo_logger.debug_query_step(
-                "sql_compilation",
-                "Could not compile SQL with literal binds",
-                correlation_id=correlation_id,
-                error=str(e),
-                fallback_sql_length=len(sql_query),
-            )
+        sql_query = LazySQL(stmt)
+        if not self._repo_logger.is_debug_enabled_for("sql"):
+            return sql_query
 
+        sql_text = str(sql_query)
+        self._repo_logger.log_sql_construction(
+            step="final_sql",
+            sql_fragment=(
+                sql_text[: self.MAX_SQL_LOG_LENGTH] + "..."
+                if len(sql_text) > self.MAX_SQL_LOG_LENGTH
+                else sql_text
+            ),
+            parameters={"full_sql_length": len(sql_text)},
+        )
+        self._repo_logger.debug_query_step(
+            "sql_compilation",
+            "Compiled SQL for logging",
+            correlation_id=correlation_id,
+            sql_length=len(sql_text),
+        )
         return sql_query
 
     async def _execute_sql_with_timeout(
-        self, stmt: Select, sql_query: str | None, correlation_id: str
+        self, stmt: Select, sql_query: LazySQL, correlation_id: str
     ) -> list[S]:
         """
         Execute SQL statement with timeout handling.
@@ -1329,12 +1513,12 @@ async def _execute_sql_with_timeout(
                     "SQL execution timed out after 30 seconds",
                     correlation_id=correlation_id,
                     execution_time=execution_time,
-                    sql_query=sql_query,
+                    sql_query=str(sql_query),
                 )
                 raise RepositoryQueryError(
                     message="Database query execution timed out after 30 seconds",
                     repository=self,
-                    sql_query=sql_query,
+                    sql_query=str(sql_query),
                     execution_time=execution_time,
                     correlation_id=correlation_id,
                 ) from e
@@ -1349,12 +1533,16 @@ async def _execute_sql_with_timeout(
                 sa_model=self.sa_model_type.__name__,
             )
 
-            # Log performance metrics
+            # Log performance metrics (SQL text only for slow or sampled queries)
             self._repo_logger.log_performance(
                 query_time=execution_time,
                 result_count=len(sa_objs),
                 memory_usage=self._repo_logger.get_memory_usage(),
-                sql_query=sql_query,
+                sql_query=(
+                    str(sql_query)
+                    if self._repo_logger.should_render_sql(execution_time)
+                    else None
+                ),
             )
 
         except (SQLAlchemyError, DatabaseError) as e:
@@ -1367,13 +1555,13 @@ async def _execute_sql_with_timeout(
                 execution_time=execution_time,
                 error=str(e),
                 error_type=type(e).__name__,
-                sql_query=sql_query,
+                sql_query=str(sql_query),
             )
 
             raise RepositoryQueryError(
                 message=f"Database query execution failed: {e!s}",
                 repository=self,
-                sql_query=sql_query,
+                sql_query=str(sql_query),
                 execution_time=execution_time,
                 correlation_id=correlation_id,
             ) from e
@@ -1529,7 +1717,7 @@ async def persist(
         self,
         domain_obj: D,
         *,
-        ttl: int = 300,  # Optional TTL for future cache invalidation use
+        ttl: int = 300,
     ) -> None:
         assert domain_obj in self.seen, (
             "Cannon persist entity which is unknown to the repo. "
@@ -1551,20 +1739,53 @@ async def persist(
         finally:
             self._session.autoflush = True
             await self._session.flush()
-        self._invalidate_cache_for_entity(domain_obj, ttl=ttl)
+        await self._invalidate_cache_for_entity(domain_obj, ttl=ttl)
 
     async def persist_all(
-        self, domain_entities: list[D] | None = None, *, ttl: int = 300
-    ) -> None:
+        self,
+        domain_entities: list[D] | None = None,
+        *,
+        ttl: int = 300,
+        bulk: bool = False,
+    ) -> BulkUpsertResult | None:
+        """
+        Write ``domain_entities`` to the session.
+
+        By default each mapped instance is merged, which costs at least one
+        SELECT and one UPDATE per row. With ``bulk=True`` the rows are
+        written with multi-row ``INSERT ... ON CONFLICT`` statements instead
+        (see :mod:`bulk_upsert`). Only the writes are batched: mappers that
+        look up the stored row (such as ``MealMapper``) still issue one SELECT
+        per entity while mapping. Versioned rows keep their optimistic check
+        (``StaleDataError`` on a concurrent edit) and the written SA instances
+        are detached from the session.
+
+        Returns:
+            Affected row counts when ``bulk`` is set, otherwise None.
+        """
         if not domain_entities:
-            return
+            return None
         for i in domain_entities:
             assert i in self.seen, (
                 "Cannon persist entity which is unknown to the repo. "
                 "Did you forget to call repo.add() for this entity?"
             )
+        if bulk:
+            return await self._bulk_upsert(domain_entities, ttl=ttl)
         self._session.autoflush = False
-        sa_instances = []
+        sa_instances = await self._map_for_persist(domain_entities)
+
+        for sa_instance in sa_instances:
+            await self._session.merge(sa_instance)
+
+        self._session.autoflush = True
+        await self._session.flush()
+        for entity in domain_entities:
+            await self._invalidate_cache_for_entity(entity, ttl=ttl)
+        return None
+
+    async def _map_for_persist(self, domain_entities: list[D]) -> list[S]:
+        sa_instances: list[S] = []
 
         async def prepare_sa_instance(obj: D):
             if isinstance(obj, Entity) and obj.discarded:
@@ -1582,23 +1803,90 @@ async def prepare_sa_instance(obj: D):
         async with anyio.create_task_group() as tg:
             for obj in domain_entities:
                 tg.start_soon(prepare_sa_instance, obj)
+        return sa_instances
 
-        for sa_instance in sa_instances:
-            await self._session.merge(sa_instance)
-
-        self._session.autoflush = True
-        await self._session.flush()
+    async def _bulk_upsert(
+        self, domain_entities: list[D], *, ttl: int = 300
+    ) -> BulkUpsertResult:
+        self._session.autoflush = False
+        try:
+            async with self._repo_logger.track_query(
+                operation="bulk_upsert", entities_count=len(domain_entities)
+            ) as query_context:
+                plan = BulkUpsertPlan()
+                for sa_instance in await self._map_for_persist(domain_entities):
+                    plan.add(sa_instance)
+                result = await execute_bulk_upsert(self._session, plan)
+                query_context.update(result.as_dict())
+        except StaleDataError:
+            # Same error a flush raises for a failed version check
+            raise
+        except (DatabaseError, SQLAlchemyError) as e:
+            raise RepositoryQueryError(
+                message=f"Bulk upsert failed: {e}",
+                repository=self,
+                filter_values={"entities_count": len(domain_entities)},
+            ) from e
+        finally:
+            self._session.autoflush = True
         for entity in domain_entities:
-            self._invalidate_cache_for_entity(entity, ttl=ttl)
+            await self._invalidate_cache_for_entity(entity, ttl=ttl)
+        return result
 
-    def _invalidate_cache_for_entity(self, entity: D, ttl: int = 300) -> None:
+    async def _invalidate_cache_for_entity(self, entity: D, ttl: int = 300) -> None:
         """
-        Placeholder for cache invalidation logic. Does nothing by default.
-        In the future, this should remove or update cache entries affected by
-        this entity. The ttl parameter is provided for future use
-        (e.g., to delay or schedule invalidation).
+        Evict cached result sets affected by a write of ``entity``.
+
+        Open-ended result sets of this namespace (a new or changed row may now
+        match their filters), result sets pinned to the entity id and every
+        result set of ``related_cache_namespaces`` are evicted. The tags are
+        also recorded in ``pending_cache_invalidations`` so the UnitOfWork can
+        repeat the eviction after commit, dropping anything a concurrent reader
+        cached between this write and the commit.
+
+        The ttl parameter is kept for API compatibility; eviction is immediate.
+        """
+        if self.cache_backend is None:
+            return
+        self._cache_bypass = True
+        tags = {namespace_tag(self._cache_namespace)}
+        entity_id = getattr(entity, "id", None)
+        if entity_id is not None:
+            tags.add(entity_tag(self._cache_namespace, entity_id))
+        for ns in self.related_cache_namespaces:
+            tags.update((namespace_tag(ns), pinned_tag(ns)))
+        self.pending_cache_invalidations.update(tags)
+        try:
+            await self.cache_backend.invalidate(tags)
+        except Exception as e:
+            self._repo_logger.logger.warning(
+                "Query cache invalidation failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                action="cache_invalidate",
+            )
+
+    async def flush_cache_invalidations(self) -> None:
         """
-        # TODO: Implement cache invalidation using self.cache_backend
+        Re-apply the invalidations recorded during this session.
+
+        Called by the UnitOfWork after a successful commit.
+        """
+        if self.cache_backend is None or not self.pending_cache_invalidations:
+            return
+        tags, self.pending_cache_invalidations = (
+            self.pending_cache_invalidations,
+            set(),
+        )
+        try:
+            await self.cache_backend.invalidate(tags)
+        except Exception as e:
+            self._repo_logger.logger.warning(
+                "Query cache invalidation failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                action="cache_invalidate",
+            )
 
     async def query(
         self,
@@ -1638,22 +1926,33 @@ async def query(
             RepositoryQueryException: When query building or execution fails
             EntityMappingException: When entity mapping fails
         """
-        # --- Caching Hook: Attempt to retrieve from cache before query execution ---
-        cache_key = self._build_cache_key(
+        # Fingerprint once: used as cache key and as log label
+        fingerprint = fingerprint_query(
+            namespace=self._cache_namespace,
             filters=filters,
             starting_stmt=starting_stmt,
             sort_stmt=sort_stmt,
             limit=limit,
             already_joined=already_joined,
             sa_model=sa_model,
-            _return_sa_instance=_return_sa_instance,
+            return_sa_instance=_return_sa_instance,
         )
-        cached_result = self._get_from_cache(cache_key)
-        if cached_result is not None:
-            self._repo_logger.debug_query_step(
-                "cache_hit", "Query result returned from cache", cache_key=cache_key
-            )
-            return cached_result
+        # --- Caching Hook: Attempt to retrieve from cache before query execution ---
+        cache_key = self._build_cache_key(
+            fingerprint, _return_sa_instance=_return_sa_instance
+        )
+        if cache_key is not None:
+            cached_result = await self._get_from_cache(cache_key)
+            if cached_result is not None:
+                for obj in cached_result:
+                    self.refresh_seen(obj)
+                self._repo_logger.debug_query_step(
+                    "cache_hit",
+                    "Query result returned from cache",
+                    cache_key=cache_key,
+                    result_count=len(cached_result),
+                )
+                return cached_result
         # Use RepositoryLogger's track_query context manager for comprehensive tracking
         async with self._repo_logger.track_query(
             "repository_query",
@@ -1664,6 +1963,7 @@ async def query(
             has_custom_sort=sort_stmt is not None,
             limit=limit,
             return_sa_instance=_return_sa_instance,
+            query_fingerprint=fingerprint.label if fingerprint else None,
         ) as context:
 
             try:
@@ -1740,18 +2040,10 @@ async def query(
                         stmt, _return_sa_instance=_return_sa_instance
                     )
                     # --- Caching Hook: Store result in cache after successful query ---
-                    self._set_cache(
-                        self._build_cache_key(
-                            filters=filters,
-                            starting_stmt=starting_stmt,
-                            sort_stmt=sort_stmt,
-                            limit=limit,
-                            already_joined=already_joined,
-                            sa_model=sa_model,
-                            _return_sa_instance=_return_sa_instance,
-                        ),
-                        result,
-                    )
+                    if cache_key is not None:
+                        await self._set_cache(
+                            cache_key, result, tags=self._cache_tags_for(filters)
+                        )
                     query_execution_time = time.perf_counter() - query_execution_start
                     context["query_execution_time"] = query_execution_time
                     context["result_count"] = len(result)
@@ -1853,6 +2145,125 @@ async def query(
                     correlation_id=self._repo_logger.correlation_id,
                 ) from e
 
+    def _build_projection_query(
+        self,
+        columns: Sequence[str],
+        *,
+        filters: dict[str, Any] | None = None,
+        starting_stmt: Select | None = None,
+        limit: int | None = None,
+        already_joined: set[str] | None = None,
+    ) -> Select:
+        """
+        Build the query() statement but select only the given table columns.
+
+        Filters, joins, sorting and pagination are applied exactly as in
+        query(); only the SELECT list is narrowed, so no relationships are
+        loaded and no ORM instances are created. Sort columns that were not
+        requested stay selected under ``_sort_<n>`` labels: with DISTINCT
+        (added for to-many joins) PostgreSQL requires ORDER BY expressions to
+        appear in the select list. query_projection() drops them from rows.
+
+        Raises:
+            FilterValidationError: When a column is not on the model's table
+        """
+        table_columns = self.sa_model_type.__table__.c
+        unknown = [name for name in columns if name not in table_columns]
+        if unknown:
+            raise FilterValidationError(
+                message=f"Unknown projection columns: {unknown}",
+                repository=self,
+                invalid_filters=unknown,
+                suggested_filters=list(table_columns.keys()),
+            )
+        stmt = self._build_query(
+            filters=filters,
+            starting_stmt=starting_stmt,
+            limit=limit,
+            already_joined=already_joined,
+        )
+        sort_columns = [
+            column.label(f"_sort_{i}")
+            for i, column in enumerate(self._sort_columns(filters))
+            if column.class_ is not self.sa_model_type or column.key not in columns
+        ]
+        return stmt.with_only_columns(
+            *(table_columns[name] for name in columns), *sort_columns
+        )
+
+    def _sort_columns(self, filters: dict[str, Any] | None) -> list[Any]:
+        """Return the columns sort_stmt() orders by for the given filters."""
+        sort_value = (filters or {}).get("sort")
+        sort_target = self._resolve_sort_column(sort_value) if sort_value else None
+        if not sort_target:
+            return []
+        sort_model, sort_name = sort_target
+        sort_columns = [getattr(sort_model, sort_name)]
+        if sort_model is self.sa_model_type and sort_name != "id":
+            sort_columns.append(self.sa_model_type.id)
+        return sort_columns
+
+    async def query_projection(
+        self,
+        columns: Sequence[str],
+        *,
+        filters: dict[str, Any] | None = None,
+        starting_stmt: Select | None = None,
+        limit: int | None = None,
+        already_joined: set[str] | None = None,
+    ) -> list[RowMapping]:
+        """
+        Run query() with a narrowed SELECT list and return plain rows.
+
+        Intended for list endpoints that only need scalar and precomputed
+        columns: skips eager loading, identity-map bookkeeping and domain
+        mapping. Results are not cached.
+
+        Args:
+            columns: Column names of the model's table to select
+            filters: Same filter criteria accepted by query()
+            starting_stmt: Optional pre-built SELECT statement
+            limit: Maximum number of results to return
+            already_joined: Set of already joined tables
+
+        Returns:
+            Row mappings keyed by column name
+
+        Raises:
+            FilterValidationError: When invalid filters or columns are provided
+            RepositoryQueryError: When query execution fails
+        """
+        async with self._repo_logger.track_query(
+            "repository_query_projection",
+            domain_model=self.domain_model_type.__name__,
+            sa_model=self.sa_model_type.__name__,
+            filter_count=len(filters) if filters else 0,
+            column_count=len(columns),
+            limit=limit,
+        ) as context:
+            stmt = self._build_projection_query(
+                columns,
+                filters=filters,
+                starting_stmt=starting_stmt,
+                limit=limit,
+                already_joined=already_joined,
+            )
+            start_time = time.perf_counter()
+            try:
+                with anyio.fail_after(30.0):
+                    result = await self._session.execute(stmt)
+                    rows = list(result.columns(*columns).mappings().all())
+            except (TimeoutError, SQLAlchemyError) as e:
+                raise RepositoryQueryError(
+                    message=f"Projection query failed: {e!s}",
+                    repository=self,
+                    filter_values=filters or {},
+                    execution_time=time.perf_counter() - start_time,
+                    correlation_id=self._repo_logger.correlation_id,
+                ) from e
+            context["result_count"] = len(rows)
+            return rows
+
     def _build_query(
         self,
         *,
@@ -1891,50 +2302,90 @@ def _build_query(
 
         if processed_filter:
             stmt = self._apply_filters(stmt, processed_filter, already_joined)
+            if processed_filter.get("cursor"):
+                stmt = self._apply_keyset_pagination(
+                    stmt, processed_filter, sort_stmt, sa_model
+                )
             stmt = self._apply_sorting(stmt, processed_filter, sort_stmt, sa_model)
 
         return stmt
 
     def _build_cache_key(
         self,
+        fingerprint: QueryFingerprint | None,
         *,
-        filters: dict[str, Any] | None = None,
-        starting_stmt: Select | None = None,
-        sort_stmt: Callable | None = None,
-        limit: int | None = None,
-        already_joined: set[str] | None = None,
-        sa_model: type[S] | None = None,
         _return_sa_instance: bool = False,
-    ) -> str:
-        """
-        Build a cache key based on query parameters. This is a simple stringification
-        for demonstration. In production, use a more robust and collision-resistant
-        approach.
-        """
-        # TODO: Replace with a more robust cache key builder as needed
-        key_parts = [
-            str(filters),
-            str(starting_stmt),
-            str(sort_stmt),
-            str(limit),
-            str(already_joined),
-            str(sa_model),
-            str(_return_sa_instance),
-        ]
-        return "|".join(key_parts)
+    ) -> str | None:
+        """
+        Build a cache key from the query fingerprint.
 
-    def _get_from_cache(self, _cache_key: str) -> Any:
+        Returns None when the query must not be cached: no backend configured,
+        the session already wrote to this repository, SA instances were
+        requested (they are bound to the session) or the query has no stable
+        fingerprint (e.g. a lambda sort callback).
         """
-        Placeholder for cache retrieval logic. Returns None by default.
-        In the future, this should query the cache_backend for the given key.
+        if (
+            self.cache_backend is None
+            or self._cache_bypass
+            or _return_sa_instance
+            or fingerprint is None
+        ):
+            return None
+        return fingerprint.digest
+
+    def _cache_tags_for(self, filters: dict[str, Any] | None) -> list[str]:
         """
-        # TODO: Implement cache lookup using self.cache_backend
-        return None
+        Return the invalidation tags for a cached result set.
+
+        Queries constrained by an exact ``id`` filter can only ever contain
+        those ids, so they are tagged per id and survive writes to other
+        entities of the namespace. They also carry the namespace's pinned tag,
+        which writes in a related namespace evict. Every other result set is
+        tagged with the namespace.
+        """
+        ids = (filters or {}).get("id")
+        if isinstance(ids, str):
+            ids = [ids]
+        if isinstance(ids, list | tuple | set) and ids:
+            return [
+                *(entity_tag(self._cache_namespace, str(i)) for i in ids),
+                pinned_tag(self._cache_namespace),
+            ]
+        return [namespace_tag(self._cache_namespace)]
 
-    def _set_cache(self, cache_key: str, value: Any, ttl: int = 300) -> None:
+    async def _get_from_cache(self, cache_key: str) -> Any:
         """
-        Placeholder for cache set logic. Does nothing by default.
-        In the future, this should store the value in cache_backend with the given
-        key and TTL.
+        Look up a cached query result. Backend failures are logged and
+        treated as a miss.
         """
-        # TODO: Implement cache set using self.cache_backend
+        if self.cache_backend is None:
+            return None
+        try:
+            return await self.cache_backend.get(cache_key)
+        except Exception as e:
+            self._repo_logger.logger.warning(
+                "Query cache lookup failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                action="cache_get",
+            )
+            return None
+
+    async def _set_cache(
+        self, cache_key: str, value: Any, *, tags: list[str], ttl: int | None = None
+    ) -> None:
+        """
+        Store a query result in the cache. Backend failures are logged and
+        otherwise ignored.
+        """
+        if self.cache_backend is None:
+            return
+        try:
+            await self.cache_backend.set(cache_key, value, tags=tags, ttl=ttl)
+        except Exception as e:
+            self._repo_logger.logger.warning(
+                "Query cache store failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                action="cache_set",
+            )
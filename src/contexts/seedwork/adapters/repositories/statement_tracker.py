@@ -0,0 +1,245 @@
+"""
+SQL statement counting, N+1 detection and query budgets.
+
+An engine-level ``before_cursor_execute`` listener records every statement
+sent to the database into the trackers active in the current context. A
+tracker is opened with :func:`track_statements` (the seedwork UnitOfWork
+opens one per unit of work). Trackers with a budget, or any tracker when
+REPOSITORY_DEBUG is set, also group statements by their normalized SQL
+shape, so the same query issued once per child row shows up as a repeated
+shape; other trackers only count, sparing the normalization of every
+statement::
+
+    with track_statements("fetch_meal", budget=10) as tracker:
+        await uow.meals.query(filters=filters)
+    tracker.count            # statements executed
+    tracker.repeated_shapes  # {normalized sql: executions} for N+1 suspects
+
+The tracker stack lives in a ContextVar. SQLAlchemy runs the sync event
+listeners in a greenlet that shares the caller's context, so statements
+issued through ``AsyncSession`` are attributed to the task that awaited them.
+
+Environment Controls:
+    REPOSITORY_N_PLUS_ONE_THRESHOLD: Executions of one shape from which it is
+        reported as an N+1 suspect (default 3)
+    QUERY_BUDGET_STRICT: When true, exceeding a budget raises
+        QueryBudgetExceededError instead of logging a warning (default false)
+    REPOSITORY_DEBUG: When true, every tracker records statement shapes
+        (default false)
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+from src.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = get_logger(__name__)
+
+_active_trackers: ContextVar[tuple[StatementTracker, ...]] = ContextVar(
+    "active_statement_trackers", default=()
+)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"\$\d+|%\(\w+\)s|%s")
+_PLACEHOLDER_TUPLE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_LIST = re.compile(r"\bVALUES \(\?\)(?:\s*,\s*\(\?\))+", re.IGNORECASE)
+_POSTCOMPILE = re.compile(r"\(?__\[POSTCOMPILE_\w+\]\)?")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "false").lower() in {"1", "true", "yes"}
+
+
+def normalize_sql(statement: str) -> str:
+    """Reduce a SQL statement to its shape.
+
+    Literals and bind parameters become ``?`` and parenthesized placeholder
+    lists (``IN (...)``, multi-row ``VALUES``) of any length collapse to a
+    single ``(?)``, so statements that differ only in their parameters
+    normalize to the same string.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _POSTCOMPILE.sub("(?)", shape)
+    shape = _BIND_PARAM.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _WHITESPACE.sub(" ", shape).strip()
+    shape = _PLACEHOLDER_TUPLE.sub("(?)", shape)
+    return _VALUES_LIST.sub("VALUES (?)", shape)
+
+
+class QueryBudgetExceededError(RuntimeError):
+    """Raised in strict mode when a scope executes more statements than allowed."""
+
+    def __init__(self, tracker: StatementTracker) -> None:
+        self.tracker = tracker
+        super().__init__(
+            f"{tracker.name} executed {tracker.count} SQL statements "
+            f"(budget {tracker.budget})"
+        )
+
+
+@dataclass(slots=True, eq=False)
+class StatementTracker:
+    """Statements executed within one tracking scope.
+
+    Attributes:
+        name: Label used in log records (endpoint, command or UoW name).
+        budget: Maximum number of statements allowed, or None for no limit.
+        n_plus_one_threshold: Executions of a single shape from which it is
+            reported as a repeated (N+1) shape.
+        track_shapes: Normalize each statement and count it per shape;
+            otherwise only ``count`` is kept.
+        count: Number of statements executed so far.
+        shapes: Executions per normalized statement shape.
+    """
+
+    name: str
+    budget: int | None = None
+    n_plus_one_threshold: int = field(
+        default_factory=lambda: _env_int("REPOSITORY_N_PLUS_ONE_THRESHOLD", 3)
+    )
+    track_shapes: bool = True
+    count: int = 0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str) -> None:
+        """Count one statement sent to the database."""
+        self.count += 1
+        if self.track_shapes:
+            self.shapes[normalize_sql(statement)] += 1
+
+    @property
+    def repeated_shapes(self) -> dict[str, int]:
+        """Shapes executed at least ``n_plus_one_threshold`` times."""
+        return {
+            shape: executions
+            for shape, executions in self.shapes.most_common()
+            if executions >= self.n_plus_one_threshold
+        }
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.count > self.budget
+
+    def summary(self) -> dict[str, Any]:
+        """Counters suitable for structured logging."""
+        return {
+            "sql_statements": self.count,
+            "sql_shapes": len(self.shapes),
+            "sql_repeated_shapes": self.repeated_shapes,
+            "sql_budget": self.budget,
+        }
+
+
+def current_statement_count() -> int | None:
+    """Statements seen by the innermost active tracker, or None if none is active."""
+    trackers = _active_trackers.get()
+    return trackers[-1].count if trackers else None
+
+
+def _deactivate(tracker: StatementTracker) -> None:
+    # Remove by identity rather than resetting a token: a unit of work may be
+    # entered and exited from different contexts (e.g. anyio task groups).
+    _active_trackers.set(tuple(t for t in _active_trackers.get() if t is not tracker))
+
+
+def _report(tracker: StatementTracker, *, strict: bool) -> None:
+    repeated = tracker.repeated_shapes
+    if repeated:
+        logger.warning(
+            "Repeated SQL statement shapes detected (possible N+1)",
+            scope=tracker.name,
+            **tracker.summary(),
+        )
+    if tracker.over_budget:
+        if strict:
+            raise QueryBudgetExceededError(tracker)
+        logger.warning(
+            "SQL statement budget exceeded",
+            scope=tracker.name,
+            **tracker.summary(),
+        )
+
+
+@contextmanager
+def track_statements(
+    name: str = "statements",
+    *,
+    budget: int | None = None,
+    strict: bool | None = None,
+    track_shapes: bool | None = None,
+) -> Iterator[StatementTracker]:
+    """Count the SQL statements executed inside the block.
+
+    Trackers nest: a statement is recorded by every tracker active in the
+    current context, so a per-request budget also sees the statements of the
+    units of work opened inside it.
+
+    Args:
+        name: Label for log records.
+        budget: Maximum number of statements before the scope is reported.
+        strict: Raise QueryBudgetExceededError on exit when the budget is
+            exceeded. Defaults to the QUERY_BUDGET_STRICT environment flag.
+            A block exiting with an exception is only logged, so the budget
+            never masks the original error.
+        track_shapes: Record statement shapes for N+1 detection. Defaults
+            to whether a budget is set or REPOSITORY_DEBUG is true.
+
+    Yields:
+        The tracker, readable during and after the block.
+    """
+    if track_shapes is None:
+        track_shapes = budget is not None or _env_flag("REPOSITORY_DEBUG")
+    tracker = StatementTracker(name=name, budget=budget, track_shapes=track_shapes)
+    _active_trackers.set((*_active_trackers.get(), tracker))
+    try:
+        yield tracker
+    except BaseException:
+        _deactivate(tracker)
+        _report(tracker, strict=False)
+        raise
+    _deactivate(tracker)
+    _report(
+        tracker, strict=_env_flag("QUERY_BUDGET_STRICT") if strict is None else strict
+    )
+
+
+def _record_statement(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    for tracker in _active_trackers.get():
+        tracker.record(statement)
+
+
+def instrument_engine(engine: AsyncEngine | Engine) -> None:
+    """Attach the statement counting listener to an engine (idempotent)."""
+    target = getattr(engine, "sync_engine", engine)
+    if not event.contains(target, "before_cursor_execute", _record_statement):
+        event.listen(target, "before_cursor_execute", _record_statement)
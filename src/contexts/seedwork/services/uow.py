@@ -4,10 +4,28 @@
 rollback on context exit and domain event collection from repositories.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from types import TracebackType
+from typing import TYPE_CHECKING
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.contexts.seedwork.adapters.repositories.statement_tracker import (
+    track_statements,
+)
+
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+    from types import TracebackType
+
+    from src.contexts.seedwork.adapters.repositories.statement_tracker import (
+        StatementTracker,
+    )
+
+    from src.contexts.seedwork.adapters.repositories.query_cache import (
+        QueryCacheBackend,
+    )
+    from src.contexts.shared_kernel.services.outbox import Outbox
 
 
 class UnitOfWork(ABC):
@@ -27,21 +45,39 @@ class UnitOfWork(ABC):
         Repositories available: session. Calls must occur within an active context.
         Concurrency: async; not thread-safe.
         FastAPI: Safe when using new instances per request via dependency injection.
+        Caching: when a query cache is given, subclasses hand it to their
+        repositories; invalidations recorded by the repositories are replayed
+        after each successful commit.
+        Instrumentation: SQL statements executed while the unit of work is
+        open are counted in ``statements`` (see statement_tracker); repeated
+        statement shapes and a ``query_budget`` overrun are reported on exit.
+        Outbox: when ``outbox`` is set (by the message bus), domain events
+        collected at commit are written as outbox rows in the same
+        transaction instead of being left for in-process dispatch.
     """
 
     session_factory: async_sessionmaker[AsyncSession]
+    query_cache: QueryCacheBackend | None = None
+    query_budget: int | None = None
+    outbox: Outbox | None = None
+    statements: StatementTracker
+    _statement_scope: AbstractContextManager[StatementTracker] | None = None
 
     def __init__(
         self,
         session_factory: async_sessionmaker[AsyncSession],
+        query_cache: QueryCacheBackend | None = None,
     ):
         """Initialize unit-of-work with session factory.
 
         Args:
             session_factory: SQLAlchemy async session factory for creating
                 database sessions.
+            query_cache: Optional repository query-result cache shared by
+                the repositories opened in this unit of work.
         """
         self.session_factory = session_factory
+        self.query_cache = query_cache
 
     @abstractmethod
     async def __aenter__(self):
@@ -51,8 +87,13 @@ async def __aenter__(self):
             self: The unit-of-work instance with active session.
 
         Side Effects:
-            Creates and stores new AsyncSession instance.
+            Creates and stores new AsyncSession instance and starts counting
+            the SQL statements it executes.
         """
+        self._statement_scope = track_statements(
+            type(self).__qualname__, budget=self.query_budget
+        )
+        self.statements = self._statement_scope.__enter__()
         self.session: AsyncSession = self.session_factory()
         return self
 
@@ -71,19 +112,40 @@ async def __aexit__(
 
         Side Effects:
             Always rolls back transaction and closes session regardless
-            of success or failure.
+            of success or failure, then reports the statement counters.
         """
-        await self.session.rollback()
-        await self.session.close()
+        scope, self._statement_scope = self._statement_scope, None
+        try:
+            await self.session.rollback()
+            await self.session.close()
+        except BaseException as e:
+            if scope is not None:
+                scope.__exit__(type(e), e, e.__traceback__)
+            raise
+        if scope is not None:
+            scope.__exit__(exc_type, exc_value, traceback)
 
     async def commit(self):
         """Commit the current transaction.
 
         Side Effects:
-            Persists all changes to database. Caller must handle
-            commit failures.
+            Persists all changes to database and replays pending query
+            cache invalidations. With an outbox, collected domain events
+            are committed as outbox rows. Caller must handle commit failures.
         """
+        if self.outbox is not None:
+            self.outbox.stage(self.session, self.collect_new_events())
         await self.session.commit()
+        await self._flush_cache_invalidations()
+
+    async def _flush_cache_invalidations(self) -> None:
+        """Replay query cache invalidations recorded by repositories."""
+        if self.query_cache is None:
+            return
+        for attr_name in list(self.__dict__):
+            repo = getattr(getattr(self, attr_name), "_generic_repo", None)
+            if hasattr(repo, "flush_cache_invalidations"):
+                await repo.flush_cache_invalidations()
 
     def collect_new_events(self):
         """Yield domain events produced by repositories in this UoW.
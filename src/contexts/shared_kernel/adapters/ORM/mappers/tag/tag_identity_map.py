@@ -0,0 +1,128 @@
+"""Session-scoped identity map for tag persistence models.
+
+Aggregate mappers (meals, recipes, menus, clients) all need the `TagSaModel`
+rows matching the domain tags they persist. Looking each tag up on its own
+costs one `SELECT` per tag, and concurrent lookups on the same session can
+create duplicate instances for the same tag. This module keeps, per
+`AsyncSession` (i.e. per UnitOfWork), a single `TagSaModel` instance for each
+`(key, value, author_id, type)` tuple and resolves missing tuples in batches
+with one `WHERE (key, value, author_id, type) IN (...)` query.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import anyio
+from sqlalchemy import event, select, tuple_
+from src.contexts.shared_kernel.adapters.ORM.sa_models.tag.tag_sa_model import (
+    TagSaModel,
+)
+from src.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.contexts.shared_kernel.domain.value_objects.tag import Tag
+
+TagIdentity = tuple[str, str, str, str]
+
+SESSION_INFO_KEY = "tag_identity_map"
+MAX_TAGS_PER_QUERY = 500
+
+
+def _discard_identity_map(sync_session, previous_transaction) -> None:
+    sync_session.info.pop(SESSION_INFO_KEY, None)
+
+
+def tag_identity(tag: Tag | TagSaModel) -> TagIdentity:
+    """Return the natural key of a tag."""
+    return (tag.key, tag.value, tag.author_id, tag.type)
+
+
+class TagIdentityMap:
+    """Identity map of `TagSaModel` instances for one session.
+
+    Tags missing from the database are created once and reused, so every
+    aggregate persisted in the same transaction links to the same instance.
+
+    Notes:
+        Stored in ``session.info`` and therefore discarded together with the
+        session, and on rollback since pending tags are expunged then.
+        Resolution is serialized with a lock because aggregate mappers map
+        children concurrently on the same session.
+    """
+
+    def __init__(self) -> None:
+        self._tags: dict[TagIdentity, TagSaModel] = {}
+        self._lock = anyio.Lock()
+        self.queries = 0
+
+    @classmethod
+    def for_session(cls, session: AsyncSession) -> TagIdentityMap:
+        """Return the identity map bound to session, creating it if needed."""
+        identity_map = session.info.get(SESSION_INFO_KEY)
+        if identity_map is None:
+            identity_map = cls()
+            session.info[SESSION_INFO_KEY] = identity_map
+            sync_session = session.sync_session
+            if not event.contains(
+                sync_session, "after_soft_rollback", _discard_identity_map
+            ):
+                event.listen(sync_session, "after_soft_rollback", _discard_identity_map)
+        return identity_map
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    async def resolve(
+        self, session: AsyncSession, tags: Iterable[Tag]
+    ) -> list[TagSaModel]:
+        """Return the `TagSaModel` for each domain tag, in input order.
+
+        Args:
+            session: Async SQLAlchemy session used for lookup.
+            tags: Domain tags to resolve.
+
+        Returns:
+            Existing or newly created persistence models, one per input tag.
+        """
+        identities = [tag_identity(tag) for tag in tags]
+        async with self._lock:
+            missing = list(
+                dict.fromkeys(i for i in identities if i not in self._tags)
+            )
+            if missing:
+                await self._load(session, missing)
+            return [self._tags[identity] for identity in identities]
+
+    async def _load(
+        self, session: AsyncSession, identities: list[TagIdentity]
+    ) -> None:
+        columns = tuple_(
+            TagSaModel.key, TagSaModel.value, TagSaModel.author_id, TagSaModel.type
+        )
+        for start in range(0, len(identities), MAX_TAGS_PER_QUERY):
+            chunk = identities[start : start + MAX_TAGS_PER_QUERY]
+            result = await session.execute(
+                select(TagSaModel).where(columns.in_(chunk))
+            )
+            self.queries += 1
+            for sa_tag in result.scalars().all():
+                self._tags[tag_identity(sa_tag)] = sa_tag
+
+        created = 0
+        for identity in identities:
+            if identity not in self._tags:
+                key, value, author_id, type_ = identity
+                self._tags[identity] = TagSaModel(
+                    key=key, value=value, author_id=author_id, type=type_
+                )
+                created += 1
+
+        get_logger(__name__).debug(
+            "Resolved tags",
+            requested=len(identities),
+            created=created,
+            cached=len(self._tags),
+        )
@@ -4,9 +4,13 @@
 corresponding SQLAlchemy model `TagSaModel`.
 """
 
+from collections.abc import Iterable
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.contexts.seedwork.adapters.ORM.mappers import helpers
 from src.contexts.seedwork.adapters.ORM.mappers.mapper import ModelMapper
+from src.contexts.shared_kernel.adapters.ORM.mappers.tag.tag_identity_map import (
+    TagIdentityMap,
+)
 from src.contexts.shared_kernel.adapters.ORM.sa_models.tag.tag_sa_model import (
     TagSaModel,
 )
@@ -18,7 +22,8 @@ class TagMapper(ModelMapper):
 
     Notes:
         Adheres to ModelMapper interface. Lossless mapping with proper type conversion.
-        Performance: Efficient conversion between domain and ORM representations.
+        Performance: Lookups go through the session's `TagIdentityMap`, so each
+        tag is fetched at most once per UnitOfWork and instances are shared.
         Transactions: methods require active UnitOfWork session.
     """
     @staticmethod
@@ -33,25 +38,27 @@ async def map_domain_to_sa(session: AsyncSession, domain_obj: Tag) -> TagSaModel
             The existing or newly created `TagSaModel` that matches the domain
             tag fields.
         """
-        tag_on_db = await helpers.get_sa_entity(
-            session=session,
-            sa_model_type=TagSaModel,
-            filters={
-                "key": domain_obj.key,
-                "value": domain_obj.value,
-                "author_id": domain_obj.author_id,
-                "type": domain_obj.type,
-            },
-        )
-        if tag_on_db is None:
-            tag_on_db = TagSaModel(
-                key=domain_obj.key,
-                value=domain_obj.value,
-                author_id=domain_obj.author_id,
-                type=domain_obj.type,
-            )
+        (tag_on_db,) = await TagMapper.map_domain_tags_to_sa(session, [domain_obj])
         return tag_on_db
 
+    @staticmethod
+    async def map_domain_tags_to_sa(
+        session: AsyncSession, domain_objs: Iterable[Tag]
+    ) -> list[TagSaModel]:
+        """Find or create the SQLAlchemy entities for many domain tags at once.
+
+        Args:
+            session: Async SQLAlchemy session used for lookup/creation.
+            domain_objs: Domain tags to map into persistence models.
+
+        Returns:
+            One `TagSaModel` per input tag, in input order. Tags not yet known
+            to the session's `TagIdentityMap` are fetched with a single query.
+        """
+        return await TagIdentityMap.for_session(session).resolve(
+            session, domain_objs
+        )
+
     @staticmethod
     def map_sa_to_domain(sa_obj: TagSaModel) -> Tag:
         """Convert a SQLAlchemy tag entity into the domain value object.
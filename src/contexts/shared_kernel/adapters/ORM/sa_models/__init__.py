@@ -4,6 +4,7 @@
     address_sa_model,
     contact_info_sa_model,
     nutri_facts_sa_model,
+    outbox_sa_model,
     profile_sa_model,
 )
 from src.contexts.shared_kernel.adapters.ORM.sa_models.tag import tag_sa_model
@@ -12,6 +13,7 @@
     "address_sa_model",
     "contact_info_sa_model",
     "nutri_facts_sa_model",
+    "outbox_sa_model",
     "profile_sa_model",
     "tag_sa_model",
 ]
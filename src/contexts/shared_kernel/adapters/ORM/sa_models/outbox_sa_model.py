@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import src.db.sa_field_types as sa_field
+from sqlalchemy import Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+from src.db.base import SaBase, SerializerMixin
+
+
+class OutboxMessageSaModel(SerializerMixin, SaBase):
+    """SQLAlchemy model for domain events awaiting dispatch (transactional outbox).
+
+    One row is written per (event, handler) pair in the same transaction as
+    the command that raised the event, so a handler is retried on its own
+    without re-running handlers that already succeeded.
+
+    Attributes:
+        id: Primary key, UUID v4 hex.
+        context: Bounded context whose dispatcher owns the row.
+        event_type: Importable event class name (``module:QualName``).
+        handler: Name of the event handler to run.
+        payload: Event attributes as JSON.
+        status: pending, processing, done or dead.
+        attempts: Number of failed handler runs.
+        available_at: When the row may next be claimed; for processing rows
+            this is the end of the claim lease.
+        last_error: Error of the last failed run.
+        created_at: When the row was written.
+        processed_at: When the handler succeeded or the row was dead-lettered.
+
+    Notes:
+        Performance: claims use ``FOR UPDATE SKIP LOCKED`` on the partial
+        index over (context, available_at) of unfinished rows.
+    """
+    __tablename__ = "outbox_messages"
+
+    id: Mapped[sa_field.strpk]
+    context: Mapped[str]
+    event_type: Mapped[str]
+    handler: Mapped[str]
+    payload: Mapped[dict] = mapped_column(JSONB)
+    status: Mapped[str] = mapped_column(default="pending")
+    attempts: Mapped[int] = mapped_column(default=0)
+    available_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now()
+    )
+    last_error: Mapped[str | None]
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now()
+    )
+    processed_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))
+
+    __table_args__ = (
+        Index(
+            "ix_outbox_messages_context_available_at_unfinished",
+            "context",
+            "available_at",
+            postgresql_where=text("status IN ('pending', 'processing')"),
+        ),
+        {
+            "schema": "shared_kernel",
+            "extend_existing": True,
+        },
+    )
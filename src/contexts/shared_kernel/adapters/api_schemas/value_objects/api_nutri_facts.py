@@ -5,7 +5,7 @@
 encapsulates a numeric value and its measurement unit.
 """
 
-from typing import Any, Union
+from typing import Any, ClassVar, Union
 
 from pydantic import Field, model_validator
 from src.contexts.seedwork.adapters.api_schemas.base_api_model import (
@@ -113,6 +113,8 @@ class ApiNutriFacts(BaseApiValueObject[NutriFacts, SaBase]):
         Provides validation, normalization, and arithmetic operations.
     """
 
+    trusted_output_safe: ClassVar[bool] = True
+
     calories: ApiNutriValue
     protein: ApiNutriValue
     carbohydrate: ApiNutriValue
@@ -459,6 +461,10 @@ def from_domain(cls, domain_obj: NutriFacts) -> "ApiNutriFacts":
                 kwargs[name] = ApiNutriValue.from_domain(value)
             else:
                 kwargs[name] = value
+        if not all(isinstance(v, ApiNutriValue) for v in kwargs.values()):
+            # Raw numbers and gaps need the normalizing validator, even for
+            # trusted output
+            return cls.model_validate(kwargs)
         return cls(**kwargs)
 
     def to_domain(self) -> NutriFacts:
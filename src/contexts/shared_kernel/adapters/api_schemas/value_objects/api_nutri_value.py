@@ -1,6 +1,6 @@
 """API value object for nutritional values with arithmetic helpers."""
 
-from typing import Any, Union
+from typing import Any, ClassVar, Union
 
 from pydantic import NonNegativeFloat
 from src.contexts.seedwork.adapters.api_schemas.base_api_model import (
@@ -27,6 +27,8 @@ class ApiNutriValue(BaseApiValueObject[NutriValue, SaBase]):
         Validates inputs and includes helpers to convert to/from domain models.
     """
 
+    trusted_output_safe: ClassVar[bool] = True
+
     unit: MeasureUnit
     value: NonNegativeFloat
 
@@ -171,7 +173,7 @@ def from_domain(cls, domain_obj: NutriValue) -> "ApiNutriValue":
         """
         return cls(
             unit=domain_obj.unit,
-            value=domain_obj.value,
+            value=float(domain_obj.value),
         )
 
     def to_domain(self) -> NutriValue:
@@ -1,5 +1,7 @@
 """API value object for tags with validation and conversions."""
 
+from typing import ClassVar
+
 from pydantic import Field
 from src.contexts.seedwork.adapters.api_schemas.base_api_fields import (
     SanitizedText,
@@ -28,6 +30,8 @@ class ApiTag(BaseApiValueObject[Tag, TagSaModel]):
         All string fields are sanitized and trimmed automatically.
     """
 
+    trusted_output_safe: ClassVar[bool] = True
+
     key: SanitizedText = Field(..., min_length=1, max_length=100)
     value: SanitizedText = Field(..., min_length=1, max_length=200)
     author_id: UUIDIdRequired = Field(..., description="User ID who created this tag")
@@ -27,6 +27,7 @@ def __init__(
         headers: dict[str, str] | None = None,
         timeout: httpx.Timeout | None = None,
         limits: httpx.Limits | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """Initialize optimized HTTP client.
 
@@ -35,6 +36,8 @@ def __init__(
             headers: Default headers for all requests.
             timeout: Request timeout configuration.
             limits: Connection limits configuration.
+            transport: Transport to send requests through instead of the
+                network (e.g. a fake server in tests).
 
         Notes:
             Uses optimized defaults for connection pooling and timeouts suitable for web applications.
@@ -76,6 +79,7 @@ def __init__(
             follow_redirects=True,
             # Web application optimizations
             http2=True,  # Enable HTTP/2 for better performance
+            transport=transport,
         )
 
     async def __aenter__(self) -> "OptimizedHTTPClient":
@@ -120,6 +124,7 @@ def create_optimized_http_client(
     headers: dict[str, str] | None = None,
     timeout: httpx.Timeout | None = None,
     limits: httpx.Limits | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
 ) -> OptimizedHTTPClient:
     """Create a new optimized HTTP client instance.
 
@@ -128,6 +133,7 @@ def create_optimized_http_client(
         headers: Default headers for all requests.
         timeout: Request timeout configuration.
         limits: Connection limits configuration.
+        transport: Transport to send requests through instead of the network.
 
     Returns:
         Configured OptimizedHTTPClient instance.
@@ -150,6 +156,7 @@ def create_optimized_http_client(
         headers=headers,
         timeout=timeout,
         limits=limits,
+        transport=transport,
     )
 
 
@@ -1,5 +1,5 @@
-import inspect
-from collections.abc import Mapping
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, ClassVar
 
 from attrs import field, fields, frozen
@@ -37,6 +37,82 @@ def _convert_to_nutri_value(nutri_fact: Any, unit: MeasureUnit) -> NutriValue:
     return NutriValue(value=nutri_fact, unit=unit)
 
 
+class NutrientVector:
+    """Array-backed representation of a NutriFacts instance.
+
+    Nutrient values are stored in ``NUTRIENT_FIELDS`` order in a float array
+    with a parallel unit table, so arithmetic over many instances is a
+    column-wise reduction instead of per-field value object allocation.
+
+    Attributes:
+        values: Nutrient values in ``NUTRIENT_FIELDS`` order.
+        units: Unit of each value, in the same order.
+    """
+
+    __slots__ = ("units", "values")
+
+    def __init__(
+        self, values: Iterable[float], units: Sequence[MeasureUnit | None]
+    ) -> None:
+        self.values = array("d", values)
+        self.units = tuple(units)
+        if len(self.values) != len(self.units):
+            raise ValueError("Nutrient values and units must have the same length")
+
+    @classmethod
+    def zeros(cls) -> "NutrientVector":
+        """Return a zero vector with the default nutrient units."""
+        return cls(array("d", bytes(8 * len(NUTRIENT_FIELDS))), DEFAULT_UNITS)
+
+    @classmethod
+    def sum(cls, vectors: Iterable["NutrientVector"]) -> "NutrientVector":
+        """Sum vectors column-wise, keeping the default nutrient units.
+
+        Equivalent to folding ``+`` over the vectors starting from
+        :meth:`zeros`.
+        """
+        columns = zip(*(vector.values for vector in vectors), strict=True)
+        values = array("d", map(sum, columns))
+        if not values:
+            return cls.zeros()
+        return cls(values, DEFAULT_UNITS)
+
+    def _merge_units(self, other: "NutrientVector") -> tuple[MeasureUnit | None, ...]:
+        # Same rule as NutriValue arithmetic: keep own unit unless missing
+        if None not in self.units:
+            return self.units
+        return tuple(
+            own if own is not None else theirs
+            for own, theirs in zip(self.units, other.units, strict=True)
+        )
+
+    def __add__(self, other: "NutrientVector") -> "NutrientVector":
+        if isinstance(other, NutrientVector):
+            return NutrientVector(
+                map(float.__add__, self.values, other.values),
+                self._merge_units(other),
+            )
+        return NotImplemented
+
+    def __sub__(self, other: "NutrientVector") -> "NutrientVector":
+        if isinstance(other, NutrientVector):
+            return NutrientVector(
+                map(float.__sub__, self.values, other.values),
+                self._merge_units(other),
+            )
+        return NotImplemented
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NutrientVector):
+            return self.values == other.values and self.units == other.units
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"NutrientVector(values={list(self.values)!r}, units={self.units!r})"
+
+
 @frozen(kw_only=True)
 class NutriFacts(ValueObject):
     """Value object representing nutritional facts of a food item.
@@ -312,15 +388,62 @@ def __attrs_post_init__(self):
         Notes:
             Auto-converts all nutrient inputs to NutriValue with appropriate units.
         """
-        for attr in fields(self.__class__):
-            attr_name = attr.name
+        for attr_name, unit in _FIELD_UNITS:
+            current = getattr(self, attr_name)
+            if isinstance(current, NutriValue) and current.value is not None:
+                continue
+            object.__setattr__(
+                self, attr_name, _convert_to_nutri_value(current, unit)
+            )
+
+    @classmethod
+    def from_vector(cls, vector: NutrientVector) -> "NutriFacts":
+        """Build NutriFacts from a nutrient vector.
+
+        Args:
+            vector: Values and units in ``NUTRIENT_FIELDS`` order.
+
+        Returns:
+            New NutriFacts holding the vector values.
+
+        Notes:
+            Skips input normalization: vector values are already numeric.
+        """
+        instance = object.__new__(cls)
+        for attr_name, value, unit in zip(
+            NUTRIENT_FIELDS, vector.values, vector.units, strict=True
+        ):
             object.__setattr__(
-                self,
-                attr_name,
-                _convert_to_nutri_value(
-                    getattr(self, attr_name), self.default_units[attr_name]
-                ),
+                instance, attr_name, NutriValue(value=value, unit=unit)
             )
+        return instance
+
+    def to_vector(self) -> NutrientVector:
+        """Export nutrient values and units as a nutrient vector."""
+        nutri_values = [getattr(self, name) for name in NUTRIENT_FIELDS]
+        return NutrientVector(
+            (float(nutri_value.value) for nutri_value in nutri_values),
+            [nutri_value.unit for nutri_value in nutri_values],
+        )
+
+    @classmethod
+    def sum(cls, items: Iterable["NutriFacts"]) -> "NutriFacts":
+        """Sum many NutriFacts in a single batched reduction.
+
+        Args:
+            items: Nutritional facts to sum.
+
+        Returns:
+            New NutriFacts with summed values and default units; a zero
+            NutriFacts when items is empty.
+
+        Notes:
+            Equivalent to ``sum(items, NutriFacts())`` without allocating
+            intermediate instances.
+        """
+        return cls.from_vector(
+            NutrientVector.sum(item.to_vector() for item in items)
+        )
 
     def __add__(self, other: "NutriFacts") -> "NutriFacts":
         """Add nutritional facts from another NutriFacts instance.
@@ -335,10 +458,7 @@ def __add__(self, other: "NutriFacts") -> "NutriFacts":
             Performs element-wise addition of all nutrient fields.
         """
         if isinstance(other, NutriFacts):
-            params = inspect.signature(self.__class__).parameters
-            self_args = {name: getattr(self, name) for name in params if name != "default_units"}
-            other_args = {name: getattr(other, name) for name in params if name != "default_units"}
-            return self.replace(**{k: v + other_args[k] for k, v in self_args.items()})
+            return self.from_vector(self.to_vector() + other.to_vector())
         return NotImplemented
 
     def __sub__(self, other: "NutriFacts") -> "NutriFacts":
@@ -354,8 +474,15 @@ def __sub__(self, other: "NutriFacts") -> "NutriFacts":
             Performs element-wise subtraction of all nutrient fields.
         """
         if isinstance(other, NutriFacts):
-            params = inspect.signature(self.__class__).parameters
-            self_args = {name: getattr(self, name) for name in params if name != "default_units"}
-            other_args = {name: getattr(other, name) for name in params if name != "default_units"}
-            return self.replace(**{k: v - other_args[k] for k, v in self_args.items()})
+            return self.from_vector(self.to_vector() - other.to_vector())
         return NotImplemented
+
+
+# Fixed nutrient order shared by NutriFacts and NutrientVector
+NUTRIENT_FIELDS: tuple[str, ...] = tuple(attr.name for attr in fields(NutriFacts))
+DEFAULT_UNITS: tuple[MeasureUnit, ...] = tuple(
+    NutriFacts.default_units[name] for name in NUTRIENT_FIELDS
+)
+_FIELD_UNITS: tuple[tuple[str, MeasureUnit], ...] = tuple(
+    zip(NUTRIENT_FIELDS, DEFAULT_UNITS, strict=True)
+)
@@ -13,10 +13,14 @@
 import structlog
 
 import src.contexts.iam.core.internal_endpoints.get as iam_internal_api
+from src.contexts.shared_kernel.middleware.auth.user_cache import get_iam_user_cache
 from src.contexts.shared_kernel.middleware.core.base_middleware import (
     BaseMiddleware,
     EndpointHandler,
 )
+from src.contexts.shared_kernel.services.cross_context import (
+    in_process_calls_enabled,
+)
 from src.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -123,7 +127,7 @@ class UnifiedIAMProvider:
 
     Attributes:
         structured_logger: Logger instance for IAM operations.
-        _cache: Cache for user data (strategy-dependent scope).
+        _cache: Per-instance cache for user data ("request" strategy).
         cache_strategy: Caching strategy ("request" or "container").
         _cache_stats: Cache performance statistics.
 
@@ -142,7 +146,8 @@ def __init__(
             logger_name: Name for the structured logger.
             cache_strategy: Caching strategy ("request" or "container").
                 - "request": Cache cleared after each request (default, current behavior)
-                - "container": Cache persists across requests (optimized for Lambda containers)
+                - "container": Process-wide LRU/TTL cache shared by every provider
+                  and invalidated on IAM role changes (see ``IAMUserCache``)
         """
         # structlog is auto-configured in logger module
         self.structured_logger = get_logger(logger_name)
@@ -165,7 +170,7 @@ async def get_user(self, user_id: str, caller_context: str) -> dict[str, Any]:
             AuthenticationError: When IAM call fails.
 
         Notes:
-            Uses request-scoped caching to reduce IAM calls.
+            Uses strategy-scoped caching to reduce IAM calls.
             Validates caller_context against supported contexts.
         """
         # Validate caller_context first
@@ -196,8 +201,15 @@ async def get_user(self, user_id: str, caller_context: str) -> dict[str, Any]:
         # Check cache first (strategy-dependent scope)
         cache_key = f"{user_id}:{caller_context}"
         correlation_id = structlog.contextvars.get_contextvars().get("correlation_id", "unknown")
+        shared_cache = (
+            get_iam_user_cache() if self.cache_strategy == "container" else None
+        )
 
-        if cache_key in self._cache:
+        if shared_cache is not None:
+            cached = shared_cache.get(user_id, caller_context)
+        else:
+            cached = self._cache.get(cache_key)
+        if cached is not None:
             self._cache_stats["hits"] += 1
             self.structured_logger.debug(
                 "IAM user data retrieved from cache",
@@ -207,7 +219,7 @@ async def get_user(self, user_id: str, caller_context: str) -> dict[str, Any]:
                 cache_strategy=self.cache_strategy,
                 cache_hit_rate=self._get_cache_hit_rate(),
             )
-            return self._cache[cache_key]
+            return cached
 
         try:
             self._cache_stats["misses"] += 1
@@ -219,64 +231,19 @@ async def get_user(self, user_id: str, caller_context: str) -> dict[str, Any]:
                 cache_strategy=self.cache_strategy,
                 cache_hit_rate=self._get_cache_hit_rate(),
             )
-
-            # Call internal IAM endpoint
-            response = await iam_internal_api.get(
-                id=user_id, caller_context=caller_context
-            )
-
-            if response.get("statusCode") != HTTP_OK:
-                self.structured_logger.warning(
-                    "IAM provider returned error",
-                    correlation_id=correlation_id,
-                    user_id_suffix=(
-                        user_id[-4:] if len(user_id) >= 4 else user_id
-                    ),  # Last 4 chars for debugging
-                    caller_context=caller_context,
-                    status_code=response.get("statusCode"),
-                    response_body_type=type(
-                        response.get("body")
-                    ).__name__,  # Type only, not content
-                    response_body_length=(
-                        len(str(response.get("body", "")))
-                        if response.get("body")
-                        else 0
-                    ),
+            if shared_cache is not None:
+                # Concurrent misses for the same user share one IAM call
+                response = await shared_cache.load(
+                    user_id,
+                    caller_context,
+                    lambda: self._fetch_user(user_id, caller_context, correlation_id),
+                )
+            else:
+                response = await self._fetch_user(
+                    user_id, caller_context, correlation_id
                 )
-                # Cache error response to avoid repeated failed calls
+                # Error responses are cached too, to avoid repeated failed calls
                 self._cache[cache_key] = response
-                return response
-
-            # The IAM internal endpoint now returns a clean response with only id and roles
-            # (without context field), so we can parse it directly with the target context's ApiUser class
-            if caller_context == "products_catalog":
-                api_user_class = ProductsApiUser
-            elif caller_context == "recipes_catalog":
-                api_user_class = RecipesApiUser
-            elif caller_context == "client_onboarding":
-                api_user_class = ClientOnboardingApiUser
-            elif caller_context == "iam":
-                api_user_class = IamApiUser
-
-            assert api_user_class is not None
-            assert isinstance(response["body"], str)
-            # Parse the filtered JSON response directly with the target context's ApiUser class
-            iam_user = api_user_class.model_validate_json(response["body"])
-            seed_user = iam_user.to_domain()
-
-            # Create successful response
-            success_response = {"statusCode": HTTP_OK, "body": seed_user}
-
-            # Cache successful response
-            self._cache[cache_key] = success_response
-
-            self.structured_logger.info(
-                "User authenticated successfully",
-                correlation_id=correlation_id,
-                user_id=user_id,
-                caller_context=caller_context,
-                user_roles_count=len(iam_user.roles),
-            )
         except Exception as e:
             self.structured_logger.error(
                 "IAM provider call failed",
@@ -292,13 +259,87 @@ async def get_user(self, user_id: str, caller_context: str) -> dict[str, Any]:
                 "body": json.dumps({"message": "Authentication service error"}),
             }
         else:
-            return success_response
+            return response
+
+    async def _fetch_user(
+        self, user_id: str, caller_context: str, correlation_id: str
+    ) -> dict[str, Any]:
+        """Call IAM and convert the user to the caller context's domain user.
+
+        Returns:
+            Dictionary with statusCode and body (SeedUser object on success,
+            IAM's JSON error body otherwise).
+        """
+        # Call internal IAM endpoint; in-process callers get the body as a
+        # dict and skip the JSON round trip
+        in_process = in_process_calls_enabled()
+        if in_process:
+            response = await iam_internal_api.get_user_data(
+                id=user_id, caller_context=caller_context
+            )
+        else:
+            response = await iam_internal_api.get(
+                id=user_id, caller_context=caller_context
+            )
+
+        if response.get("statusCode") != HTTP_OK:
+            if in_process:
+                response = response | {"body": json.dumps(response["body"])}
+            self.structured_logger.warning(
+                "IAM provider returned error",
+                correlation_id=correlation_id,
+                user_id_suffix=(
+                    user_id[-4:] if len(user_id) >= 4 else user_id
+                ),  # Last 4 chars for debugging
+                caller_context=caller_context,
+                status_code=response.get("statusCode"),
+                response_body_type=type(
+                    response.get("body")
+                ).__name__,  # Type only, not content
+                response_body_length=(
+                    len(str(response.get("body", "")))
+                    if response.get("body")
+                    else 0
+                ),
+            )
+            return response
+
+        # The IAM internal endpoint now returns a clean response with only id and roles
+        # (without context field), so we can parse it directly with the target context's ApiUser class
+        if caller_context == "products_catalog":
+            api_user_class = ProductsApiUser
+        elif caller_context == "recipes_catalog":
+            api_user_class = RecipesApiUser
+        elif caller_context == "client_onboarding":
+            api_user_class = ClientOnboardingApiUser
+        elif caller_context == "iam":
+            api_user_class = IamApiUser
+
+        assert api_user_class is not None
+        if in_process:
+            assert isinstance(response["body"], dict)
+            iam_user = api_user_class.model_validate(response["body"])
+        else:
+            assert isinstance(response["body"], str)
+            # Parse the filtered JSON response directly with the target context's ApiUser class
+            iam_user = api_user_class.model_validate_json(response["body"])
+        seed_user = iam_user.to_domain()
+
+        self.structured_logger.info(
+            "User authenticated successfully",
+            correlation_id=correlation_id,
+            user_id=user_id,
+            caller_context=caller_context,
+            user_roles_count=len(iam_user.roles),
+        )
+        return {"statusCode": HTTP_OK, "body": seed_user}
 
     def clear_cache(self):
         """Clear cache based on strategy.
 
         - "request" strategy: Always clears cache (current behavior)
-        - "container" strategy: Does not clear cache (optimized for Lambda containers)
+        - "container" strategy: Does not clear cache; the process-wide cache
+          expires entries itself and is invalidated by IAM role changes
         """
         if self.cache_strategy == "request":
             self._cache.clear()
@@ -320,7 +361,7 @@ def get_cache_stats(self) -> dict[str, Any]:
             self._cache_stats["hits"] / total_requests if total_requests > 0 else 0.0
         )
 
-        return {
+        stats: dict[str, Any] = {
             "cache_strategy": self.cache_strategy,
             "cache_hits": self._cache_stats["hits"],
             "cache_misses": self._cache_stats["misses"],
@@ -328,6 +369,11 @@ def get_cache_stats(self) -> dict[str, Any]:
             "hit_rate": round(hit_rate, 4),
             "cache_size": len(self._cache),
         }
+        if self.cache_strategy == "container":
+            shared_stats = get_iam_user_cache().stats()
+            stats["cache_size"] = shared_stats["entries"]
+            stats["shared_cache"] = shared_stats
+        return stats
 
     def _get_cache_hit_rate(self) -> float:
         """Get current cache hit rate as a percentage."""
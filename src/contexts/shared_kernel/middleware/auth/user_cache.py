@@ -0,0 +1,142 @@
+"""Process-wide cache of IAM user lookups.
+
+Authenticated requests resolve the caller through IAM, which opens a
+UnitOfWork per lookup. :class:`IAMUserCache` keeps the resolved responses for
+a bounded time so a FastAPI worker or a warm Lambda container only reaches
+IAM again when an entry expires, is evicted, or is invalidated by an IAM
+role change.
+
+Concurrent misses for the same user and caller context share one IAM call
+(single-flight).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Any
+
+from src.config.app_config import get_app_settings
+from src.contexts.seedwork.adapters.caching import LruTtlCache, SingleFlight
+
+HTTP_OK = 200
+HTTP_NOT_FOUND = 404
+
+type CacheKey = tuple[str, str]
+
+
+class IAMUserCache:
+    """Bounded LRU cache of IAM user responses with per-entry TTL.
+
+    Successful responses live for ``ttl`` seconds, "user not found" responses
+    for ``negative_ttl`` seconds; other errors are never cached. Expiry uses
+    the monotonic clock and is checked lazily on access.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        ttl: float = 300.0,
+        negative_ttl: float = 5.0,
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: LruTtlCache[CacheKey, dict[str, Any]] = LruTtlCache(
+            max_entries, on_drop=self._unindex
+        )
+        self._user_keys: dict[str, set[CacheKey]] = {}
+        self._flights: SingleFlight[CacheKey, dict[str, Any]] = SingleFlight()
+        # In-flight loads invalidated while running; their result is not stored
+        self._stale: set[CacheKey] = set()
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        return self._entries.max_entries
+
+    def get(self, user_id: str, caller_context: str) -> dict[str, Any] | None:
+        """Return the cached response or None on miss/expiry."""
+        return self._entries.get((user_id, caller_context))
+
+    async def load(
+        self,
+        user_id: str,
+        caller_context: str,
+        loader: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Run loader once per key, sharing its outcome with concurrent callers.
+
+        The response is stored when cacheable and no invalidation for the
+        user happened while the loader was running.
+
+        Raises:
+            Exception: Whatever loader raised, re-raised for every waiter.
+        """
+        key = (user_id, caller_context)
+
+        async def load_and_store() -> dict[str, Any]:
+            try:
+                response = await loader()
+                if key not in self._stale:
+                    self._store(key, response)
+                return response
+            finally:
+                self._stale.discard(key)
+
+        return await self._flights.run(key, load_and_store)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Evict every entry of a user, across caller contexts."""
+        for key in self._user_keys.pop(user_id, ()):
+            if self._entries.pop(key) is not None:
+                self.invalidations += 1
+        self._stale.update(key for key in self._flights if key[0] == user_id)
+
+    def clear(self) -> None:
+        """Evict every entry."""
+        self._entries.clear()
+        self._user_keys.clear()
+        self._stale.update(self._flights)
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss counters and current occupancy."""
+        return {
+            **self._entries.stats(),
+            "coalesced": self._flights.coalesced,
+            "invalidations": self.invalidations,
+        }
+
+    def _store(self, key: CacheKey, response: dict[str, Any]) -> None:
+        status_code = response.get("statusCode")
+        if status_code == HTTP_OK:
+            ttl = self.ttl
+        elif status_code == HTTP_NOT_FOUND:
+            ttl = self.negative_ttl
+        else:
+            return
+        self._entries.set(key, response, ttl)
+        self._user_keys.setdefault(key[0], set()).add(key)
+
+    def _unindex(self, key: CacheKey, _: dict[str, Any]) -> None:
+        keys = self._user_keys.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._user_keys[key[0]]
+
+
+@lru_cache
+def get_iam_user_cache() -> IAMUserCache:
+    """Return the process-wide IAM user cache.
+
+    Sized by ``IAM_USER_CACHE_MAX_ENTRIES`` and ``IAM_USER_CACHE_TTL`` (see
+    :class:`APPSettings`).
+    """
+    settings = get_app_settings()
+    return IAMUserCache(
+        max_entries=settings.iam_user_cache_max_entries,
+        ttl=settings.iam_user_cache_ttl,
+    )
@@ -10,6 +10,9 @@
 from collections.abc import Callable
 from typing import Any
 
+from src.contexts.seedwork.adapters.repositories.statement_tracker import (
+    track_statements,
+)
 from src.contexts.shared_kernel.middleware.core.base_middleware import (
     BaseMiddleware,
     EndpointHandler,
@@ -23,6 +26,7 @@ def async_endpoint_handler(
     *middleware: BaseMiddleware,
     timeout: float | None = None,
     name: str | None = None,
+    query_budget: int | None = None,
 ) -> Callable[[EndpointHandler], EndpointHandler]:
     """Decorator for Lambda handlers with middleware composition.
 
@@ -35,6 +39,9 @@ def async_endpoint_handler(
                     (order will be automatically enforced).
         timeout: Optional timeout in seconds for the entire middleware chain.
         name: Optional name for the decorated handler (useful for debugging).
+        query_budget: Optional maximum number of SQL statements one invocation
+                    may execute. Overruns are logged, or raise
+                    QueryBudgetExceededError when QUERY_BUDGET_STRICT is set.
 
     Returns:
         A decorator function that wraps the handler with the specified middleware.
@@ -95,13 +102,17 @@ async def wrapped_handler(
             **kwargs,
         ) -> dict[str, Any]:
             """Execute the handler with middleware composition."""
-            return await composed_handler(*args, **kwargs)
+            if query_budget is None:
+                return await composed_handler(*args, **kwargs)
+            with track_statements(name or handler.__name__, budget=query_budget):
+                return await composed_handler(*args, **kwargs)
 
         # Add metadata for debugging and introspection
         meta = {
             "middleware_count": len(middleware),
             "middleware_names": [m.name for m in middleware],
             "timeout": timeout,
+            "query_budget": query_budget,
             "decorator_name": name or handler.__name__,
         }
         wrapped_handler._middleware_info = meta  # type: ignore[attr-defined]
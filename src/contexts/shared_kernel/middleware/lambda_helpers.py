@@ -141,9 +141,10 @@ def extract_pagination_params(
         default_limit: int = 50,
         default_sort: str = "-updated_at",
     ) -> dict[str, Any]:
-        """Extract and normalize limit and sort parameters from query parameters.
+        """Extract and normalize limit, sort and cursor parameters.
 
         Handles both single values and lists (extracts first item from lists).
+        The keyset ``cursor`` is only kept when present and non-empty.
 
         Args:
             params: Query parameters dictionary.
@@ -151,7 +152,7 @@ def extract_pagination_params(
             default_sort: Default sort value if not provided.
 
         Returns:
-            Dictionary with normalized limit and sort values.
+            Dictionary with normalized limit, sort and cursor values.
         """
         result = dict(params)
 
@@ -167,8 +168,50 @@ def extract_pagination_params(
             sort_value = sort_value[0] if sort_value else default_sort
         result["sort"] = sort_value
 
+        # Handle keyset cursor parameter
+        cursor_value = params.get("cursor")
+        if isinstance(cursor_value, list):
+            cursor_value = cursor_value[0] if cursor_value else None
+        if cursor_value:
+            result["cursor"] = cursor_value
+        else:
+            result.pop("cursor", None)
+
         return result
 
+    @staticmethod
+    def wants_summary_projection(event: dict[str, Any]) -> bool:
+        """Check whether a list request asked for ``projection=summary``.
+
+        Args:
+            event: Lambda event dictionary.
+
+        Returns:
+            True when the client asked for lightweight summaries instead of
+            full aggregates.
+        """
+        projection = LambdaHelpers.extract_query_parameters(event).get("projection")
+        return projection == "summary"
+
+    @staticmethod
+    def pagination_headers(next_cursor: str | None) -> dict[str, str]:
+        """Build response headers advertising the next keyset cursor.
+
+        Args:
+            next_cursor: Cursor returned by the repository, or None on the
+                last page.
+
+        Returns:
+            ``X-Next-Cursor`` (exposed to browsers through CORS) when a next
+            page exists, otherwise an empty dict.
+        """
+        if not next_cursor:
+            return {}
+        return {
+            "X-Next-Cursor": next_cursor,
+            "Access-Control-Expose-Headers": "X-Next-Cursor",
+        }
+
     @staticmethod
     def process_query_filters_from_aws_event(
         *,
@@ -0,0 +1,148 @@
+"""
+Persistent event loop for AWS Lambda handlers.
+
+``anyio.run`` creates and closes an event loop per invocation. Pooled
+asyncpg connections are bound to the loop that opened them, so warm
+invocations could never reuse them and paid connect/TLS/auth every time.
+:class:`LambdaRuntime` keeps one event loop per container and runs every
+invocation on it; the database pool (Lambda profile, see
+``src.db.fastapi_database``) then survives between invocations.
+
+After the container was idle (frozen) longer than
+``lambda_idle_revalidate_seconds`` the first invocation revalidates the pool
+before running the handler, so connections closed during the freeze are
+replaced instead of failing the request.
+
+Usage in a handler module:
+
+    def lambda_handler(event, context):
+        generate_correlation_id()
+        return run_lambda_handler(async_handler, event, context)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.config.app_config import get_app_settings
+from src.logging.logger import flush_logs, get_logger
+
+logger = get_logger(__name__)
+
+
+async def revalidate_database(idle_seconds: float) -> None:
+    """Revalidate the shared database pool after the container was idle."""
+    from src.db.fastapi_database import get_fastapi_database
+
+    alive = await get_fastapi_database().revalidate()
+    logger.info(
+        "Revalidated database pool after idle container",
+        action="lambda_thaw",
+        idle_seconds=round(idle_seconds, 1),
+        pool_alive=alive,
+    )
+
+
+class LambdaRuntime:
+    """Runs async Lambda handlers on one long-lived event loop.
+
+    Attributes:
+        idle_revalidate_seconds: Idle gap after which `on_thaw` runs before
+            the next handler.
+        on_thaw: Awaitable called with the idle seconds after such a gap.
+        invocations: Handlers run by this runtime.
+        thaws: Invocations that ran `on_thaw` first.
+
+    Notes:
+        The loop is created on the first invocation. Tasks a handler leaves
+        behind stay scheduled on it and resume with the next invocation.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_revalidate_seconds: float = 60.0,
+        on_thaw: Callable[[float], Awaitable[None]] | None = revalidate_database,
+    ):
+        self.idle_revalidate_seconds = idle_revalidate_seconds
+        self.on_thaw = on_thaw
+        self._runner: asyncio.Runner | None = None
+        # Wall clock: monotonic clocks may not advance while frozen
+        self._last_finished_at: float | None = None
+        self.invocations = 0
+        self.thaws = 0
+
+    @property
+    def warm(self) -> bool:
+        return self._runner is not None
+
+    def run[T](self, handler: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """Run `handler(*args)` on the persistent loop and return its result."""
+        runner = self._runner
+        if runner is None:
+            runner = self._runner = asyncio.Runner()
+        idle_seconds = (
+            time.time() - self._last_finished_at
+            if self._last_finished_at is not None
+            else 0.0
+        )
+        try:
+            return runner.run(self._invoke(handler, args, idle_seconds))
+        finally:
+            # Queued log records must be written before the container freezes
+            flush_logs()
+            self._last_finished_at = time.time()
+            self.invocations += 1
+
+    async def _invoke[T](
+        self,
+        handler: Callable[..., Awaitable[T]],
+        args: tuple[Any, ...],
+        idle_seconds: float,
+    ) -> T:
+        if self.on_thaw is not None and idle_seconds >= self.idle_revalidate_seconds:
+            self.thaws += 1
+            try:
+                await self.on_thaw(idle_seconds)
+            except Exception as e:
+                # The handler surfaces real connectivity problems itself
+                logger.warning(
+                    "Thaw hook failed",
+                    action="lambda_thaw_error",
+                    error_type=type(e).__name__,
+                    error_message=str(e),
+                )
+        return await handler(*args)
+
+    def close(self) -> None:
+        """Close the event loop (the next invocation starts a new one)."""
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
+            self._last_finished_at = None
+
+
+_runtime: LambdaRuntime | None = None
+
+
+def get_lambda_runtime() -> LambdaRuntime:
+    """Return the container-wide Lambda runtime."""
+    global _runtime
+    if _runtime is None:
+        _runtime = LambdaRuntime(
+            idle_revalidate_seconds=get_app_settings().lambda_idle_revalidate_seconds
+        )
+    return _runtime
+
+
+def run_lambda_handler[T](
+    handler: Callable[..., Awaitable[T]], event: dict[str, Any], context: Any
+) -> T:
+    """Run an async Lambda handler on the container's persistent event loop.
+
+    Drop-in replacement for ``anyio.run(handler, event, context)``.
+    """
+    return get_lambda_runtime().run(handler, event, context)
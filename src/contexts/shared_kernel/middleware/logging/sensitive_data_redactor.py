@@ -7,11 +7,42 @@
 The redaction follows a conservative approach where sensitive fields are either
 completely removed or replaced with masked values that indicate the presence
 of data without exposing the actual values.
+
+Redaction is a single pass over the data: dictionary keys are checked against
+one compiled pattern built from SENSITIVE_KEYS (memoized per key), string
+values are scanned once by a combined JWT/email/IP pattern (limited to the
+alternatives a cheap substring check says can match), and oversized or
+deeply nested data is truncated before it is scanned. Containers produced by
+the redactor are marked so they are not traversed again when an already
+redacted subtree is passed back in.
 """
 
 import re
+import string
 from typing import Any, ClassVar
 
+# Characters that can be part of a JWT, email address or IP address. A string
+# cut inside such a run could leak a partial value the patterns no longer match.
+_VALUE_CHARS = string.ascii_letters + string.digits + "._%+@-"
+
+# Every IP address contains this; unlike IP_PATTERN it starts with a literal,
+# which the regex engine can scan for quickly.
+_IP_HINT = re.compile(r"\.[0-9]{1,3}\.[0-9]{1,3}\.")
+
+_KEY_CACHE_SIZE = 4096
+
+
+class _RedactedDict(dict):
+    """A dictionary produced by SensitiveDataRedactor."""
+
+    __slots__ = ()
+
+
+class _RedactedList(list):
+    """A list produced by SensitiveDataRedactor."""
+
+    __slots__ = ()
+
 
 class SensitiveDataRedactor:
     """Redacts sensitive information from data structures for safe logging.
@@ -22,129 +53,202 @@ class SensitiveDataRedactor:
 
     Attributes:
         REDACTION_MASK: The string used to replace sensitive values.
+        TRUNCATION_MASK: The string used to replace data nested beyond max_depth.
         SENSITIVE_HEADERS: Set of HTTP headers that typically contain sensitive data.
         SENSITIVE_KEYS: Set of dictionary keys that typically contain sensitive data.
+            A key is sensitive if it contains any of them, case-insensitively.
         EMAIL_PATTERN: Regex pattern to identify email addresses.
         IP_PATTERN: Regex pattern to identify IP addresses.
         JWT_PATTERN: Regex pattern to identify JWT tokens.
     """
 
     REDACTION_MASK = "[REDACTED]"
+    TRUNCATION_MASK = "[TRUNCATED]"
 
     # Headers that typically contain sensitive information
-    SENSITIVE_HEADERS: ClassVar[set[str]] = {
-        "authorization",
-        "x-api-key",
-        "x-auth-token",
-        "cookie",
-        "set-cookie",
-        "x-forwarded-for",
-        "x-real-ip",
-        "x-client-ip",
-        "x-forwarded-proto",
-        "x-amzn-trace-id",
-    }
+    SENSITIVE_HEADERS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "authorization",
+            "x-api-key",
+            "x-auth-token",
+            "cookie",
+            "set-cookie",
+            "x-forwarded-for",
+            "x-real-ip",
+            "x-client-ip",
+            "x-forwarded-proto",
+            "x-amzn-trace-id",
+        }
+    )
 
     # Dictionary keys that typically contain sensitive information
-    SENSITIVE_KEYS: ClassVar[set[str]] = {
-        "authorization",
-        "password",
-        "token",
-        "secret",
-        "key",
-        "email",
-        "sub",
-        "user_id",
-        "userid",
-        "account_id",
-        "accountid",
-        "cognito_username",
-        "cognito:username",
-        "jti",
-        "origin_jti",
-        "aud",
-        "iss",
-        "sourceIp",
-        "source_ip",
-        "userArn",
-        "user_arn",
-        "caller",
-        "principalOrgId",
-        "principal_org_id",
-        "cognitoIdentityId",
-        "cognito_identity_id",
-        "cognitoIdentityPoolId",
-        "cognito_identity_pool_id",
-        "accessKey",
-        "access_key",
-        "userAgent",
-        "user_agent",
-        "domainName",
-        "domain_name",
-        "deploymentId",
-        "deployment_id",
-        "apiId",
-        "api_id",
-        "requestId",
-        "request_id",
-        "extendedRequestId",
-        "extended_request_id",
-    }
+    SENSITIVE_KEYS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "authorization",
+            "password",
+            "token",
+            "secret",
+            "key",
+            "email",
+            "sub",
+            "user_id",
+            "userid",
+            "account_id",
+            "accountid",
+            "cognito_username",
+            "cognito:username",
+            "jti",
+            "origin_jti",
+            "aud",
+            "iss",
+            "sourceIp",
+            "source_ip",
+            "userArn",
+            "user_arn",
+            "caller",
+            "principalOrgId",
+            "principal_org_id",
+            "cognitoIdentityId",
+            "cognito_identity_id",
+            "cognitoIdentityPoolId",
+            "cognito_identity_pool_id",
+            "accessKey",
+            "access_key",
+            "userAgent",
+            "user_agent",
+            "domainName",
+            "domain_name",
+            "deploymentId",
+            "deployment_id",
+            "apiId",
+            "api_id",
+            "requestId",
+            "request_id",
+            "extendedRequestId",
+            "extended_request_id",
+        }
+    )
 
     # Regex patterns for identifying sensitive data
     EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
     IP_PATTERN = re.compile(r"\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b")
     JWT_PATTERN = re.compile(r"eyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*")
 
+    def __init__(
+        self,
+        *,
+        max_depth: int = 16,
+        max_string_length: int = 4096,
+        max_collection_items: int = 200,
+    ) -> None:
+        """Initialize the redactor and compile its key matcher.
+
+        Args:
+            max_depth: Containers nested deeper than this are replaced with
+                TRUNCATION_MASK.
+            max_string_length: Strings longer than this are cut before being
+                scanned, with a note of how many characters were dropped.
+            max_collection_items: Lists longer than this keep their first
+                items followed by a note of how many were dropped.
+        """
+        self.max_depth = max_depth
+        self.max_string_length = max_string_length
+        self.max_collection_items = max_collection_items
+        self._key_pattern = re.compile(
+            "|".join(
+                re.escape(key)
+                for key in sorted(
+                    {key.lower() for key in self.SENSITIVE_KEYS}, key=len, reverse=True
+                )
+            )
+        )
+        self._key_cache: dict[str, bool] = {}
+        # The value patterns combined into one alternation, for every subset
+        # of JWT (1), email (2) and IP (4), indexed by the subset's bitmask
+        alternatives = (self.JWT_PATTERN, self.EMAIL_PATTERN, self.IP_PATTERN)
+        self._value_patterns = [
+            re.compile(
+                "|".join(
+                    pattern.pattern
+                    for bit, pattern in enumerate(alternatives)
+                    if mask & (1 << bit)
+                )
+            )
+            for mask in range(8)
+        ]
+
     def redact_data(self, data: Any) -> Any:
         """Recursively redact sensitive information from data structures.
 
+        Data previously returned by this method is returned as is.
+
         Args:
             data: The data structure to redact sensitive information from.
 
         Returns:
             A copy of the data structure with sensitive information redacted.
         """
-        if isinstance(data, dict):
-            return self._redact_dict(data)
-        elif isinstance(data, list):
-            return self._redact_list(data)
-        elif isinstance(data, str):
+        return self._redact(data, 0)
+
+    def _redact(self, data: Any, depth: int) -> Any:
+        """Redact `data` found `depth` containers below the redaction root."""
+        if isinstance(data, str):
             return self._redact_string(data)
-        else:
+        if isinstance(data, _RedactedDict | _RedactedList):
             return data
+        if isinstance(data, dict):
+            if depth >= self.max_depth:
+                return self.TRUNCATION_MASK
+            return self._redact_dict(data, depth + 1)
+        if isinstance(data, list):
+            if depth >= self.max_depth:
+                return self.TRUNCATION_MASK
+            return self._redact_list(data, depth + 1)
+        return data
 
-    def _redact_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+    def _redact_dict(self, data: dict[str, Any], depth: int) -> dict[str, Any]:
         """Redact sensitive information from a dictionary.
 
         Args:
             data: The dictionary to redact.
+            depth: The nesting depth of the dictionary's values.
 
         Returns:
             A new dictionary with sensitive information redacted.
         """
-        redacted = {}
+        redacted = _RedactedDict()
 
         for key, value in data.items():
             # Check if the key itself is sensitive
             if self._is_sensitive_key(key):
                 redacted[key] = self.REDACTION_MASK
-            else:
+            elif isinstance(value, str):
+                redacted[key] = self._redact_string(value)
+            elif isinstance(value, dict | list):
                 # Recursively redact the value
-                redacted[key] = self.redact_data(value)
+                redacted[key] = self._redact(value, depth)
+            else:
+                redacted[key] = value
 
         return redacted
 
-    def _redact_list(self, data: list[Any]) -> list[Any]:
+    def _redact_list(self, data: list[Any], depth: int) -> list[Any]:
         """Redact sensitive information from a list.
 
         Args:
             data: The list to redact.
+            depth: The nesting depth of the list's items.
 
         Returns:
             A new list with sensitive information redacted.
         """
-        return [self.redact_data(item) for item in data]
+        redacted = _RedactedList(
+            self._redact(item, depth) for item in data[: self.max_collection_items]
+        )
+        dropped = len(data) - self.max_collection_items
+        if dropped > 0:
+            redacted.append(f"{self.TRUNCATION_MASK} {dropped} more items")
+        return redacted
 
     def _redact_string(self, data: str) -> str:
         """Redact sensitive information from a string.
@@ -155,43 +259,54 @@ def _redact_string(self, data: str) -> str:
         Returns:
             A new string with sensitive information redacted.
         """
-        # Redact JWT tokens
-        data = self.JWT_PATTERN.sub(self.REDACTION_MASK, data)
+        if len(data) > self.max_string_length:
+            kept = data[: self.max_string_length].rstrip(_VALUE_CHARS)
+            dropped = len(data) - len(kept)
+            return (
+                f"{self._redact_string(kept)}..."
+                f"{self.TRUNCATION_MASK} {dropped} more characters"
+            )
 
-        # Redact email addresses
-        data = self.EMAIL_PATTERN.sub(self.REDACTION_MASK, data)
+        # Every value pattern contains a dot
+        if "." not in data:
+            return data
 
-        # Redact IP addresses
-        data = self.IP_PATTERN.sub(self.REDACTION_MASK, data)
+        mask = (
+            ("eyJ" in data)
+            | ("@" in data) << 1
+            | (_IP_HINT.search(data) is not None) << 2
+        )
+        if not mask:
+            return data
 
-        return data
+        return self._value_patterns[mask].sub(self.REDACTION_MASK, data)
 
     def _is_sensitive_key(self, key: str) -> bool:
         """Check if a dictionary key is considered sensitive.
 
+        A key is sensitive if it contains any of SENSITIVE_KEYS, ignoring case.
+
         Args:
             key: The key to check.
 
         Returns:
             True if the key is considered sensitive, False otherwise.
         """
-        key_lower = key.lower()
-
-        # Check exact matches
-        if key_lower in self.SENSITIVE_KEYS:
-            return True
-
-        # Check if key contains sensitive patterns
-        for sensitive_key in self.SENSITIVE_KEYS:
-            return sensitive_key in key_lower
-
-        return False
+        sensitive = self._key_cache.get(key)
+        if sensitive is None:
+            if not isinstance(key, str):
+                return False
+            sensitive = self._key_pattern.search(key.lower()) is not None
+            if len(self._key_cache) < _KEY_CACHE_SIZE:
+                self._key_cache[key] = sensitive
+        return sensitive
 
     def redact_lambda_event(self, event: dict[str, Any]) -> dict[str, Any]:
         """Redact sensitive information from AWS Lambda event data.
 
-        This method provides specialized redaction for AWS Lambda events,
-        handling nested structures like headers, requestContext, and authorizer claims.
+        This method provides specialized redaction for AWS Lambda events:
+        on top of redact_data, header values are masked by header name. The
+        authorizer claims are covered by the key and value rules of redact_data.
 
         Args:
             event: The AWS Lambda event dictionary.
@@ -200,78 +315,38 @@ def redact_lambda_event(self, event: dict[str, Any]) -> dict[str, Any]:
             A new event dictionary with sensitive information redacted.
         """
         redacted_event = self.redact_data(event)
+        if not isinstance(redacted_event, dict):
+            return redacted_event
 
         # Additional specialized redaction for Lambda events
-        if "headers" in redacted_event:
-            redacted_event["headers"] = self._redact_headers(redacted_event["headers"])
-
-        if "multiValueHeaders" in redacted_event:
-            redacted_event["multiValueHeaders"] = self._redact_headers(
-                redacted_event["multiValueHeaders"]
-            )
-
-        # Redact requestContext authorizer claims
-        if "requestContext" in redacted_event:
-            request_context = redacted_event["requestContext"]
-            if (
-                "authorizer" in request_context
-                and "claims" in request_context["authorizer"]
-            ):
-                request_context["authorizer"]["claims"] = (
-                    self._redact_authorizer_claims(
-                        request_context["authorizer"]["claims"]
-                    )
-                )
+        for name in ("headers", "multiValueHeaders"):
+            headers = redacted_event.get(name)
+            if isinstance(headers, dict):
+                redacted_event[name] = self._redact_headers(headers)
 
         return redacted_event
 
     def _redact_headers(self, headers: dict[str, Any]) -> dict[str, Any]:
-        """Redact sensitive information from HTTP headers.
+        """Mask the values of sensitive HTTP headers.
 
         Args:
-            headers: The headers dictionary to redact.
+            headers: The headers dictionary to redact, already passed
+                through redact_data.
 
         Returns:
-            A new headers dictionary with sensitive information redacted.
+            A new headers dictionary with sensitive headers masked.
         """
-        redacted_headers = {}
+        redacted_headers = _RedactedDict()
 
         for key, value in headers.items():
-            key_lower = key.lower()
-
             # Check if this is a sensitive header
-            if key_lower in self.SENSITIVE_HEADERS:
+            if isinstance(key, str) and key.lower() in self.SENSITIVE_HEADERS:
                 redacted_headers[key] = self.REDACTION_MASK
             else:
-                # For non-sensitive headers, still redact any sensitive content in the value
-                if isinstance(value, str):
-                    redacted_headers[key] = self._redact_string(value)
-                else:
-                    redacted_headers[key] = value
+                redacted_headers[key] = value
 
         return redacted_headers
 
-    def _redact_authorizer_claims(self, claims: dict[str, Any]) -> dict[str, Any]:
-        """Redact sensitive information from authorizer claims.
-
-        Args:
-            claims: The authorizer claims dictionary to redact.
-
-        Returns:
-            A new claims dictionary with sensitive information redacted.
-        """
-        redacted_claims = {}
-
-        for key, value in claims.items():
-            if self._is_sensitive_key(key):
-                redacted_claims[key] = self.REDACTION_MASK
-            else:
-                redacted_claims[key] = (
-                    self._redact_string(str(value)) if isinstance(value, str) else value
-                )
-
-        return redacted_claims
-
 
 # Global instance for easy access
 sensitive_data_redactor = SensitiveDataRedactor()
@@ -0,0 +1,30 @@
+"""Transport selection for cross-context reads.
+
+Bounded contexts read each other through internal endpoints. When the caller
+and the callee share a process (the FastAPI runtime) the endpoints can hand
+over validated read models directly; deployments where contexts run apart
+keep exchanging JSON. Providers ask :func:`in_process_calls_enabled` which
+path to take.
+"""
+
+from src.config.app_config import get_app_settings
+
+_in_process_override: bool | None = None
+
+
+def use_in_process_calls(enabled: bool | None = True) -> None:
+    """Force the cross-context transport for this process.
+
+    Args:
+        enabled: True for in-process read models, False for JSON, None to
+            fall back to ``CROSS_CONTEXT_IN_PROCESS``.
+    """
+    global _in_process_override
+    _in_process_override = enabled
+
+
+def in_process_calls_enabled() -> bool:
+    """Return whether cross-context reads skip JSON serialization."""
+    if _in_process_override is not None:
+        return _in_process_override
+    return get_app_settings().cross_context_in_process
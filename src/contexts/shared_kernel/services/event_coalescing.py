@@ -0,0 +1,141 @@
+"""Coalescing of domain events that target the same aggregate.
+
+Several events raised for one aggregate (e.g. edits of many meals of one
+menu) would each load and persist that aggregate in their own unit of work.
+An `EventCoalescer` is registered in place of a per-event handler; the
+message bus groups the events of one command by the coalescer's key and
+invokes its batched handler once per key. With a ``window`` the coalescer
+also merges groups for the same key raised by other commands within that
+many seconds, so bursts of requests cost one handler run per aggregate.
+
+Coalescers with the same name share their pending batches and counters
+across message bus instances (one bus is bootstrapped per request).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import TYPE_CHECKING, Any
+
+import anyio
+from src.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.contexts.seedwork.domain.event import Event
+
+logger = get_logger(__name__)
+
+# (coalescer name, key) -> events waiting for the end of the window
+_pending: dict[tuple[str, Hashable], list[Event]] = {}
+# coalescer name -> counters
+_stats: dict[str, dict[str, int]] = {}
+
+
+class EventCoalescer:
+    """Batched event handler invoked once per key for a group of events.
+
+    Attributes:
+        name: Identifies the coalescer across message bus instances.
+        handler: Awaitable taking the list of events of one key, in the
+            order they were raised.
+        key: Returns the target aggregate id of an event.
+        window: Seconds to keep merging events of a key raised by other
+            commands before running the handler; 0 merges only the events
+            of a single command.
+
+    Notes:
+        Register the same coalescer under every event type it handles so
+        mixed events for one aggregate end up in one batch. Called with a
+        single event (e.g. by the outbox dispatcher) it runs a batch of one.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[list[Event]], Awaitable[None]],
+        key: Callable[[Event], Hashable],
+        *,
+        window: float = 0.0,
+    ):
+        self.name = name
+        self.__name__ = name
+        self.handler = handler
+        self.key = key
+        self.window = window
+
+    async def __call__(self, event: Event) -> None:
+        await self.handler([event])
+
+    def group(self, events: Sequence[Event]) -> list[list[Event]]:
+        """Split events into per-key batches, keeping their order."""
+        groups: dict[Hashable, list[Event]] = {}
+        for event in events:
+            groups.setdefault(self.key(event), []).append(event)
+        return list(groups.values())
+
+    async def run(self, events: list[Event]) -> None:
+        """Run the handler for a batch of events sharing one key.
+
+        With a window, the first batch for a key waits ``window`` seconds
+        and then runs with every batch for that key that arrived meanwhile;
+        those later calls return immediately. If the first call is
+        cancelled while waiting, it still runs the batch (shielded) before
+        propagating the cancellation, since the later calls already
+        returned and would otherwise lose their events.
+        """
+        stats = _stats.setdefault(self.name, {"events": 0, "batches": 0, "merged": 0})
+        stats["events"] += len(events)
+        if self.window <= 0:
+            await self._run_batch(events, stats)
+            return
+
+        pending_key = (self.name, self.key(events[0]))
+        pending = _pending.get(pending_key)
+        if pending is not None:
+            pending.extend(events)
+            return
+        _pending[pending_key] = batch = list(events)
+        try:
+            await anyio.sleep(self.window)
+        except anyio.get_cancelled_exc_class():
+            _pending.pop(pending_key, None)
+            with anyio.CancelScope(shield=True):
+                await self._run_batch(batch, stats)
+            raise
+        _pending.pop(pending_key, None)
+        await self._run_batch(batch, stats)
+
+    async def _run_batch(self, events: list[Event], stats: dict[str, int]) -> None:
+        stats["batches"] += 1
+        stats["merged"] += len(events) - 1
+        if len(events) > 1:
+            logger.debug(
+                "Coalesced events",
+                action="event_coalescing",
+                coalescer=self.name,
+                events=len(events),
+            )
+        await self.handler(events)
+
+
+def get_coalescing_stats() -> dict[str, dict[str, Any]]:
+    """Return per-coalescer counters.
+
+    Returns:
+        For each coalescer name: events received, handler batches run,
+        events merged into another event's batch, and the merge ratio.
+    """
+    return {
+        name: {
+            **counters,
+            "merge_ratio": (
+                counters["merged"] / counters["events"] if counters["events"] else 0.0
+            ),
+        }
+        for name, counters in _stats.items()
+    }
+
+
+def reset_coalescing_stats() -> None:
+    """Reset all coalescer counters."""
+    _stats.clear()
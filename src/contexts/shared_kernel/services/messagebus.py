@@ -8,6 +8,7 @@
 from src.contexts.seedwork.domain.commands.command import Command
 from src.contexts.seedwork.domain.event import Event
 from src.contexts.seedwork.services.uow import UnitOfWork
+from src.contexts.shared_kernel.services.event_coalescing import EventCoalescer
 from src.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,6 +16,8 @@
 if TYPE_CHECKING:
     from collections.abc import Coroutine
 
+    from src.contexts.shared_kernel.services.outbox import Outbox
+
 _settings = get_app_settings()
 CMD_TIMEOUT = _settings.messagebus_cmd_timeout
 EVENT_TIMEOUT = _settings.messagebus_event_timeout
@@ -43,6 +46,8 @@ class MessageBus[U: Callable[[],UnitOfWork]]:
     Transactions:
         One UnitOfWork per command. Events are processed within the same
         transaction context. Command failures prevent event processing.
+        With an outbox, events are instead written as outbox rows in the
+        command's transaction and run later by an OutboxDispatcher.
 
     Side Effects:
         Publishes events to registered handlers. Each event handler runs
@@ -52,6 +57,8 @@ class MessageBus[U: Callable[[],UnitOfWork]]:
         Command-only interface: handle() only accepts Command objects.
         Event handler failures are logged but do not affect other handlers
         or command execution. Async-safe but not thread-safe.
+        Handlers registered as an EventCoalescer receive the command's events
+        batched per target aggregate instead of one call per event.
     """
 
     def __init__(
@@ -62,6 +69,7 @@ def __init__(
         *,
         spawn_fn: Callable[[Coroutine[Any, Any, None]], None] | None = None,
         limiter: anyio.CapacityLimiter | None = None,
+        outbox: Outbox | None = None,
     ):
         """Initialize the message bus with handlers and unit of work.
 
@@ -69,12 +77,15 @@ def __init__(
             uow: UnitOfWork instance for transaction management.
             event_handlers: Mapping of event types to handler function lists.
             command_handlers: Mapping of command types to single handler functions.
+            outbox: Optional transactional outbox; when set, committed events
+                are persisted for an OutboxDispatcher instead of run here.
         """
         self.uow_factory = uow_factory
         self.event_handlers = event_handlers
         self.command_handlers = command_handlers
         self.spawn_fn = spawn_fn
         self.handler_limiter = limiter
+        self.outbox = outbox
 
     def _get_handler_name(self, handler) -> str:
         """Extract handler name for logging purposes.
@@ -96,6 +107,28 @@ def _get_handler_name(self, handler) -> str:
             else:
                 return handler.__class__.__name__
 
+    def _event_runs(self, events: list[Event]) -> list[tuple[Callable, Any]]:
+        """Pair event handlers with their argument, batching coalesced events.
+
+        Args:
+            events: Events collected from the command's unit of work.
+
+        Returns:
+            (handler, argument) pairs: an event for plain handlers and one
+            per-key event list for each EventCoalescer.
+        """
+        runs: list[tuple[Callable, Any]] = []
+        batches: dict[EventCoalescer, list[Event]] = {}
+        for ev in events:
+            for h in self.event_handlers.get(type(ev), []):
+                if isinstance(h, EventCoalescer):
+                    batches.setdefault(h, []).append(ev)
+                else:
+                    runs.append((h, ev))
+        for coalescer, batch in batches.items():
+            runs.extend((coalescer.run, group) for group in coalescer.group(batch))
+        return runs
+
     async def handle(
         self,
         command: Command,
@@ -158,6 +191,8 @@ async def handle(
             raise KeyError(error_message)
 
         uow = self.uow_factory()
+        if self.outbox is not None:
+            uow.outbox = self.outbox
         try:
             with anyio.move_on_after(cmd_timeout) as scope:
                 response = await handler(command, uow=uow)
@@ -179,21 +214,20 @@ async def handle(
             # handle only event that were generated during command execution
             # events generated during event handling are not handled
             event_list = list(uow.collect_new_events())
+            event_runs = self._event_runs(event_list)
 
             if self.spawn_fn is not None:
-                for ev in event_list:
-                    for h in self.event_handlers.get(type(ev), []):
-                        self.spawn_fn(
-                            run_event_handler(h, ev, timeout_s=event_timeout, limiter=self.handler_limiter)
-                        )
+                for h, ev in event_runs:
+                    self.spawn_fn(
+                        run_event_handler(h, ev, timeout_s=event_timeout, limiter=self.handler_limiter)
+                    )
             else:
                 async with anyio.create_task_group() as tg:
-                    for ev in event_list:
-                        for h in self.event_handlers.get(type(ev), []):
-                            # Create a closure to capture the current values
-                            async def _run_handler(handler=h, event=ev):
-                                await run_event_handler(handler, event, timeout_s=event_timeout, limiter=self.handler_limiter)
-                            tg.start_soon(_run_handler)
+                    for h, ev in event_runs:
+                        # Create a closure to capture the current values
+                        async def _run_handler(handler=h, event=ev):
+                            await run_event_handler(handler, event, timeout_s=event_timeout, limiter=self.handler_limiter)
+                        tg.start_soon(_run_handler)
         return response
 
 async def run_event_handler(
@@ -0,0 +1,429 @@
+"""Transactional outbox for domain events.
+
+With the outbox enabled, a unit of work writes one outbox row per (event,
+handler) pair in the same transaction as the command that raised the event,
+instead of the message bus running the handlers in-process after the
+command returns. An `OutboxDispatcher` then claims due rows in batches with
+``SELECT ... FOR UPDATE SKIP LOCKED`` and runs the handlers, retrying
+failures with exponential backoff and dead-lettering rows that keep failing.
+
+Events therefore survive a crash or a frozen Lambda between commit and
+dispatch, and event work no longer extends request latency. Delivery is at
+least once: a handler may run again if the process dies after the handler
+succeeded but before its row was marked done.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import timedelta
+from enum import Enum, unique
+from functools import partial
+from typing import TYPE_CHECKING, Any, get_origin
+
+import anyio
+import attrs
+from sqlalchemy import case, func, select, update
+from src.config.app_config import get_app_settings
+from src.contexts.shared_kernel.adapters.ORM.sa_models.outbox_sa_model import (
+    OutboxMessageSaModel,
+)
+from src.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterable, Mapping
+
+    from sqlalchemy import Row
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+    from src.contexts.seedwork.domain.event import Event
+
+    EventHandler = Callable[[Event], Coroutine[Any, Any, None]]
+
+logger = get_logger(__name__)
+
+LEASE_EXPIRED_ERROR = "Lease expired before the handler run was recorded"
+
+
+@unique
+class OutboxStatus(Enum):
+    """Lifecycle of an outbox row."""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DONE = "done"
+    DEAD = "dead"
+
+
+def event_type_name(event_type: type[Event]) -> str:
+    """Return the importable name stored for an event class."""
+    return f"{event_type.__module__}:{event_type.__qualname__}"
+
+
+def handler_name(handler: Callable[..., Any]) -> str:
+    """Return the name stored for an event handler (partials unwrapped)."""
+    func_ = handler.func if isinstance(handler, partial) else handler
+    return getattr(func_, "__name__", type(func_).__name__)
+
+
+def _to_json_value(_: Any, __: attrs.Attribute | None, value: Any) -> Any:
+    if isinstance(value, set | frozenset):
+        return sorted(value)
+    return value
+
+
+def serialize_event(event: Event) -> dict[str, Any]:
+    """Return an attrs event's attributes as a JSON-compatible dict.
+
+    Sets are stored as sorted lists; `deserialize_event` restores them from
+    the field annotations.
+    """
+    return attrs.asdict(event, value_serializer=_to_json_value)
+
+
+def deserialize_event(event_type: type[Event], payload: Mapping[str, Any]) -> Event:
+    """Rebuild an attrs event from `serialize_event` output.
+
+    Raises:
+        TypeError: If the payload does not match the event's fields.
+    """
+    attrs.resolve_types(event_type)
+    kwargs: dict[str, Any] = {}
+    for field in attrs.fields(event_type):
+        if not field.init or field.name not in payload:
+            continue
+        value = payload[field.name]
+        origin = get_origin(field.type) or field.type
+        if origin in (set, frozenset, tuple):
+            value = origin(value)
+        kwargs[field.alias] = value
+    return event_type(**kwargs)
+
+
+class Outbox:
+    """Routes a context's domain events to outbox rows and back to handlers.
+
+    Attributes:
+        context: Bounded context name stored on every row; a dispatcher only
+            claims rows of its own context.
+
+    Notes:
+        Built from the same event handler mapping as the context's
+        `MessageBus`, so only events with at least one handler are written.
+    """
+
+    def __init__(
+        self,
+        context: str,
+        event_handlers: Mapping[type[Event], list[EventHandler]],
+    ):
+        """Index the handlers of a context.
+
+        Args:
+            context: Bounded context name.
+            event_handlers: Mapping of event types to handler lists.
+
+        Raises:
+            ValueError: If two handlers of one event type share a name.
+        """
+        self.context = context
+        self._routes: dict[type[Event], tuple[str, list[str]]] = {}
+        self._handlers: dict[tuple[str, str], tuple[type[Event], EventHandler]] = {}
+        for event_type, handlers in event_handlers.items():
+            type_name = event_type_name(event_type)
+            names: list[str] = []
+            for handler in handlers:
+                name = handler_name(handler)
+                if (type_name, name) in self._handlers:
+                    error_message = f"Duplicate handler {name} for {type_name}"
+                    raise ValueError(error_message)
+                self._handlers[(type_name, name)] = (event_type, handler)
+                names.append(name)
+            self._routes[event_type] = (type_name, names)
+
+    def stage(self, session: AsyncSession, events: Iterable[Event]) -> int:
+        """Add outbox rows for events to the session's pending transaction.
+
+        Args:
+            session: Session of the unit of work about to commit.
+            events: Domain events collected from the unit of work.
+
+        Returns:
+            Number of rows added.
+        """
+        rows = []
+        for event in events:
+            type_name, names = self._routes.get(type(event), (None, ()))
+            if not names:
+                continue
+            payload = serialize_event(event)
+            rows.extend(
+                OutboxMessageSaModel(
+                    id=uuid.uuid4().hex,
+                    context=self.context,
+                    event_type=type_name,
+                    handler=name,
+                    payload=payload,
+                    status=OutboxStatus.PENDING.value,
+                    attempts=0,
+                )
+                for name in names
+            )
+        session.add_all(rows)
+        return len(rows)
+
+    def resolve(self, type_name: str, name: str) -> tuple[type[Event], EventHandler]:
+        """Return the event class and handler of a row.
+
+        Raises:
+            KeyError: If the event type or handler is no longer registered.
+        """
+        return self._handlers[(type_name, name)]
+
+
+def get_outbox(
+    context: str,
+    event_handlers: Mapping[type[Event], list[EventHandler]],
+) -> Outbox | None:
+    """Return an outbox for a context's message bus, or None when disabled."""
+    if not get_app_settings().messagebus_outbox_enabled or not event_handlers:
+        return None
+    return Outbox(context, event_handlers)
+
+
+class OutboxDispatcher:
+    """Claims due outbox rows of one context and runs their handlers.
+
+    Attributes:
+        session_factory: Factory for the dispatcher's own sessions.
+        outbox: Outbox of the context to dispatch.
+        batch_size: Maximum rows claimed per transaction.
+        limiter: Optional cap on concurrently running handlers, shared with
+            other background work.
+        max_attempts: Failed runs after which a row is dead-lettered.
+        base_backoff: Delay in seconds before the first retry; doubled on
+            each further failure.
+        max_backoff: Upper bound of the retry delay in seconds.
+        lease_seconds: How long a claimed row stays invisible to other
+            dispatchers; rows of a crashed dispatcher are reclaimed after it
+            and the lost run counts as a failed attempt. Keep it above
+            `handler_timeout`.
+        poll_interval: Sleep in seconds when no rows are due.
+        handler_timeout: Per-handler timeout in seconds, including the wait
+            for a `limiter` slot.
+
+    Notes:
+        Several dispatchers (processes) may run against one database; SKIP
+        LOCKED keeps them from claiming the same rows. Unknown event types
+        or handlers and undecodable payloads are dead-lettered immediately.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        outbox: Outbox,
+        *,
+        batch_size: int = 50,
+        limiter: anyio.CapacityLimiter | None = None,
+        max_attempts: int = 5,
+        base_backoff: float = 1.0,
+        max_backoff: float = 300.0,
+        lease_seconds: float = 60.0,
+        poll_interval: float = 1.0,
+        handler_timeout: float | None = None,
+    ):
+        self.session_factory = session_factory
+        self.outbox = outbox
+        self.batch_size = batch_size
+        self.limiter = limiter
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.handler_timeout = (
+            handler_timeout
+            if handler_timeout is not None
+            else get_app_settings().messagebus_event_timeout
+        )
+
+    def backoff(self, attempts: int) -> float:
+        """Return the retry delay after `attempts` failed runs."""
+        return min(self.max_backoff, self.base_backoff * 2 ** (attempts - 1))
+
+    async def run(self) -> None:
+        """Dispatch forever, sleeping `poll_interval` whenever a batch is not full."""
+        while True:
+            try:
+                dispatched = await self.dispatch_once()
+            except Exception as exc:
+                logger.error(
+                    "Outbox dispatch failed",
+                    action="outbox_dispatch_error",
+                    context=self.outbox.context,
+                    error_type=type(exc).__name__,
+                    error_message=str(exc),
+                    exc_info=True,
+                )
+                dispatched = 0
+            if dispatched < self.batch_size:
+                await anyio.sleep(self.poll_interval)
+
+    async def dispatch_once(self) -> int:
+        """Claim one batch of due rows, run their handlers and record outcomes.
+
+        Returns:
+            Number of rows claimed.
+        """
+        batch = await self._claim()
+        if not batch:
+            return 0
+        errors: dict[str, tuple[str, bool]] = {}
+        async with anyio.create_task_group() as tg:
+            for row in batch:
+                tg.start_soon(self._run, row, errors)
+        await self._record(batch, errors)
+        return len(batch)
+
+    async def _claim(self) -> list[Row]:
+        model = OutboxMessageSaModel
+        async with self.session_factory() as session:
+            stmt = (
+                select(model.id)
+                .where(
+                    model.context == self.outbox.context,
+                    model.status.in_(
+                        [OutboxStatus.PENDING.value, OutboxStatus.PROCESSING.value]
+                    ),
+                    model.available_at <= func.now(),
+                )
+                .order_by(model.available_at)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            ids = list((await session.scalars(stmt)).all())
+            if not ids:
+                await session.commit()
+                return []
+            # A due PROCESSING row is one whose lease expired: its last run
+            # never recorded an outcome (crash, frozen Lambda) and counts as
+            # a failed attempt.
+            expired = model.status == OutboxStatus.PROCESSING.value
+            attempts = case((expired, model.attempts + 1), else_=model.attempts)
+            exhausted = attempts >= self.max_attempts
+            claimed = await session.execute(
+                update(model)
+                .where(model.id.in_(ids))
+                .values(
+                    attempts=attempts,
+                    status=case(
+                        (exhausted, OutboxStatus.DEAD.value),
+                        else_=OutboxStatus.PROCESSING.value,
+                    ),
+                    available_at=func.now() + timedelta(seconds=self.lease_seconds),
+                    processed_at=case(
+                        (exhausted, func.now()), else_=model.processed_at
+                    ),
+                    last_error=case(
+                        (expired, LEASE_EXPIRED_ERROR), else_=model.last_error
+                    ),
+                )
+                .returning(
+                    model.id,
+                    model.event_type,
+                    model.handler,
+                    model.payload,
+                    model.attempts,
+                    model.status,
+                )
+            )
+            batch = []
+            for row in claimed.all():
+                if row.status == OutboxStatus.PROCESSING.value:
+                    batch.append(row)
+                    continue
+                logger.error(
+                    "Outbox message dead-lettered",
+                    action="outbox_dead_letter",
+                    message_id=row.id,
+                    event_type=row.event_type,
+                    handler=row.handler,
+                    attempts=row.attempts,
+                    error_message=LEASE_EXPIRED_ERROR,
+                )
+            await session.commit()
+        return batch
+
+    async def _run(self, row: Row, errors: dict[str, tuple[str, bool]]) -> None:
+        try:
+            event_type, handler = self.outbox.resolve(row.event_type, row.handler)
+            event = deserialize_event(event_type, row.payload)
+        except (KeyError, TypeError, ValueError) as exc:
+            errors[row.id] = (f"{type(exc).__name__}: {exc}", False)
+            return
+        try:
+            # The wait for a limiter slot counts against the timeout so a
+            # row never outlives its lease queued behind other work.
+            with anyio.fail_after(self.handler_timeout):
+                if self.limiter is not None:
+                    async with self.limiter:
+                        await handler(event)
+                else:
+                    await handler(event)
+        except Exception as exc:
+            errors[row.id] = (f"{type(exc).__name__}: {exc}", True)
+            logger.warning(
+                "Outbox event handler failed",
+                action="outbox_handler_error",
+                event_type=row.event_type,
+                handler=row.handler,
+                attempt=row.attempts + 1,
+                error_type=type(exc).__name__,
+                error_message=str(exc),
+            )
+
+    async def _record(
+        self, batch: list[Row], errors: dict[str, tuple[str, bool]]
+    ) -> None:
+        model = OutboxMessageSaModel
+        done = [row.id for row in batch if row.id not in errors]
+        async with self.session_factory() as session:
+            if done:
+                await session.execute(
+                    update(model)
+                    .where(model.id.in_(done))
+                    .values(
+                        status=OutboxStatus.DONE.value,
+                        processed_at=func.now(),
+                        last_error=None,
+                    )
+                )
+            for row in batch:
+                if row.id not in errors:
+                    continue
+                error, retryable = errors[row.id]
+                attempts = row.attempts + 1
+                if retryable and attempts < self.max_attempts:
+                    values = {
+                        "status": OutboxStatus.PENDING.value,
+                        "available_at": func.now()
+                        + timedelta(seconds=self.backoff(attempts)),
+                    }
+                else:
+                    values = {
+                        "status": OutboxStatus.DEAD.value,
+                        "processed_at": func.now(),
+                    }
+                    logger.error(
+                        "Outbox message dead-lettered",
+                        action="outbox_dead_letter",
+                        message_id=row.id,
+                        event_type=row.event_type,
+                        handler=row.handler,
+                        attempts=attempts,
+                        error_message=error,
+                    )
+                await session.execute(
+                    update(model)
+                    .where(model.id == row.id)
+                    .values(attempts=attempts, last_error=error, **values)
+                )
+            await session.commit()
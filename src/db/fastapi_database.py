@@ -2,10 +2,18 @@
 
 This module provides a FastAPI-specific database configuration that enables
 connection pooling and optimizations for long-running web applications.
-It complements the existing Lambda-optimized database configuration.
+
+Inside AWS Lambda the same engine uses a Lambda profile: a small pool whose
+connections are reused by warm invocations (handlers run on the container's
+persistent event loop, see ``lambda_runtime``) and revalidated after the
+container was frozen for a while.
 """
 
+import os
+from typing import Any, Literal
+
 import logfire
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -14,6 +22,46 @@
     create_async_engine,
 )
 from src.config.app_config import get_app_settings
+from src.contexts.seedwork.adapters.repositories.statement_tracker import (
+    instrument_engine,
+)
+from src.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+type EngineProfile = Literal["fastapi", "lambda"]
+
+
+def is_lambda_environment() -> bool:
+    """Return True when running inside an AWS Lambda container."""
+    return "AWS_LAMBDA_FUNCTION_NAME" in os.environ
+
+
+def engine_pool_options(profile: EngineProfile) -> dict[str, Any]:
+    """Return the connection pool options of an engine profile.
+
+    Args:
+        profile: "fastapi" for long-running workers serving concurrent
+            requests, "lambda" for a container serving one invocation at a
+            time.
+    """
+    settings = get_app_settings()
+    if profile == "lambda":
+        return {
+            "pool_size": settings.lambda_pool_size,
+            "max_overflow": settings.lambda_max_overflow,
+            # Staleness after freeze/thaw is checked once per thaw by
+            # `FastAPIDatabase.revalidate`, not on every checkout
+            "pool_pre_ping": False,
+            "pool_recycle": settings.lambda_pool_recycle,
+            "pool_timeout": 10,
+        }
+    return {
+        "pool_size": settings.fastapi_pool_size,
+        "max_overflow": settings.fastapi_max_overflow,
+        "pool_pre_ping": settings.fastapi_pool_pre_ping,
+        "pool_recycle": settings.fastapi_pool_recycle,
+    }
 
 
 class FastAPIDatabase:
@@ -27,40 +75,45 @@ class FastAPIDatabase:
         async_session_factory: Factory for creating async database sessions.
     """
     
-    def __init__(self, db_url: str | None = None) -> None:
+    def __init__(
+        self, db_url: str | None = None, profile: EngineProfile | None = None
+    ) -> None:
         """Create a FastAPI-optimized async engine and session factory.
 
         Args:
             db_url: SQLAlchemy database URL. Defaults to the configured async
                 DSN from application settings.
+            profile: Pool profile; defaults to "lambda" inside AWS Lambda
+                and "fastapi" elsewhere.
 
         Notes:
             Engine configured with REPEATABLE READ isolation and AsyncAdaptedQueuePool
             for optimal FastAPI performance with connection pooling.
         """
         settings = get_app_settings()
-        
+        if profile is None:
+            profile = "lambda" if is_lambda_environment() else "fastapi"
+        self.profile: EngineProfile = profile
+
         self._engine: AsyncEngine = create_async_engine(
             db_url or str(settings.async_sqlalchemy_db_uri),
             isolation_level="REPEATABLE READ",
-            # FastAPI-optimized connection pooling
+            # Profile-specific connection pooling
             poolclass=AsyncAdaptedQueuePool,
-            pool_size=settings.fastapi_pool_size,
-            max_overflow=settings.fastapi_max_overflow,
-            pool_pre_ping=settings.fastapi_pool_pre_ping,
-            pool_recycle=settings.fastapi_pool_recycle,
+            **engine_pool_options(profile),
             # Additional FastAPI optimizations
             echo=False,  # Disable SQL logging in production
             future=True,  # Enable SQLAlchemy 2.0 features
             # asyncpg-specific optimizations
             connect_args={
                 "server_settings": {
-                    "application_name": "fastapi_app",
+                    "application_name": f"{profile}_app",
                     "jit": "off",  # Disable JIT for better connection reuse
                 }
             },
         )
         logfire.instrument_sqlalchemy(self._engine)
+        instrument_engine(self._engine)
         self.async_session_factory: async_sessionmaker[AsyncSession] = (
             async_sessionmaker(
                 bind=self._engine,
@@ -72,9 +125,55 @@ def __init__(self, db_url: str | None = None) -> None:
             )
         )
 
+    async def revalidate(self) -> bool:
+        """Ping a pooled connection and drop the pool if it went stale.
+
+        Used after a Lambda container thaws: connections idle through the
+        freeze may have been closed by the server or a proxy. A disconnect
+        invalidates the pool, so later checkouts open fresh connections.
+
+        Returns:
+            True if the pooled connection was alive.
+        """
+        try:
+            async with self._engine.connect() as conn:
+                await conn.exec_driver_sql("SELECT 1")
+        except DBAPIError as e:
+            logger.warning(
+                "Pooled database connection went stale, dropping pool",
+                action="db_pool_revalidate",
+                connection_invalidated=e.connection_invalidated,
+                error_type=type(e.orig).__name__,
+            )
+            await self._engine.dispose()
+            return False
+        return True
+
+
+# Global database instance, created on first use (not at import) so Lambda
+# handler modules do not pay engine construction and instrumentation during
+# module init, and modules that never touch the database never build it.
+_database: FastAPIDatabase | None = None
+
+
+def get_fastapi_database() -> FastAPIDatabase:
+    """Return the process-wide database, creating it on first call.
+
+    Returns:
+        The shared FastAPIDatabase instance.
+    """
+    global _database
+    if _database is None:
+        _database = FastAPIDatabase()
+    return _database
+
 
-# Global FastAPI database instance
-fastapi_db = FastAPIDatabase()
+def __getattr__(name: str) -> Any:
+    # Keeps `from src.db.fastapi_database import fastapi_db` working; the
+    # instance is still only created when the name is first looked up
+    if name == "fastapi_db":
+        return get_fastapi_database()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_fastapi_session_factory() -> async_sessionmaker[AsyncSession]:
@@ -84,10 +183,10 @@ def get_fastapi_session_factory() -> async_sessionmaker[AsyncSession]:
         A cached async session factory bound to the FastAPI-optimized engine.
 
     Notes:
-        Uses the global FastAPIDatabase instance configured at module import.
+        Uses the global FastAPIDatabase instance, created on first call.
         This factory is optimized for FastAPI applications with connection pooling.
     """
-    return fastapi_db.async_session_factory
+    return get_fastapi_database().async_session_factory
 
 
 def get_fastapi_engine() -> AsyncEngine:
@@ -99,4 +198,4 @@ def get_fastapi_engine() -> AsyncEngine:
     Notes:
         Useful for direct engine operations or health checks.
     """
-    return fastapi_db._engine
+    return get_fastapi_database()._engine
@@ -4,20 +4,54 @@
 structlog's intended patterns. Uses structlog.contextvars for correlation ID
 management and provides a clean API for structured logging.
 
+Two profiles are available (``LOG_PROFILE`` env var; defaults to
+"production" inside AWS Lambda and "development" elsewhere):
+
+- development: pretty-printed, colored JSON with emoji levels and callsite
+  details on every record.
+- production: single-line JSON (orjson when installed), callsite details
+  only on DEBUG records, level filtering before the event dict is built,
+  and output written by a background thread through a queue so log calls
+  never block on stdout.
+
 The module exports:
 - configure_logging(): One-time configuration function
 - get_logger(): Get a configured structlog logger
+- flush_logs(): Wait until queued records are written
 - Helper functions for correlation ID management
 """
 
+import atexit
+import json
 import logging
 import os
+import queue
+import sys
 import uuid
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Literal
 
 import structlog
 import logfire
 import colorlog
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+type LogProfile = Literal["development", "production"]
+
+CALLSITE_PARAMETERS = [
+    structlog.processors.CallsiteParameter.FILENAME,
+    structlog.processors.CallsiteParameter.FUNC_NAME,
+    structlog.processors.CallsiteParameter.LINENO,
+]
+
+# Background writer of the production profile
+_listener: QueueListener | None = None
+
 def add_log_level_emoji(logger, method_name, event_dict):
     """Add emoji to log level for better visibility (without colors in JSON)."""
     level = event_dict.get("level", "").lower()
@@ -40,7 +74,62 @@ def add_log_level_emoji(logger, method_name, event_dict):
     return event_dict
 
 
-def configure_logging(log_level: str | None = None) -> None:
+class DebugCallsiteAdder:
+    """Add filename, function and line number to DEBUG records only.
+
+    Callsite lookup inspects the stack on every call; at INFO and above the
+    logger name and event are enough to find the source.
+    """
+
+    def __init__(self) -> None:
+        self._adder = structlog.processors.CallsiteParameterAdder(
+            parameters=CALLSITE_PARAMETERS, additional_ignores=[__name__]
+        )
+
+    def __call__(self, logger, method_name, event_dict):
+        if method_name == "debug":
+            return self._adder(logger, method_name, event_dict)
+        return event_dict
+
+
+def compact_json(obj: Any, default: Any = None) -> str:
+    """Serialize an event dict to single-line JSON (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(obj, default=default, ensure_ascii=False, separators=(",", ":"))
+
+
+def default_log_profile() -> LogProfile:
+    """Return the LOG_PROFILE env var, or the profile for this environment."""
+    profile = os.getenv("LOG_PROFILE", "").lower()
+    if profile in ("development", "production"):
+        return profile
+    return "production" if "AWS_LAMBDA_FUNCTION_NAME" in os.environ else "development"
+
+
+def flush_logs() -> None:
+    """Block until every queued record has been written.
+
+    No-op for the development profile, which writes synchronously. Lambda
+    calls this at the end of each invocation, before the container can be
+    frozen.
+    """
+    if _listener is not None:
+        _listener.queue.join()
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def configure_logging(
+    log_level: str | None = None, profile: LogProfile | None = None
+) -> None:
     """Configure structlog for JSON output with correlation ID support.
     
     This is the one-time configuration that sets up structlog with:
@@ -52,10 +141,20 @@ def configure_logging(log_level: str | None = None) -> None:
     Args:
         log_level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
                   Defaults to LOG_LEVEL env var or INFO.
+        profile: "development" or "production". Defaults to
+                 `default_log_profile()`.
     """
     if log_level is None:
         log_level = os.getenv("LOG_LEVEL","INFO")
-    
+    if profile is None:
+        profile = default_log_profile()
+    numeric_level = getattr(logging, log_level.upper(), 10)  # DEBUG = 10
+
+    _stop_listener()
+    if profile == "production":
+        _configure_production(numeric_level)
+        return
+
     # Configure structlog with idiomatic processors
     structlog.configure(
         processors=[
@@ -84,7 +183,6 @@ def configure_logging(log_level: str | None = None) -> None:
     )
     
     # Configure stdlib logging level and ensure it has a handler
-    numeric_level = getattr(logging, log_level.upper(), 10)  # DEBUG = 10
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
     
@@ -111,6 +209,44 @@ def configure_logging(log_level: str | None = None) -> None:
     root_logger.addHandler(handler)
 
 
+def _configure_production(numeric_level: int) -> None:
+    global _listener
+
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.stdlib.add_logger_name,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            DebugCallsiteAdder(),
+            logfire.StructlogProcessor(),
+            # After Logfire, which reads exc_info itself. Locals are left out
+            # so tracebacks cannot leak request data
+            structlog.processors.ExceptionRenderer(
+                structlog.tracebacks.ExceptionDictTransformer(show_locals=False)
+            ),
+            structlog.processors.JSONRenderer(serializer=compact_json),
+        ],
+        # Filters by level before any processor runs or the event dict is
+        # built, so disabled debug calls cost a no-op method call
+        wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(numeric_level)
+    root_logger.handlers.clear()
+
+    # Log calls only enqueue; a listener thread does the blocking write
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    root_logger.addHandler(QueueHandler(log_queue))
+
+
 def get_logger(name: str | None = None) -> structlog.BoundLogger:
     """Get a configured structlog logger.
     
@@ -156,4 +292,5 @@ def clear_correlation_id() -> None:
 
 
 # Auto-configure on import for convenience
-configure_logging()
\ No newline at end of file
+configure_logging()
+atexit.register(_stop_listener)
\ No newline at end of file
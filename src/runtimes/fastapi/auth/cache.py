@@ -1,350 +1,466 @@
 """
-FastAPI thread-safe authentication caching.
+FastAPI two-tier authentication caching.
 
-This module provides request-scoped caching for authentication data to improve
-performance and reduce database calls for user authentication and authorization.
+This module caches authentication data (validated credentials, user context,
+roles, permissions) in two tiers:
+
+- A per-request layer held in a context variable. Within one request a key
+  resolves to the same value without touching the shared tier again.
+- A bounded process-level LRU with monotonic-clock expiry shared by every
+  request of the worker.
+
+Keys are ``"<prefix>:<rest>"`` strings. Entries may be tagged with the user
+they belong to, which keeps a user -> keys index for ``invalidate_user``;
+``invalidate_prefix`` bumps a per-prefix generation so a whole namespace is
+dropped in O(1) and stale entries are discarded lazily.
+
+The cache is designed for a single event loop and takes no locks.
 """
 
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
 from typing import Any
-from datetime import datetime, timezone, timedelta
-from threading import RLock
-from dataclasses import dataclass, field
 
 from .user_context import UserContext
 
 logger = logging.getLogger(__name__)
 
+# Per-request layer; None outside a request scope
+_request_layer: ContextVar[dict[str, Any] | None] = ContextVar(
+    "auth_cache_request_layer", default=None
+)
+_request_id: ContextVar[str | None] = ContextVar("auth_cache_request_id", default=None)
 
-@dataclass
-class CacheEntry[T]:
-    """Cache entry with value, expiration, and metadata."""
-    
-    value: T
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    expires_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc) + timedelta(minutes=15))
-    access_count: int = 0
-    last_accessed: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    
-    def is_expired(self) -> bool:
-        """Check if the cache entry has expired."""
-        return datetime.now(timezone.utc) > self.expires_at
-    
-    def touch(self) -> None:
-        """Update access metadata."""
-        self.access_count += 1
-        self.last_accessed = datetime.now(timezone.utc)
+
+def _prefix(key: str) -> str:
+    return key.partition(":")[0]
 
 
 class RequestScopedAuthCache:
     """
-    Thread-safe request-scoped authentication cache.
-    
-    This cache stores authentication data for the duration of a request,
-    providing fast access to user context, roles, and permissions without
-    repeated database calls.
+    Two-tier authentication cache: per-request layer over a process LRU.
+
+    Attributes:
+        default_ttl_seconds: Expiry applied when ``set`` gets no ttl.
+        max_entries: Capacity of the process tier; least recently used
+            entries are evicted beyond it.
     """
-    
-    def __init__(self, default_ttl_seconds: int = 900):  # 15 minutes default
+
+    def __init__(self, default_ttl_seconds: int = 900, max_entries: int = 10_000):
         """
-        Initialize the request-scoped cache.
-        
+        Initialize the cache.
+
         Args:
             default_ttl_seconds: Default time-to-live for cache entries in seconds
+            max_entries: Maximum entries kept in the process tier
         """
         self.default_ttl_seconds = default_ttl_seconds
-        self._cache: dict[str, CacheEntry[Any]] = {}
-        self._lock = RLock()
-        self._request_id: str | None = None
+        self.max_entries = max_entries
+        # key -> (expires_at, prefix generation, value, user_id)
+        self._entries: OrderedDict[str, tuple[float, int, Any, str | None]] = (
+            OrderedDict()
+        )
+        self._user_keys: dict[str, set[str]] = {}
+        self._generations: dict[str, int] = {}
         self._created_at = datetime.now(timezone.utc)
-    
+        self._started = time.monotonic()
+        self.request_hits = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def _request_id(self) -> str | None:
+        return _request_id.get()
+
     def set_request_id(self, request_id: str) -> None:
         """
-        Set the request ID for this cache instance.
-        
+        Open the per-request layer for the current context.
+
         Args:
             request_id: Unique identifier for the current request
         """
-        with self._lock:
-            self._request_id = request_id
-            logger.debug(
-                "Request-scoped cache initialized",
-                extra={
-                    "request_id": request_id,
-                    "cache_created_at": self._created_at.isoformat(),
-                }
-            )
-    
+        _request_id.set(request_id)
+        _request_layer.set({})
+
     def get(self, key: str) -> Any | None:
         """
         Get a value from the cache.
-        
+
         Args:
             key: Cache key
-            
+
         Returns:
             Cached value if found and not expired, None otherwise
         """
-        with self._lock:
-            if key not in self._cache:
-                return None
-            
-            entry = self._cache[key]
-            
-            if entry.is_expired():
-                del self._cache[key]
-                logger.debug(
-                    "Cache entry expired and removed",
-                    extra={
-                        "key": key,
-                        "request_id": self._request_id,
-                        "expired_at": entry.expires_at.isoformat(),
-                    }
-                )
-                return None
-            
-            entry.touch()
-            
-            logger.debug(
-                "Cache hit",
-                extra={
-                    "key": key,
-                    "request_id": self._request_id,
-                    "access_count": entry.access_count,
-                }
-            )
-            
-            return entry.value
-    
+        layer = _request_layer.get()
+        if layer is not None and key in layer:
+            self.request_hits += 1
+            return layer[key]
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, generation, value, _ = entry
+        if generation != self._generations.get(_prefix(key), 0):
+            self._drop(key)
+            self.misses += 1
+            return None
+        if expires_at <= time.monotonic():
+            self._drop(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        if layer is not None:
+            layer[key] = value
+        return value
+
     def set(
-        self, 
-        key: str, 
-        value: Any, 
-        ttl_seconds: int | None = None
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int | None = None,
+        *,
+        user_id: str | None = None,
     ) -> None:
         """
         Set a value in the cache.
-        
+
         Args:
             key: Cache key
             value: Value to cache
             ttl_seconds: Time-to-live in seconds (uses default if None)
+            user_id: User the entry belongs to, for ``invalidate_user``
+        """
+        if key in self._entries:
+            self._drop(key)
+        expires_at = time.monotonic() + (ttl_seconds or self.default_ttl_seconds)
+        generation = self._generations.get(_prefix(key), 0)
+        self._entries[key] = (expires_at, generation, value, user_id)
+        if user_id is not None:
+            self._user_keys.setdefault(user_id, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+        layer = _request_layer.get()
+        if layer is not None:
+            layer[key] = value
+
+    async def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl_seconds: int | None = None,
+        *,
+        user_id: str | None = None,
+    ) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: Cache key
+            factory: Coroutine function producing the value
+            ttl_seconds: Time-to-live in seconds (uses default if None)
+            user_id: User the entry belongs to, for ``invalidate_user``
         """
-        with self._lock:
-            ttl = ttl_seconds or self.default_ttl_seconds
-            expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl)
-            
-            self._cache[key] = CacheEntry(
-                value=value,
-                expires_at=expires_at,
-            )
-            
-            logger.debug(
-                "Cache entry set",
-                extra={
-                    "key": key,
-                    "request_id": self._request_id,
-                    "ttl_seconds": ttl,
-                    "expires_at": expires_at.isoformat(),
-                }
-            )
-    
+        value = self.get(key)
+        if value is None:
+            value = await factory()
+            self.set(key, value, ttl_seconds, user_id=user_id)
+        return value
+
     def delete(self, key: str) -> bool:
         """
         Delete a value from the cache.
-        
+
         Args:
             key: Cache key to delete
-            
+
         Returns:
             True if key was deleted, False if not found
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                logger.debug(
-                    "Cache entry deleted",
-                    extra={
-                        "key": key,
-                        "request_id": self._request_id,
-                    }
-                )
-                return True
-            return False
-    
+        layer = _request_layer.get()
+        if layer is not None:
+            layer.pop(key, None)
+        if key in self._entries:
+            self._drop(key)
+            return True
+        return False
+
     def clear(self) -> None:
         """Clear all cache entries."""
-        with self._lock:
-            entry_count = len(self._cache)
-            self._cache.clear()
-            
-            logger.debug(
-                "Cache cleared",
-                extra={
-                    "request_id": self._request_id,
-                    "entries_cleared": entry_count,
-                }
-            )
-    
+        entry_count = len(self._entries)
+        self._entries.clear()
+        self._user_keys.clear()
+        self._generations.clear()
+        self._clear_request_layer()
+
+        logger.debug(
+            "Cache cleared",
+            extra={
+                "request_id": self._request_id,
+                "entries_cleared": entry_count,
+            },
+        )
+
+    def invalidate_user(self, user_id: str) -> int:
+        """
+        Invalidate every entry tagged with a user.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Number of entries invalidated
+        """
+        keys = self._user_keys.pop(user_id, ())
+        for key in keys:
+            self._entries.pop(key, None)
+        self._clear_request_layer()
+        return len(keys)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """
+        Invalidate every entry whose key starts with ``"<prefix>:"`` in O(1).
+
+        Entries of the prefix become stale and are dropped on their next
+        access or through LRU eviction.
+
+        Args:
+            prefix: Key namespace, without the trailing colon
+        """
+        self._generations[prefix] = self._generations.get(prefix, 0) + 1
+        self._clear_request_layer()
+
     def invalidate_pattern(self, pattern: str) -> int:
         """
-        Invalidate cache entries matching a pattern.
-        
+        Invalidate cache entries whose key contains pattern.
+
+        Scans every key; prefer ``invalidate_user`` or ``invalidate_prefix``.
+
         Args:
             pattern: Pattern to match against cache keys
-            
+
         Returns:
             Number of entries invalidated
         """
-        with self._lock:
-            keys_to_delete = [
-                key for key in self._cache.keys() 
-                if pattern in key
-            ]
-            
-            for key in keys_to_delete:
-                del self._cache[key]
-            
-            logger.debug(
-                "Cache entries invalidated by pattern",
-                extra={
-                    "pattern": pattern,
-                    "request_id": self._request_id,
-                    "entries_invalidated": len(keys_to_delete),
-                }
-            )
-            
-            return len(keys_to_delete)
-    
+        keys_to_delete = [key for key in self._entries if pattern in key]
+        for key in keys_to_delete:
+            self._drop(key)
+        self._clear_request_layer()
+
+        logger.debug(
+            "Cache entries invalidated by pattern",
+            extra={
+                "pattern": pattern,
+                "request_id": self._request_id,
+                "entries_invalidated": len(keys_to_delete),
+            },
+        )
+
+        return len(keys_to_delete)
+
     def get_stats(self) -> dict[str, Any]:
         """
         Get cache statistics.
-        
+
+        Counters are maintained incrementally, so this does not scan entries;
+        ``total_entries`` may include expired entries not yet accessed.
+
         Returns:
             Dictionary with cache statistics
         """
-        with self._lock:
-            now = datetime.now(timezone.utc)
-            total_entries = len(self._cache)
-            expired_entries = sum(1 for entry in self._cache.values() if entry.is_expired())
-            active_entries = total_entries - expired_entries
-            
-            total_access_count = sum(entry.access_count for entry in self._cache.values())
-            avg_access_count = total_access_count / total_entries if total_entries > 0 else 0
-            
-            return {
-                "request_id": self._request_id,
-                "created_at": self._created_at.isoformat(),
-                "total_entries": total_entries,
-                "active_entries": active_entries,
-                "expired_entries": expired_entries,
-                "total_access_count": total_access_count,
-                "avg_access_count": round(avg_access_count, 2),
-                "cache_age_seconds": (now - self._created_at).total_seconds(),
-            }
-    
+        lookups = self.request_hits + self.hits + self.misses
+        return {
+            "request_id": self._request_id,
+            "created_at": self._created_at.isoformat(),
+            "total_entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "tracked_users": len(self._user_keys),
+            "request_hits": self.request_hits,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": (
+                round((self.request_hits + self.hits) / lookups, 4) if lookups else 0.0
+            ),
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "cache_age_seconds": time.monotonic() - self._started,
+        }
+
+    get_cache_stats = get_stats
+
     def cleanup_expired(self) -> int:
         """
-        Remove expired entries from the cache.
-        
+        Remove expired and invalidated entries from the process tier.
+
         Returns:
-            Number of expired entries removed
-        """
-        with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items() 
-                if entry.is_expired()
-            ]
-            
-            for key in expired_keys:
-                del self._cache[key]
-            
-            if expired_keys:
-                logger.debug(
-                    "Expired cache entries cleaned up",
-                    extra={
-                        "request_id": self._request_id,
-                        "entries_removed": len(expired_keys),
-                    }
-                )
-            
-            return len(expired_keys)
+            Number of entries removed
+        """
+        now = time.monotonic()
+        stale_keys = [
+            key
+            for key, (expires_at, generation, _, _) in self._entries.items()
+            if expires_at <= now or generation != self._generations.get(_prefix(key), 0)
+        ]
+        for key in stale_keys:
+            self._drop(key)
+
+        if stale_keys:
+            logger.debug(
+                "Expired cache entries cleaned up",
+                extra={
+                    "request_id": self._request_id,
+                    "entries_removed": len(stale_keys),
+                },
+            )
+
+        return len(stale_keys)
+
+    def _drop(self, key: str) -> None:
+        _, _, _, user_id = self._entries.pop(key)
+        if user_id is not None:
+            keys = self._user_keys.get(user_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._user_keys[user_id]
+
+    @staticmethod
+    def _clear_request_layer() -> None:
+        layer = _request_layer.get()
+        if layer:
+            layer.clear()
+
+
+def open_request_scope(request_id: str | None = None) -> tuple[Token, Token]:
+    """
+    Open a fresh per-request cache layer in the current context.
+
+    Args:
+        request_id: Identifier reported in cache statistics and logs
+
+    Returns:
+        Tokens to pass to ``close_request_scope``
+    """
+    return _request_layer.set({}), _request_id.set(request_id)
+
+
+def close_request_scope(tokens: tuple[Token, Token]) -> None:
+    """Discard the per-request layer opened by ``open_request_scope``."""
+    layer_token, request_id_token = tokens
+    _request_layer.reset(layer_token)
+    _request_id.reset(request_id_token)
+
+
+class AuthCacheScopeMiddleware:
+    """
+    ASGI middleware giving every HTTP request its own auth cache layer.
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_id = None
+        for name, value in scope.get("headers", ()):
+            if name == b"x-correlation-id":
+                request_id = value.decode("latin-1")
+                break
+        tokens = open_request_scope(request_id)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            close_request_scope(tokens)
 
 
 class UserContextCache:
     """
     Specialized cache for user context data.
-    
+
     This cache provides optimized storage and retrieval for user context
-    objects with role and permission data.
+    objects with role and permission data. Every entry is tagged with its
+    user, so ``invalidate_user`` does not scan the cache.
     """
-    
+
     def __init__(self, auth_cache: RequestScopedAuthCache):
         """
         Initialize user context cache.
-        
+
         Args:
-            auth_cache: Request-scoped authentication cache instance
+            auth_cache: Authentication cache instance
         """
         self.auth_cache = auth_cache
         self._user_prefix = "user_context:"
         self._roles_prefix = "user_roles:"
         self._permissions_prefix = "user_permissions:"
-    
+
     def get_user_context(self, user_id: str) -> UserContext | None:
         """
         Get user context from cache.
-        
+
         Args:
             user_id: User identifier
-            
+
         Returns:
             UserContext if found in cache, None otherwise
         """
         key = f"{self._user_prefix}{user_id}"
         return self.auth_cache.get(key)
-    
+
     def set_user_context(
-        self, 
-        user_id: str, 
+        self,
+        user_id: str,
         user_context: UserContext,
         ttl_seconds: int | None = None
     ) -> None:
         """
         Set user context in cache.
-        
+
         Args:
             user_id: User identifier
             user_context: User context to cache
             ttl_seconds: Time-to-live in seconds
         """
         key = f"{self._user_prefix}{user_id}"
-        self.auth_cache.set(key, user_context, ttl_seconds)
-    
+        self.auth_cache.set(key, user_context, ttl_seconds, user_id=user_id)
+
     def get_user_roles(self, user_id: str, context: str = "fastapi") -> list[str] | None:
         """
         Get user roles from cache.
-        
+
         Args:
             user_id: User identifier
             context: Context for role filtering
-            
+
         Returns:
             List of roles if found in cache, None otherwise
         """
         key = f"{self._roles_prefix}{user_id}:{context}"
         return self.auth_cache.get(key)
-    
+
     def set_user_roles(
-        self, 
-        user_id: str, 
-        roles: list[str], 
+        self,
+        user_id: str,
+        roles: list[str],
         context: str = "fastapi",
         ttl_seconds: int | None = None
     ) -> None:
         """
         Set user roles in cache.
-        
+
         Args:
             user_id: User identifier
             roles: List of roles to cache
@@ -352,36 +468,36 @@ def set_user_roles(
             ttl_seconds: Time-to-live in seconds
         """
         key = f"{self._roles_prefix}{user_id}:{context}"
-        self.auth_cache.set(key, roles, ttl_seconds)
-    
+        self.auth_cache.set(key, roles, ttl_seconds, user_id=user_id)
+
     def get_user_permissions(
-        self, 
-        user_id: str, 
+        self,
+        user_id: str,
         context: str = "fastapi"
     ) -> list[str] | None:
         """
         Get user permissions from cache.
-        
+
         Args:
             user_id: User identifier
             context: Context for permission filtering
-            
+
         Returns:
             List of permissions if found in cache, None otherwise
         """
         key = f"{self._permissions_prefix}{user_id}:{context}"
         return self.auth_cache.get(key)
-    
+
     def set_user_permissions(
-        self, 
-        user_id: str, 
-        permissions: list[str], 
+        self,
+        user_id: str,
+        permissions: list[str],
         context: str = "fastapi",
         ttl_seconds: int | None = None
     ) -> None:
         """
         Set user permissions in cache.
-        
+
         Args:
             user_id: User identifier
             permissions: List of permissions to cache
@@ -389,28 +505,20 @@ def set_user_permissions(
             ttl_seconds: Time-to-live in seconds
         """
         key = f"{self._permissions_prefix}{user_id}:{context}"
-        self.auth_cache.set(key, permissions, ttl_seconds)
-    
+        self.auth_cache.set(key, permissions, ttl_seconds, user_id=user_id)
+
     def invalidate_user(self, user_id: str) -> int:
         """
         Invalidate all cache entries for a user.
-        
+
         Args:
             user_id: User identifier
-            
+
         Returns:
             Number of entries invalidated
         """
-        patterns = [
-            f"{self._user_prefix}{user_id}",
-            f"{self._roles_prefix}{user_id}:",
-            f"{self._permissions_prefix}{user_id}:",
-        ]
-        
-        total_invalidated = 0
-        for pattern in patterns:
-            total_invalidated += self.auth_cache.invalidate_pattern(pattern)
-        
+        total_invalidated = self.auth_cache.invalidate_user(user_id)
+
         logger.debug(
             "User cache entries invalidated",
             extra={
@@ -419,44 +527,44 @@ def invalidate_user(self, user_id: str) -> int:
                 "request_id": self.auth_cache._request_id,
             }
         )
-        
+
         return total_invalidated
-    
+
     def invalidate_user_context(self, user_id: str) -> bool:
         """
         Invalidate user context cache entry.
-        
+
         Args:
             user_id: User identifier
-            
+
         Returns:
             True if entry was deleted, False if not found
         """
         key = f"{self._user_prefix}{user_id}"
         return self.auth_cache.delete(key)
-    
+
     def invalidate_user_roles(self, user_id: str, context: str = "fastapi") -> bool:
         """
         Invalidate user roles cache entry.
-        
+
         Args:
             user_id: User identifier
             context: Context for role filtering
-            
+
         Returns:
             True if entry was deleted, False if not found
         """
         key = f"{self._roles_prefix}{user_id}:{context}"
         return self.auth_cache.delete(key)
-    
+
     def invalidate_user_permissions(self, user_id: str, context: str = "fastapi") -> bool:
         """
         Invalidate user permissions cache entry.
-        
+
         Args:
             user_id: User identifier
             context: Context for permission filtering
-            
+
         Returns:
             True if entry was deleted, False if not found
         """
@@ -464,58 +572,55 @@ def invalidate_user_permissions(self, user_id: str, context: str = "fastapi") ->
         return self.auth_cache.delete(key)
 
 
-# Global cache instances (singleton pattern)
-_auth_cache_instance:RequestScopedAuthCache | None = None
+# Process-level cache instances (the per-request layer lives in a contextvar)
+_auth_cache_instance: RequestScopedAuthCache | None = None
 _user_context_cache_instance: UserContextCache | None = None
 
 
 def get_auth_cache() -> RequestScopedAuthCache:
     """
-    Get or create the global authentication cache instance.
-    
+    Get or create the process-level authentication cache.
+
     Returns:
-        RequestScopedAuthCache: Global cache instance
-        
+        RequestScopedAuthCache: Process-wide cache instance
+
     Notes:
-        Uses singleton pattern to avoid recreating cache instances
-        across requests.
+        The instance is shared across requests; each request sees its own
+        per-request layer on top of it when ``AuthCacheScopeMiddleware`` is
+        installed.
     """
     global _auth_cache_instance
-    
+
     if _auth_cache_instance is None:
         _auth_cache_instance = RequestScopedAuthCache()
-    
+
     return _auth_cache_instance
 
 
 def get_user_context_cache() -> UserContextCache:
     """
-    Get or create the global user context cache instance.
-    
+    Get or create the process-level user context cache.
+
     Returns:
-        UserContextCache: Global cache instance
-        
-    Notes:
-        Uses singleton pattern to avoid recreating cache instances
-        across requests.
+        UserContextCache: Cache bound to ``get_auth_cache()``
     """
     global _user_context_cache_instance
-    
+
     if _user_context_cache_instance is None:
         auth_cache = get_auth_cache()
         _user_context_cache_instance = UserContextCache(auth_cache)
-    
+
     return _user_context_cache_instance
 
 
 def clear_global_caches() -> None:
     """Clear all global cache instances."""
     global _auth_cache_instance, _user_context_cache_instance
-    
+
     if _auth_cache_instance:
         _auth_cache_instance.clear()
-    
+
     _auth_cache_instance = None
     _user_context_cache_instance = None
-    
+
     logger.info("Global authentication caches cleared")
@@ -0,0 +1,158 @@
+"""
+Async JWKS (JSON Web Key Set) manager for Cognito token validation.
+
+Signing keys are fetched with an async HTTP client, so a key-cache miss never
+blocks the event loop. Keys are prefetched at startup and refreshed in the
+background; a token signed with an unknown ``kid`` (key rotation) triggers
+one refresh shared by every concurrent request that hit the same miss, and
+refreshes triggered by unknown kids are rate limited so forged kids cannot
+hammer the JWKS endpoint.
+"""
+
+import logging
+import time
+
+import anyio
+import httpx
+import jwt
+from jwt import PyJWK, PyJWKSet
+
+logger = logging.getLogger(__name__)
+
+
+class JWKSKeyNotFoundError(jwt.InvalidTokenError):
+    """Raised when no signing key matches the token's ``kid``."""
+
+
+class AsyncJWKSManager:
+    """
+    Async, self-refreshing cache of JWKS signing keys.
+
+    Attributes:
+        jwks_url: URL of the JWKS document
+        refresh_interval: Seconds between background refreshes
+        min_refresh_interval: Minimum seconds between refreshes triggered by
+            unknown kids
+        timeout: HTTP timeout in seconds
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        *,
+        refresh_interval: float = 3600,
+        min_refresh_interval: float = 30,
+        timeout: float = 5.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initialize the manager. No request is made until a key is needed.
+
+        Args:
+            jwks_url: URL of the JWKS document
+            refresh_interval: Seconds between background refreshes
+            min_refresh_interval: Minimum seconds between kid-miss refreshes
+            timeout: HTTP timeout in seconds
+            transport: Optional httpx transport (e.g. ``httpx.MockTransport``
+                serving a local JWKS stub)
+        """
+        self.jwks_url = jwks_url
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self._transport = transport
+        self._keys: dict[str, PyJWK] = {}
+        self._fetched_at: float | None = None
+        self._refreshes = 0
+        self._lock: anyio.Lock | None = None
+
+    @property
+    def key_ids(self) -> list[str]:
+        """Key ids currently cached."""
+        return list(self._keys)
+
+    @property
+    def refresh_count(self) -> int:
+        """Number of successful JWKS fetches."""
+        return self._refreshes
+
+    async def get_signing_key(self, kid: str | None) -> PyJWK:
+        """
+        Return the signing key for a key id, refreshing the key set on a miss.
+
+        Args:
+            kid: Key id from the token header
+
+        Returns:
+            PyJWK: Matching signing key
+
+        Raises:
+            JWKSKeyNotFoundError: When no key matches after a refresh
+            httpx.HTTPError: When the JWKS document cannot be fetched
+        """
+        if kid is None:
+            raise JWKSKeyNotFoundError("Token header has no kid")
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        seen = self._refreshes
+        async with self._get_lock():
+            # Another request may have refreshed while we waited
+            if self._refreshes == seen and self._may_refresh_for_miss():
+                await self._fetch()
+        key = self._keys.get(kid)
+        if key is None:
+            raise JWKSKeyNotFoundError(f"No signing key found for kid {kid!r}")
+        return key
+
+    async def refresh(self) -> None:
+        """Fetch the key set now."""
+        async with self._get_lock():
+            await self._fetch()
+
+    async def prefetch(self) -> None:
+        """Fetch the key set if it has never been loaded; log failures."""
+        if self._fetched_at is not None:
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning("JWKS prefetch failed", extra={"error": str(e)})
+
+    async def run_background_refresh(self) -> None:
+        """Refresh the key set every ``refresh_interval`` seconds, forever."""
+        await self.prefetch()
+        while True:
+            await anyio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning("JWKS background refresh failed", extra={"error": str(e)})
+
+    def _may_refresh_for_miss(self) -> bool:
+        return (
+            self._fetched_at is None
+            or time.monotonic() - self._fetched_at >= self.min_refresh_interval
+        )
+
+    def _get_lock(self) -> anyio.Lock:
+        # Created lazily so the manager can be built outside an event loop
+        if self._lock is None:
+            self._lock = anyio.Lock()
+        return self._lock
+
+    async def _fetch(self) -> None:
+        async with httpx.AsyncClient(
+            timeout=self.timeout, transport=self._transport
+        ) as client:
+            response = await client.get(self.jwks_url)
+            response.raise_for_status()
+            jwk_set = PyJWKSet.from_dict(response.json())
+        self._keys = {key.key_id: key for key in jwk_set.keys if key.key_id}
+        self._fetched_at = time.monotonic()
+        self._refreshes += 1
+        logger.debug(
+            "JWKS refreshed",
+            extra={"jwks_url": self.jwks_url, "key_count": len(self._keys)},
+        )
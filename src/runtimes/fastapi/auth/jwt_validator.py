@@ -12,11 +12,12 @@
 
 import httpx
 import jwt
-from jwt import PyJWKClient
 from pydantic import BaseModel, Field
 
 from src.config.app_config import get_app_settings
 from src.contexts.shared_kernel.middleware.auth.authentication import AuthenticationError
+from src.runtimes.fastapi.auth.jwks import AsyncJWKSManager
+from src.runtimes.fastapi.auth.verified_tokens import VerifiedTokenCache
 from datetime import datetime, timezone, timedelta
 
 logger = logging.getLogger(__name__)
@@ -86,14 +87,16 @@ class CognitoJWTValidator:
     - Checks token expiration and not-before times
     - Validates issuer and audience
     - Extracts and validates user claims
-    - Caches JWKS (JSON Web Key Set) for performance
+    - Fetches JWKS (JSON Web Key Set) asynchronously and refreshes it in
+      the background
+    - Caches verified claims per token until the token expires
     
     Attributes:
-        jwks_client: PyJWKClient for fetching and caching JWKS
+        jwks: Async JWKS manager providing signing keys
+        verified_tokens: Cache of verified claims, evicted on revocation
         cognito_region: AWS region where Cognito User Pool is located
         user_pool_id: Cognito User Pool ID
         client_id: Cognito App Client ID
-        _jwks_cache: Cache for JWKS to avoid repeated HTTP calls
     """
     
     def __init__(
@@ -102,6 +105,8 @@ def __init__(
         user_pool_id:str | None = None,
         client_id:str | None = None,
         check_revocation: bool = True,
+        jwks_manager: AsyncJWKSManager | None = None,
+        verified_tokens: VerifiedTokenCache | None = None,
     ):
         """
         Initialize Cognito JWT validator.
@@ -111,6 +116,8 @@ def __init__(
             user_pool_id: Cognito User Pool ID
             client_id: Cognito App Client ID
             check_revocation: Whether to check token revocation status
+            jwks_manager: JWKS manager (one for ``jwks_url`` if None)
+            verified_tokens: Verified claims cache (a new one if None)
             
         Notes:
             If parameters are not provided, they will be loaded from app configuration.
@@ -134,23 +141,22 @@ def __init__(
             f"{self.user_pool_id}/.well-known/jwks.json"
         )
         
-        # Initialize JWKS client with caching
-        # Based on PyJWT documentation: https://pyjwt.readthedocs.io/en/stable/usage.html
-        self.jwks_client = PyJWKClient(
-            uri=self.jwks_url,
-            cache_keys=True,           # Cache signing keys for performance
-            max_cached_keys=16,        # Default max cached keys
-            cache_jwk_set=True,        # Cache the JWK set
-            lifespan=3600,             # Cache for 1 hour (3600 seconds)
-            timeout=30,                # HTTP timeout
+        self.issuer = (
+            f"https://cognito-idp.{self.cognito_region}.amazonaws.com/{self.user_pool_id}"
         )
         
+        # Signing keys are fetched asynchronously; the FastAPI lifespan keeps
+        # them fresh in the background
+        self.jwks = jwks_manager or AsyncJWKSManager(self.jwks_url)
+        self.verified_tokens = verified_tokens or VerifiedTokenCache()
+        
         # Initialize token revoker if revocation checking is enabled
         self.token_revoker = None
         if self.check_revocation:
             try:
                 from src.runtimes.fastapi.auth.token_revocation import get_token_revoker
                 self.token_revoker = get_token_revoker()
+                self.token_revoker.add_revocation_listener(self.verified_tokens.evict)
             except ImportError:
                 logger.warning("Token revocation module not available, revocation checking disabled")
                 self.check_revocation = False
@@ -184,19 +190,25 @@ async def validate_token(self, token: str) -> CognitoJWTClaims:
             - Token not-before time (nbf claim)
             - Token issuer (iss claim)
             - Token audience (aud claim)
+            
+            Verified claims are cached until the token's exp; revoking the
+            token's jti/origin_jti evicts them.
         """
+        cached_claims = self.verified_tokens.get(token)
+        if cached_claims is not None:
+            return cached_claims
+
         try:
-            # Get signing key from JWKS using the token directly
-            # Based on PyJWT documentation: https://pyjwt.readthedocs.io/en/stable/usage.html
-            signing_key = self.jwks_client.get_signing_key_from_jwt(token).key
+            header = jwt.get_unverified_header(token)
+            signing_key = await self.jwks.get_signing_key(header.get("kid"))
             # Decode and validate token
             # Based on PyJWT documentation patterns for Cognito validation
             decoded_token = jwt.decode(
                 token,
-                signing_key,
+                signing_key.key,
                 algorithms=["RS256"],
                 audience=self.client_id,
-                issuer=f"https://cognito-idp.{self.cognito_region}.amazonaws.com/{self.user_pool_id}",
+                issuer=self.issuer,
                 options={
                     "verify_signature": True,
                     "verify_exp": True,
@@ -214,16 +226,24 @@ async def validate_token(self, token: str) -> CognitoJWTClaims:
                     f"Invalid token_use: {token_use}. Expected 'access' or 'id'"
                 )
             
+            # Parse claims using Pydantic model
+            claims = CognitoJWTClaims(**decoded_token)
+            
             # Check token revocation if enabled
             if self.check_revocation and self.token_revoker:
-                if self.token_revoker.is_token_revoked(token):
+                if self.token_revoker.is_origin_jti_revoked(claims.origin_jti):
                     raise JWTValidationError(
                         "Token has been revoked",
                         "TOKEN_REVOKED"
                     )
             
-            # Parse claims using Pydantic model
-            claims = CognitoJWTClaims(**decoded_token)
+            self.verified_tokens.set(
+                token,
+                claims,
+                exp=claims.exp,
+                jti=claims.jti,
+                origin_jti=claims.origin_jti,
+            )
             
             logger.debug(
                 "JWT token validated successfully",
@@ -236,6 +256,9 @@ async def validate_token(self, token: str) -> CognitoJWTClaims:
             
             return claims
             
+        except JWTValidationError:
+            raise
+            
         except jwt.ExpiredSignatureError as e:
             logger.warning("JWT token expired", extra={"error": str(e)})
             raise JWTValidationError("Token has expired", "TOKEN_EXPIRED") from e
@@ -6,13 +6,14 @@
 token refresh, and revocation.
 """
 
+import time
 from typing import Any
 from fastapi import HTTPException, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from src.runtimes.fastapi.auth.jwt_validator import get_jwt_validator, JWTValidationError, CognitoJWTClaims
-from src.runtimes.fastapi.auth.cache import RequestScopedAuthCache
-from src.runtimes.fastapi.auth.token_revocation import CognitoTokenRevoker
+from src.runtimes.fastapi.auth.cache import RequestScopedAuthCache, get_auth_cache
+from src.runtimes.fastapi.auth.token_revocation import CognitoTokenRevoker, get_token_revoker
 
 from src.logging.logger import get_logger
 
@@ -46,13 +47,13 @@ def __init__(
         Initialize JWT Bearer authentication.
         
         Args:
-            cache: Request-scoped cache instance (creates default if None)
-            token_revoker: Token revoker instance (creates default if None)
+            cache: Authentication cache (process-level cache if None)
+            token_revoker: Token revoker instance (process-wide revoker if None)
             auto_error: Whether to automatically raise HTTP exceptions on auth failure
         """
         super().__init__(auto_error=auto_error)
-        self.cache = cache or RequestScopedAuthCache()
-        self.token_revoker = token_revoker or CognitoTokenRevoker()
+        self.cache = cache or get_auth_cache()
+        self.token_revoker = token_revoker or get_token_revoker()
     
     async def __call__(self, request: Request) -> JWTAuthorizationCredentials | None:
         """
@@ -102,21 +103,23 @@ async def __call__(self, request: Request) -> JWTAuthorizationCredentials | None
             # Check cache first (only for production mode with real tokens)
             cache_key = f"jwt_credentials:{jwt_token}"
             cached_credentials = self.cache.get(cache_key)
-            if cached_credentials:
+            if cached_credentials and not self._is_revoked(
+                jwt_validator, cached_credentials.claims
+            ):
                 return cached_credentials
             
             # Validate JWT token
             claims = await jwt_validator.validate_token(jwt_token)
             
             # Check if token is revoked (only for production mode)
-            if hasattr(jwt_validator, 'check_revocation') and jwt_validator.check_revocation:
-                if self.token_revoker.is_token_revoked(jwt_token):
-                    logger.error("Token has been revoked", request_url=str(request.url), request_method=request.method)
-                    raise HTTPException(
-                        status_code=401,
-                        detail="Token has been revoked",
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
+            if self._is_revoked(jwt_validator, claims):
+                self.cache.delete(cache_key)
+                logger.error("Token has been revoked", request_url=str(request.url), request_method=request.method)
+                raise HTTPException(
+                    status_code=401,
+                    detail="Token has been revoked",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
             
             # Parse JWT components (handle dev mode tokens)
             if jwt_token.startswith("dev-token-"):
@@ -140,8 +143,14 @@ async def __call__(self, request: Request) -> JWTAuthorizationCredentials | None
                 message=message,
             )
             
-            # Cache the validated credentials
-            self.cache.set(cache_key, jwt_credentials)
+            # Cache the validated credentials, never past the token's expiry
+            ttl_seconds = min(
+                self.cache.default_ttl_seconds, claims.exp - int(time.time())
+            )
+            if ttl_seconds > 0:
+                self.cache.set(
+                    cache_key, jwt_credentials, ttl_seconds, user_id=claims.sub
+                )
             
             return jwt_credentials
             
@@ -171,6 +180,13 @@ async def __call__(self, request: Request) -> JWTAuthorizationCredentials | None
             return None
 
 
+    def _is_revoked(self, jwt_validator: Any, claims: CognitoJWTClaims) -> bool:
+        """Check revocation of verified claims (production mode only)."""
+        if not getattr(jwt_validator, "check_revocation", False):
+            return False
+        return self.token_revoker.is_origin_jti_revoked(claims.origin_jti)
+
+
 # Create default JWT Bearer instance
 jwt_bearer = JWTBearer(auto_error=False)  # Don't auto-raise for Swagger UI integration
 
@@ -6,6 +6,7 @@
 """
 
 import logging
+from collections.abc import Callable
 from datetime import datetime, timezone, timedelta
 from typing import Any, Optional
 
@@ -94,6 +95,8 @@ def __init__(
         
         # Cache for revoked tokens (origin_jti -> revocation_time)
         self._revoked_tokens: dict[str, datetime] = {}
+        # Called with each revoked jti/origin_jti (e.g. verified-token caches)
+        self._revocation_listeners: list[Callable[[str], Any]] = []
         
         logger.info(
             "CognitoTokenRevoker initialized",
@@ -179,6 +182,7 @@ async def revoke_token(self, token: str) -> bool:
                             "Cached revoked token origin_jti",
                             extra={"origin_jti": origin_jti}
                         )
+                    self._notify_revoked(decoded.get("jti"), origin_jti)
                 except Exception as e:
                     logger.warning(
                         "Failed to extract origin_jti from revoked token",
@@ -273,6 +277,46 @@ def is_token_revoked(self, token: str) -> bool:
             # If we can't decode the token, assume it's not revoked for safety
             return False
     
+    def is_origin_jti_revoked(self, origin_jti: str | None) -> bool:
+        """
+        Check a revocation id from already verified claims.
+
+        Args:
+            origin_jti: ``origin_jti`` claim of the token
+
+        Returns:
+            bool: True if the token family has been revoked
+
+        Notes:
+            Unlike ``is_token_revoked`` this does not decode the token.
+        """
+        if not origin_jti or origin_jti not in self._revoked_tokens:
+            return False
+        self._cleanup_revoked_tokens_cache()
+        return origin_jti in self._revoked_tokens
+
+    def add_revocation_listener(self, listener: Callable[[str], Any]) -> None:
+        """
+        Register a callback receiving each revoked ``jti`` and ``origin_jti``.
+
+        Args:
+            listener: Called once per id after a successful revocation
+        """
+        self._revocation_listeners.append(listener)
+
+    def _notify_revoked(self, *token_ids: str | None) -> None:
+        for token_id in token_ids:
+            if not token_id:
+                continue
+            for listener in self._revocation_listeners:
+                try:
+                    listener(token_id)
+                except Exception as e:
+                    logger.warning(
+                        "Token revocation listener failed",
+                        extra={"error": str(e)}
+                    )
+
     def _cleanup_revoked_tokens_cache(self) -> None:
         """Clean up expired entries from the revoked tokens cache."""
         cutoff_time = datetime.now(tz=timezone.utc) - timedelta(hours=24)
@@ -0,0 +1,108 @@
+"""
+Bounded cache of verified JWT claims.
+
+Signature verification and claims validation run once per token; later
+requests carrying the same token reuse the verified claims until the token's
+``exp``. Entries are keyed by a SHA-256 digest of the token, so raw tokens
+are never kept as keys, and are indexed by ``jti`` and ``origin_jti`` so a
+revocation evicts them immediately.
+"""
+
+import hashlib
+import time
+from typing import Any
+
+from src.contexts.seedwork.adapters.caching import LruTtlCache
+
+
+def token_digest(token: str) -> bytes:
+    """Return the cache key of a token."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+class VerifiedTokenCache:
+    """
+    LRU cache of verified claims, expiring at each token's ``exp``.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        # digest -> (claims, jti, origin_jti); wall clock, as ``exp`` is
+        self._entries: LruTtlCache[bytes, tuple[Any, str | None, str | None]] = (
+            LruTtlCache(max_entries, clock=time.time, on_drop=self._unindex)
+        )
+        self._by_jti: dict[str, set[bytes]] = {}
+        self.revocations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        return self._entries.max_entries
+
+    def get(self, token: str) -> Any | None:
+        """Return the verified claims of a token, or None on miss/expiry."""
+        entry = self._entries.get(token_digest(token))
+        return entry[0] if entry is not None else None
+
+    def set(
+        self,
+        token: str,
+        claims: Any,
+        *,
+        exp: int,
+        jti: str | None = None,
+        origin_jti: str | None = None,
+    ) -> None:
+        """
+        Store verified claims until ``exp`` (Unix timestamp).
+
+        Args:
+            token: Raw token
+            claims: Verified claims
+            exp: Token expiry; already expired tokens are not stored
+            jti: Token id, for revocation eviction
+            origin_jti: Revocation id shared by tokens of one refresh token
+        """
+        ttl = exp - time.time()
+        if ttl <= 0:
+            return
+        digest = token_digest(token)
+        self._entries.set(digest, (claims, jti, origin_jti), ttl)
+        for token_id in (jti, origin_jti):
+            if token_id:
+                self._by_jti.setdefault(token_id, set()).add(digest)
+
+    def evict(self, token_id: str) -> int:
+        """
+        Evict every entry whose ``jti`` or ``origin_jti`` equals token_id.
+
+        Returns:
+            Number of entries evicted
+        """
+        evicted = 0
+        for digest in self._by_jti.pop(token_id, ()):
+            if self._entries.pop(digest) is not None:
+                evicted += 1
+        self.revocations += evicted
+        return evicted
+
+    def clear(self) -> None:
+        """Evict every entry."""
+        self._entries.clear()
+        self._by_jti.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss counters and current occupancy."""
+        return {**self._entries.stats(), "revocations": self.revocations}
+
+    def _unindex(
+        self, digest: bytes, entry: tuple[Any, str | None, str | None]
+    ) -> None:
+        for token_id in entry[1:]:
+            if token_id:
+                digests = self._by_jti.get(token_id)
+                if digests is not None:
+                    digests.discard(digest)
+                    if not digests:
+                        del self._by_jti[token_id]
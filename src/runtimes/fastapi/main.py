@@ -20,6 +20,11 @@
 
 
 from src.config.app_config import get_app_settings
+from src.contexts.shared_kernel.services.cross_context import use_in_process_calls
+from src.contexts.shared_kernel.services.outbox import OutboxDispatcher
+from src.db.fastapi_database import get_fastapi_database
+from src.runtimes.fastapi.auth.cache import AuthCacheScopeMiddleware
+from src.runtimes.fastapi.auth.jwt_validator import CognitoJWTValidator, get_jwt_validator
 from src.runtimes.fastapi.dependencies.containers import AppContainer
 
 from src.runtimes.fastapi.error_handling import setup_error_handlers
@@ -46,6 +51,7 @@ async def lifespan(app: FastAPI):
     - Creates a task group for supervised background tasks
     - Provides a spawn function with proper exception handling
     - Sets up capacity limiter for concurrency control
+    - Runs long-lived services (JWKS refresh, outbox dispatchers)
     - Handles graceful shutdown with spawn rejection
     
     Args:
@@ -56,6 +62,8 @@ async def lifespan(app: FastAPI):
     """
     container = AppContainer()
     app.state.container = container
+    # All contexts share this process: exchange read models, not JSON.
+    use_in_process_calls()
     
     async with anyio.create_task_group() as tg:
         app.state.bg_limiter = anyio.CapacityLimiter(64)
@@ -77,10 +85,47 @@ def spawn(coro: Coroutine[Any, Any, Any], *, name: Optional[str] = None) -> None
 
         app.state.spawn = spawn
 
+        service_scopes: list[anyio.CancelScope] = []
+
+        def spawn_service(coro: Coroutine[Any, Any, Any], *, name: str) -> None:
+            """Spawn a never-ending background task, cancelled on shutdown."""
+            scope = anyio.CancelScope()
+            service_scopes.append(scope)
+
+            async def _run() -> None:
+                with scope:
+                    await coro
+
+            spawn(_run(), name=name)
+
         # Get app configuration
         config = get_app_settings()
         app.state.config = config
 
+        # Prefetch Cognito signing keys and keep them fresh off the request path
+        jwt_validator = get_jwt_validator()
+        if isinstance(jwt_validator, CognitoJWTValidator):
+            await jwt_validator.jwks.prefetch()
+            spawn_service(jwt_validator.jwks.run_background_refresh(), name="jwks_refresh")
+
+        # Run committed domain events from the transactional outbox
+        for bus_factory in (
+            container.recipes.bus_factory,
+            container.products.bus_factory,
+            container.iam.bus_factory,
+        ):
+            outbox = bus_factory().outbox
+            if outbox is None:
+                continue
+            dispatcher = OutboxDispatcher(
+                get_fastapi_database().async_session_factory,
+                outbox,
+                batch_size=config.messagebus_outbox_batch_size,
+                max_attempts=config.messagebus_outbox_max_attempts,
+                limiter=app.state.bg_limiter,
+            )
+            spawn_service(dispatcher.run(), name=f"outbox_{outbox.context}")
+
         logger.info("FastAPI application starting with task supervision")
 
         try:
@@ -91,6 +136,8 @@ def _reject_spawn(_: Coroutine[Any, Any, Any], *, name: Optional[str] = None):
                 logger.warning("Spawn called during shutdown", extra={"task": name})
                 raise RuntimeError("Shutting down")
             app.state.spawn = _reject_spawn
+            for scope in service_scopes:
+                scope.cancel()
 
             # tiny grace before TG auto-cancels/joins children
             with anyio.move_on_after(0.2):
@@ -160,6 +207,9 @@ def custom_openapi():
     if config.rate_limit_enabled:
         app.add_middleware(SlowAPIMiddleware)
 
+    # Per-request layer of the auth cache
+    app.add_middleware(AuthCacheScopeMiddleware)
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=config.fastapi_cors_origins,
@@ -17,8 +17,8 @@
 
 logger = get_logger(__name__)
 
-# Request-scoped IAM provider instances (prevents duplicate auth calls)
-_request_iam_providers: dict[str, UnifiedIAMProvider] = {}
+# One IAM provider per caller context; user lookups are cached process-wide
+_iam_providers: dict[str, UnifiedIAMProvider] = {}
 
 
 def extract_user_roles_from_claims(claims: CognitoJWTClaims) -> list[str]:
@@ -58,10 +58,11 @@ def extract_user_roles_from_claims(claims: CognitoJWTClaims) -> list[str]:
 
 
 def get_iam_provider(caller_context: str) -> UnifiedIAMProvider:
-    """Get a request-scoped UnifiedIAMProvider instance.
+    """Get the UnifiedIAMProvider for a caller context.
     
-    Prevents duplicate IAM calls and authentication logs by reusing the same
-    provider instance across dependency calls within the same request.
+    Providers use the "container" strategy, so user lookups are served from
+    the process-wide IAM user cache across requests and concurrent misses for
+    the same user share one IAM call.
     
     Args:
         caller_context: The IAM context (e.g., "recipes_catalog", "iam")
@@ -69,12 +70,12 @@ def get_iam_provider(caller_context: str) -> UnifiedIAMProvider:
     Returns:
         UnifiedIAMProvider instance for the given context
     """
-    if caller_context not in _request_iam_providers:
-        _request_iam_providers[caller_context] = UnifiedIAMProvider(
+    if caller_context not in _iam_providers:
+        _iam_providers[caller_context] = UnifiedIAMProvider(
             logger_name=f"fastapi_iam_{caller_context}",
-            cache_strategy="request"
+            cache_strategy="container"
         )
-    return _request_iam_providers[caller_context]
+    return _iam_providers[caller_context]
 
 
 
@@ -20,11 +20,25 @@ def create_success_response(data: Any, status_code: int = 200) -> JSONResponse:
     )
 
 
+def create_cursor_response(data: Any, next_cursor: str | None) -> JSONResponse:
+    """Create success response carrying the keyset cursor of the next page."""
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+        data = json.loads(data)
+    elif isinstance(data, str):
+        data = json.loads(data)
+    return JSONResponse(
+        status_code=200,
+        content={"data": data, "next_cursor": next_cursor}
+    )
+
+
 def create_paginated_response(
     data: Any, 
     total: int, 
     page: int = 1, 
-    limit: int = 50
+    limit: int = 50,
+    next_cursor: str | None = None,
 ) -> JSONResponse:
     """Create paginated response."""
     if isinstance(data, bytes):
@@ -41,6 +55,7 @@ def create_paginated_response(
                 "limit": limit,
                 "total": total,
                 "pages": (total + limit - 1) // limit,
+                "next_cursor": next_cursor,
             }
         }
     )
@@ -47,6 +47,7 @@ async def search_products(
     uow: UnitOfWork
     async with bus.uow_factory() as uow:
         result: list[Product] = await uow.products.query(filters=filter_dict)
+        next_cursor = uow.products.next_cursor(result, filter_dict)
     
     # Convert domain products to API format
     api_products = []
@@ -65,5 +66,6 @@ async def search_products(
         data=response_body,
         total=total,
         page=page,
-        limit=limit
+        limit=limit,
+        next_cursor=next_cursor,
     )
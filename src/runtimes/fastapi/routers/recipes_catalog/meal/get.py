@@ -52,7 +52,7 @@ async def get_meal(
         error_message = "User does not have enough privileges to get meal"
         raise PermissionError(error_message)
     
-    api_meal = ApiMeal.from_domain(meal)
+    api_meal = ApiMeal.from_domain_trusted(meal)
     
     response_body = api_meal.model_dump_json()
     
@@ -1,7 +1,7 @@
 """FastAPI router for meal search endpoint."""
 
 from fastapi import Depends, Query
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.root_aggregate.api_meal import (
     ApiMeal,
@@ -9,15 +9,21 @@
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.root_aggregate.api_meal_filter import (
     ApiMealFilter,
 )
+from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.root_aggregate.api_meal_summary import (
+    ApiMealSummary,
+)
 from src.contexts.recipes_catalog.core.services.uow import UnitOfWork
 from src.contexts.recipes_catalog.fastapi.dependencies import get_recipes_bus
 from src.contexts.shared_kernel.services.messagebus import MessageBus
 from src.runtimes.fastapi.routers.deps import get_recipes_user
 from src.runtimes.fastapi.routers.helpers import (
-    create_success_response,
+    create_cursor_response,
     create_router,
 )
-from src.runtimes.fastapi.routers.type_adapters import MealListTypeAdapter
+from src.runtimes.fastapi.routers.type_adapters import (
+    MealListTypeAdapter,
+    MealSummaryListTypeAdapter,
+)
 
 router = create_router(prefix="/meals")
 
@@ -25,6 +31,7 @@
 async def search_meals(
     filters: Annotated[ApiMealFilter, Query()],
     current_user: Annotated[Any, Depends(get_recipes_user)],
+    projection: Annotated[Literal["full", "summary"], Query()] = "full",
     bus: MessageBus = Depends(get_recipes_bus),
 ) -> Any:
     """Search meals with pagination and filtering.
@@ -36,6 +43,8 @@ async def search_meals(
         filters: Meal filter criteria (auto-converted from query params)
         bus: Message bus for business logic
         current_user: Current authenticated user
+        projection: "summary" returns ApiMealSummary items selected as plain
+            columns instead of full aggregates
         
     Returns:
         List of meals matching filters
@@ -58,15 +67,25 @@ async def search_meals(
             ]
     
     uow: UnitOfWork
+    if projection == "summary":
+        async with bus.uow_factory() as uow:
+            summaries = await uow.meals.query_summaries(filters=filter_dict)
+            next_cursor = uow.meals.next_cursor(summaries, filter_dict)
+        response_body = MealSummaryListTypeAdapter.dump_json(
+            [ApiMealSummary.from_read_model(s) for s in summaries]
+        )
+        return create_cursor_response(response_body, next_cursor)
+
     async with bus.uow_factory() as uow:
         result: list = await uow.meals.query(filters=filter_dict)
+        next_cursor = uow.meals.next_cursor(result, filter_dict)
     
     api_meals = []
     conversion_errors = 0
     
     for _, meal in enumerate(result):
         try:
-            api_meal = ApiMeal.from_domain(meal)
+            api_meal = ApiMeal.from_domain_trusted(meal)
             api_meals.append(api_meal)
         except Exception:
             conversion_errors += 1
@@ -77,4 +96,4 @@ async def search_meals(
     
     response_body = MealListTypeAdapter.dump_json(api_meals)
     
-    return create_success_response(response_body)
+    return create_cursor_response(response_body, next_cursor)
@@ -67,7 +67,7 @@ async def get_shopping_list_data(
     response = ApiShoppingListDataResponse(
         clients=[ApiClient.from_domain(c) for c in clients],
         menus=[ApiMenu.from_domain(m) for m in menus],
-        meals=[ApiMeal.from_domain(m) for m in meals],
+        meals=[ApiMeal.from_domain_trusted(m) for m in meals],
         products=[ApiProduct.from_domain(p) for p in products],
     ).model_dump_json()
 
@@ -52,7 +52,7 @@ async def get_recipe(
         error_message = "User does not have enough privileges to get recipe"
         raise PermissionError(error_message)
     
-    api_recipe = ApiRecipe.from_domain(recipe)
+    api_recipe = ApiRecipe.from_domain_trusted(recipe)
     
     response_body = api_recipe.model_dump_json()
     
@@ -1,7 +1,7 @@
 """FastAPI router for recipe search endpoint."""
 
 from fastapi import Depends, Query
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.entities.api_recipe import (
     ApiRecipe,
@@ -9,15 +9,21 @@
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.entities.api_recipe_filter import (
     ApiRecipeFilter,
 )
+from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.entities.api_recipe_summary import (
+    ApiRecipeSummary,
+)
 from src.contexts.recipes_catalog.core.services.uow import UnitOfWork
 from src.contexts.recipes_catalog.fastapi.dependencies import get_recipes_bus
 from src.contexts.shared_kernel.services.messagebus import MessageBus
 from src.runtimes.fastapi.routers.deps import get_recipes_user
 from src.runtimes.fastapi.routers.helpers import (
-    create_success_response,
+    create_cursor_response,
     create_router,
 )
-from src.runtimes.fastapi.routers.type_adapters import RecipeListTypeAdapter
+from src.runtimes.fastapi.routers.type_adapters import (
+    RecipeListTypeAdapter,
+    RecipeSummaryListTypeAdapter,
+)
 
 router = create_router(prefix="/recipes")
 
@@ -25,6 +31,7 @@
 async def search_recipes(
     filters: Annotated[ApiRecipeFilter, Query()],
     current_user: Annotated[Any, Depends(get_recipes_user)],
+    projection: Annotated[Literal["full", "summary"], Query()] = "full",
     bus: MessageBus = Depends(get_recipes_bus),
 ) -> Any:
     """Search recipes with pagination and filtering.
@@ -36,6 +43,8 @@ async def search_recipes(
         filters: Recipe filter criteria (auto-converted from query params)
         bus: Message bus for business logic
         current_user: Current authenticated user
+        projection: "summary" returns ApiRecipeSummary items selected as plain
+            columns instead of full aggregates
         
     Returns:
         List of recipes matching filters
@@ -58,14 +67,24 @@ async def search_recipes(
             ]
     
     uow: UnitOfWork
+    if projection == "summary":
+        async with bus.uow_factory() as uow:
+            summaries = await uow.recipes.query_summaries(filters=filter_dict)
+            next_cursor = uow.recipes.next_cursor(summaries, filter_dict)
+        response_body = RecipeSummaryListTypeAdapter.dump_json(
+            [ApiRecipeSummary.from_read_model(s) for s in summaries]
+        )
+        return create_cursor_response(response_body, next_cursor)
+
     async with bus.uow_factory() as uow:
         result: list = await uow.recipes.query(filters=filter_dict)
+        next_cursor = uow.recipes.next_cursor(result, filter_dict)
     
     api_recipes = []
     for recipe in result:
-        api_recipe = ApiRecipe.from_domain(recipe)
+        api_recipe = ApiRecipe.from_domain_trusted(recipe)
         api_recipes.append(api_recipe)
     
     response_body = RecipeListTypeAdapter.dump_json(api_recipes)
     
-    return create_success_response(response_body)
+    return create_cursor_response(response_body, next_cursor)
@@ -1,6 +1,6 @@
 """Centralized Pydantic TypeAdapters for FastAPI routers."""
 
-from pydantic import TypeAdapter
+from pydantic import ConfigDict, TypeAdapter
 
 from src.contexts.products_catalog.core.adapters.api_schemas.root_aggregate.api_product import (
     ApiProduct,
@@ -11,15 +11,26 @@
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.entities.api_recipe import (
     ApiRecipe,
 )
+from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.entities.api_recipe_summary import (
+    ApiRecipeSummary,
+)
 from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.root_aggregate.api_meal import (
     ApiMeal,
 )
+from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.root_aggregate.api_meal_summary import (
+    ApiMealSummary,
+)
 from src.contexts.shared_kernel.adapters.api_schemas.value_objects.tag.api_tag import (
     ApiTag,
 )
 
-ProductListTypeAdapter = TypeAdapter(list[ApiProduct])
-MealListTypeAdapter = TypeAdapter(list[ApiMeal])
-RecipeListTypeAdapter = TypeAdapter(list[ApiRecipe])
-TagListAdapter = TypeAdapter(list[ApiTag])
-ClientListTypeAdapter = TypeAdapter(list[ApiClient])
+# Schemas are built on first use rather than at import
+_DEFERRED = ConfigDict(defer_build=True)
+
+ProductListTypeAdapter = TypeAdapter(list[ApiProduct], config=_DEFERRED)
+MealListTypeAdapter = TypeAdapter(list[ApiMeal], config=_DEFERRED)
+RecipeListTypeAdapter = TypeAdapter(list[ApiRecipe], config=_DEFERRED)
+MealSummaryListTypeAdapter = TypeAdapter(list[ApiMealSummary], config=_DEFERRED)
+RecipeSummaryListTypeAdapter = TypeAdapter(list[ApiRecipeSummary], config=_DEFERRED)
+TagListAdapter = TypeAdapter(list[ApiTag], config=_DEFERRED)
+ClientListTypeAdapter = TypeAdapter(list[ApiClient], config=_DEFERRED)
@@ -10,7 +10,7 @@
 from tests.utils.simple_counter_manager import reset_all_counters
 
 # Pytest plugins - must be at top level
-pytest_plugins = ["tests.integration_conftest"]
+pytest_plugins = ["tests.integration_conftest", "tests.utils.cold_start"]
 
 pytestmark = pytest.mark.anyio
 
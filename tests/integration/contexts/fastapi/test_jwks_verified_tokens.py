@@ -0,0 +1,168 @@
+"""
+Integration tests for async JWKS fetching and the verified-token cache.
+
+Tokens are signed with a locally generated RSA key and the JWKS document is
+served by an ``httpx.MockTransport`` stub, so validation runs end to end
+without reaching Cognito.
+"""
+
+import json
+import time
+
+import anyio
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from src.runtimes.fastapi.auth.jwks import AsyncJWKSManager, JWKSKeyNotFoundError
+from src.runtimes.fastapi.auth.jwt_validator import CognitoJWTValidator
+from src.runtimes.fastapi.auth.verified_tokens import VerifiedTokenCache
+
+pytestmark = [pytest.mark.integration, pytest.mark.anyio]
+
+REGION = "us-east-1"
+POOL_ID = "us-east-1_test"
+CLIENT_ID = "test-client"
+ISSUER = f"https://cognito-idp.{REGION}.amazonaws.com/{POOL_ID}"
+JWKS_URL = f"{ISSUER}/.well-known/jwks.json"
+
+
+class JWKSStub:
+    """Serves a mutable JWKS document and counts requests."""
+
+    def __init__(self):
+        self.keys: dict[str, rsa.RSAPrivateKey] = {}
+        self.requests = 0
+
+    def add_key(self, kid: str) -> rsa.RSAPrivateKey:
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.keys[kid] = key
+        return key
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        jwks = []
+        for kid, key in self.keys.items():
+            jwk = json.loads(RSAAlgorithm.to_jwk(key.public_key()))
+            jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+            jwks.append(jwk)
+        return httpx.Response(200, json={"keys": jwks})
+
+    def manager(self, **kwargs) -> AsyncJWKSManager:
+        return AsyncJWKSManager(
+            JWKS_URL, transport=httpx.MockTransport(self.handler), **kwargs
+        )
+
+    def sign(self, kid: str, **claims) -> str:
+        now = int(time.time())
+        payload = {
+            "sub": "user-1",
+            "iss": ISSUER,
+            "aud": CLIENT_ID,
+            "token_use": "id",
+            "iat": now,
+            "exp": now + 3600,
+            "jti": "jti-1",
+            "origin_jti": "origin-1",
+        }
+        payload.update(claims)
+        return jwt.encode(
+            payload, self.keys[kid], algorithm="RS256", headers={"kid": kid}
+        )
+
+
+@pytest.fixture
+def jwks_stub() -> JWKSStub:
+    stub = JWKSStub()
+    stub.add_key("key-1")
+    return stub
+
+
+def make_validator(manager: AsyncJWKSManager) -> CognitoJWTValidator:
+    return CognitoJWTValidator(
+        cognito_region=REGION,
+        user_pool_id=POOL_ID,
+        client_id=CLIENT_ID,
+        check_revocation=False,
+        jwks_manager=manager,
+        verified_tokens=VerifiedTokenCache(),
+    )
+
+
+async def test_prefetched_keys_validate_without_further_requests(jwks_stub):
+    manager = jwks_stub.manager()
+    await manager.prefetch()
+    validator = make_validator(manager)
+
+    claims = await validator.validate_token(jwks_stub.sign("key-1"))
+
+    assert claims.sub == "user-1"
+    assert jwks_stub.requests == 1
+
+
+async def test_unknown_kid_triggers_one_shared_refresh(jwks_stub):
+    manager = jwks_stub.manager(min_refresh_interval=0)
+    await manager.prefetch()
+    validator = make_validator(manager)
+    jwks_stub.add_key("key-2")
+    results = []
+
+    async def validate(i: int):
+        token = jwks_stub.sign("key-2", jti=f"jti-{i}")
+        results.append(await validator.validate_token(token))
+
+    async with anyio.create_task_group() as tg:
+        for i in range(10):
+            tg.start_soon(validate, i)
+
+    assert len(results) == 10
+    assert jwks_stub.requests == 2
+    assert manager.key_ids == ["key-1", "key-2"]
+
+
+async def test_kid_miss_refreshes_are_rate_limited(jwks_stub):
+    manager = jwks_stub.manager(min_refresh_interval=60)
+    await manager.prefetch()
+
+    for _ in range(3):
+        with pytest.raises(JWKSKeyNotFoundError):
+            await manager.get_signing_key("forged")
+
+    assert jwks_stub.requests == 1
+
+
+async def test_verified_claims_are_reused_for_the_same_token(jwks_stub, monkeypatch):
+    validator = make_validator(jwks_stub.manager())
+    token = jwks_stub.sign("key-1")
+    first = await validator.validate_token(token)
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("token verified twice")
+
+    monkeypatch.setattr(jwt, "decode", fail_decode)
+    second = await validator.validate_token(token)
+
+    assert second is first
+    assert validator.verified_tokens.stats()["hits"] == 1
+
+
+async def test_revocation_evicts_verified_claims(jwks_stub):
+    validator = make_validator(jwks_stub.manager())
+    token = jwks_stub.sign("key-1")
+    other = jwks_stub.sign("key-1", jti="jti-2", origin_jti="origin-2")
+    await validator.validate_token(token)
+    await validator.validate_token(other)
+
+    assert validator.verified_tokens.evict("origin-1") == 1
+    assert validator.verified_tokens.get(token) is None
+    assert validator.verified_tokens.get(other) is not None
+
+
+def test_expired_tokens_are_not_cached():
+    cache = VerifiedTokenCache()
+
+    cache.set("token", {"sub": "u1"}, exp=int(time.time()) - 1, jti="jti-1")
+
+    assert len(cache) == 0
@@ -0,0 +1,34 @@
+"""Integration tests for SQL statement counting through AsyncSession.
+
+Checks that statements issued by the async engine are attributed to the
+tracker opened by the awaiting task.
+"""
+
+import pytest
+from sqlalchemy import text
+from src.contexts.seedwork.adapters.repositories.statement_tracker import (
+    QueryBudgetExceededError,
+    track_statements,
+)
+
+pytestmark = [pytest.mark.anyio, pytest.mark.integration]
+
+
+async def test_async_session_statements_are_counted(clean_async_pg_session):
+    with track_statements("test", track_shapes=True) as tracker:
+        for value in range(3):
+            await clean_async_pg_session.execute(
+                text("SELECT :value"), {"value": value}
+            )
+
+    assert tracker.count == 3
+    assert list(tracker.repeated_shapes.values()) == [3]
+
+
+async def test_budget_is_enforced_in_strict_mode(clean_async_pg_session):
+    with (
+        pytest.raises(QueryBudgetExceededError),
+        track_statements("test", budget=1, strict=True),
+    ):
+        await clean_async_pg_session.execute(text("SELECT 1"))
+        await clean_async_pg_session.execute(text("SELECT 2"))
@@ -0,0 +1,205 @@
+"""Integration tests for the outbox dispatcher against PostgreSQL.
+
+Covers claiming with SKIP LOCKED, retries with backoff, dead-lettering and
+the capacity limiter shared with other background work.
+"""
+
+from __future__ import annotations
+
+import anyio
+import pytest
+from attrs import frozen
+from sqlalchemy import select, update
+from src.contexts.seedwork.domain.event import Event
+from src.contexts.shared_kernel.adapters.ORM.sa_models.outbox_sa_model import (
+    OutboxMessageSaModel,
+)
+from src.contexts.shared_kernel.services.outbox import (
+    Outbox,
+    OutboxDispatcher,
+    OutboxStatus,
+)
+
+pytestmark = [pytest.mark.integration, pytest.mark.anyio]
+
+
+@frozen
+class MenuTouched(Event):
+    menu_id: str
+
+
+class RecordingHandler:
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.seen: list[str] = []
+        self.__name__ = "recording_handler"
+
+    async def __call__(self, event: MenuTouched):
+        self.seen.append(event.menu_id)
+        if len(self.seen) <= self.failures:
+            raise RuntimeError("projection unavailable")
+
+
+async def stage(session_factory, outbox: Outbox, *menu_ids: str) -> None:
+    async with session_factory() as session:
+        outbox.stage(session, [MenuTouched(menu_id) for menu_id in menu_ids])
+        await session.commit()
+
+
+async def rows(session_factory) -> list[OutboxMessageSaModel]:
+    async with session_factory() as session:
+        result = await session.execute(select(OutboxMessageSaModel))
+        return list(result.scalars())
+
+
+async def make_due(session_factory) -> None:
+    async with session_factory() as session:
+        await session.execute(
+            update(OutboxMessageSaModel).values(
+                available_at=OutboxMessageSaModel.created_at
+            )
+        )
+        await session.commit()
+
+
+async def test_dispatch_runs_handlers_and_marks_rows_done(
+    async_pg_session_factory, clean_database_before_test
+):
+    handler = RecordingHandler()
+    outbox = Outbox("recipes_catalog", {MenuTouched: [handler]})
+    await stage(async_pg_session_factory, outbox, "m1", "m2")
+    dispatcher = OutboxDispatcher(async_pg_session_factory, outbox, handler_timeout=5)
+
+    assert await dispatcher.dispatch_once() == 2
+    assert await dispatcher.dispatch_once() == 0
+
+    assert sorted(handler.seen) == ["m1", "m2"]
+    assert {r.status for r in await rows(async_pg_session_factory)} == {
+        OutboxStatus.DONE.value
+    }
+
+
+async def test_failed_handler_is_retried_then_dead_lettered(
+    async_pg_session_factory, clean_database_before_test
+):
+    handler = RecordingHandler(failures=10)
+    outbox = Outbox("recipes_catalog", {MenuTouched: [handler]})
+    await stage(async_pg_session_factory, outbox, "m1")
+    dispatcher = OutboxDispatcher(
+        async_pg_session_factory, outbox, max_attempts=2, handler_timeout=5
+    )
+
+    await dispatcher.dispatch_once()
+    [row] = await rows(async_pg_session_factory)
+    assert (row.status, row.attempts) == (OutboxStatus.PENDING.value, 1)
+    assert await dispatcher.dispatch_once() == 0  # backing off
+
+    await make_due(async_pg_session_factory)
+    await dispatcher.dispatch_once()
+    [row] = await rows(async_pg_session_factory)
+    assert (row.status, row.attempts) == (OutboxStatus.DEAD.value, 2)
+    assert "projection unavailable" in row.last_error
+
+
+async def test_concurrent_dispatchers_never_claim_the_same_row(
+    async_pg_session_factory, clean_database_before_test
+):
+    handler = RecordingHandler()
+    outbox = Outbox("recipes_catalog", {MenuTouched: [handler]})
+    await stage(async_pg_session_factory, outbox, *(f"m{i}" for i in range(40)))
+    limiter = anyio.CapacityLimiter(4)
+    dispatchers = [
+        OutboxDispatcher(
+            async_pg_session_factory,
+            outbox,
+            batch_size=5,
+            limiter=limiter,
+            handler_timeout=5,
+        )
+        for _ in range(4)
+    ]
+
+    async def drain(dispatcher: OutboxDispatcher):
+        while await dispatcher.dispatch_once():
+            pass
+
+    async with anyio.create_task_group() as tg:
+        for dispatcher in dispatchers:
+            tg.start_soon(drain, dispatcher)
+
+    assert sorted(handler.seen) == sorted(f"m{i}" for i in range(40))
+
+
+async def test_rows_of_other_contexts_are_not_claimed(
+    async_pg_session_factory, clean_database_before_test
+):
+    handler = RecordingHandler()
+    await stage(
+        async_pg_session_factory,
+        Outbox("products_catalog", {MenuTouched: [handler]}),
+        "m1",
+    )
+    dispatcher = OutboxDispatcher(
+        async_pg_session_factory,
+        Outbox("recipes_catalog", {MenuTouched: [handler]}),
+        handler_timeout=5,
+    )
+
+    assert await dispatcher.dispatch_once() == 0
+    assert handler.seen == []
+
+
+async def test_reclaimed_row_counts_the_lost_run_as_an_attempt(
+    async_pg_session_factory, clean_database_before_test
+):
+    handler = RecordingHandler()
+    outbox = Outbox("recipes_catalog", {MenuTouched: [handler]})
+    await stage(async_pg_session_factory, outbox, "m1")
+    dispatcher = OutboxDispatcher(
+        async_pg_session_factory, outbox, max_attempts=2, handler_timeout=5
+    )
+
+    await dispatcher._claim()  # dispatcher dies before recording
+    await make_due(async_pg_session_factory)
+    assert await dispatcher.dispatch_once() == 1
+    [row] = await rows(async_pg_session_factory)
+    assert (row.status, row.attempts) == (OutboxStatus.DONE.value, 1)
+
+
+async def test_row_reclaimed_too_often_is_dead_lettered(
+    async_pg_session_factory, clean_database_before_test
+):
+    handler = RecordingHandler()
+    outbox = Outbox("recipes_catalog", {MenuTouched: [handler]})
+    await stage(async_pg_session_factory, outbox, "m1")
+    dispatcher = OutboxDispatcher(
+        async_pg_session_factory, outbox, max_attempts=1, handler_timeout=5
+    )
+
+    await dispatcher._claim()
+    await make_due(async_pg_session_factory)
+    assert await dispatcher.dispatch_once() == 0
+
+    assert handler.seen == []
+    [row] = await rows(async_pg_session_factory)
+    assert (row.status, row.attempts) == (OutboxStatus.DEAD.value, 1)
+
+
+async def test_limiter_wait_counts_against_the_handler_timeout(
+    async_pg_session_factory, clean_database_before_test
+):
+    handler = RecordingHandler()
+    outbox = Outbox("recipes_catalog", {MenuTouched: [handler]})
+    await stage(async_pg_session_factory, outbox, "m1")
+    limiter = anyio.CapacityLimiter(1)
+    dispatcher = OutboxDispatcher(
+        async_pg_session_factory, outbox, limiter=limiter, handler_timeout=0.1
+    )
+
+    async with limiter:
+        await dispatcher.dispatch_once()
+
+    assert handler.seen == []
+    [row] = await rows(async_pg_session_factory)
+    assert (row.status, row.attempts) == (OutboxStatus.PENDING.value, 1)
+    assert "TimeoutError" in row.last_error
@@ -0,0 +1,66 @@
+"""
+Cold-start budgets for AWS Lambda handler modules.
+
+Every module defining ``lambda_handler`` is imported in a fresh interpreter.
+Budgets are set with ``--cold-start-import-budget-ms`` and
+``--cold-start-rss-budget-mb``; run ``python -m tests.utils.cold_start`` for
+the per-module breakdown of a slow handler.
+"""
+
+import pytest
+from tests.utils.cold_start import (
+    ColdStartBudget,
+    ImportProfile,
+    discover_handler_modules,
+    parse_importtime,
+    profile_import,
+)
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+HANDLER_MODULES = discover_handler_modules()
+
+
+@pytest.mark.parametrize("module", HANDLER_MODULES)
+def test_handler_import_stays_within_cold_start_budget(module, cold_start_budget):
+    profile = profile_import(module)
+
+    problems = cold_start_budget.violations(profile)
+    assert not problems, f"{'; '.join(problems)}\n{profile.report()}"
+
+
+def test_handler_modules_are_discovered():
+    assert "src.contexts.recipes_catalog.aws_lambda.meal.fetch_meal" in HANDLER_MODULES
+    assert not any(m.endswith("api_headers") for m in HANDLER_MODULES)
+
+
+def test_importtime_output_is_parsed_per_module():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   _abc\n"
+        "import time:      4500 |       9800 | sqlalchemy\n"
+    )
+
+    imports = parse_importtime(output)
+
+    assert [i.name for i in imports] == ["_abc", "sqlalchemy"]
+    assert imports[1].self_us == 4500
+    assert imports[1].cumulative_us == 9800
+
+
+def test_budget_flags_import_time_side_effects():
+    profile = ImportProfile(
+        module="handler",
+        wall_ms=10,
+        rss_mb=1,
+        modules_loaded=5,
+        engine_created=True,
+        deferred_loaded=["pydantic_ai"],
+    )
+
+    problems = ColdStartBudget().violations(profile)
+
+    assert problems == [
+        "database engine created at import time",
+        "imported pydantic_ai at import time",
+    ]
@@ -0,0 +1,94 @@
+"""
+Performance tests for the two-tier FastAPI authentication cache.
+
+Covers per-operation cost of process-tier and request-layer lookups, the
+cost of ``invalidate_user`` as the cache grows (it must not scan), and
+O(1) prefix invalidation.
+"""
+
+import time
+
+import pytest
+
+from src.runtimes.fastapi.auth.cache import (
+    RequestScopedAuthCache,
+    UserContextCache,
+    close_request_scope,
+    open_request_scope,
+)
+
+pytestmark = [pytest.mark.performance, pytest.mark.benchmark]
+
+OPERATIONS = 50_000
+
+
+def per_op_us(fn, operations: int = OPERATIONS) -> float:
+    start = time.perf_counter()
+    for i in range(operations):
+        fn(i)
+    return (time.perf_counter() - start) / operations * 1e6
+
+
+def fill(cache: RequestScopedAuthCache, users: int) -> UserContextCache:
+    user_cache = UserContextCache(cache)
+    for i in range(users):
+        user_cache.set_user_roles(f"user{i}", ["user"])
+        user_cache.set_user_permissions(f"user{i}", ["read"])
+    return user_cache
+
+
+def test_process_tier_get_and_set_are_cheap():
+    cache = RequestScopedAuthCache(max_entries=OPERATIONS)
+
+    set_us = per_op_us(lambda i: cache.set(f"jwt_credentials:{i}", i, user_id=f"u{i}"))
+    get_us = per_op_us(lambda i: cache.get(f"jwt_credentials:{i}"))
+
+    print(f"\nprocess tier: set {set_us:.2f}us, get {get_us:.2f}us")
+    assert cache.get_stats()["hits"] == OPERATIONS
+    assert set_us < 20
+    assert get_us < 10
+
+
+def test_request_layer_serves_repeated_lookups():
+    cache = RequestScopedAuthCache()
+    cache.set("user_context:u1", "ctx", user_id="u1")
+    tokens = open_request_scope("req-1")
+    try:
+        layer_us = per_op_us(lambda i: cache.get("user_context:u1"))
+    finally:
+        close_request_scope(tokens)
+    process_us = per_op_us(lambda i: cache.get("user_context:u1"))
+
+    print(f"\nrequest layer {layer_us:.2f}us, process tier {process_us:.2f}us")
+    stats = cache.get_stats()
+    assert stats["request_hits"] == OPERATIONS - 1
+    assert layer_us < 10
+
+
+@pytest.mark.parametrize("users", [1_000, 50_000])
+def test_invalidate_user_does_not_scan(users):
+    cache = RequestScopedAuthCache(max_entries=2 * users)
+    user_cache = fill(cache, users)
+
+    start = time.perf_counter()
+    for i in range(1_000):
+        user_cache.invalidate_user(f"user{i}")
+    per_call_us = (time.perf_counter() - start) / 1_000 * 1e6
+
+    print(f"\n{users} users: invalidate_user {per_call_us:.2f}us")
+    assert cache.get_stats()["total_entries"] == 2 * (users - 1_000)
+    assert per_call_us < 50
+
+
+def test_prefix_invalidation_is_constant_time():
+    cache = RequestScopedAuthCache(max_entries=100_000)
+    fill(cache, 50_000)
+
+    start = time.perf_counter()
+    cache.invalidate_prefix("user_roles")
+    elapsed_us = (time.perf_counter() - start) * 1e6
+
+    print(f"\ninvalidate_prefix over 100k entries: {elapsed_us:.2f}us")
+    assert cache.get("user_roles:user1:fastapi") is None
+    assert cache.get("user_permissions:user1:fastapi") == ["read"]
+    assert elapsed_us < 1_000
@@ -0,0 +1,111 @@
+"""
+Per-call overhead of the products catalog port transports.
+
+The products catalog use cases are replaced by prebuilt ``ApiProduct`` read
+models so only the transport is measured: JSON encode + decode + validation
+for the serialized port, plain-value dump + validation for the in-process
+port. Measured for single lookups and 500-id batches.
+"""
+
+import time
+import uuid
+
+import pytest
+import src.contexts.products_catalog.core.internal_endpoints.products as products_catalog_api
+from src.contexts.products_catalog.core.adapters.api_schemas.root_aggregate.api_product import (
+    ApiProduct,
+)
+from src.contexts.products_catalog.core.internal_endpoints.products import (
+    fetch,
+    get_by_id,
+)
+from src.contexts.recipes_catalog.core.adapters.other_ctx_providers.products_catalog.port import (
+    InProcessProductsCatalogPort,
+    SerializedProductsCatalogPort,
+)
+
+pytestmark = [pytest.mark.anyio, pytest.mark.performance, pytest.mark.benchmark]
+
+ITERATIONS = 200
+BATCH_ITERATIONS = 20
+BATCH_SIZE = 500
+
+
+def make_api_product(i: int) -> ApiProduct:
+    return ApiProduct(
+        id=str(uuid.uuid4()),
+        source_id="taco",
+        name=f"Product {i}",
+        is_food=True,
+        barcode=f"789{i:010d}",
+        brand_id="brand-1",
+        category_id="category-1",
+        ingredients="water, salt",
+        package_size=500.0,
+    )
+
+
+@pytest.fixture
+def api_products(monkeypatch) -> list[ApiProduct]:
+    products = [make_api_product(i) for i in range(BATCH_SIZE)]
+
+    async def get_api_product(id: str) -> ApiProduct:
+        return products[0]
+
+    async def get_api_products(filters=None) -> list[ApiProduct]:
+        return products
+
+    for module in (products_catalog_api, get_by_id):
+        monkeypatch.setattr(module, "get_api_product", get_api_product)
+    for module in (products_catalog_api, fetch):
+        monkeypatch.setattr(module, "get_api_products", get_api_products)
+    return products
+
+
+async def time_calls(call, iterations: int) -> float:
+    await call()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await call()
+    return (time.perf_counter() - start) / iterations
+
+
+async def test_ports_return_equal_read_models(api_products):
+    in_process = InProcessProductsCatalogPort()
+    serialized = SerializedProductsCatalogPort()
+
+    assert await in_process.get("id") == await serialized.get("id")
+    assert await in_process.query({"id": []}) == await serialized.query({"id": []})
+
+
+async def test_single_lookup_overhead(api_products):
+    in_process = InProcessProductsCatalogPort()
+    serialized = SerializedProductsCatalogPort()
+
+    serialized_seconds = await time_calls(lambda: serialized.get("id"), ITERATIONS)
+    in_process_seconds = await time_calls(lambda: in_process.get("id"), ITERATIONS)
+
+    print(
+        f"\nsingle lookup: serialized {serialized_seconds * 1e6:.1f}us, "
+        f"in-process {in_process_seconds * 1e6:.1f}us"
+    )
+    assert in_process_seconds < serialized_seconds * 1.5
+
+
+async def test_batch_lookup_overhead(api_products):
+    in_process = InProcessProductsCatalogPort()
+    serialized = SerializedProductsCatalogPort()
+    ids = [product.id for product in api_products]
+
+    serialized_seconds = await time_calls(
+        lambda: serialized.query({"id": ids}), BATCH_ITERATIONS
+    )
+    in_process_seconds = await time_calls(
+        lambda: in_process.query({"id": ids}), BATCH_ITERATIONS
+    )
+
+    print(
+        f"\n{BATCH_SIZE}-id batch: serialized {serialized_seconds * 1000:.2f}ms, "
+        f"in-process {in_process_seconds * 1000:.2f}ms"
+    )
+    assert in_process_seconds < serialized_seconds
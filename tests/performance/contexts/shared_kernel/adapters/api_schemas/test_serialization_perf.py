@@ -8,12 +8,27 @@
 - Complex schema serialization (ApiNutriFacts): P95 < 5ms
 - Bulk serialization (100 items): P95 < 50ms
 - JSON serialization: P95 < 2ms
+- Meal list responses: trusted output (from_domain_trusted) faster than
+  validated from_domain for 50 and 500 meals
 """
 
 import json
+import statistics
 import time
+import uuid
+from datetime import UTC, datetime
 
 import pytest
+from pydantic import TypeAdapter
+from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.root_aggregate.api_meal import (
+    ApiMeal,
+)
+from src.contexts.recipes_catalog.core.domain.meal.entities.recipe import _Recipe
+from src.contexts.recipes_catalog.core.domain.meal.root_aggregate.meal import Meal
+from src.contexts.recipes_catalog.core.domain.meal.value_objects.ingredient import (
+    Ingredient,
+)
+from src.contexts.recipes_catalog.core.domain.meal.value_objects.rating import Rating
 from src.contexts.shared_kernel.adapters.api_schemas.value_objects.api_address import (
     ApiAddress,
 )
@@ -29,7 +44,7 @@
 from src.contexts.shared_kernel.adapters.api_schemas.value_objects.tag.api_tag import (
     ApiTag,
 )
-from src.contexts.shared_kernel.domain.enums import MeasureUnit, State
+from src.contexts.shared_kernel.domain.enums import MeasureUnit, Privacy, State
 from src.contexts.shared_kernel.domain.value_objects.address import Address
 from src.contexts.shared_kernel.domain.value_objects.contact_info import ContactInfo
 from src.contexts.shared_kernel.domain.value_objects.nutri_facts import NutriFacts
@@ -468,3 +483,108 @@ async def test_arithmetic_operations_performance(async_benchmark_timer, seed_dat
             await timer.measure(lambda: nutri1 - nutri2)
             await timer.measure(lambda: nutri1 * 2.0)
             await timer.measure(lambda: nutri1 / 2.0)
+
+
+MealListAdapter = TypeAdapter(list[ApiMeal])
+
+RECIPES_PER_MEAL = 3
+INGREDIENTS_PER_RECIPE = 6
+
+
+def build_domain_meal(index: int) -> Meal:
+    """Build a meal shaped like a typical query result (recipes, tags, ratings)."""
+    meal_id = uuid.uuid4().hex
+    author_id = uuid.uuid4().hex
+    timestamp = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+    recipes = []
+    for r in range(RECIPES_PER_MEAL):
+        recipe_id = uuid.uuid4().hex
+        recipes.append(
+            _Recipe(
+                id=recipe_id,
+                name=f"Recipe {index}-{r}",
+                instructions="Mix everything and bake for 30 minutes.",
+                author_id=author_id,
+                meal_id=meal_id,
+                ingredients=[
+                    Ingredient(
+                        name=f"Ingredient {i}",
+                        unit=MeasureUnit.GRAM,
+                        quantity=10.0 * (i + 1),
+                        position=i,
+                    )
+                    for i in range(INGREDIENTS_PER_RECIPE)
+                ],
+                nutri_facts=NutriFacts(
+                    calories=NutriValue(value=250.0 + r, unit=MeasureUnit.ENERGY),
+                    protein=NutriValue(value=15.0, unit=MeasureUnit.GRAM),
+                    carbohydrate=NutriValue(value=30.0, unit=MeasureUnit.GRAM),
+                    total_fat=NutriValue(value=10.0, unit=MeasureUnit.GRAM),
+                ),
+                description="A recipe used for serialization benchmarks",
+                total_time=30 + r,
+                tags={
+                    Tag(key="cuisine", value=v, author_id=author_id, type="recipe")
+                    for v in ("italian", "vegetarian")
+                },
+                privacy=Privacy.PUBLIC,
+                ratings=[
+                    Rating(
+                        user_id=uuid.uuid4().hex,
+                        recipe_id=recipe_id,
+                        taste=4,
+                        convenience=5,
+                        comment="Great",
+                    )
+                ],
+                weight_in_grams=300,
+                created_at=timestamp,
+                updated_at=timestamp,
+            )
+        )
+    return Meal(
+        id=meal_id,
+        name=f"Meal {index}",
+        author_id=author_id,
+        recipes=recipes,
+        tags={Tag(key="occasion", value="dinner", author_id=author_id, type="meal")},
+        description="A meal used for serialization benchmarks",
+        like=True,
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+
+
+def median_ms(operation, rounds: int) -> float:
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        operation()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(("count", "rounds"), [(1, 200), (50, 20), (500, 5)])
+def test_meal_list_serialization_performance(count, rounds):
+    """Compare validated and trusted domain -> JSON for a meal list response."""
+    meals = [build_domain_meal(i) for i in range(count)]
+
+    def validated():
+        MealListAdapter.dump_json([ApiMeal.from_domain(m) for m in meals])
+
+    def trusted():
+        MealListAdapter.dump_json([ApiMeal.from_domain_trusted(m) for m in meals])
+
+    # Warmup (schema build, domain property caches)
+    validated()
+    trusted()
+
+    validated_ms = median_ms(validated, rounds)
+    trusted_ms = median_ms(trusted, rounds)
+    print(
+        f"\n{count} meals: validated {validated_ms:.2f}ms, "
+        f"trusted {trusted_ms:.2f}ms ({validated_ms / trusted_ms:.1f}x)"
+    )
+    if count >= 50:
+        assert trusted_ms < validated_ms
@@ -0,0 +1,136 @@
+"""Throughput benchmarks for the development and production logging profiles.
+
+Both profiles write into an in-memory stream so the numbers measure the
+pipeline, not the terminal. Production time includes `flush_logs()`, i.e.
+every record is written by the listener thread before the clock stops.
+"""
+
+import io
+import json
+import logging
+import time
+
+import pytest
+import structlog
+from src.logging import logger as logger_module
+from src.logging.logger import configure_logging, flush_logs
+
+pytestmark = [pytest.mark.performance, pytest.mark.benchmark]
+
+RECORDS = 5_000
+FILTERED_CALLS = 50_000
+LOGGER_NAME = "benchmark.pipeline"
+
+
+@pytest.fixture
+def use_profile():
+    def configure(profile: str, level: str = "INFO") -> io.StringIO:
+        configure_logging(level, profile=profile)
+        # The autouse suppress_logs fixture raises every logger created by an
+        # earlier test (and its parents) to CRITICAL
+        for name in ("benchmark", LOGGER_NAME):
+            logging.getLogger(name).setLevel(logging.NOTSET)
+        sink = io.StringIO()
+        if profile == "production":
+            handler = logger_module._listener.handlers[0]
+        else:
+            handler = logging.getLogger().handlers[0]
+        handler.setStream(sink)
+        return sink
+
+    yield configure
+    configure_logging()
+
+
+def emit_info(records: int) -> float:
+    log = structlog.get_logger(LOGGER_NAME)
+    start = time.perf_counter()
+    for i in range(records):
+        log.info(
+            "Query executed",
+            action="query",
+            entity="meal",
+            rows=i,
+            duration_ms=12.5,
+        )
+    flush_logs()
+    return time.perf_counter() - start
+
+
+def emit_filtered_debug(calls: int) -> float:
+    log = structlog.get_logger(LOGGER_NAME)
+    start = time.perf_counter()
+    for i in range(calls):
+        log.debug("[query_steps] Applying filters", step="filters", index=i)
+    return time.perf_counter() - start
+
+
+def test_production_profile_outpaces_development(use_profile):
+    use_profile("development")
+    development_s = emit_info(RECORDS)
+
+    sink = use_profile("production")
+    production_s = emit_info(RECORDS)
+
+    print(
+        f"\n{RECORDS} INFO records: development {RECORDS / development_s:,.0f}/s, "
+        f"production {RECORDS / production_s:,.0f}/s"
+    )
+    assert len(sink.getvalue().splitlines()) == RECORDS
+    assert production_s < development_s
+
+
+def test_disabled_debug_calls_are_filtered_before_processing(use_profile):
+    use_profile("development")
+    development_s = emit_filtered_debug(FILTERED_CALLS)
+
+    sink = use_profile("production")
+    production_s = emit_filtered_debug(FILTERED_CALLS)
+
+    print(
+        f"\n{FILTERED_CALLS} filtered DEBUG calls: "
+        f"development {development_s / FILTERED_CALLS * 1e6:.2f}us/call, "
+        f"production {production_s / FILTERED_CALLS * 1e6:.2f}us/call"
+    )
+    assert sink.getvalue() == ""
+    assert production_s < development_s
+
+
+def test_production_records_are_single_line_json_with_debug_callsites(use_profile):
+    sink = use_profile("production", level="DEBUG")
+    log = structlog.get_logger(LOGGER_NAME)
+
+    log.info("Meal fetched", meal_id="abc")
+    log.debug("[sql] Built statement")
+    flush_logs()
+
+    info, debug = (json.loads(line) for line in sink.getvalue().splitlines())
+    assert info["event"] == "Meal fetched"
+    assert info["meal_id"] == "abc"
+    assert "lineno" not in info
+    assert debug["func_name"] == (
+        "test_production_records_are_single_line_json_with_debug_callsites"
+    )
+
+
+def test_production_records_carry_logger_name_and_structured_tracebacks(
+    use_profile,
+):
+    sink = use_profile("production")
+    log = structlog.get_logger(LOGGER_NAME)
+
+    try:
+        raise ValueError("bad meal")
+    except ValueError:
+        log.error("Meal update failed", exc_info=True)
+    flush_logs()
+
+    (record,) = (json.loads(line) for line in sink.getvalue().splitlines())
+    assert record["logger"] == LOGGER_NAME
+    assert "exc_info" not in record
+    (exception,) = record["exception"]
+    assert (exception["exc_type"], exception["exc_value"]) == (
+        "ValueError",
+        "bad meal",
+    )
+    assert "locals" not in exception["frames"][-1]
@@ -0,0 +1,90 @@
+"""
+Cold vs warm Lambda invocation latency against a local PostgreSQL.
+
+"Cold" reproduces the previous per-invocation ``anyio.run``: a new event
+loop, so a new engine and a fresh connection (connect, TLS, auth) every
+time. "Warm" runs invocations on the persistent :class:`LambdaRuntime` loop
+with the Lambda engine profile, reusing the pooled connection.
+"""
+
+import time
+
+import anyio
+import pytest
+from sqlalchemy import text
+from src.contexts.shared_kernel.middleware.lambda_runtime import LambdaRuntime
+from src.db.fastapi_database import FastAPIDatabase
+
+pytestmark = [pytest.mark.performance, pytest.mark.benchmark, pytest.mark.integration]
+
+INVOCATIONS = 30
+
+
+async def query_once(database: FastAPIDatabase) -> None:
+    async with database.async_session_factory() as session:
+        await session.execute(text("SELECT 1"))
+
+
+def mean_ms(samples: list[float]) -> float:
+    return sum(samples) / len(samples) * 1000
+
+
+def test_warm_invocations_reuse_pooled_connections():
+    cold: list[float] = []
+    for _ in range(INVOCATIONS):
+        start = time.perf_counter()
+
+        async def cold_invocation():
+            database = FastAPIDatabase(profile="lambda")
+            try:
+                await query_once(database)
+            finally:
+                await database._engine.dispose()
+
+        anyio.run(cold_invocation)
+        cold.append(time.perf_counter() - start)
+
+    database = FastAPIDatabase(profile="lambda")
+    runtime = LambdaRuntime(on_thaw=None)
+    warm: list[float] = []
+    try:
+        runtime.run(query_once, database)  # container init
+        for _ in range(INVOCATIONS):
+            start = time.perf_counter()
+            runtime.run(query_once, database)
+            warm.append(time.perf_counter() - start)
+        runtime.run(database._engine.dispose)
+    finally:
+        runtime.close()
+
+    cold_ms, warm_ms = mean_ms(cold), mean_ms(warm)
+    print(f"\ncold {cold_ms:.2f}ms, warm {warm_ms:.2f}ms per invocation")
+    assert warm_ms < cold_ms
+
+
+def test_revalidate_replaces_connections_closed_while_frozen():
+    database = FastAPIDatabase(profile="lambda")
+    admin = FastAPIDatabase(profile="fastapi")
+    runtime = LambdaRuntime(on_thaw=None)
+
+    async def kill_pooled_connections():
+        # What an idle timeout on the server or a proxy does to a frozen
+        # container's connections
+        async with admin._engine.connect() as conn:
+            await conn.execute(
+                text(
+                    "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                    "WHERE application_name = 'lambda_app'"
+                )
+            )
+        await admin._engine.dispose()
+
+    try:
+        runtime.run(query_once, database)
+        runtime.run(kill_pooled_connections)
+        assert runtime.run(database.revalidate) is False
+        runtime.run(query_once, database)
+        assert runtime.run(database.revalidate) is True
+        runtime.run(database._engine.dispose)
+    finally:
+        runtime.close()
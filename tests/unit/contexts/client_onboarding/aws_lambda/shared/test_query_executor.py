@@ -0,0 +1,96 @@
+"""Unit tests for the shared response query executor.
+
+Verifies that pagination, totals and response counts come from the
+repositories' aggregated queries instead of in-memory slicing.
+"""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.contexts.client_onboarding.aws_lambda.shared.query_executor import (
+    execute_query,
+)
+from src.contexts.client_onboarding.core.adapters.api_schemas.queries.response_queries import (
+    QueryType,
+    ResponseQueryRequest,
+)
+from src.contexts.client_onboarding.core.domain.models.onboarding_form import (
+    OnboardingFormStatus,
+)
+
+pytestmark = [pytest.mark.anyio, pytest.mark.unit]
+
+NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def make_form(form_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=form_id,
+        typeform_id=f"tf-{form_id}",
+        status=OnboardingFormStatus.ACTIVE,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def make_response(response_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=response_id,
+        response_id=f"r-{response_id}",
+        form_id=1,
+        client_identifiers=None,
+        submitted_at=NOW,
+        processed_at=NOW,
+        response_data={"answers": []},
+    )
+
+
+@pytest.fixture
+def uow():
+    fake = MagicMock()
+    fake.onboarding_forms = MagicMock()
+    fake.form_responses = MagicMock()
+    return fake
+
+
+async def test_forms_by_user_uses_aggregated_counts(uow):
+    uow.onboarding_forms.count_by_user_id = AsyncMock(return_value=7)
+    uow.onboarding_forms.get_page_with_response_counts_by_user_id = AsyncMock(
+        return_value=[(make_form(1), 3), (make_form(2), 0)]
+    )
+    uow.form_responses.get_by_form_id = AsyncMock()
+    query = ResponseQueryRequest(
+        query_type=QueryType.FORMS_BY_USER, user_id="u1", offset=2, limit=2
+    )
+
+    result = await execute_query(query, uow, MagicMock())
+
+    assert result.success
+    assert result.total_count == 7
+    assert [f.response_count for f in result.forms] == [3, 0]
+    assert result.pagination["has_more"] is True
+    uow.onboarding_forms.get_page_with_response_counts_by_user_id.assert_awaited_once_with(
+        "u1", offset=2, limit=2
+    )
+    uow.form_responses.get_by_form_id.assert_not_called()
+
+
+async def test_responses_by_user_is_paginated_in_sql(uow):
+    uow.form_responses.count_by_user_id = AsyncMock(return_value=1)
+    uow.form_responses.get_page_by_user_id = AsyncMock(
+        return_value=[make_response(1)]
+    )
+    query = ResponseQueryRequest(
+        query_type=QueryType.RESPONSES_BY_USER, user_id="u1", limit=50
+    )
+
+    result = await execute_query(query, uow, MagicMock())
+
+    assert result.success
+    assert result.total_count == 1
+    assert result.responses[0].response_data is None
+    uow.form_responses.get_page_by_user_id.assert_awaited_once_with(
+        "u1", offset=0, limit=50, include_response_data=False
+    )
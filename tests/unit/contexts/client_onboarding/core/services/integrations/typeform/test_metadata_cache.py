@@ -0,0 +1,155 @@
+"""Unit tests for the TypeForm form/webhook metadata cache.
+
+Runs the TypeForm client against a local fake TypeForm server that answers
+``If-None-Match`` with 304 to cover TTL hits, ETag revalidation and
+invalidation on webhook writes.
+"""
+
+from __future__ import annotations
+
+import anyio
+import httpx
+import pytest
+from src.contexts.client_onboarding.core.services.integrations.typeform.client import (
+    TypeFormClient,
+)
+from src.contexts.client_onboarding.core.services.integrations.typeform.metadata_cache import (
+    TypeFormMetadataCache,
+)
+from src.contexts.client_onboarding.core.services.integrations.typeform.scheduler import (
+    RequestScheduler,
+    TokenBucket,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.anyio]
+
+
+class FakeTypeformServer:
+    """Serves one webhook per form, versioned by an ETag."""
+
+    def __init__(self):
+        self.version = 1
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        _, _, form_id, _, tag = request.url.path.split("/")
+        if request.method == "DELETE":
+            self.version += 1
+            return httpx.Response(204)
+        etag = f'"v{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(
+            200,
+            headers={"ETag": etag},
+            json={
+                "id": f"wh-{form_id}-v{self.version}",
+                "form_id": form_id,
+                "tag": tag,
+                "url": "https://example.com/webhook",
+                "enabled": True,
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+                "verify_ssl": True,
+            },
+        )
+
+
+def make_client(
+    server: FakeTypeformServer, cache: TypeFormMetadataCache, api_key: str = "key-a"
+) -> TypeFormClient:
+    client = TypeFormClient(
+        api_key=api_key,
+        base_url="https://api.typeform.test",
+        transport=httpx.MockTransport(server),
+    )
+    client.scheduler = RequestScheduler(TokenBucket(1000, 100))
+    client.metadata_cache = cache
+    return client
+
+
+async def test_fresh_entry_is_served_without_a_request():
+    server = FakeTypeformServer()
+    cache = TypeFormMetadataCache(ttl=60)
+    client = make_client(server, cache)
+
+    first = await client.get_webhook("form1", "client_onboarding")
+    second = await client.get_webhook("form1", "client_onboarding")
+
+    assert first == second
+    assert len(server.requests) == 1
+    assert cache.stats()["hits"] == 1
+
+
+async def test_expired_entry_is_revalidated_with_its_etag():
+    server = FakeTypeformServer()
+    cache = TypeFormMetadataCache(ttl=0.01)
+    client = make_client(server, cache)
+
+    first = await client.get_webhook("form1", "client_onboarding")
+    await anyio.sleep(0.02)
+    second = await client.get_webhook("form1", "client_onboarding")
+
+    assert second == first
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+    assert cache.stats()["revalidated"] == 1
+
+
+async def test_webhook_delete_invalidates_the_form():
+    server = FakeTypeformServer()
+    cache = TypeFormMetadataCache(ttl=60)
+    client = make_client(server, cache)
+
+    await client.get_webhook("form1", "client_onboarding")
+    await client.get_webhook("form2", "client_onboarding")
+    await client.delete_webhook("form1", "client_onboarding")
+    refreshed = await client.get_webhook("form1", "client_onboarding")
+    await client.get_webhook("form2", "client_onboarding")
+
+    assert refreshed.id == "wh-form1-v2"
+    assert [r.method for r in server.requests] == ["GET", "GET", "DELETE", "GET"]
+
+
+async def test_entries_are_scoped_per_api_key():
+    server = FakeTypeformServer()
+    cache = TypeFormMetadataCache(ttl=60)
+
+    await make_client(server, cache, "key-a").get_webhook("form1", "client_onboarding")
+    await make_client(server, cache, "key-b").get_webhook("form1", "client_onboarding")
+
+    assert len(server.requests) == 2
+
+
+def test_load_racing_an_invalidation_is_not_stored():
+    cache = TypeFormMetadataCache(ttl=60)
+    generation = cache.generation()
+
+    cache.invalidate_form("scope", "form1")
+    cache.store("scope", "forms/form1", {"id": "form1"}, None, generation)
+
+    assert cache.lookup("scope", "forms/form1") is None
+
+
+def test_invalidation_records_are_bounded():
+    cache = TypeFormMetadataCache(max_entries=2, ttl=60)
+    generation = cache.generation()
+
+    for form_id in ("a", "b", "c"):
+        cache.invalidate_form("scope", form_id)
+    cache.store("scope", "forms/a", {"id": "a"}, None, generation)
+    cache.store("scope", "forms/d", {"id": "d"}, None, cache.generation())
+
+    assert len(cache._invalidated) == 2
+    assert cache.lookup("scope", "forms/a") is None
+    assert cache.lookup("scope", "forms/d") is not None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TypeFormMetadataCache(max_entries=2, ttl=60)
+    for form_id in ("a", "b", "c"):
+        cache.store("scope", f"forms/{form_id}", {"id": form_id}, None, 0)
+
+    assert cache.lookup("scope", "forms/a") is None
+    assert cache.lookup("scope", "forms/c") is not None
+    assert cache.stats()["evictions"] == 1
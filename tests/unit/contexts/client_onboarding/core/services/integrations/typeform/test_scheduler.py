@@ -0,0 +1,229 @@
+"""Unit tests for TypeForm request scheduling.
+
+Runs the TypeForm client against a local fake TypeForm server (an httpx
+mock transport with simulated latency and rate limiting) to cover token
+bucket pacing, Retry-After backoff, coalescing of identical GETs and the
+concurrent bulk webhook status check.
+"""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import anyio
+import httpx
+import pytest
+from src.contexts.client_onboarding.core.domain.models.onboarding_form import (
+    OnboardingFormStatus,
+)
+from src.contexts.client_onboarding.core.services.integrations.typeform.client import (
+    TypeFormClient,
+)
+from src.contexts.client_onboarding.core.services.integrations.typeform.metadata_cache import (
+    TypeFormMetadataCache,
+)
+from src.contexts.client_onboarding.core.services.integrations.typeform.scheduler import (
+    RequestScheduler,
+    TokenBucket,
+    get_token_bucket,
+)
+from src.contexts.client_onboarding.core.services.webhooks.manager import (
+    WebhookManager,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.anyio]
+
+WEBHOOK_URL = "https://example.com/webhook"
+
+
+class FakeTypeformServer:
+    """Serves `GET forms/{id}/webhooks/{tag}` with a fixed latency."""
+
+    def __init__(self, latency: float = 0.0, rate_limited: int = 0, retry_after: str = "0"):
+        self.latency = latency
+        self.rate_limited = rate_limited
+        self.retry_after = retry_after
+        self.requests: list[tuple[float, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failing_forms: set[str] = set()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((time.monotonic(), request.url.path))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await anyio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        if self.rate_limited:
+            self.rate_limited -= 1
+            return httpx.Response(
+                429,
+                headers={"Retry-After": self.retry_after},
+                json={"message": "Too many requests"},
+            )
+        _, _, form_id, _, tag = request.url.path.split("/")
+        if form_id in self.failing_forms:
+            return httpx.Response(500, json={"message": "boom"})
+        return httpx.Response(
+            200,
+            json={
+                "id": f"wh-{form_id}",
+                "form_id": form_id,
+                "tag": tag,
+                "url": WEBHOOK_URL,
+                "enabled": True,
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+                "verify_ssl": True,
+            },
+        )
+
+
+def make_client(
+    server: FakeTypeformServer,
+    *,
+    rate: float = 100.0,
+    burst: float = 100.0,
+    max_concurrency: int = 4,
+) -> TypeFormClient:
+    client = TypeFormClient(
+        api_key="test-api-key",
+        base_url="https://api.typeform.test",
+        transport=httpx.MockTransport(server),
+    )
+    client.scheduler = RequestScheduler(
+        TokenBucket(rate, burst), max_concurrency=max_concurrency, base_backoff=0.01
+    )
+    # Every request must reach the fake server
+    client.metadata_cache = TypeFormMetadataCache(ttl=0)
+    return client
+
+
+class FakeUnitOfWork:
+    def __init__(self, forms):
+        self.onboarding_forms = SimpleNamespace(get_by_user_id=self._get_by_user_id)
+        self._forms = forms
+
+    async def _get_by_user_id(self, user_id: str):
+        return list(self._forms)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+def make_form(index: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=index,
+        typeform_id=f"form{index}",
+        status=OnboardingFormStatus.ACTIVE,
+        webhook_url=WEBHOOK_URL,
+    )
+
+
+async def test_token_bucket_paces_acquisitions_after_the_burst():
+    bucket = TokenBucket(rate=50, capacity=2)
+
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+
+    # 2 tokens up front, then 4 more at 20ms intervals
+    assert time.monotonic() - start >= 0.07
+    assert bucket.acquired == 6
+
+
+async def test_token_bucket_is_shared_per_api_key():
+    assert get_token_bucket("key-a", 2, 2) is get_token_bucket("key-a", 2, 2)
+    assert get_token_bucket("key-a", 2, 2) is not get_token_bucket("key-b", 2, 2)
+
+
+async def test_paused_bucket_holds_every_caller_until_retry_after():
+    bucket = TokenBucket(rate=1000, capacity=10)
+    bucket.pause(0.05)
+
+    start = time.monotonic()
+    await bucket.acquire()
+
+    assert time.monotonic() - start >= 0.045
+
+
+async def test_rate_limited_request_is_retried_after_retry_after():
+    server = FakeTypeformServer(rate_limited=1, retry_after="0.05")
+    client = make_client(server)
+
+    webhook = await client.get_webhook("form1", "client_onboarding")
+
+    assert webhook.form_id == "form1"
+    assert client.scheduler.retries == 1
+    (first, _), (second, _) = server.requests
+    assert second - first >= 0.045
+
+
+async def test_identical_in_flight_gets_share_one_request():
+    server = FakeTypeformServer(latency=0.05)
+    client = make_client(server)
+    results = []
+
+    async def fetch():
+        results.append(await client.get_webhook("form1", "client_onboarding"))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(fetch)
+
+    assert len(server.requests) == 1
+    assert client.scheduler.coalesced == 2
+    assert [w.id for w in results] == ["wh-form1"] * 3
+
+
+async def test_bulk_status_check_fans_out_within_concurrency_limit():
+    server = FakeTypeformServer(latency=0.1)
+    client = make_client(server, max_concurrency=4)
+    forms = [make_form(i) for i in range(8)]
+    manager = WebhookManager(typeform_client=client)
+
+    start = time.monotonic()
+    statuses = await manager.bulk_webhook_status_check(
+        lambda: FakeUnitOfWork(forms), "user-1"
+    )
+    elapsed = time.monotonic() - start
+
+    # Two waves of four instead of eight sequential round trips
+    assert elapsed < 0.5
+    assert server.max_in_flight == 4
+    assert [s.onboarding_form_id for s in statuses] == list(range(8))
+    assert all(s.webhook_exists and s.status_synchronized for s in statuses)
+
+
+async def test_bulk_status_check_is_paced_by_the_rate_limit():
+    server = FakeTypeformServer()
+    client = make_client(server, rate=20, burst=1, max_concurrency=8)
+    forms = [make_form(i) for i in range(5)]
+    manager = WebhookManager(typeform_client=client)
+
+    start = time.monotonic()
+    await manager.bulk_webhook_status_check(lambda: FakeUnitOfWork(forms), "user-1")
+
+    # N / rate: four 50ms intervals after the first request
+    assert time.monotonic() - start >= 0.19
+
+
+async def test_bulk_status_check_reports_failures_per_form():
+    server = FakeTypeformServer()
+    server.failing_forms = {"form1"}
+    client = make_client(server)
+    forms = [make_form(i) for i in range(3)]
+    manager = WebhookManager(typeform_client=client)
+
+    statuses = await manager.bulk_webhook_status_check(
+        lambda: FakeUnitOfWork(forms), "user-1"
+    )
+
+    assert [s.webhook_exists for s in statuses] == [True, False, True]
+    assert any("Error checking webhook status" in i for i in statuses[1].issues)
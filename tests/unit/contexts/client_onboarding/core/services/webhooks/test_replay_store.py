@@ -0,0 +1,105 @@
+"""Unit tests for webhook replay-protection stores."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+
+import anyio
+import pytest
+from src.contexts.client_onboarding.core.services.webhooks.replay_store import (
+    InMemoryFingerprintStore,
+    InMemoryReplayStore,
+    SharedReplayStore,
+)
+from src.contexts.client_onboarding.core.services.webhooks.security import (
+    WebhookSecurityVerifier,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.anyio]
+
+SECRET = "test-webhook-secret-0123456789"
+
+
+def signed_headers(payload: str) -> dict[str, str]:
+    digest = hmac.new(
+        SECRET.encode(), (payload + "\n").encode(), hashlib.sha256
+    ).digest()
+    return {"Typeform-Signature": "sha256=" + base64.b64encode(digest).decode()}
+
+
+async def test_fingerprint_is_a_replay_within_its_ttl():
+    store = InMemoryReplayStore()
+
+    assert await store.seen_or_add("fp", 60) is False
+    assert await store.seen_or_add("fp", 60) is True
+    assert store.stats()["replays"] == 1
+
+
+async def test_expired_fingerprints_are_purged():
+    store = InMemoryReplayStore()
+    for i in range(10):
+        await store.add(f"old{i}", 0.01)
+    await anyio.sleep(0.02)
+
+    assert await store.seen_or_add("new", 60) is False
+    assert len(store) == 1
+    assert store.stats()["expired"] == 10
+
+
+async def test_store_evicts_least_recently_seen_fingerprints_when_full():
+    store = InMemoryReplayStore(max_entries=3)
+    await store.add("short", 10)
+    await store.add("long1", 100)
+    await store.add("long2", 100)
+
+    await store.add("long3", 100)
+
+    assert len(store) == 3
+    assert await store.seen_or_add("short", 10) is False
+    assert store.stats()["evictions"] >= 1
+
+
+async def test_re_adding_a_fingerprint_extends_it():
+    store = InMemoryReplayStore()
+    await store.add("fp", 0.01)
+    for _ in range(500):
+        await store.add("fp", 60)
+    await anyio.sleep(0.02)
+
+    assert len(store) == 1
+    assert await store.seen_or_add("fp", 60) is True
+
+
+async def test_workers_sharing_a_backend_see_each_others_fingerprints():
+    backend = InMemoryFingerprintStore()
+    worker_a = SharedReplayStore(backend)
+    worker_b = SharedReplayStore(backend)
+
+    assert await worker_a.seen_or_add("fp", 60) is False
+    assert await worker_b.seen_or_add("fp", 60) is True
+
+
+async def test_verifier_rejects_a_replayed_request():
+    verifier = WebhookSecurityVerifier(SECRET, replay_store=InMemoryReplayStore())
+    payload = '{"event_id": "1"}'
+    headers = signed_headers(payload)
+
+    assert await verifier.verify_webhook_request(payload, headers) == (True, None)
+    is_valid, error = await verifier.verify_webhook_request(payload, headers)
+
+    assert is_valid is False
+    assert error == "Potential replay attack detected"
+
+
+async def test_replay_is_detected_across_verifiers_sharing_a_store():
+    backend = InMemoryFingerprintStore()
+    payload = '{"event_id": "2"}'
+    headers = signed_headers(payload)
+
+    first = WebhookSecurityVerifier(SECRET, replay_store=SharedReplayStore(backend))
+    second = WebhookSecurityVerifier(SECRET, replay_store=SharedReplayStore(backend))
+
+    assert (await first.verify_webhook_request(payload, headers))[0] is True
+    assert (await second.verify_webhook_request(payload, headers))[0] is False
@@ -0,0 +1,36 @@
+"""Unit tests for incremental product dump reading."""
+
+import json
+
+import pytest
+from src.contexts.products_catalog.core.adapters.json_record_stream import (
+    iter_json_records,
+)
+
+pytestmark = pytest.mark.unit
+
+RECORDS = [{"id": i, "name": f"product {i}", "values": [1.5, i]} for i in range(50)]
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 1 << 16])
+def test_json_array_is_read_incrementally(tmp_path, read_size):
+    path = tmp_path / "taco.json"
+    path.write_text(json.dumps(RECORDS, indent=2))
+
+    assert list(iter_json_records(str(path), read_size=read_size)) == RECORDS
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 1 << 16])
+def test_ndjson_is_read_line_by_line(tmp_path, read_size):
+    path = tmp_path / "taco.ndjson"
+    path.write_text("\n".join(json.dumps(r) for r in RECORDS) + "\n\n")
+
+    assert list(iter_json_records(str(path), read_size=read_size)) == RECORDS
+
+
+def test_truncated_array_raises(tmp_path):
+    path = tmp_path / "taco.json"
+    path.write_text('[{"id": 1}, {"id": ')
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_records(str(path)))
@@ -0,0 +1,119 @@
+"""Unit tests for product kwargs extraction: traversal and chunked streaming."""
+
+import json
+
+import pytest
+from src.contexts.products_catalog.core.adapters.product_kwargs_extractor import (
+    ProductKwargsExtractor,
+    normalize_records,
+    traverse,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def private_record(i: int) -> dict:
+    return {
+        "name": f"Milk {i}",
+        "category": "dairy",
+        "parent_category": "drinks",
+        "brands": "Acme",
+        "barcode": f"789{i}",
+        "ingredients_text": "milk",
+        "package_size": "1",
+        "package_size_unit": "l",
+        "score": {"final": 80, "ingredients": 70, "nutrients": 90},
+        "nutrition_facts": {"serving_size": 200, "calories": 120, "protein": 6},
+    }
+
+
+class TestTraverse:
+    def test_reads_nested_value_without_consuming_keys(self):
+        keys = ["a", "b"]
+
+        assert traverse(keys=keys, type=float, data={"a": {"b": "2"}}) == 2.0
+        assert traverse(keys=keys, type=float, data={"a": {"b": "3"}}) == 3.0
+        assert keys == ["a", "b"]
+
+    def test_missing_numeric_value_defaults_to_zero(self):
+        keys = ["a", "missing"]
+
+        assert traverse(keys=keys, type=float, data={"a": {"b": 1}}) == 0
+        assert keys == ["a", "missing"]
+
+    def test_missing_text_value_raises_without_consuming_keys(self):
+        keys = ["a", "missing", "c"]
+
+        with pytest.raises(Exception, match=r"\['c'\]"):
+            traverse(keys=keys, type=str, data={"a": {"b": "x"}})
+        assert keys == ["a", "missing", "c"]
+
+    def test_accepts_tuple_keys(self):
+        assert traverse(keys=("a",), type=str, data={"a": "text"}) == "text"
+
+    def test_divides_by_normalizer(self):
+        value = traverse(
+            keys=["a"], type=float, data={"a": "50"}, nutri_fact_value_normalizer=0.5
+        )
+
+        assert value == 100.0
+
+
+class TestProductKwargsExtractor:
+    def test_chunks_are_produced_lazily(self):
+        read = []
+
+        def records():
+            for i in range(5):
+                read.append(i)
+                yield {"id": i}
+
+        extractor = ProductKwargsExtractor(
+            records(), lambda data: {"id": data["id"], "score": {"final": 0}}
+        )
+        chunks = extractor.iter_chunks(2)
+
+        first = next(chunks)
+
+        assert read == [0, 1]
+        assert first[0] == {"id": 0, "score": None, "json_data": '{"id": 0}'}
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+
+    def test_chunks_match_kwargs(self):
+        records = [private_record(i) for i in range(5)]
+
+        chunks = ProductKwargsExtractor.from_private(records).iter_chunks(2)
+
+        assert [kwargs for chunk in chunks for kwargs in chunk] == (
+            ProductKwargsExtractor.from_private(records).kwargs
+        )
+
+    def test_private_record_is_normalized_per_100g(self):
+        record = private_record(1)
+
+        (kwargs,) = ProductKwargsExtractor.from_private([record]).kwargs
+
+        assert kwargs["name"] == "Milk 1"
+        assert kwargs["barcode"] == "7891"
+        assert kwargs["nutri_facts"]["calories"] == 60.0
+        assert kwargs["nutri_facts"]["protein"] == 3.0
+        assert kwargs["json_data"] == json.dumps(record, ensure_ascii=False)
+
+    def test_stream_path_reads_ndjson_and_infers_source(self, tmp_path):
+        path = tmp_path / "private_dump.ndjson"
+        path.write_text("\n".join(json.dumps(private_record(i)) for i in range(3)))
+
+        extractor = ProductKwargsExtractor.stream_path(str(path))
+
+        assert [kwargs["name"] for kwargs in extractor.iter_kwargs()] == [
+            "Milk 0",
+            "Milk 1",
+            "Milk 2",
+        ]
+
+    def test_normalize_records_matches_extractor(self):
+        records = [private_record(i) for i in range(3)]
+
+        assert normalize_records("private", records) == (
+            ProductKwargsExtractor.from_private(records).kwargs
+        )
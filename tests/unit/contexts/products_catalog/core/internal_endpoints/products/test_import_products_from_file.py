@@ -0,0 +1,111 @@
+"""Unit tests for the streaming product importer's batching and progress."""
+
+import json
+
+import pytest
+from src.contexts.products_catalog.core.domain.commands.products.add_food_product_bulk import (
+    AddFoodProductBulk,
+)
+from src.contexts.products_catalog.core.internal_endpoints.products import (
+    import_products_from_file as importer,
+)
+from src.contexts.products_catalog.core.internal_endpoints.products.import_products_from_file import (
+    import_products_from_file,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.anyio]
+
+
+class FakeBus:
+    def __init__(self, fail_on_batch: int | None = None):
+        self.cmds: list[AddFoodProductBulk] = []
+        self.fail_on_batch = fail_on_batch
+
+    async def handle(self, cmd: AddFoodProductBulk) -> None:
+        if len(self.cmds) + 1 == self.fail_on_batch:
+            raise RuntimeError("batch failed")
+        self.cmds.append(cmd)
+
+
+def fake_normalize(source: str, records) -> list[dict]:
+    return [
+        {"source_id": source, "name": r["name"], "nutri_facts": None, "extra": 1}
+        for r in records
+    ]
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    bus = FakeBus()
+
+    class FakeContainer:
+        def bootstrap(self):
+            return bus
+
+    monkeypatch.setattr(importer, "Container", FakeContainer)
+    monkeypatch.setattr(importer, "normalize_records", fake_normalize)
+    return bus
+
+
+@pytest.fixture
+def dump(tmp_path):
+    path = tmp_path / "private_dump.ndjson"
+    path.write_text("\n".join(json.dumps({"name": f"p{i}"}) for i in range(5)))
+    return str(path)
+
+
+def names(bus: FakeBus) -> list[list[str]]:
+    return [[c.name for c in cmd.add_product_cmds] for cmd in bus.cmds]
+
+
+async def test_persists_one_command_per_batch_and_reports_progress(bus, dump):
+    reported = []
+
+    progress = await import_products_from_file(
+        dump,
+        batch_size=2,
+        on_progress=lambda p: reported.append((p.batches, p.products_added)),
+    )
+
+    assert names(bus) == [["p0", "p1"], ["p2", "p3"], ["p4"]]
+    assert {c.source_id for cmd in bus.cmds for c in cmd.add_product_cmds} == {
+        "private"
+    }
+    assert (progress.records_read, progress.products_added, progress.batches) == (
+        5,
+        5,
+        3,
+    )
+    assert reported == [(1, 2), (2, 4), (3, 5)]
+    assert progress.products_per_second > 0
+
+
+async def test_explicit_source_overrides_file_name(bus, dump):
+    await import_products_from_file(dump, "taco", batch_size=10)
+
+    assert bus.cmds[0].add_product_cmds[0].source_id == "taco"
+
+
+async def test_worker_batches_keep_file_order(bus, dump, monkeypatch):
+    calls = []
+
+    async def run_sync(func, *args, limiter=None):
+        calls.append(len(args[1]))
+        return func(*args)
+
+    monkeypatch.setattr(importer.anyio.to_process, "run_sync", run_sync)
+
+    progress = await import_products_from_file(dump, batch_size=2, workers=2)
+
+    assert calls == [2, 2, 1]
+    assert names(bus) == [["p0", "p1"], ["p2", "p3"], ["p4"]]
+    assert progress.batches == 3
+
+
+async def test_failed_batch_stops_the_import(bus, dump):
+    bus.fail_on_batch = 2
+
+    with pytest.raises(RuntimeError):
+        await import_products_from_file(dump, batch_size=2)
+
+    assert names(bus) == [["p0", "p1"]]
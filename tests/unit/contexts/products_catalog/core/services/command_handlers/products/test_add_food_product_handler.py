@@ -0,0 +1,129 @@
+"""Unit tests for the bulk add food product handler's barcode checks."""
+
+import pytest
+from src.contexts.products_catalog.core.domain.commands.products.add_food_product import (
+    AddFoodProduct,
+)
+from src.contexts.products_catalog.core.domain.commands.products.add_food_product_bulk import (
+    AddFoodProductBulk,
+)
+from src.contexts.products_catalog.core.domain.root_aggregate.product import Product
+from src.contexts.products_catalog.core.services.command_handlers.products import (
+    add_food_product_handler,
+)
+from src.contexts.products_catalog.core.services.command_handlers.products.add_food_product_handler import (
+    add_new_food_product,
+)
+from src.contexts.shared_kernel.domain.exceptions import BusinessRuleValidationError
+
+pytestmark = [pytest.mark.unit, pytest.mark.anyio]
+
+
+class FakeProductRepo:
+    def __init__(self, stored: list[Product] | None = None):
+        self.stored = list(stored or [])
+        self.queries: list[dict] = []
+        self.added: list[Product] = []
+
+    async def query(self, filters: dict) -> list[Product]:
+        self.queries.append(filters)
+        return [p for p in self.stored if p.barcode in filters["barcode"]]
+
+    async def add_all(self, entities: list[Product]) -> None:
+        self.added.extend(entities)
+
+
+class FakeUnitOfWork:
+    def __init__(self, stored: list[Product] | None = None):
+        self.products = FakeProductRepo(stored)
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def commit(self) -> None:
+        self.committed = True
+
+
+def add_cmd(name: str, barcode: str | None, source_id: str = "private"):
+    return AddFoodProduct(
+        source_id=source_id, name=name, nutri_facts=None, barcode=barcode
+    )
+
+
+async def test_adds_batch_with_one_barcode_lookup():
+    uow = FakeUnitOfWork()
+    cmd = AddFoodProductBulk(
+        add_product_cmds=[
+            add_cmd("milk", "789"),
+            add_cmd("bread", "123"),
+            add_cmd("apple", None),
+        ]
+    )
+
+    ids = await add_new_food_product(cmd, uow)
+
+    assert ids == [p.id for p in uow.products.added]
+    assert [p.name for p in uow.products.added] == ["milk", "bread", "apple"]
+    assert uow.products.queries == [{"barcode": ["789", "123"]}]
+    assert uow.committed
+
+
+async def test_rejects_barcode_already_stored_for_source():
+    stored = Product.add_food_product(source_id="private", name="milk", barcode="789")
+    uow = FakeUnitOfWork([stored])
+    cmd = AddFoodProductBulk(add_product_cmds=[add_cmd("other milk", "789")])
+
+    with pytest.raises(BusinessRuleValidationError):
+        await add_new_food_product(cmd, uow)
+
+    assert uow.products.added == []
+    assert not uow.committed
+
+
+async def test_rejects_barcode_repeated_within_batch():
+    uow = FakeUnitOfWork()
+    cmd = AddFoodProductBulk(
+        add_product_cmds=[add_cmd("milk", "789"), add_cmd("milk again", "789")]
+    )
+
+    with pytest.raises(BusinessRuleValidationError):
+        await add_new_food_product(cmd, uow)
+
+    assert uow.products.added == []
+    assert not uow.committed
+
+
+async def test_same_barcode_is_allowed_once_per_source():
+    uow = FakeUnitOfWork()
+    cmd = AddFoodProductBulk(
+        add_product_cmds=[
+            add_cmd("milk", "789", source_id="private"),
+            add_cmd("milk", "789", source_id="taco"),
+            add_cmd("water", None),
+            add_cmd("juice", None),
+        ]
+    )
+
+    ids = await add_new_food_product(cmd, uow)
+
+    assert len(ids) == 4
+
+
+async def test_barcodes_are_looked_up_in_chunks(monkeypatch):
+    monkeypatch.setattr(add_food_product_handler, "BARCODE_LOOKUP_CHUNK", 2)
+    uow = FakeUnitOfWork()
+    cmd = AddFoodProductBulk(
+        add_product_cmds=[add_cmd(f"product {i}", str(i)) for i in range(5)]
+    )
+
+    await add_new_food_product(cmd, uow)
+
+    assert uow.products.queries == [
+        {"barcode": ["0", "1"]},
+        {"barcode": ["2", "3"]},
+        {"barcode": ["4"]},
+    ]
@@ -314,6 +314,7 @@ def test_get_allowed_filters(self):
             "skip",
             "limit",
             "sort",
+            "cursor",
             "created_at",
             "tags",
             "tags_not_exists",
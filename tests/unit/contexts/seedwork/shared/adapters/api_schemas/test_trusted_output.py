@@ -0,0 +1,127 @@
+"""Unit tests for trusted output: from_domain_trusted matches from_domain."""
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import TypeAdapter
+from src.contexts.recipes_catalog.core.adapters.meal.api_schemas.root_aggregate.api_meal import (
+    ApiMeal,
+)
+from src.contexts.recipes_catalog.core.domain.meal.entities.recipe import _Recipe
+from src.contexts.recipes_catalog.core.domain.meal.root_aggregate.meal import Meal
+from src.contexts.recipes_catalog.core.domain.meal.value_objects.ingredient import (
+    Ingredient,
+)
+from src.contexts.recipes_catalog.core.domain.meal.value_objects.rating import Rating
+from src.contexts.shared_kernel.domain.enums import MeasureUnit, Privacy
+from src.contexts.shared_kernel.domain.value_objects.nutri_facts import NutriFacts
+from src.contexts.shared_kernel.domain.value_objects.nutri_value import NutriValue
+from src.contexts.shared_kernel.domain.value_objects.tag import Tag
+
+pytestmark = pytest.mark.unit
+
+MealListAdapter = TypeAdapter(list[ApiMeal])
+
+PADDED = "  Padded soup  "
+SCRIPT = "<script>alert(1)</script>Soup"
+
+
+def build_domain_meal(index: int, text: str = "Soup") -> Meal:
+    """Build a meal with recipes, ingredients, tags and ratings using `text`."""
+    meal_id = uuid.uuid4().hex
+    author_id = uuid.uuid4().hex
+    recipe_id = uuid.uuid4().hex
+    timestamp = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+    recipe = _Recipe(
+        id=recipe_id,
+        name=f"{text} {index}",
+        instructions=text,
+        author_id=author_id,
+        meal_id=meal_id,
+        ingredients=[
+            Ingredient(
+                name=f"{text} {i}",
+                unit=MeasureUnit.GRAM,
+                quantity=10.0 * (i + 1),
+                position=i,
+            )
+            for i in range(3)
+        ],
+        nutri_facts=NutriFacts(
+            calories=NutriValue(value=250.0, unit=MeasureUnit.ENERGY),
+            protein=NutriValue(value=15.0, unit=MeasureUnit.GRAM),
+        ),
+        description=text,
+        total_time=30,
+        tags={
+            Tag(key="cuisine", value=v, author_id=author_id, type="recipe")
+            for v in ("italian", "vegetarian")
+        },
+        privacy=Privacy.PUBLIC,
+        ratings=[
+            Rating(
+                user_id=uuid.uuid4().hex,
+                recipe_id=recipe_id,
+                taste=4,
+                convenience=5,
+                comment=text,
+            )
+        ],
+        weight_in_grams=300,
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+    return Meal(
+        id=meal_id,
+        name=f"{text} {index}",
+        author_id=author_id,
+        recipes=[recipe],
+        tags={Tag(key="occasion", value="dinner", author_id=author_id, type="meal")},
+        description=text,
+        like=True,
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+
+
+def dump_both(meals: list[Meal]) -> tuple[bytes, bytes]:
+    validated = MealListAdapter.dump_json([ApiMeal.from_domain(m) for m in meals])
+    trusted = MealListAdapter.dump_json(
+        [ApiMeal.from_domain_trusted(m) for m in meals]
+    )
+    return validated, trusted
+
+
+@pytest.mark.parametrize("count", [1, 50])
+def test_trusted_meal_output_is_byte_identical(count):
+    meals = [build_domain_meal(i) for i in range(count)]
+
+    validated, trusted = dump_both(meals)
+
+    assert trusted == validated
+
+
+def test_trusted_output_strips_padded_text():
+    validated, trusted = dump_both([build_domain_meal(0, PADDED)])
+
+    assert trusted == validated
+    assert b'"  Padded' not in trusted
+    assert b'"description":"Padded soup"' in trusted
+    assert b'"name":"Padded soup   0"' in trusted
+
+
+def test_trusted_output_sanitizes_script_tags():
+    validated, trusted = dump_both([build_domain_meal(0, SCRIPT)])
+
+    assert trusted == validated
+    assert b"<script>" not in trusted
+
+
+def test_trusted_output_inside_nested_schemas_is_sanitized():
+    meal = ApiMeal.from_domain_trusted(build_domain_meal(0, SCRIPT))
+
+    (recipe,) = meal.recipes
+    assert "<script>" not in recipe.instructions
+    assert all("<script>" not in i.name for i in recipe.ingredients)
+    assert all("<script>" not in (r.comment or "") for r in recipe.ratings)
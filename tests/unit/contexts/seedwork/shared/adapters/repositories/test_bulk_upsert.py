@@ -0,0 +1,154 @@
+"""Unit tests for the bulk upsert plan and statement builder.
+
+Plans are built from transient SA instances and statements are compiled
+with the PostgreSQL dialect; no database is needed.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from src.contexts.seedwork.adapters.repositories import bulk_upsert
+from src.contexts.seedwork.adapters.repositories.bulk_upsert import (
+    BulkUpsertPlan,
+    build_upsert_statements,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.models import (
+    IngredientSaTestModel,
+    MealSaTestModel,
+    RecipeSaTestModel,
+    SupplierSaTestModel,
+    TagSaTestModel,
+)
+
+pytestmark = pytest.mark.unit
+
+MEALS = MealSaTestModel.__table__
+RECIPES = RecipeSaTestModel.__table__
+INGREDIENTS = IngredientSaTestModel.__table__
+
+
+def make_meal(meal_id: str = "meal-1", *, tags=()) -> MealSaTestModel:
+    recipe = RecipeSaTestModel(
+        id=f"{meal_id}-recipe",
+        name="Recipe",
+        preprocessed_name="recipe",
+        instructions="Mix",
+        author_id="author-1",
+        ingredients=[
+            IngredientSaTestModel(name="salt", quantity=1.0, unit="g", position=0)
+        ],
+    )
+    return MealSaTestModel(
+        id=meal_id,
+        name="Meal",
+        preprocessed_name="meal",
+        author_id="author-1",
+        recipes=[recipe],
+        tags=list(tags),
+    )
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestBulkUpsertPlan:
+    """Test row collection from SA instance graphs."""
+
+    def test_rows_are_grouped_per_table(self):
+        plan = BulkUpsertPlan()
+        plan.add(make_meal("meal-1"))
+        plan.add(make_meal("meal-2"))
+
+        assert set(plan.rows[MEALS]) == {("meal-1",), ("meal-2",)}
+        assert len(plan.rows[RECIPES]) == 2
+        assert len(plan.rows[INGREDIENTS]) == 2
+
+    def test_foreign_keys_are_taken_from_the_parent(self):
+        plan = BulkUpsertPlan()
+        plan.add(make_meal("meal-1"))
+
+        (recipe_row,) = plan.rows[RECIPES].values()
+        (ingredient_row,) = plan.rows[INGREDIENTS].values()
+        assert recipe_row["meal_id"] == "meal-1"
+        assert ingredient_row["recipe_id"] == "meal-1-recipe"
+        assert "id" not in ingredient_row
+
+    def test_new_rows_get_initial_version(self):
+        plan = BulkUpsertPlan()
+        plan.add(make_meal("meal-1"))
+
+        assert plan.rows[MEALS][("meal-1",)]["version"] == 1
+        assert plan.version_columns[MEALS] == "version"
+
+    def test_delete_orphan_relationships_record_kept_children(self):
+        plan = BulkUpsertPlan()
+        plan.add(make_meal("meal-1"))
+
+        (scope,) = plan.orphan_scopes
+        assert scope.table is INGREDIENTS
+        assert scope.kept == {("meal-1-recipe",): set()}
+
+    def test_secondary_relationships_become_links(self):
+        tag = TagSaTestModel(id=7, key="diet", value="vegan", author_id="a", type="meal")
+        plan = BulkUpsertPlan()
+        plan.add(make_meal("meal-1", tags=[tag]))
+
+        (scope,) = plan.link_scopes
+        assert scope.links == {("meal-1",): [tag]}
+
+    def test_missing_primary_key_is_rejected(self):
+        plan = BulkUpsertPlan()
+
+        with pytest.raises(ValueError, match="primary key"):
+            plan.add(SupplierSaTestModel(name="Acme"))
+
+
+class TestBuildUpsertStatements:
+    """Test multi-row INSERT ... ON CONFLICT generation."""
+
+    def test_conflicts_update_non_key_columns_and_bump_version(self):
+        rows = [{"id": "m1", "name": "A", "version": 1}]
+
+        ((stmt, row_count),) = build_upsert_statements(
+            MEALS, rows, version_column="version"
+        )
+        sql = compile_sql(stmt)
+
+        assert row_count == 1
+        assert "ON CONFLICT (id) DO UPDATE SET" in sql
+        assert "name = excluded.name" in sql
+        assert "version = (test_seedwork.test_meals.version +" in sql
+        assert "updated_at = now()" in sql
+        assert "RETURNING xmax = 0" in sql
+
+    def test_versioned_conflicts_only_update_the_version_read(self):
+        rows = [{"id": "m1", "name": "A", "version": 3}]
+
+        ((stmt, _),) = build_upsert_statements(MEALS, rows, version_column="version")
+
+        assert (
+            "WHERE test_seedwork.test_meals.version = excluded.version"
+            in compile_sql(stmt)
+        )
+
+    def test_unversioned_conflicts_update_unconditionally(self):
+        rows = [{"id": "m1", "name": "A"}]
+
+        ((stmt, _),) = build_upsert_statements(MEALS, rows)
+
+        assert "WHERE" not in compile_sql(stmt)
+
+    def test_rows_with_different_columns_are_split(self):
+        rows = [{"id": "m1", "name": "A"}, {"id": "m2", "name": "B", "notes": "n"}]
+
+        statements = build_upsert_statements(MEALS, rows)
+
+        assert len(statements) == 2
+
+    def test_statements_stay_under_bind_parameter_limit(self, monkeypatch):
+        monkeypatch.setattr(bulk_upsert, "MAX_BIND_PARAMS", 4)
+        rows = [{"id": f"m{i}", "name": "A"} for i in range(5)]
+
+        statements = build_upsert_statements(MEALS, rows)
+
+        assert [row_count for _, row_count in statements] == [2, 2, 1]
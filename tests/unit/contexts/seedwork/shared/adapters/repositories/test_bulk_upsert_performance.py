@@ -0,0 +1,91 @@
+"""
+Bulk upsert vs per-entity merge benchmark with real database
+
+Persists the same number of changed meals through ``persist_all`` with and
+without ``bulk=True`` and compares the SQL statement counts at
+10, 100 and 1000 entities. Both paths map each meal first (one lookup of
+the stored row per meal); the merge path then issues further statements per
+meal, the bulk path a constant number per table.
+"""
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.orm.exc import StaleDataError
+from src.contexts.seedwork.adapters.repositories.statement_tracker import (
+    track_statements,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.data_factories import (
+    create_test_meal,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.models import (
+    MealSaTestModel,
+)
+
+pytestmark = [pytest.mark.anyio, pytest.mark.integration, pytest.mark.performance]
+
+
+async def add_meals(meal_repository, test_session, count: int, prefix: str):
+    meals = [
+        create_test_meal(id=f"{prefix}-{i}", name=f"{prefix} meal {i}")
+        for i in range(count)
+    ]
+    for meal in meals:
+        await meal_repository.add(meal)
+    await test_session.commit()
+    for meal in meals:
+        meal.notes = "updated"
+    return meals
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [10, 100, 1000])
+async def test_bulk_upsert_issues_fewer_statements_than_merge(
+    meal_repository, test_session, count
+):
+    merge_meals = await add_meals(meal_repository, test_session, count, "merge")
+    bulk_meals = await add_meals(meal_repository, test_session, count, "bulk")
+
+    with track_statements("merge") as merge_tracker:
+        await meal_repository.persist_all(merge_meals)
+
+    with track_statements("bulk") as bulk_tracker:
+        result = await meal_repository.persist_all(bulk_meals, bulk=True)
+    await test_session.commit()
+
+    assert result is not None
+    assert (result.inserted, result.updated) == (0, count)
+    assert bulk_tracker.count < merge_tracker.count
+    assert merge_tracker.count >= count
+
+    updated = await test_session.scalar(
+        select(func.count())
+        .select_from(MealSaTestModel)
+        .where(MealSaTestModel.notes == "updated", MealSaTestModel.version == 2)
+    )
+    assert updated == 2 * count
+
+
+async def test_bulk_upsert_inserts_new_entities(meal_repository, test_session):
+    meals = [create_test_meal(id=f"new-{i}", name=f"new meal {i}") for i in range(3)]
+    for meal in meals:
+        meal_repository.refresh_seen(meal)
+
+    result = await meal_repository.persist_all(meals, bulk=True)
+    await test_session.commit()
+
+    assert result is not None
+    assert (result.inserted, result.updated) == (3, 0)
+    stored = await meal_repository.query(filters={}, _return_sa_instance=True)
+    assert {meal.id for meal in stored} == {"new-0", "new-1", "new-2"}
+
+
+async def test_bulk_upsert_rejects_stale_versions(meal_repository, test_session):
+    (meal,) = await add_meals(meal_repository, test_session, 1, "stale")
+    await test_session.execute(
+        update(MealSaTestModel)
+        .where(MealSaTestModel.id == meal.id)
+        .values(version=MealSaTestModel.version + 1)
+    )
+
+    with pytest.raises(StaleDataError):
+        await meal_repository.persist_all([meal], bulk=True)
@@ -0,0 +1,172 @@
+"""Unit tests for keyset (cursor) pagination.
+
+Covers cursor encoding, the generated seek predicate and the
+SaGenericRepository hooks that do not need a database connection.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from src.contexts.seedwork.adapters.repositories.keyset_pagination import (
+    InvalidCursorError,
+    KeysetCursor,
+    keyset_predicate,
+)
+from src.contexts.seedwork.adapters.repositories.repository_exceptions import (
+    FilterValidationError,
+)
+from src.contexts.seedwork.adapters.repositories.sa_generic_repository import (
+    SaGenericRepository,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.data_factories import (
+    create_test_meal,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.entities import (
+    MealTestEntity,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.mappers import (
+    MealTestMapper,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.models import (
+    MealSaTestModel,
+)
+
+pytestmark = pytest.mark.unit
+
+# MealSaTestModel lives in the test_seedwork schema
+MEALS = "test_seedwork.test_meals"
+
+
+def make_repo() -> SaGenericRepository:
+    return SaGenericRepository(
+        db_session=MagicMock(),
+        data_mapper=MealTestMapper,
+        domain_model_type=MealTestEntity,
+        sa_model_type=MealSaTestModel,
+    )
+
+
+def compile_sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+class TestKeysetCursor:
+    """Test opaque cursor round-trips."""
+
+    def test_round_trip_preserves_datetimes(self):
+        cursor = KeysetCursor(
+            sort="-created_at",
+            value=datetime(2024, 1, 1, 12, tzinfo=UTC),
+            last_id="meal-1",
+        )
+
+        assert KeysetCursor.decode(cursor.encode()) == cursor
+
+    def test_token_is_url_safe(self):
+        token = KeysetCursor(sort="name", value="a/b+c", last_id="x").encode()
+
+        assert "=" not in token
+        assert "/" not in token
+        assert "+" not in token
+
+    def test_null_sort_values_are_supported(self):
+        cursor = KeysetCursor(sort="total_time", value=None, last_id="meal-1")
+
+        assert KeysetCursor.decode(cursor.encode()).value is None
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "e30"])
+    def test_malformed_tokens_are_rejected(self, token):
+        with pytest.raises(InvalidCursorError):
+            KeysetCursor.decode(token)
+
+
+class TestKeysetPredicate:
+    """Test the seek WHERE clause."""
+
+    def test_descending_sort_seeks_below_last_row(self):
+        cursor = KeysetCursor(sort="-total_time", value=10, last_id="meal-1")
+
+        sql = compile_sql(
+            keyset_predicate(MealSaTestModel.total_time, MealSaTestModel.id, cursor)
+        )
+
+        assert f"({MEALS}.total_time, {MEALS}.id) <" in sql
+        assert f"{MEALS}.total_time IS NULL" in sql
+
+    def test_ascending_sort_seeks_above_last_row(self):
+        cursor = KeysetCursor(sort="total_time", value=10, last_id="meal-1")
+
+        sql = compile_sql(
+            keyset_predicate(MealSaTestModel.total_time, MealSaTestModel.id, cursor)
+        )
+
+        assert f"({MEALS}.total_time, {MEALS}.id) >" in sql
+
+    def test_null_tail_pages_by_id_only(self):
+        cursor = KeysetCursor(sort="-total_time", value=None, last_id="meal-1")
+
+        sql = compile_sql(
+            keyset_predicate(MealSaTestModel.total_time, MealSaTestModel.id, cursor)
+        )
+
+        assert f"{MEALS}.total_time IS NULL AND {MEALS}.id <" in sql
+
+
+class TestRepositoryKeysetPagination:
+    """Test cursor handling in SaGenericRepository."""
+
+    def test_next_cursor_for_full_page(self):
+        repo = make_repo()
+        meals = [create_test_meal(), create_test_meal()]
+
+        token = repo.next_cursor(meals, {"sort": "-created_at", "limit": 2})
+
+        assert token is not None
+        cursor = KeysetCursor.decode(token)
+        assert cursor.sort == "-created_at"
+        assert cursor.last_id == meals[-1].id
+
+    def test_no_cursor_for_last_page(self):
+        repo = make_repo()
+
+        token = repo.next_cursor(
+            [create_test_meal()], {"sort": "-created_at", "limit": 2}
+        )
+
+        assert token is None
+
+    def test_no_cursor_for_unsortable_key(self):
+        repo = make_repo()
+
+        token = repo.next_cursor([create_test_meal()], {"sort": "-source", "limit": 1})
+
+        assert token is None
+
+    def test_cursor_replaces_offset(self):
+        repo = make_repo()
+        meal = create_test_meal()
+        token = repo.next_cursor([meal], {"sort": "-created_at", "limit": 1})
+
+        stmt = repo._build_query(
+            filters={"sort": "-created_at", "limit": 1, "skip": 50, "cursor": token}
+        )
+        sql = compile_sql(stmt)
+
+        assert f"({MEALS}.created_at, {MEALS}.id) <" in sql
+        assert "OFFSET" not in sql
+        assert f"{MEALS}.id DESC" in sql
+
+    def test_cursor_from_other_sort_is_rejected(self):
+        repo = make_repo()
+        token = KeysetCursor(sort="name", value="a", last_id="x").encode()
+
+        with pytest.raises(FilterValidationError):
+            repo._build_query(filters={"sort": "-created_at", "cursor": token})
+
+    def test_garbage_cursor_is_rejected(self):
+        repo = make_repo()
+
+        with pytest.raises(FilterValidationError):
+            repo._build_query(filters={"sort": "-created_at", "cursor": "garbage"})
@@ -0,0 +1,137 @@
+"""Unit tests for column projection queries.
+
+Covers the SELECT list narrowing in SaGenericRepository, including the sort
+columns kept for DISTINCT queries, without a database connection.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from src.contexts.seedwork.adapters.repositories.repository_exceptions import (
+    FilterValidationError,
+)
+from src.contexts.seedwork.adapters.repositories.sa_generic_repository import (
+    SaGenericRepository,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.entities import (
+    MealTestEntity,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.filter_mappers import (
+    TEST_MEAL_FILTER_MAPPERS,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.mappers import (
+    MealTestMapper,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.models import (
+    MealSaTestModel,
+)
+
+pytestmark = pytest.mark.unit
+
+# MealSaTestModel lives in the test_seedwork schema
+MEALS = "test_seedwork.test_meals"
+
+
+def make_repo(filter_to_column_mappers=None) -> SaGenericRepository:
+    return SaGenericRepository(
+        db_session=MagicMock(),
+        data_mapper=MealTestMapper,
+        domain_model_type=MealTestEntity,
+        sa_model_type=MealSaTestModel,
+        filter_to_column_mappers=filter_to_column_mappers,
+    )
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestProjectionQuery:
+    """Test the narrowed SELECT built for projection queries."""
+
+    def test_selects_only_requested_columns(self):
+        repo = make_repo()
+
+        sql = compile_sql(
+            repo._build_projection_query(
+                ["id", "name", "calorie_density"],
+                filters={"sort": "-created_at", "limit": 5},
+            )
+        )
+
+        select_list = sql.split("FROM")[0]
+        assert "test_meals.id" in select_list
+        assert "test_meals.name" in select_list
+        assert "test_meals.calorie_density" in select_list
+        assert "test_meals.description" not in select_list
+
+    def test_keeps_discarded_filter_sorting_and_limit(self):
+        repo = make_repo(TEST_MEAL_FILTER_MAPPERS)
+
+        sql = compile_sql(
+            repo._build_projection_query(
+                ["id", "name"],
+                filters={"sort": "-created_at", "limit": 5},
+            )
+        )
+
+        assert f"WHERE {MEALS}.discarded IS false" in sql
+        assert f"ORDER BY {MEALS}.created_at DESC NULLS LAST, {MEALS}.id DESC" in sql
+        assert "LIMIT" in sql
+
+    def test_unknown_column_is_rejected(self):
+        repo = make_repo()
+
+        with pytest.raises(FilterValidationError):
+            repo._build_projection_query(["id", "recipes"])
+
+    def test_keeps_sort_columns_selected_under_distinct(self):
+        repo = make_repo(TEST_MEAL_FILTER_MAPPERS)
+
+        sql = compile_sql(
+            repo._build_projection_query(
+                ["id", "name"],
+                filters={"tag_value": "vegan", "sort": "-recipe_name"},
+            )
+        )
+
+        select_list = sql.split("FROM")[0]
+        assert select_list.startswith("SELECT DISTINCT")
+        assert "test_recipes.name AS _sort_0" in select_list
+        assert "test_tags" in sql
+        assert "ORDER BY" in sql
+
+    def test_unprojected_main_table_sort_column_is_selected(self):
+        repo = make_repo(TEST_MEAL_FILTER_MAPPERS)
+
+        sql = compile_sql(
+            repo._build_projection_query(
+                ["name"], filters={"tag_value": "vegan", "sort": "total_time"}
+            )
+        )
+
+        select_list = sql.split("FROM")[0]
+        assert "test_meals.total_time AS _sort_0" in select_list
+        assert "test_meals.id AS _sort_1" in select_list
+
+    def test_projected_sort_column_is_not_repeated(self):
+        repo = make_repo()
+
+        sql = compile_sql(
+            repo._build_projection_query(["id", "name"], filters={"sort": "name"})
+        )
+
+        assert "_sort_" not in sql
+
+    @pytest.mark.anyio
+    async def test_rows_only_contain_requested_columns(self):
+        repo = make_repo(TEST_MEAL_FILTER_MAPPERS)
+        result = MagicMock()
+        repo._session.execute = AsyncMock(return_value=result)
+
+        await repo.query_projection(
+            ["id", "name"], filters={"tag_value": "vegan", "sort": "-recipe_name"}
+        )
+
+        result.columns.assert_called_once_with("id", "name")
@@ -0,0 +1,250 @@
+"""Unit tests for repository query-result caching.
+
+Covers the in-process LRU/TTL backend, the tag-versioned shared backend over
+the local key/value stand-in, and the cache hooks of SaGenericRepository that
+do not need a database connection.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.contexts.seedwork.adapters.repositories.query_cache import (
+    InMemoryKeyValueStore,
+    InMemoryQueryCache,
+    SharedQueryCache,
+    entity_tag,
+    namespace_tag,
+    pinned_tag,
+)
+from src.contexts.seedwork.adapters.repositories.query_fingerprint import (
+    fingerprint_query,
+)
+from src.contexts.seedwork.adapters.repositories.sa_generic_repository import (
+    SaGenericRepository,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.data_factories import (
+    create_test_meal,
+    create_test_recipe,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.entities import (
+    MealTestEntity,
+    RecipeTestEntity,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.mappers import (
+    MealTestMapper,
+    TestRecipeMapper,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.models import (
+    MealSaTestModel,
+    RecipeSaTestModel,
+)
+
+pytestmark = [pytest.mark.anyio, pytest.mark.unit]
+
+NAMESPACE = MealSaTestModel.__table__.fullname
+RECIPE_NAMESPACE = RecipeSaTestModel.__table__.fullname
+
+
+def fingerprint(**filters):
+    return fingerprint_query(namespace=NAMESPACE, filters=filters)
+
+
+def make_repo(cache_backend=None, related=()) -> SaGenericRepository:
+    return SaGenericRepository(
+        db_session=MagicMock(),
+        data_mapper=MealTestMapper,
+        domain_model_type=MealTestEntity,
+        sa_model_type=MealSaTestModel,
+        cache_backend=cache_backend,
+        related_cache_namespaces=related,
+    )
+
+
+def make_recipe_repo(cache_backend, related=(NAMESPACE,)) -> SaGenericRepository:
+    return SaGenericRepository(
+        db_session=MagicMock(),
+        data_mapper=TestRecipeMapper,
+        domain_model_type=RecipeTestEntity,
+        sa_model_type=RecipeSaTestModel,
+        cache_backend=cache_backend,
+        related_cache_namespaces=related,
+    )
+
+
+class TestInMemoryQueryCache:
+    """Test the in-process LRU/TTL backend."""
+
+    async def test_get_returns_private_copy(self):
+        cache = InMemoryQueryCache()
+        await cache.set("k", [{"a": 1}], tags=["t"])
+
+        first = await cache.get("k")
+        first[0]["a"] = 2
+
+        assert await cache.get("k") == [{"a": 1}]
+        assert cache.stats()["hits"] == 2
+
+    async def test_miss_is_counted(self):
+        cache = InMemoryQueryCache()
+
+        assert await cache.get("missing") is None
+        assert cache.stats()["misses"] == 1
+
+    async def test_expired_entries_are_dropped(self, monkeypatch):
+        cache = InMemoryQueryCache(default_ttl=10)
+        now = [1000.0]
+        monkeypatch.setattr(
+            "src.contexts.seedwork.adapters.repositories.query_cache.time.monotonic",
+            lambda: now[0],
+        )
+        await cache.set("k", "v", tags=["t"])
+        now[0] += 11
+
+        assert await cache.get("k") is None
+        assert len(cache) == 0
+
+    async def test_lru_eviction_keeps_recently_used(self):
+        cache = InMemoryQueryCache(max_entries=2)
+        await cache.set("a", 1, tags=[])
+        await cache.set("b", 2, tags=[])
+        await cache.get("a")
+        await cache.set("c", 3, tags=[])
+
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert cache.stats()["evictions"] == 1
+
+    async def test_invalidate_only_drops_tagged_entries(self):
+        cache = InMemoryQueryCache()
+        await cache.set("open", 1, tags=[namespace_tag("ns")])
+        await cache.set("by_id", 2, tags=[entity_tag("ns", "x")])
+        await cache.set("other", 3, tags=[entity_tag("ns", "y")])
+
+        await cache.invalidate([namespace_tag("ns"), entity_tag("ns", "x")])
+
+        assert await cache.get("open") is None
+        assert await cache.get("by_id") is None
+        assert await cache.get("other") == 3
+
+
+class TestSharedQueryCache:
+    """Test the tag-versioned backend over the local key/value stand-in."""
+
+    async def test_round_trip(self):
+        cache = SharedQueryCache(InMemoryKeyValueStore())
+        await cache.set("k", [1, 2], tags=["t"])
+
+        assert await cache.get("k") == [1, 2]
+
+    async def test_invalidation_is_visible_to_other_workers(self):
+        store = InMemoryKeyValueStore()
+        worker_a = SharedQueryCache(store)
+        worker_b = SharedQueryCache(store)
+        await worker_a.set("k", "v", tags=["t"])
+        await worker_a.set("untouched", "u", tags=["other"])
+
+        await worker_b.invalidate(["t"])
+
+        assert await worker_a.get("k") is None
+        assert await worker_a.get("untouched") == "u"
+
+    async def test_clear(self):
+        cache = SharedQueryCache(InMemoryKeyValueStore())
+        await cache.set("k", "v", tags=[])
+        await cache.clear()
+
+        assert await cache.get("k") is None
+
+
+class TestRepositoryCacheHooks:
+    """Test SaGenericRepository cache key, tagging and invalidation hooks."""
+
+    def test_no_key_without_backend(self):
+        repo = make_repo()
+
+        assert repo._build_cache_key(fingerprint(name="x")) is None
+
+    def test_key_ignores_filter_insertion_order(self):
+        repo = make_repo(InMemoryQueryCache())
+
+        assert repo._build_cache_key(
+            fingerprint(name="x", author_id="a")
+        ) == repo._build_cache_key(fingerprint(author_id="a", name="x"))
+
+    def test_sa_instance_queries_are_not_cached(self):
+        repo = make_repo(InMemoryQueryCache())
+
+        assert (
+            repo._build_cache_key(fingerprint(), _return_sa_instance=True) is None
+        )
+
+    def test_unfingerprintable_queries_are_not_cached(self):
+        repo = make_repo(InMemoryQueryCache())
+
+        assert repo._build_cache_key(None) is None
+
+    def test_id_constrained_queries_are_tagged_per_id(self):
+        repo = make_repo(InMemoryQueryCache())
+
+        assert repo._cache_tags_for({"id": ["a", "b"]}) == [
+            entity_tag(NAMESPACE, "a"),
+            entity_tag(NAMESPACE, "b"),
+            pinned_tag(NAMESPACE),
+        ]
+        assert repo._cache_tags_for({"name": "x"}) == [namespace_tag(NAMESPACE)]
+
+    async def test_invalidation_evicts_affected_entries_only(self):
+        cache = InMemoryQueryCache()
+        repo = make_repo(cache, related=("other.table",))
+        meal = create_test_meal()
+        await cache.set("open", 1, tags=repo._cache_tags_for({"name": "x"}))
+        await cache.set("mine", 2, tags=repo._cache_tags_for({"id": meal.id}))
+        await cache.set("theirs", 3, tags=repo._cache_tags_for({"id": "other"}))
+        await cache.set("related", 4, tags=[namespace_tag("other.table")])
+
+        await repo._invalidate_cache_for_entity(meal)
+
+        assert await cache.get("open") is None
+        assert await cache.get("mine") is None
+        assert await cache.get("related") is None
+        assert await cache.get("theirs") == 3
+
+    async def test_related_write_evicts_id_constrained_entries(self):
+        cache = InMemoryQueryCache()
+        meals = make_repo(cache, related=(RECIPE_NAMESPACE,))
+        recipes = make_recipe_repo(cache)
+        meal = create_test_meal()
+        key = meals._build_cache_key(fingerprint(id=meal.id))
+        tags = meals._cache_tags_for({"id": meal.id})
+        await meals._set_cache(key, [meal], tags=tags)
+        recipe = create_test_recipe(meal_id=meal.id)
+
+        await recipes._invalidate_cache_for_entity(recipe)
+
+        assert await cache.get(key) is None
+
+    async def test_writes_bypass_cache_for_rest_of_session(self):
+        repo = make_repo(InMemoryQueryCache())
+
+        await repo._invalidate_cache_for_entity(create_test_meal())
+
+        assert repo._build_cache_key(fingerprint(name="x")) is None
+        assert namespace_tag(NAMESPACE) in repo.pending_cache_invalidations
+
+    async def test_flush_replays_pending_invalidations(self):
+        backend = AsyncMock()
+        repo = make_repo(backend)
+        await repo._invalidate_cache_for_entity(create_test_meal())
+        backend.invalidate.reset_mock()
+
+        await repo.flush_cache_invalidations()
+
+        backend.invalidate.assert_awaited_once()
+        assert repo.pending_cache_invalidations == set()
+
+    async def test_backend_errors_are_treated_as_miss(self):
+        backend = AsyncMock()
+        backend.get.side_effect = ConnectionError("down")
+        repo = make_repo(backend)
+
+        assert await repo._get_from_cache("k") is None
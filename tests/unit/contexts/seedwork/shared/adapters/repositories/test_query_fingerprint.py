@@ -0,0 +1,135 @@
+"""Unit tests for canonical repository query fingerprints."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from src.contexts.seedwork.adapters.repositories.query_fingerprint import (
+    UnfingerprintableError,
+    canonicalize,
+    fingerprint_query,
+    normalize_filters,
+)
+from tests.unit.contexts.seedwork.shared.adapters.repositories.testing_infrastructure.models import (
+    MealSaTestModel,
+)
+
+pytestmark = pytest.mark.unit
+
+NAMESPACE = MealSaTestModel.__table__.fullname
+
+
+def sort_by_name(stmt, value):
+    return stmt
+
+
+def fingerprint(**kwargs):
+    return fingerprint_query(namespace=NAMESPACE, **kwargs)
+
+
+class TestCanonicalize:
+    """Test canonical filter value representation."""
+
+    def test_lists_are_unordered(self):
+        assert canonicalize(["b", "a"]) == canonicalize(["a", "b"])
+        assert canonicalize({"b", "a"}) == canonicalize(["a", "b"])
+
+    def test_tuples_keep_order(self):
+        assert canonicalize(("a", "b")) != canonicalize(("b", "a"))
+
+    def test_types_do_not_collide(self):
+        assert canonicalize(1) != canonicalize("1")
+        assert canonicalize(True) != canonicalize(1)
+        assert canonicalize(Decimal("1")) != canonicalize("1")
+
+    def test_datetimes_are_supported(self):
+        assert canonicalize(datetime(2024, 1, 1)) == canonicalize(
+            datetime(2024, 1, 1)
+        )
+
+    def test_unknown_objects_are_rejected(self):
+        with pytest.raises(UnfingerprintableError):
+            canonicalize(object())
+
+
+class TestNormalizeFilters:
+    """Test filter normalization through the operator registry."""
+
+    def test_postfix_is_split_from_field(self):
+        assert normalize_filters({"calorie_density_gte": 10}) == (
+            ("calorie_density", "_gte", ("int", 10)),
+        )
+
+    def test_postfix_changes_identity(self):
+        assert normalize_filters({"name_ne": "x"}) != normalize_filters(
+            {"name": "x"}
+        )
+
+
+class TestFingerprintQuery:
+    """Test fingerprints of complete query() argument sets."""
+
+    def test_filter_order_is_irrelevant(self):
+        assert fingerprint(filters={"name": "x", "author_id": "a"}) == fingerprint(
+            filters={"author_id": "a", "name": "x"}
+        )
+
+    def test_filter_values_change_identity(self):
+        assert fingerprint(filters={"name": "x"}) != fingerprint(
+            filters={"name": "y"}
+        )
+
+    def test_limit_changes_identity(self):
+        assert fingerprint(limit=10) != fingerprint(limit=20)
+
+    def test_label_ignores_filter_values_and_limit(self):
+        first = fingerprint(filters={"name": "x"}, limit=10)
+        second = fingerprint(filters={"name": "y"}, limit=20)
+
+        assert first is not None and second is not None
+        assert first.digest != second.digest
+        assert first.label == second.label
+
+    def test_label_changes_with_filter_fields_operators_and_sort(self):
+        labels = {
+            fingerprint(filters=filters).label
+            for filters in (
+                {"name": "x"},
+                {"name_ne": "x"},
+                {"author_id": "x"},
+                {"name": "x", "sort": "name"},
+                {"name": "x", "sort": "-name"},
+            )
+        }
+
+        assert len(labels) == 5
+
+    def test_label_ignores_statement_bind_values(self):
+        first = select(MealSaTestModel).where(MealSaTestModel.name == "x")
+        second = select(MealSaTestModel).where(MealSaTestModel.name == "y")
+
+        assert fingerprint(starting_stmt=first).label == (
+            fingerprint(starting_stmt=second).label
+        )
+
+    def test_equivalent_statements_share_fingerprint(self):
+        first = select(MealSaTestModel).where(MealSaTestModel.name == "x")
+        second = select(MealSaTestModel).where(MealSaTestModel.name == "x")
+
+        assert fingerprint(starting_stmt=first) == fingerprint(starting_stmt=second)
+
+    def test_statement_bind_values_change_identity(self):
+        first = select(MealSaTestModel).where(MealSaTestModel.name == "x")
+        second = select(MealSaTestModel).where(MealSaTestModel.name == "y")
+
+        assert fingerprint(starting_stmt=first) != fingerprint(starting_stmt=second)
+
+    def test_named_sort_callbacks_are_supported(self):
+        assert fingerprint(sort_stmt=sort_by_name) is not None
+
+    def test_lambdas_are_not_fingerprinted(self):
+        assert fingerprint(sort_stmt=lambda stmt, value: stmt) is None
+
+    def test_unfingerprintable_filter_values_yield_none(self):
+        assert fingerprint(filters={"name": object()}) is None
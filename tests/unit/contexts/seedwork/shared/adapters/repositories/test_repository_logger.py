@@ -23,6 +23,7 @@
 from sqlalchemy.exc import IntegrityError
 from src.contexts.seedwork.adapters.repositories.repository_logger import (
     PSUTIL_AVAILABLE,
+    LazySQL,
     RepositoryLogger,
     create_repository_logger,
 )
@@ -756,3 +757,81 @@ def test_graceful_degradation_when_psutil_unavailable(self):
         # Performance warnings should still work without memory monitoring
         logger._check_performance_warnings("test_op", 0.5, {})
         # Should not raise any exceptions
+
+
+@pytest.mark.unit
+class TestLazySqlRendering:
+    """Test deferred SQL rendering and sampling controls"""
+
+    @pytest.fixture
+    def quiet_logger(self, monkeypatch):
+        """Logger with every debug context disabled"""
+        for var in ("REPOSITORY_DEBUG", "SQL_DEBUG", "DEBUG_CONTEXTS"):
+            monkeypatch.delenv(var, raising=False)
+        logger = RepositoryLogger("lazy_sql_test")
+        logger.debug_enabled = False
+        return logger
+
+    def test_sql_is_compiled_on_first_use_only(self):
+        """Test LazySQL defers and memoizes compilation"""
+        stmt = Mock()
+        stmt.compile.return_value = "SELECT 1"
+        sql = LazySQL(stmt)
+
+        assert not sql.rendered
+        stmt.compile.assert_not_called()
+
+        assert str(sql) == "SELECT 1"
+        assert str(sql) == "SELECT 1"
+        assert sql.rendered
+        stmt.compile.assert_called_once()
+
+    def test_sql_falls_back_to_plain_string(self):
+        """Test LazySQL falls back when literal binds cannot be rendered"""
+        stmt = Mock()
+        stmt.compile.side_effect = NotImplementedError("no literal")
+        stmt.__str__ = Mock(return_value="SELECT :param")
+
+        assert str(LazySQL(stmt)) == "SELECT :param"
+
+    def test_fast_queries_are_not_rendered_by_default(self, quiet_logger):
+        """Test SQL is not rendered for fast, unsampled queries"""
+        assert not quiet_logger.should_render_sql(0.01)
+
+    def test_slow_queries_are_rendered(self, quiet_logger):
+        """Test SQL is rendered above the slow query threshold"""
+        quiet_logger.slow_query_threshold = 0.5
+
+        assert quiet_logger.should_render_sql(0.6)
+
+    def test_sampled_queries_are_rendered(self, quiet_logger):
+        """Test SQL is rendered for sampled queries"""
+        quiet_logger.sql_sample_rate = 1.0
+
+        assert quiet_logger.should_render_sql(0.01)
+
+    def test_sql_debug_context_renders_sql(self, quiet_logger, monkeypatch):
+        """Test SQL debugging forces rendering"""
+        monkeypatch.setenv("SQL_DEBUG", "true")
+
+        assert quiet_logger.should_render_sql(0.01)
+
+    @pytest.mark.skipif(not PSUTIL_AVAILABLE, reason="psutil not available")
+    def test_memory_usage_is_rate_limited(self, monkeypatch):
+        """Test the process is sampled at most once per interval"""
+        logger = RepositoryLogger("memory_sample_test")
+        logger.memory_sample_interval = 60.0
+        monkeypatch.setattr(
+            "src.contexts.seedwork.adapters.repositories.repository_logger._memory_sample",
+            None,
+        )
+
+        with patch(
+            "src.contexts.seedwork.adapters.repositories.repository_logger.psutil.Process"
+        ) as process:
+            process.return_value.memory_info.return_value.rss = 100 * 1024 * 1024
+            first = logger.get_memory_usage()
+            second = logger.get_memory_usage()
+
+        assert first == second == 100.0
+        process.assert_called_once()
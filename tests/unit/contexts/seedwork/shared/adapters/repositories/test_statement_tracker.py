@@ -0,0 +1,124 @@
+"""Unit tests for SQL statement counting and query budgets.
+
+Uses an in-memory SQLite engine; no external database is needed.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from src.contexts.seedwork.adapters.repositories.statement_tracker import (
+    QueryBudgetExceededError,
+    current_statement_count,
+    instrument_engine,
+    normalize_sql,
+    track_statements,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+class TestNormalizeSql:
+    """Test statement shape normalization."""
+
+    def test_parameters_and_literals_are_erased(self):
+        first = normalize_sql("SELECT * FROM t WHERE id = $1 AND name = 'a'")
+        second = normalize_sql("SELECT * FROM t WHERE id = $7 AND name = 'bb'")
+
+        assert first == second
+
+    def test_in_lists_of_any_length_collapse(self):
+        short = normalize_sql("SELECT * FROM t WHERE id IN ($1)")
+        long = normalize_sql("SELECT * FROM t WHERE id IN ($1, $2, $3)")
+
+        assert short == long == "SELECT * FROM t WHERE id IN (?)"
+
+    def test_multi_row_values_collapse(self):
+        shape = normalize_sql("INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4)")
+
+        assert shape == "INSERT INTO t (a, b) VALUES (?)"
+
+
+class TestTrackStatements:
+    """Test statement counting through the engine listener."""
+
+    def test_counts_statements_in_scope(self, engine):
+        with engine.connect() as conn, track_statements("test") as tracker:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        assert tracker.count == 2
+
+    def test_statements_outside_scope_are_ignored(self, engine):
+        with track_statements("test") as tracker:
+            pass
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert tracker.count == 0
+        assert current_statement_count() is None
+
+    def test_repeated_shapes_are_flagged(self, engine):
+        with (
+            engine.connect() as conn,
+            track_statements("test", track_shapes=True) as tracker,
+        ):
+            for i in range(4):
+                conn.execute(text("SELECT :value"), {"value": i})
+            conn.execute(text("SELECT 1, 2"))
+
+        assert list(tracker.repeated_shapes.values()) == [4]
+
+    def test_shapes_are_only_tracked_with_a_budget(self, engine, monkeypatch):
+        monkeypatch.delenv("REPOSITORY_DEBUG", raising=False)
+        with engine.connect() as conn:
+            with track_statements("plain") as plain:
+                conn.execute(text("SELECT 1"))
+            with track_statements("budgeted", budget=5) as budgeted:
+                conn.execute(text("SELECT 1"))
+
+        assert (plain.count, len(plain.shapes)) == (1, 0)
+        assert (budgeted.count, len(budgeted.shapes)) == (1, 1)
+
+    def test_nested_scopes_both_count(self, engine):
+        with engine.connect() as conn, track_statements("outer") as outer:
+            conn.execute(text("SELECT 1"))
+            with track_statements("inner") as inner:
+                conn.execute(text("SELECT 2"))
+
+        assert (outer.count, inner.count) == (2, 1)
+
+    def test_strict_budget_raises(self, engine):
+        with (
+            pytest.raises(QueryBudgetExceededError),
+            engine.connect() as conn,
+            track_statements("test", budget=1, strict=True),
+        ):
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+    def test_strict_budget_does_not_mask_the_block_error(self, engine):
+        with (
+            pytest.raises(ValueError, match="boom"),
+            engine.connect() as conn,
+            track_statements("test", budget=1, strict=True),
+        ):
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+            raise ValueError("boom")
+
+    def test_lenient_budget_only_reports(self, engine):
+        with (
+            engine.connect() as conn,
+            track_statements("test", budget=1, strict=False) as tracker,
+        ):
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        assert tracker.over_budget
@@ -389,6 +389,7 @@ class MealSaTestModel(SaBase):
         Index("idx_meal_author_created", "author_id", "created_at"),
         {"schema": TEST_SCHEMA, "extend_existing": True},
     )
+    __mapper_args__ = {"version_id_col": version}
 
 
 # =============================================================================
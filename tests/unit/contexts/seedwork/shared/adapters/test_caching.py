@@ -0,0 +1,130 @@
+"""Unit tests for the shared LRU/TTL cache and single-flight primitives."""
+
+import anyio
+import pytest
+from src.contexts.seedwork.adapters.caching import LruTtlCache, SingleFlight
+
+pytestmark = [pytest.mark.unit, pytest.mark.anyio]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLruTtlCache:
+    """Test expiry, eviction and the drop hook."""
+
+    def test_entries_expire_after_their_ttl(self):
+        clock = FakeClock()
+        cache = LruTtlCache[str, int](10, clock=clock)
+        cache.set("a", 1, ttl=5)
+
+        assert cache.get("a") == 1
+        clock.now += 5
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["expired"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LruTtlCache[str, int](2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert list(cache) == ["a", "c"]
+        assert cache.stats()["evictions"] == 1
+
+    def test_expired_entries_can_be_kept_for_revalidation(self):
+        clock = FakeClock()
+        cache = LruTtlCache[str, int](10, clock=clock, keep_expired=True)
+        cache.set("a", 1, ttl=5)
+        clock.now += 5
+
+        assert cache.get("a") is None
+        assert cache.peek("a") == 1
+        assert cache.touch("a", ttl=5)
+        assert cache.get("a") == 1
+
+    def test_drop_hook_sees_every_removal_but_clear(self):
+        clock = FakeClock()
+        dropped: list[str] = []
+        cache = LruTtlCache[str, int](
+            2, clock=clock, on_drop=lambda key, _: dropped.append(key)
+        )
+        cache.set("expired", 1, ttl=1)
+        cache.set("popped", 2)
+        clock.now += 1
+        cache.get("expired")
+        cache.pop("popped")
+        cache.set("a", 3)
+        cache.set("a", 4)
+        cache.set("b", 5)
+        cache.set("c", 6)
+        cache.clear()
+
+        assert dropped == ["expired", "popped", "a", "a"]
+
+    def test_purge_drops_expired_entries_from_the_oldest_end(self):
+        clock = FakeClock()
+        cache = LruTtlCache[str, int](10, clock=clock)
+        for i in range(3):
+            cache.set(f"old{i}", i, ttl=1)
+        cache.set("new", 3, ttl=10)
+        clock.now += 1
+
+        assert cache.purge_expired() == 3
+        assert list(cache) == ["new"]
+
+
+class TestSingleFlight:
+    """Test deduplication of concurrent calls."""
+
+    async def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight[str, int]()
+        calls: list[str] = []
+        results: list[int] = []
+
+        async def call() -> int:
+            calls.append("call")
+            await anyio.sleep(0.01)
+            return 42
+
+        async def caller():
+            results.append(await flights.run("k", call))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(caller)
+
+        assert calls == ["call"]
+        assert results == [42, 42, 42]
+        assert flights.coalesced == 2
+        assert len(flights) == 0
+
+    async def test_errors_are_raised_for_every_waiter(self):
+        flights = SingleFlight[str, int]()
+        errors: list[Exception] = []
+
+        async def call() -> int:
+            await anyio.sleep(0.01)
+            raise RuntimeError("down")
+
+        async def caller():
+            try:
+                await flights.run("k", call)
+            except RuntimeError as e:
+                errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(2):
+                tg.start_soon(caller)
+
+        assert len(errors) == 2
+        assert errors[0] is errors[1]
@@ -0,0 +1,90 @@
+"""Unit tests for the session-scoped tag identity map.
+
+Tests batched resolution, instance sharing and rollback handling.
+Follows testing principles: no I/O, fakes only, behavior-focused assertions.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.orm import Session
+from src.contexts.shared_kernel.adapters.ORM.mappers.tag.tag_identity_map import (
+    SESSION_INFO_KEY,
+    TagIdentityMap,
+)
+from src.contexts.shared_kernel.adapters.ORM.mappers.tag.tag_mapper import TagMapper
+from src.contexts.shared_kernel.adapters.ORM.sa_models.tag.tag_sa_model import (
+    TagSaModel,
+)
+from src.contexts.shared_kernel.domain.value_objects.tag import Tag
+
+pytestmark = [pytest.mark.anyio, pytest.mark.unit]
+
+
+def _fake_session(rows: list[TagSaModel] | None = None):
+    """Async session stand-in backed by a real, unbound sync session."""
+    sync_session = Session()
+    result = Mock()
+    result.scalars.return_value.all.return_value = rows or []
+    return SimpleNamespace(
+        info=sync_session.info,
+        sync_session=sync_session,
+        execute=AsyncMock(return_value=result),
+    )
+
+
+def _tag(value: str, author_id: str = "author-1") -> Tag:
+    return Tag(key="diet", value=value, author_id=author_id, type="meal")
+
+
+class TestTagIdentityMap:
+    """Test batched tag resolution through the identity map."""
+
+    async def test_resolves_many_tags_with_one_query(self):
+        """Missing tags are loaded with a single IN query."""
+        existing = TagSaModel(
+            key="diet", value="vegan", author_id="author-1", type="meal"
+        )
+        session = _fake_session([existing])
+        tags = [_tag("vegan"), _tag("keto"), _tag("paleo")]
+
+        resolved = await TagMapper.map_domain_tags_to_sa(session, tags)
+
+        assert session.execute.await_count == 1
+        assert resolved[0] is existing
+        assert [t.value for t in resolved] == ["vegan", "keto", "paleo"]
+
+    async def test_reuses_instances_within_session(self):
+        """Repeated lookups return the same instance without querying."""
+        session = _fake_session()
+
+        first = await TagMapper.map_domain_to_sa(session, _tag("keto"))
+        second = await TagMapper.map_domain_to_sa(session, _tag("keto"))
+
+        assert first is second
+        assert session.execute.await_count == 1
+        assert TagIdentityMap.for_session(session).queries == 1
+
+    async def test_duplicate_tags_in_one_call_share_instance(self):
+        """Duplicated identities in one request map to one instance."""
+        session = _fake_session()
+
+        resolved = await TagMapper.map_domain_tags_to_sa(
+            session, [_tag("keto"), _tag("keto")]
+        )
+
+        assert resolved[0] is resolved[1]
+        assert len(TagIdentityMap.for_session(session)) == 1
+
+    async def test_rollback_discards_identity_map(self):
+        """Rolling back the session drops tags created in the transaction."""
+        session = _fake_session()
+        # The rollback event only fires for a transaction that was begun
+        session.sync_session.begin()
+        await TagMapper.map_domain_to_sa(session, _tag("keto"))
+        assert SESSION_INFO_KEY in session.info
+
+        session.sync_session.rollback()
+
+        assert SESSION_INFO_KEY not in session.info
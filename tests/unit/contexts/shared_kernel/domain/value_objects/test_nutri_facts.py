@@ -5,7 +5,11 @@
 import pytest
 from typing import Any
 from src.contexts.shared_kernel.domain.enums import MeasureUnit
-from src.contexts.shared_kernel.domain.value_objects.nutri_facts import NutriFacts
+from src.contexts.shared_kernel.domain.value_objects.nutri_facts import (
+    NUTRIENT_FIELDS,
+    NutriFacts,
+    NutrientVector,
+)
 from src.contexts.shared_kernel.domain.value_objects.nutri_value import NutriValue
 
 
@@ -280,4 +284,68 @@ def test_nutri_facts_arithmetic_with_non_nutri_facts(self):
             facts + other_object  # type: ignore
 
         with pytest.raises(TypeError, match="unsupported operand type"):
-            facts - other_object  # type: ignore
\ No newline at end of file
+            facts - other_object  # type: ignore
+
+
+class TestNutriFactsVectorization:
+    """Test the array-backed nutrient vector and batched summation."""
+
+    def test_vector_round_trip_preserves_values_and_units(self):
+        """Test NutriFacts survives export to and import from a vector."""
+        # Given
+        facts = NutriFacts(
+            calories=NutriValue(value=100.0, unit=MeasureUnit.ENERGY),
+            protein=NutriValue(value=5.5, unit=MeasureUnit.GRAM),
+        )
+
+        # When
+        vector = facts.to_vector()
+
+        # Then
+        assert len(vector.values) == len(NUTRIENT_FIELDS)
+        assert NutriFacts.from_vector(vector) == facts
+
+    def test_sum_matches_pairwise_addition(self):
+        """Test batched sum equals folding + over the same items."""
+        # Given
+        items = [
+            NutriFacts(calories=100.0, protein=5.0, sodium=200.0),
+            NutriFacts(calories=150.5, total_fat=3.0),
+            NutriFacts(protein={"value": 8.0, "unit": MeasureUnit.GRAM}),
+        ]
+
+        # When
+        result = NutriFacts.sum(items)
+
+        # Then
+        assert result == items[0] + items[1] + items[2]
+        assert result.calories.value == 250.5
+        assert result.protein.unit == MeasureUnit.GRAM
+
+    def test_sum_of_empty_iterable_is_zero(self):
+        """Test summing nothing yields zero nutritional facts."""
+        assert NutriFacts.sum([]) == NutriFacts()
+
+    def test_sum_accepts_generators(self):
+        """Test sum consumes any iterable once."""
+        result = NutriFacts.sum(NutriFacts(calories=10.0) for _ in range(3))
+
+        assert result.calories.value == 30.0
+
+    def test_vector_arithmetic_keeps_own_units(self):
+        """Test vector arithmetic follows NutriValue unit rules."""
+        # Given
+        left = NutriFacts(calories=NutriValue(value=1.0, unit=MeasureUnit.KILOGRAM))
+        right = NutriFacts(calories=2.0)
+
+        # When
+        result = left.to_vector() + right.to_vector()
+
+        # Then
+        assert result.units[NUTRIENT_FIELDS.index("calories")] == MeasureUnit.KILOGRAM
+        assert result.values[NUTRIENT_FIELDS.index("calories")] == 3.0
+
+    def test_vector_rejects_mismatched_lengths(self):
+        """Test values and units must line up."""
+        with pytest.raises(ValueError, match="same length"):
+            NutrientVector([1.0, 2.0], [MeasureUnit.GRAM])
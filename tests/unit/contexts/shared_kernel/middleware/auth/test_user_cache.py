@@ -0,0 +1,157 @@
+"""Unit tests for the process-wide IAM user cache."""
+
+import anyio
+import pytest
+from src.contexts.seedwork.adapters import caching
+from src.contexts.shared_kernel.middleware.auth.user_cache import IAMUserCache
+
+pytestmark = [pytest.mark.unit, pytest.mark.anyio]
+
+OK = {"statusCode": 200, "body": "user"}
+NOT_FOUND = {"statusCode": 404, "body": '{"message": "User not in database."}'}
+SERVER_ERROR = {"statusCode": 500, "body": '{"message": "Internal server error."}'}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(caching.time, "monotonic", clock)
+    return clock
+
+
+def loader_for(response, calls: list[str]):
+    async def loader():
+        calls.append("call")
+        return response
+
+    return loader
+
+
+async def test_loaded_response_is_served_until_ttl(clock):
+    cache = IAMUserCache(ttl=60)
+    calls: list[str] = []
+
+    await cache.load("u1", "iam", loader_for(OK, calls))
+
+    assert cache.get("u1", "iam") is OK
+    clock.now += 61
+    assert cache.get("u1", "iam") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+async def test_not_found_uses_negative_ttl_and_errors_are_not_cached(clock):
+    cache = IAMUserCache(ttl=60, negative_ttl=5)
+    calls: list[str] = []
+
+    await cache.load("u1", "iam", loader_for(NOT_FOUND, calls))
+    await cache.load("u2", "iam", loader_for(SERVER_ERROR, calls))
+
+    assert cache.get("u1", "iam") is NOT_FOUND
+    assert cache.get("u2", "iam") is None
+    clock.now += 6
+    assert cache.get("u1", "iam") is None
+
+
+async def test_least_recently_used_entry_is_evicted(clock):
+    cache = IAMUserCache(max_entries=2)
+    calls: list[str] = []
+    for user_id in ("u1", "u2"):
+        await cache.load(user_id, "iam", loader_for(OK, calls))
+
+    cache.get("u1", "iam")
+    await cache.load("u3", "iam", loader_for(OK, calls))
+
+    assert cache.get("u2", "iam") is None
+    assert cache.get("u1", "iam") is OK
+    assert cache.stats()["evictions"] == 1
+
+
+async def test_invalidate_user_drops_every_caller_context(clock):
+    cache = IAMUserCache()
+    calls: list[str] = []
+    for context in ("iam", "recipes_catalog"):
+        await cache.load("u1", context, loader_for(OK, calls))
+    await cache.load("u2", "iam", loader_for(OK, calls))
+
+    cache.invalidate_user("u1")
+
+    assert cache.get("u1", "iam") is None
+    assert cache.get("u1", "recipes_catalog") is None
+    assert cache.get("u2", "iam") is OK
+    assert cache.stats()["invalidations"] == 2
+
+
+async def test_concurrent_misses_share_one_load():
+    cache = IAMUserCache()
+    calls: list[str] = []
+    release = anyio.Event()
+    results = []
+
+    async def loader():
+        calls.append("call")
+        await release.wait()
+        return OK
+
+    async def lookup():
+        results.append(await cache.load("u1", "iam", loader))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(lookup)
+        await anyio.wait_all_tasks_blocked()
+        release.set()
+
+    assert calls == ["call"]
+    assert results == [OK] * 5
+    assert cache.stats()["coalesced"] == 4
+
+
+async def test_load_failure_is_raised_to_every_waiter():
+    cache = IAMUserCache()
+    release = anyio.Event()
+    errors = []
+
+    async def loader():
+        await release.wait()
+        raise RuntimeError("iam down")
+
+    async def lookup():
+        try:
+            await cache.load("u1", "iam", loader)
+        except RuntimeError as e:
+            errors.append(e)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(lookup)
+        await anyio.wait_all_tasks_blocked()
+        release.set()
+
+    assert len(errors) == 3
+    assert cache.get("u1", "iam") is None
+
+
+async def test_invalidation_during_load_is_not_overwritten():
+    cache = IAMUserCache()
+    release = anyio.Event()
+
+    async def loader():
+        await release.wait()
+        return OK
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(cache.load, "u1", "iam", loader)
+        await anyio.wait_all_tasks_blocked()
+        cache.invalidate_user("u1")
+        release.set()
+
+    assert cache.get("u1", "iam") is None
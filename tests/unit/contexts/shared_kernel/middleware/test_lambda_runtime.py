@@ -0,0 +1,97 @@
+"""Unit tests for the persistent Lambda event loop."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from src.contexts.shared_kernel.middleware.lambda_runtime import LambdaRuntime
+
+pytestmark = pytest.mark.unit
+
+
+async def current_loop(event, context):
+    return asyncio.get_running_loop()
+
+
+class ThawRecorder:
+    def __init__(self, fail: bool = False):
+        self.idle: list[float] = []
+        self.fail = fail
+
+    async def __call__(self, idle_seconds: float) -> None:
+        self.idle.append(idle_seconds)
+        if self.fail:
+            raise ConnectionError("database unreachable")
+
+
+def test_invocations_share_one_event_loop():
+    runtime = LambdaRuntime(on_thaw=None)
+    try:
+        first = runtime.run(current_loop, {}, None)
+        second = runtime.run(current_loop, {}, None)
+    finally:
+        runtime.close()
+
+    assert first is second
+    assert runtime.invocations == 2
+
+
+def test_loop_state_survives_between_invocations():
+    runtime = LambdaRuntime(on_thaw=None)
+    state = {}
+
+    async def open_resource(event, context):
+        state["future"] = asyncio.get_running_loop().create_future()
+
+    async def use_resource(event, context):
+        # Fails with "attached to a different loop" on a fresh loop
+        state["future"].set_result("ok")
+        return await state["future"]
+
+    try:
+        runtime.run(open_resource, {}, None)
+        assert runtime.run(use_resource, {}, None) == "ok"
+    finally:
+        runtime.close()
+
+
+def test_thaw_hook_runs_only_after_an_idle_gap():
+    hook = ThawRecorder()
+    runtime = LambdaRuntime(idle_revalidate_seconds=60, on_thaw=hook)
+    try:
+        runtime.run(current_loop, {}, None)
+        runtime.run(current_loop, {}, None)
+        runtime._last_finished_at -= 120  # container frozen for two minutes
+        runtime.run(current_loop, {}, None)
+    finally:
+        runtime.close()
+
+    assert runtime.thaws == 1
+    assert hook.idle[0] >= 120
+
+
+def test_failing_thaw_hook_does_not_fail_the_invocation():
+    runtime = LambdaRuntime(idle_revalidate_seconds=0, on_thaw=ThawRecorder(fail=True))
+    try:
+        runtime.run(current_loop, {}, None)
+        loop = runtime.run(current_loop, {}, None)
+    finally:
+        runtime.close()
+
+    assert isinstance(loop, asyncio.AbstractEventLoop)
+
+
+def test_handler_errors_leave_the_loop_usable():
+    runtime = LambdaRuntime(on_thaw=None)
+
+    async def boom(event, context):
+        raise ValueError("bad request")
+
+    try:
+        first = runtime.run(current_loop, {}, None)
+        with pytest.raises(ValueError):
+            runtime.run(boom, {}, None)
+        assert runtime.run(current_loop, {}, None) is first
+    finally:
+        runtime.close()
@@ -0,0 +1,158 @@
+"""Unit tests for per-aggregate event coalescing in the message bus."""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from unittest.mock import AsyncMock, MagicMock
+
+import anyio
+import pytest
+from attrs import frozen
+from src.contexts.seedwork.domain.commands.command import Command
+from src.contexts.seedwork.domain.event import Event
+from src.contexts.seedwork.services.uow import UnitOfWork
+from src.contexts.shared_kernel.services import event_coalescing
+from src.contexts.shared_kernel.services.event_coalescing import (
+    EventCoalescer,
+    get_coalescing_stats,
+)
+from src.contexts.shared_kernel.services.messagebus import MessageBus
+
+pytestmark = [pytest.mark.unit, pytest.mark.anyio]
+
+
+@frozen
+class MealChanged(Event):
+    menu_id: str
+    meal_id: str
+
+
+@frozen
+class MealRemoved(Event):
+    menu_id: str
+    meal_id: str
+
+
+class EditMeals(Command):
+    def __init__(self, events: list[Event]):
+        self.events = events
+
+
+class FakeUnitOfWork(UnitOfWork):
+    def __init__(self):
+        self.session_factory = MagicMock()
+        self.session = AsyncMock()
+        self.events: list[Event] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def collect_new_events(self):
+        events, self.events = self.events, []
+        return events
+
+
+class BatchRecorder:
+    def __init__(self):
+        self.batches: list[list[Event]] = []
+
+    async def __call__(self, events: list[Event]):
+        self.batches.append(events)
+
+
+@pytest.fixture(autouse=True)
+def isolated_stats(monkeypatch):
+    monkeypatch.setattr(event_coalescing, "_stats", {})
+    monkeypatch.setattr(event_coalescing, "_pending", {})
+
+
+def make_bus(handlers: dict) -> MessageBus:
+    async def edit_meals(cmd: EditMeals, uow: FakeUnitOfWork):
+        uow.events.extend(cmd.events)
+
+    return MessageBus(
+        FakeUnitOfWork,
+        event_handlers=handlers,
+        command_handlers={EditMeals: edit_meals},
+    )
+
+
+async def test_events_of_one_command_are_batched_per_menu():
+    recorder = BatchRecorder()
+    coalescer = EventCoalescer("menus", recorder, key=attrgetter("menu_id"))
+    bus = make_bus({MealChanged: [coalescer], MealRemoved: [coalescer]})
+
+    await bus.handle(
+        EditMeals(
+            [
+                MealChanged("menu1", "a"),
+                MealChanged("menu2", "b"),
+                MealRemoved("menu1", "c"),
+                MealChanged("menu1", "d"),
+            ]
+        )
+    )
+
+    batches = sorted(recorder.batches, key=lambda b: b[0].menu_id)
+    assert [[e.meal_id for e in b] for b in batches] == [["a", "c", "d"], ["b"]]
+    assert get_coalescing_stats()["menus"] == {
+        "events": 4,
+        "batches": 2,
+        "merged": 2,
+        "merge_ratio": 0.5,
+    }
+
+
+async def test_plain_handlers_still_run_once_per_event():
+    recorder = BatchRecorder()
+    plain = AsyncMock()
+    coalescer = EventCoalescer("menus", recorder, key=attrgetter("menu_id"))
+    bus = make_bus({MealChanged: [coalescer, plain]})
+
+    await bus.handle(EditMeals([MealChanged("menu1", "a"), MealChanged("menu1", "b")]))
+
+    assert plain.await_count == 2
+    assert len(recorder.batches) == 1
+
+
+async def test_window_merges_batches_from_separate_commands():
+    recorder = BatchRecorder()
+    coalescer = EventCoalescer(
+        "menus", recorder, key=attrgetter("menu_id"), window=0.05
+    )
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(coalescer.run, [MealChanged("menu1", "a")])
+        await anyio.wait_all_tasks_blocked()
+        tg.start_soon(coalescer.run, [MealChanged("menu1", "b")])
+        tg.start_soon(coalescer.run, [MealChanged("menu2", "c")])
+
+    merged = [b for b in recorder.batches if b[0].menu_id == "menu1"]
+    assert [[e.meal_id for e in b] for b in merged] == [["a", "b"]]
+    assert get_coalescing_stats()["menus"]["merged"] == 1
+
+
+async def test_cancelled_window_still_runs_the_merged_batch():
+    recorder = BatchRecorder()
+    coalescer = EventCoalescer("menus", recorder, key=attrgetter("menu_id"), window=10)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(coalescer.run, [MealChanged("menu1", "a")])
+        await anyio.wait_all_tasks_blocked()
+        await coalescer.run([MealChanged("menu1", "b")])
+        tg.cancel_scope.cancel()
+
+    assert [[e.meal_id for e in b] for b in recorder.batches] == [["a", "b"]]
+    assert event_coalescing._pending == {}
+
+
+async def test_single_event_call_runs_a_batch_of_one():
+    recorder = BatchRecorder()
+    coalescer = EventCoalescer("menus", recorder, key=attrgetter("menu_id"))
+
+    await coalescer(MealChanged("menu1", "a"))
+
+    assert recorder.batches == [[MealChanged("menu1", "a")]]
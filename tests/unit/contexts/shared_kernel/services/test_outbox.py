@@ -0,0 +1,139 @@
+"""Unit tests for the transactional outbox routing and message bus wiring."""
+
+from __future__ import annotations
+
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from attrs import frozen
+from src.contexts.seedwork.domain.commands.command import Command
+from src.contexts.seedwork.domain.event import Event
+from src.contexts.seedwork.services.uow import UnitOfWork
+from src.contexts.shared_kernel.services.messagebus import MessageBus
+from src.contexts.shared_kernel.services.outbox import (
+    Outbox,
+    OutboxDispatcher,
+    OutboxStatus,
+    deserialize_event,
+    event_type_name,
+    serialize_event,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.anyio]
+
+
+@frozen(kw_only=True)
+class MealsChanged(Event):
+    menu_id: str
+    ids_of_meals_added: frozenset[str]
+
+
+@frozen
+class Unhandled(Event):
+    menu_id: str
+
+
+class SampleCommand(Command):
+    pass
+
+
+async def refresh_menu(evt: Event, uow_factory=None):
+    pass
+
+
+async def notify_client(evt: Event, uow_factory=None):
+    pass
+
+
+class FakeUnitOfWork(UnitOfWork):
+    def __init__(self):
+        self.session_factory = MagicMock()
+        self.session = MagicMock()
+        self.session.commit = AsyncMock()
+        self.events: list[Event] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def collect_new_events(self):
+        while self.events:
+            yield self.events.pop(0)
+
+
+def make_outbox() -> Outbox:
+    return Outbox(
+        "recipes_catalog",
+        {
+            MealsChanged: [
+                partial(refresh_menu, uow_factory=None),
+                partial(notify_client, uow_factory=None),
+            ]
+        },
+    )
+
+
+def test_event_payload_round_trips_sets():
+    event = MealsChanged(menu_id="m1", ids_of_meals_added=frozenset({"b", "a"}))
+
+    payload = serialize_event(event)
+
+    assert payload == {"menu_id": "m1", "ids_of_meals_added": ["a", "b"]}
+    assert deserialize_event(MealsChanged, payload) == event
+
+
+def test_stage_writes_one_row_per_handler_and_skips_unhandled_events():
+    outbox = make_outbox()
+    session = MagicMock()
+    event = MealsChanged(menu_id="m1", ids_of_meals_added=frozenset({"a"}))
+
+    staged = outbox.stage(session, [event, Unhandled("m1")])
+
+    rows = session.add_all.call_args.args[0]
+    assert staged == 2
+    assert [row.handler for row in rows] == ["refresh_menu", "notify_client"]
+    assert {row.event_type for row in rows} == {event_type_name(MealsChanged)}
+    assert {row.status for row in rows} == {OutboxStatus.PENDING.value}
+    assert outbox.resolve(rows[0].event_type, "refresh_menu")[0] is MealsChanged
+
+
+def test_duplicate_handler_names_are_rejected():
+    with pytest.raises(ValueError):
+        Outbox("recipes_catalog", {MealsChanged: [refresh_menu, refresh_menu]})
+
+
+def test_backoff_doubles_up_to_the_cap():
+    dispatcher = OutboxDispatcher(
+        MagicMock(), make_outbox(), base_backoff=2, max_backoff=10, handler_timeout=1
+    )
+
+    assert [dispatcher.backoff(n) for n in (1, 2, 3, 4)] == [2, 4, 8, 10]
+
+
+async def test_bus_with_outbox_commits_events_instead_of_running_handlers():
+    handler = AsyncMock()
+    outbox = Outbox("recipes_catalog", {MealsChanged: [handler]})
+    uow = FakeUnitOfWork()
+
+    async def command_handler(cmd, uow):
+        uow.events.append(
+            MealsChanged(menu_id="m1", ids_of_meals_added=frozenset({"a"}))
+        )
+        await uow.commit()
+
+    bus = MessageBus(
+        lambda: uow,
+        event_handlers={MealsChanged: [handler]},
+        command_handlers={SampleCommand: command_handler},
+        outbox=outbox,
+    )
+
+    await bus.handle(SampleCommand())
+
+    assert uow.session.add_all.call_count == 1
+    assert len(uow.session.add_all.call_args.args[0]) == 1
+    uow.session.commit.assert_awaited_once()
+    handler.assert_not_called()
@@ -0,0 +1,238 @@
+"""
+Cold-start import profiling for AWS Lambda handler modules.
+
+Each handler module is imported in a fresh interpreter, as a Lambda cold
+start does, with ``-X importtime``. The child process reports wall time, RSS
+growth and the import-time side effects handlers must avoid (database engine
+created, AI provider SDKs loaded); the parent parses the importtime log into
+per-module self/cumulative times so the slowest imports can be pointed at.
+
+Command line:
+
+    python -m tests.utils.cold_start                 # every handler module
+    python -m tests.utils.cold_start src.contexts.iam.aws_lambda.create_user
+    python -m tests.utils.cold_start --top 25 --budget-ms 1500
+
+As a pytest plugin (registered in tests/conftest.py) it adds the
+``--cold-start-import-budget-ms`` and ``--cold-start-rss-budget-mb`` options
+and the ``cold_start_budget`` fixture.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+DEFAULT_IMPORT_BUDGET_MS = 3000.0
+DEFAULT_RSS_BUDGET_MB = 256.0
+
+# Top-level packages that no handler needs at import time
+DEFERRED_PACKAGES = ("pydantic_ai",)
+
+_CHILD = """
+import importlib, json, resource, sys, time
+
+def rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform == "darwin" else peak
+
+name = sys.argv[1]
+modules_before = len(sys.modules)
+rss_before = rss_kb()
+start = time.perf_counter()
+importlib.import_module(name)
+wall_ms = (time.perf_counter() - start) * 1000
+db = sys.modules.get("src.db.fastapi_database")
+print(json.dumps({
+    "wall_ms": wall_ms,
+    "rss_mb": (rss_kb() - rss_before) / 1024,
+    "modules_loaded": len(sys.modules) - modules_before,
+    "engine_created": getattr(db, "_database", None) is not None,
+    "packages": sorted({m.partition(".")[0] for m in sys.modules}),
+}))
+"""
+
+
+@dataclass(frozen=True)
+class ModuleImport:
+    """One line of ``-X importtime`` output (times in microseconds)."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class ImportProfile:
+    """What importing one module in a fresh interpreter cost."""
+
+    module: str
+    wall_ms: float
+    rss_mb: float
+    modules_loaded: int
+    engine_created: bool
+    deferred_loaded: list[str]
+    imports: list[ModuleImport] = field(default_factory=list)
+
+    def slowest(self, n: int = 10) -> list[ModuleImport]:
+        """Return the `n` imports with the highest self time."""
+        return sorted(self.imports, key=lambda i: i.self_us, reverse=True)[:n]
+
+    def report(self, top: int = 10) -> str:
+        lines = [
+            f"{self.module}: {self.wall_ms:.0f}ms, +{self.rss_mb:.1f}MB RSS, "
+            f"{self.modules_loaded} modules"
+        ]
+        lines += [
+            f"  {i.self_us / 1000:8.1f}ms self "
+            f"{i.cumulative_us / 1000:8.1f}ms cum  {i.name}"
+            for i in self.slowest(top)
+        ]
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class ColdStartBudget:
+    """Limits a handler module import has to stay within."""
+
+    import_ms: float = DEFAULT_IMPORT_BUDGET_MS
+    rss_mb: float = DEFAULT_RSS_BUDGET_MB
+
+    def violations(self, profile: ImportProfile) -> list[str]:
+        """Return a description of every limit `profile` exceeds."""
+        problems = []
+        if profile.wall_ms > self.import_ms:
+            problems.append(
+                f"import took {profile.wall_ms:.0f}ms (budget {self.import_ms:.0f}ms)"
+            )
+        if profile.rss_mb > self.rss_mb:
+            problems.append(
+                f"import grew RSS by {profile.rss_mb:.1f}MB (budget {self.rss_mb:.0f}MB)"
+            )
+        if profile.engine_created:
+            problems.append("database engine created at import time")
+        if profile.deferred_loaded:
+            problems.append(
+                f"imported {', '.join(profile.deferred_loaded)} at import time"
+            )
+        return problems
+
+
+def discover_handler_modules(root: Path = REPO_ROOT) -> list[str]:
+    """Return the dotted names of all modules defining a ``lambda_handler``."""
+    modules = []
+    for path in sorted(root.glob("src/contexts/*/aws_lambda/**/*.py")):
+        if "def lambda_handler(" in path.read_text():
+            relative = path.relative_to(root).with_suffix("")
+            modules.append(".".join(relative.parts))
+    return modules
+
+
+def parse_importtime(output: str) -> list[ModuleImport]:
+    """Parse ``-X importtime`` stderr into module import records."""
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header
+        imports.append(ModuleImport(name.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def profile_import(module: str, *, timeout: float = 120.0) -> ImportProfile:
+    """Import `module` in a fresh interpreter and measure the cost.
+
+    The child runs with ``AWS_LAMBDA_FUNCTION_NAME`` set so code that
+    branches on the Lambda environment takes its Lambda path.
+
+    Raises:
+        RuntimeError: If the import fails in the child process.
+    """
+    env = {
+        **os.environ,
+        "AWS_LAMBDA_FUNCTION_NAME": "cold-start-profile",
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])
+        ),
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, module],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        check=False,
+    )
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.splitlines()[-20:])
+        raise RuntimeError(f"Importing {module} failed:\n{tail}")
+
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    return ImportProfile(
+        module=module,
+        wall_ms=data["wall_ms"],
+        rss_mb=data["rss_mb"],
+        modules_loaded=data["modules_loaded"],
+        engine_created=data["engine_created"],
+        deferred_loaded=[p for p in DEFERRED_PACKAGES if p in data["packages"]],
+        imports=parse_importtime(result.stderr),
+    )
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("cold-start", "Lambda handler cold-start budgets")
+    group.addoption(
+        "--cold-start-import-budget-ms",
+        type=float,
+        default=DEFAULT_IMPORT_BUDGET_MS,
+        help="Maximum wall time for importing one handler module",
+    )
+    group.addoption(
+        "--cold-start-rss-budget-mb",
+        type=float,
+        default=DEFAULT_RSS_BUDGET_MB,
+        help="Maximum RSS growth for importing one handler module",
+    )
+
+
+@pytest.fixture
+def cold_start_budget(request: pytest.FixtureRequest) -> ColdStartBudget:
+    return ColdStartBudget(
+        import_ms=request.config.getoption("--cold-start-import-budget-ms"),
+        rss_mb=request.config.getoption("--cold-start-rss-budget-mb"),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="Defaults to every handler")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_IMPORT_BUDGET_MS)
+    parser.add_argument("--budget-mb", type=float, default=DEFAULT_RSS_BUDGET_MB)
+    args = parser.parse_args(argv)
+
+    budget = ColdStartBudget(import_ms=args.budget_ms, rss_mb=args.budget_mb)
+    failed = 0
+    for module in args.modules or discover_handler_modules():
+        profile = profile_import(module)
+        print(profile.report(args.top))
+        for problem in budget.violations(profile):
+            failed += 1
+            print(f"  OVER BUDGET: {problem}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())